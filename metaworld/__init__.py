@@ -4,13 +4,17 @@ from __future__ import annotations
 
 import abc
 import pickle
+import zlib
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 import numpy as np
 import numpy.typing as npt
 
 import metaworld.envs.mujoco.env_dict as _env_dict
+from metaworld import task_cache as _task_cache
+from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import SawyerXYZEnv
 from metaworld.types import Task
 
 
@@ -69,6 +73,12 @@ class Benchmark(abc.ABC):
         """Returns all of the test tasks for this benchmark."""
         return self._test_tasks
 
+    def _precompute_reset_states(self) -> None:
+        """Stores the reset state of every train and test task in the task (see `SawyerXYZEnv.capture_reset_state()`)."""
+        self._train_tasks = _add_reset_states(self._train_classes, self._train_tasks)
+        if self._test_tasks:
+            self._test_tasks = _add_reset_states(self._test_classes, self._test_tasks)
+
 
 _ML_OVERRIDE = dict(partially_observable=True)
 """The overrides for the Meta-Learning benchmarks. Disables the inclusion of the goal position in the observation."""
@@ -80,6 +90,10 @@ _N_GOALS = 50
 """The number of goals to generate for each environment."""
 
 
+_RAND_VECS_PER_RESET = 2
+"""The number of rand vecs `SawyerXYZEnv.reset()` samples (it runs `reset_model()` twice). Only the last one is kept."""
+
+
 def _encode_task(env_name, data) -> Task:
     """Instantiates a new `Task` object after pickling the data.
 
@@ -93,73 +107,174 @@ def _encode_task(env_name, data) -> Task:
     return Task(env_name=env_name, data=pickle.dumps(data))
 
 
-def _make_tasks(
-    classes: _env_dict.EnvDict,
-    args_kwargs: _env_dict.EnvArgsKwargsDict,
+def _env_seed(seed: int, env_name: str) -> int:
+    """Derives the seed the goals of one environment are generated with from the benchmark seed.
+
+    The seed only depends on the benchmark seed and the environment name, so the goals
+    of an environment do not depend on the other environments of the benchmark, on
+    their order or on the process they are generated in.
+
+    Args:
+        seed: The benchmark seed.
+        env_name: The name of the environment.
+
+    Returns:
+        A seed for `np.random.seed()`.
+    """
+    seed_seq = np.random.SeedSequence([seed, zlib.crc32(env_name.encode())])
+    return int(seed_seq.generate_state(1)[0])
+
+
+def _make_env_tasks(
+    env_name: str,
+    env_cls: type[SawyerXYZEnv],
+    args: dict[str, Any],
     kwargs_override: dict,
-    seed: int | None = None,
+    seed: int,
 ) -> list[Task]:
-    """Initialises goals for a given set of environments.
+    """Initialises the goals of a single environment.
+
+    Runs in a worker process when `_make_tasks()` is given more than one worker.
 
     Args:
-        classes: The environment classes as an `EnvDict`.
-        args_kwargs: The environment arguments and keyword arguments.
+        env_name: The name of the environment.
+        env_cls: The environment class.
+        args: The environment arguments and keyword arguments.
         kwargs_override: Any kwarg overrides.
-        seed: The random seed to use.
+        seed: The environment seed (see `_env_seed()`).
 
     Returns:
-        A flat list of `Task` objects, `_N_GOALS` for each environment in `classes`.
+        A list of `_N_GOALS` `Task` objects.
     """
+    kwargs = args["kwargs"].copy()
+    assert isinstance(kwargs, dict)
+    assert len(args["args"]) == 0
+
     # Cache existing random state
-    if seed is not None:
-        st0 = np.random.get_state()
-        np.random.seed(seed)
+    st0 = np.random.get_state()
+    np.random.seed(seed)
+
+    # Init env
+    env = env_cls()
+    env._freeze_rand_vec = False
+    env._set_task_called = True
+    rand_vecs: list[npt.NDArray[Any]] = []
+
+    # Set task
+    del kwargs["task_id"]
+    env._set_task_inner(**kwargs)
+
+    # Generate random goals. This samples the same rand vecs as resetting the env
+    # `_N_GOALS` times would, without simulating the resets
+    for _ in range(_N_GOALS):
+        for _ in range(_RAND_VECS_PER_RESET):
+            rand_vec = env._sample_state_rand_vec()
+        rand_vecs.append(rand_vec)
+
+    unique_task_rand_vecs = np.unique(np.array(rand_vecs), axis=0)
+    assert (
+        unique_task_rand_vecs.shape[0] == _N_GOALS
+    ), f"Only generated {unique_task_rand_vecs.shape[0]} unique goals, not {_N_GOALS}"
+    env.close()
+    del env
 
+    # Restore random state
+    np.random.set_state(st0)
+
+    # Create a task for each random goal
     tasks = []
-    for env_name, args in args_kwargs.items():
+    for rand_vec in rand_vecs:
         kwargs = args["kwargs"].copy()
         assert isinstance(kwargs, dict)
-        assert len(args["args"]) == 0
+        del kwargs["task_id"]
 
-        # Init env
-        env = classes[env_name]()
-        env._freeze_rand_vec = False
-        env._set_task_called = True
-        rand_vecs: list[npt.NDArray[Any]] = []
+        kwargs.update(dict(rand_vec=rand_vec, env_cls=env_cls))
+        kwargs.update(kwargs_override)
 
-        # Set task
-        del kwargs["task_id"]
-        env._set_task_inner(**kwargs)
+        tasks.append(_encode_task(env_name, kwargs))
+    return tasks
 
-        for _ in range(_N_GOALS):  # Generate random goals
-            env.reset()
-            assert env._last_rand_vec is not None
-            rand_vecs.append(env._last_rand_vec)
 
-        unique_task_rand_vecs = np.unique(np.array(rand_vecs), axis=0)
-        assert (
-            unique_task_rand_vecs.shape[0] == _N_GOALS
-        ), f"Only generated {unique_task_rand_vecs.shape[0]} unique goals, not {_N_GOALS}"
-        env.close()
+def _make_tasks(
+    classes: _env_dict.EnvDict,
+    args_kwargs: _env_dict.EnvArgsKwargsDict,
+    kwargs_override: dict,
+    seed: int | None = None,
+    num_workers: int = 1,
+) -> list[Task]:
+    """Initialises goals for a given set of environments.
 
-        # Create a task for each random goal
-        for rand_vec in rand_vecs:
-            kwargs = args["kwargs"].copy()
-            assert isinstance(kwargs, dict)
-            del kwargs["task_id"]
+    The goals of each environment are generated with their own seed, derived from `seed`
+    (see `_env_seed()`), so the result does not depend on `num_workers`.
 
-            kwargs.update(dict(rand_vec=rand_vec, env_cls=classes[env_name]))
-            kwargs.update(kwargs_override)
+    Args:
+        classes: The environment classes as an `EnvDict`.
+        args_kwargs: The environment arguments and keyword arguments.
+        kwargs_override: Any kwarg overrides.
+        seed: The random seed to use. If `None`, one is drawn from the global `np.random` state.
+        num_workers: The number of processes to generate the goals of the environments in.
+            With a single worker, they are generated in the current process.
 
-            tasks.append(_encode_task(env_name, kwargs))
+    Returns:
+        A flat list of `Task` objects, `_N_GOALS` for each environment in `classes`.
+    """
+    # Load the tasks from the on-disk cache, if it is enabled (see `metaworld.task_cache`)
+    cache_key = None
+    if seed is not None and _task_cache.get_cache_dir() is not None:
+        cache_key = _task_cache.cache_key(classes, args_kwargs, kwargs_override, seed)
+        cached_tasks = _task_cache.load_tasks(cache_key)
+        if cached_tasks is not None:
+            return cached_tasks
+
+    if seed is None:
+        seed = int(np.random.randint(2**31))
+    env_names = list(args_kwargs.keys())
+    job_args = (
+        env_names,
+        [classes[env_name] for env_name in env_names],
+        [args_kwargs[env_name] for env_name in env_names],
+        [kwargs_override] * len(env_names),
+        [_env_seed(seed, env_name) for env_name in env_names],
+    )
+
+    num_workers = min(num_workers, len(env_names))
+    if num_workers > 1:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            env_tasks = list(executor.map(_make_env_tasks, *job_args))
+    else:
+        env_tasks = list(map(_make_env_tasks, *job_args))
+    tasks = [task for tasks in env_tasks for task in tasks]
+
+    if cache_key is not None:
+        _task_cache.save_tasks(cache_key, tasks)
+    return tasks
 
-        del env
 
-    # Restore random state
-    if seed is not None:
-        np.random.set_state(st0)
+def _add_reset_states(classes: _env_dict.EnvDict, tasks: list[Task]) -> list[Task]:
+    """Precomputes the reset state of every task and stores it in the task.
 
-    return tasks
+    Environments reset into a task with a reset state restore it instead of simulating the reset.
+
+    Args:
+        classes: The environment classes as an `EnvDict`.
+        tasks: The tasks of the environments in `classes`.
+
+    Returns:
+        The tasks, with their reset state added to their data.
+    """
+    envs = {}
+    tasks_with_states = []
+    for task in tasks:
+        if task.env_name not in envs:
+            envs[task.env_name] = classes[task.env_name]()
+        env = envs[task.env_name]
+        env.set_task(task)
+        data = pickle.loads(task.data)
+        data["reset_state"] = env.capture_reset_state()
+        tasks_with_states.append(_encode_task(task.env_name, data))
+    for env in envs.values():
+        env.close()
+    return tasks_with_states
 
 
 # MT Benchmarks
@@ -170,7 +285,7 @@ class MT1(Benchmark):
 
     ENV_NAMES = list(_env_dict.ALL_V2_ENVIRONMENTS.keys())
 
-    def __init__(self, env_name, seed=None):
+    def __init__(self, env_name, seed=None, precompute_reset_states=False):
         super().__init__()
         if env_name not in _env_dict.ALL_V2_ENVIRONMENTS:
             raise ValueError(f"{env_name} is not a V2 environment")
@@ -184,38 +299,52 @@ class MT1(Benchmark):
         )
 
         self._test_tasks = []
+        if precompute_reset_states:
+            self._precompute_reset_states()
 
 
 class MT10(Benchmark):
     """The MT10 benchmark. Contains 10 tasks in its train set. Has an empty test set."""
 
-    def __init__(self, seed=None):
+    def __init__(self, seed=None, precompute_reset_states=False, num_workers=1):
         super().__init__()
         self._train_classes = _env_dict.MT10_V2
         self._test_classes = OrderedDict()
         train_kwargs = _env_dict.MT10_V2_ARGS_KWARGS
         self._train_tasks = _make_tasks(
-            self._train_classes, train_kwargs, _MT_OVERRIDE, seed=seed
+            self._train_classes,
+            train_kwargs,
+            _MT_OVERRIDE,
+            seed=seed,
+            num_workers=num_workers,
         )
 
         self._test_tasks = []
         self._test_classes = []
+        if precompute_reset_states:
+            self._precompute_reset_states()
 
 
 class MT50(Benchmark):
     """The MT50 benchmark. Contains all (50) tasks in its train set. Has an empty test set."""
 
-    def __init__(self, seed=None):
+    def __init__(self, seed=None, precompute_reset_states=False, num_workers=1):
         super().__init__()
         self._train_classes = _env_dict.MT50_V2
         self._test_classes = OrderedDict()
         train_kwargs = _env_dict.MT50_V2_ARGS_KWARGS
         self._train_tasks = _make_tasks(
-            self._train_classes, train_kwargs, _MT_OVERRIDE, seed=seed
+            self._train_classes,
+            train_kwargs,
+            _MT_OVERRIDE,
+            seed=seed,
+            num_workers=num_workers,
         )
 
         self._test_tasks = []
         self._test_classes = []
+        if precompute_reset_states:
+            self._precompute_reset_states()
 
 
 # ML Benchmarks
@@ -227,7 +356,7 @@ class ML1(Benchmark):
 
     ENV_NAMES = list(_env_dict.ALL_V2_ENVIRONMENTS.keys())
 
-    def __init__(self, env_name, seed=None):
+    def __init__(self, env_name, seed=None, precompute_reset_states=False):
         super().__init__()
         if env_name not in _env_dict.ALL_V2_ENVIRONMENTS:
             raise ValueError(f"{env_name} is not a V2 environment")
@@ -246,12 +375,14 @@ class ML1(Benchmark):
             _ML_OVERRIDE,
             seed=(seed + 1 if seed is not None else seed),
         )
+        if precompute_reset_states:
+            self._precompute_reset_states()
 
 
 class ML10(Benchmark):
     """The ML10 benchmark. Contains 10 tasks in its train set and 5 tasks in its test set. The goal position is not part of the observation."""
 
-    def __init__(self, seed=None):
+    def __init__(self, seed=None, precompute_reset_states=False, num_workers=1):
         super().__init__()
         self._train_classes = _env_dict.ML10_V2["train"]
         self._test_classes = _env_dict.ML10_V2["test"]
@@ -259,18 +390,28 @@ class ML10(Benchmark):
 
         test_kwargs = _env_dict.ML10_ARGS_KWARGS["test"]
         self._train_tasks = _make_tasks(
-            self._train_classes, train_kwargs, _ML_OVERRIDE, seed=seed
+            self._train_classes,
+            train_kwargs,
+            _ML_OVERRIDE,
+            seed=seed,
+            num_workers=num_workers,
         )
 
         self._test_tasks = _make_tasks(
-            self._test_classes, test_kwargs, _ML_OVERRIDE, seed=seed
+            self._test_classes,
+            test_kwargs,
+            _ML_OVERRIDE,
+            seed=seed,
+            num_workers=num_workers,
         )
+        if precompute_reset_states:
+            self._precompute_reset_states()
 
 
 class ML45(Benchmark):
     """The ML45 benchmark. Contains 45 tasks in its train set and 5 tasks in its test set (50 in total). The goal position is not part of the observation."""
 
-    def __init__(self, seed=None):
+    def __init__(self, seed=None, precompute_reset_states=False, num_workers=1):
         super().__init__()
         self._train_classes = _env_dict.ML45_V2["train"]
         self._test_classes = _env_dict.ML45_V2["test"]
@@ -278,11 +419,21 @@ class ML45(Benchmark):
         test_kwargs = _env_dict.ML45_ARGS_KWARGS["test"]
 
         self._train_tasks = _make_tasks(
-            self._train_classes, train_kwargs, _ML_OVERRIDE, seed=seed
+            self._train_classes,
+            train_kwargs,
+            _ML_OVERRIDE,
+            seed=seed,
+            num_workers=num_workers,
         )
         self._test_tasks = _make_tasks(
-            self._test_classes, test_kwargs, _ML_OVERRIDE, seed=seed
+            self._test_classes,
+            test_kwargs,
+            _ML_OVERRIDE,
+            seed=seed,
+            num_workers=num_workers,
         )
+        if precompute_reset_states:
+            self._precompute_reset_states()
 
 
 __all__ = ["ML1", "MT1", "ML10", "MT10", "ML45", "MT50"]
@@ -0,0 +1,680 @@
+"""Generates and reads datasets of expert demonstrations with the scripted policies of `metaworld.policies`.
+
+Run `python -m metaworld.dataset --help`, or call `generate_dataset()`. Read a dataset back with
+`Dataset`.
+
+A dataset is a directory of chunks plus an `index.json`. A chunk holds the steps of whole
+episodes back to back, in one `.npy` file per field (`<chunk>.<field>.npy`, loadable
+memory-mapped with `np.load(path, mmap_mode="r")`). The index lists the fields (with their
+dtype and per-step shape), the chunks and the episodes: the env name, the task (the index of
+the task among the tasks of the env), the episode number, the chunk and the step range in it.
+A step holds the observation its action was taken in (`obs`) and the one it led to
+(`next_obs`), so transitions can be sampled without reading the following step.
+It also names the slices of the observations (see `obs_layout()`), so consumers can take views
+of their parts instead of copies.
+
+The action noise of each episode is seeded from the dataset seed, the env name, the task and
+the episode number, so the dataset does not depend on the number of workers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import queue
+import threading
+import zlib
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+import metaworld
+from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import SawyerXYZEnv
+from metaworld.policies import ENV_POLICY_MAP
+from metaworld.policies.policy import Policy
+from metaworld.types import Task
+from metaworld.utils import atomic_write
+
+FORMAT_VERSION = 2
+"""The version of the dataset format, stored in the index."""
+
+INDEX_FILE = "index.json"
+"""The name of the index file in the dataset directory."""
+
+INFO_FIELDS = (
+    "near_object",
+    "grasp_success",
+    "grasp_reward",
+    "in_place_reward",
+    "obj_to_target",
+    "unscaled_reward",
+)
+"""The `info` entries stored as fields, besides `success`."""
+
+
+def _fields(obs_dim: int) -> dict[str, dict[str, Any]]:
+    """Returns the dtype and per-step shape of each field."""
+    fields: dict[str, dict[str, Any]] = {
+        "obs": {"dtype": "float64", "shape": [obs_dim]},
+        "next_obs": {"dtype": "float64", "shape": [obs_dim]},
+        "action": {"dtype": "float32", "shape": [4]},
+        "reward": {"dtype": "float64", "shape": []},
+        "terminated": {"dtype": "bool", "shape": []},
+        "truncated": {"dtype": "bool", "shape": []},
+        "success": {"dtype": "bool", "shape": []},
+    }
+    for key in INFO_FIELDS:
+        fields[key] = {"dtype": "float64", "shape": []}
+    return fields
+
+
+def obs_layout(obs_dim: int) -> dict[str, list[int]]:
+    """Names the slices of the observations of `SawyerXYZEnv._get_obs()`.
+
+    An observation is the current frame, the previous frame and the goal position (zeroed
+    while the goal is hidden). A frame is the hand position, the gripper opening and the
+    objects, each a position and a quaternion, zero padded to a fixed number of objects.
+    The slices of the previous frame are prefixed with `prev_`.
+
+    Args:
+        obs_dim: The size of the observations.
+
+    Returns:
+        A map from the names of the slices to their `[start, stop)` bounds.
+    """
+    frame_len = (obs_dim - 3) // 2
+    layout = {"curr_obs": [0, frame_len], "prev_obs": [frame_len, 2 * frame_len]}
+    frame = {"hand_pos": [0, 3], "gripper_distance_apart": [3, 4]}
+    for i in range((frame_len - 4) // 7):
+        frame[f"obj_{i}_pos"] = [4 + 7 * i, 7 + 7 * i]
+        frame[f"obj_{i}_quat"] = [7 + 7 * i, 11 + 7 * i]
+    for name, (start, stop) in frame.items():
+        layout[name] = [start, stop]
+        layout[f"prev_{name}"] = [frame_len + start, frame_len + stop]
+    layout["goal_pos"] = [2 * frame_len, obs_dim]
+    return layout
+
+
+def chunk_path(path: str, chunk: str, field: str) -> str:
+    """Returns the path of the file of a field of a chunk.
+
+    Args:
+        path: The dataset directory.
+        chunk: The name of the chunk.
+        field: The name of the field.
+
+    Returns:
+        The path of the `.npy` file.
+    """
+    return os.path.join(path, f"{chunk}.{field}.npy")
+
+
+class _ChunkWriter:
+    """Buffers episodes and writes them out in chunks of about `chunk_steps` steps.
+
+    Args:
+        path: The dataset directory.
+        prefix: The prefix of the names of the chunks, unique to the writer.
+        chunk_steps: The number of steps after which a chunk is written. Episodes are never split.
+    """
+
+    def __init__(self, path: str, prefix: str, chunk_steps: int) -> None:
+        self.path = path
+        self.prefix = prefix
+        self.chunk_steps = chunk_steps
+        self.chunks: list[dict[str, Any]] = []
+        self.episodes: list[dict[str, Any]] = []
+        self._buffer: list[dict[str, npt.NDArray[Any]]] = []
+        self._buffered_steps = 0
+
+    def add(self, episode: dict[str, Any], data: dict[str, npt.NDArray[Any]]) -> None:
+        """Adds an episode.
+
+        Args:
+            episode: The index entry of the episode, without its location.
+            data: The arrays of the fields of the episode.
+        """
+        num_steps = len(data["action"])
+        self.episodes.append(
+            {
+                **episode,
+                "chunk": len(self.chunks),
+                "start": self._buffered_steps,
+                "stop": self._buffered_steps + num_steps,
+            }
+        )
+        self._buffer.append(data)
+        self._buffered_steps += num_steps
+        if self._buffered_steps >= self.chunk_steps:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered episodes out as a chunk."""
+        if not self._buffer:
+            return
+        name = f"{self.prefix}-{len(self.chunks):04d}"
+        for field in self._buffer[0]:
+            array = np.concatenate([data[field] for data in self._buffer])
+            atomic_write(
+                chunk_path(self.path, name, field),
+                lambda f: np.save(f, array),
+                "wb",
+            )
+        self.chunks.append({"name": name, "num_steps": self._buffered_steps})
+        self._buffer = []
+        self._buffered_steps = 0
+
+
+def _episode_seed(
+    seed: int, env_name: str, task: int, episode: int
+) -> np.random.SeedSequence:
+    return np.random.SeedSequence([seed, zlib.crc32(env_name.encode()), task, episode])
+
+
+def _rollout(
+    env: SawyerXYZEnv,
+    policy: Policy,
+    rng: np.random.Generator,
+    act_noise_pct: float,
+    max_episode_steps: int,
+    end_on_success: bool,
+) -> dict[str, npt.NDArray[Any]]:
+    """Runs one episode of `policy` in `env`, which must have its task set.
+
+    The noisy actions are clipped to the action space, and stored as taken.
+
+    Returns:
+        The arrays of the fields of the episode. `obs[t]` is the observation `action[t]` was taken
+        in and `next_obs[t]` the one it led to, so the last step keeps its next observation.
+    """
+    obs_dim = env.observation_space.shape[0]
+    low, high = env.action_space.low, env.action_space.high
+    noise_std = act_noise_pct * (high - low)
+
+    obs = np.empty((max_episode_steps + 1, obs_dim), dtype=np.float64)
+    action = np.empty((max_episode_steps, 4), dtype=np.float32)
+    scalars = {
+        field: np.zeros(max_episode_steps, dtype=spec["dtype"])
+        for field, spec in _fields(obs_dim).items()
+        if not spec["shape"]
+    }
+
+    obs[0], _ = env.reset()
+    for t in range(max_episode_steps):
+        # Some scripted policies modify the observation they are given
+        expert_action = policy.get_action(obs[t].copy())
+        action[t] = np.clip(rng.normal(expert_action, noise_std), low, high)
+        _, reward, terminated, truncated, info = env.step(action[t], out=obs[t + 1])
+        scalars["reward"][t] = reward
+        scalars["terminated"][t] = terminated
+        scalars["truncated"][t] = truncated
+        scalars["success"][t] = bool(info["success"])
+        for key in INFO_FIELDS:
+            scalars[key][t] = info[key]
+        if terminated or truncated or (end_on_success and info["success"]):
+            break
+    else:
+        # Ran out of steps before the env truncated the episode
+        scalars["truncated"][t] = True
+    num_steps = t + 1
+
+    return {
+        "obs": obs[:num_steps].copy(),
+        "next_obs": obs[1 : num_steps + 1].copy(),
+        "action": action[:num_steps].copy(),
+        **{field: array[:num_steps].copy() for field, array in scalars.items()},
+    }
+
+
+def _generate_job(
+    path: str,
+    prefix: str,
+    env_name: str,
+    env_cls: type[SawyerXYZEnv],
+    tasks: list[tuple[int, Task]],
+    episodes_per_task: int,
+    act_noise_pct: float,
+    max_episode_steps: int | None,
+    end_on_success: bool,
+    chunk_steps: int,
+    seed: int,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], int]:
+    """Generates the episodes of some tasks of one env and writes them out in chunks.
+
+    Returns:
+        The chunks and the episodes written, with chunk numbers local to the job, and the obs size.
+    """
+    env = env_cls()
+    policy = ENV_POLICY_MAP[env_name]()
+    max_steps = env.max_path_length
+    if max_episode_steps is not None:
+        max_steps = min(max_steps, max_episode_steps)
+    writer = _ChunkWriter(path, prefix, chunk_steps)
+    for task_idx, task in tasks:
+        env.set_task(task)
+        for episode in range(episodes_per_task):
+            seed_seq = _episode_seed(seed, env_name, task_idx, episode)
+            env_seed, noise_seed = seed_seq.spawn(2)
+            env.seed(int(env_seed.generate_state(1)[0]))
+            data = _rollout(
+                env,
+                policy,
+                np.random.default_rng(noise_seed),
+                act_noise_pct,
+                max_steps,
+                end_on_success,
+            )
+            writer.add(
+                {
+                    "env_name": env_name,
+                    "task": task_idx,
+                    "episode": episode,
+                    "success": bool(data["success"].any()),
+                },
+                data,
+            )
+    writer.flush()
+    env.close()
+    return writer.chunks, writer.episodes, env.observation_space.shape[0]
+
+
+def generate_dataset(
+    benchmark: metaworld.Benchmark,
+    path: str,
+    split: str = "train",
+    episodes_per_task: int = 1,
+    tasks_per_env: int | None = None,
+    act_noise_pct: float = 0.1,
+    max_episode_steps: int | None = None,
+    end_on_success: bool = False,
+    chunk_steps: int = 100_000,
+    seed: int = 0,
+    num_workers: int = 1,
+) -> dict[str, Any]:
+    """Generates a dataset of expert demonstrations for the tasks of a benchmark.
+
+    Each episode runs the scripted policy of its env, with Gaussian action noise, until the
+    env truncates it (or it succeeds, with `end_on_success`).
+
+    Args:
+        benchmark: The benchmark to run the expert policies in.
+        path: The directory to write the dataset to. Created if it does not exist.
+        split: Which tasks of the benchmark to use, `"train"` or `"test"`.
+        episodes_per_task: The number of episodes to run in each task.
+        tasks_per_env: The number of tasks of each env to run, `None` for all of them.
+        act_noise_pct: The standard deviation of the action noise, as a fraction of the action space.
+        max_episode_steps: The maximum length of an episode, `None` for the env's `max_path_length`.
+        end_on_success: Whether to end episodes at their first success.
+        chunk_steps: The number of steps after which a chunk is written. Episodes are never split.
+        seed: The seed of the action noise.
+        num_workers: The number of processes to run the episodes in. With a single worker,
+            they are run in the current process.
+
+    Returns:
+        The index of the dataset, as written to `index.json`.
+
+    Raises:
+        ValueError: If `split` is neither `"train"` nor `"test"`, or `max_episode_steps` is
+            not positive.
+    """
+    if max_episode_steps is not None and max_episode_steps < 1:
+        raise ValueError(f"max_episode_steps must be positive, got {max_episode_steps}")
+    if split == "train":
+        classes, tasks = benchmark.train_classes, benchmark.train_tasks
+    elif split == "test":
+        classes, tasks = benchmark.test_classes, benchmark.test_tasks
+    else:
+        raise ValueError(f"split must be 'train' or 'test', got {split!r}")
+    os.makedirs(path, exist_ok=True)
+
+    env_tasks: dict[str, list[tuple[int, Task]]] = {
+        env_name: [] for env_name in classes
+    }
+    for task in tasks:
+        env_tasks[task.env_name].append((len(env_tasks[task.env_name]), task))
+    if tasks_per_env is not None:
+        env_tasks = {name: ts[:tasks_per_env] for name, ts in env_tasks.items()}
+
+    # Split the tasks of each env into enough jobs to keep every worker busy
+    jobs_per_env = max(1, math.ceil(num_workers / max(1, len(env_tasks))))
+    jobs: list[tuple[str, list[tuple[int, Task]]]] = []
+    for env_name, env_task_list in env_tasks.items():
+        size = max(1, math.ceil(len(env_task_list) / jobs_per_env))
+        for start in range(0, len(env_task_list), size):
+            jobs.append((env_name, env_task_list[start : start + size]))
+
+    job_args = (
+        [path] * len(jobs),
+        [f"{i:05d}" for i in range(len(jobs))],
+        [env_name for env_name, _ in jobs],
+        [classes[env_name] for env_name, _ in jobs],
+        [job_tasks for _, job_tasks in jobs],
+        [episodes_per_task] * len(jobs),
+        [act_noise_pct] * len(jobs),
+        [max_episode_steps] * len(jobs),
+        [end_on_success] * len(jobs),
+        [chunk_steps] * len(jobs),
+        [seed] * len(jobs),
+    )
+    num_workers = min(num_workers, len(jobs))
+    if num_workers > 1:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            results = list(executor.map(_generate_job, *job_args))
+    else:
+        results = list(map(_generate_job, *job_args))
+
+    chunks: list[dict[str, Any]] = []
+    episodes: list[dict[str, Any]] = []
+    for job_chunks, job_episodes, _ in results:
+        episodes += [{**ep, "chunk": ep["chunk"] + len(chunks)} for ep in job_episodes]
+        chunks += job_chunks
+    obs_dim = results[0][2] if results else 0
+
+    index = {
+        "format_version": FORMAT_VERSION,
+        "benchmark": type(benchmark).__name__,
+        "split": split,
+        "seed": seed,
+        "act_noise_pct": act_noise_pct,
+        "fields": _fields(obs_dim),
+        "obs_layout": obs_layout(obs_dim),
+        "chunks": chunks,
+        "episodes": episodes,
+    }
+    # The index is written last, so a dataset is never read before it is complete
+    atomic_write(os.path.join(path, INDEX_FILE), lambda f: json.dump(index, f), "w")
+    return index
+
+
+_DONE = object()
+"""Marks the end of the batches of a prefetch thread."""
+
+
+def _prefetch(batches: Iterator[Any], size: int) -> Iterator[Any]:
+    """Produces the items of `batches` in a background thread, up to `size` ahead.
+
+    Exceptions raised while producing an item are re-raised when it would have been
+    yielded. The thread stops once the returned iterator is closed or garbage collected.
+    """
+    items: queue.Queue[Any] = queue.Queue(maxsize=size)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce() -> None:
+        try:
+            for batch in batches:
+                if not put(batch):
+                    return
+        except BaseException as e:
+            put(e)
+        else:
+            put(_DONE)
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = items.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+class Dataset:
+    """Reads a dataset written by `generate_dataset()`.
+
+    The fields of the chunks are memory-mapped, so opening a dataset reads only its index,
+    and episodes are read from disk as they are used.
+
+    Args:
+        path: The dataset directory.
+
+    Raises:
+        ValueError: If the dataset was written in another version of the format.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(os.path.join(path, INDEX_FILE)) as f:
+            self.index: dict[str, Any] = json.load(f)
+        if self.index["format_version"] != FORMAT_VERSION:
+            raise ValueError(
+                f"Dataset format version {self.index['format_version']} "
+                f"is not supported, expected {FORMAT_VERSION}"
+            )
+        self.fields: dict[str, dict[str, Any]] = self.index["fields"]
+        self.episodes: list[dict[str, Any]] = self.index["episodes"]
+        self.obs_layout: dict[str, list[int]] = self.index["obs_layout"]
+        self._chunks = [
+            {
+                field: np.load(chunk_path(path, chunk["name"], field), mmap_mode="r")
+                for field in self.fields
+            }
+            for chunk in self.index["chunks"]
+        ]
+        # The first step of each chunk, counting the steps of all the chunks in order
+        self._chunk_starts = np.cumsum(
+            [0] + [chunk["num_steps"] for chunk in self.index["chunks"]]
+        )
+
+    def __len__(self) -> int:
+        return len(self.episodes)
+
+    @property
+    def num_steps(self) -> int:
+        """The number of steps in the dataset."""
+        return int(self._chunk_starts[-1])
+
+    def obs_slice(self, name: str) -> slice:
+        """Returns the slice of the observations named `name` in `obs_layout`.
+
+        Indexing the last axis of observations with it gives a view, not a copy.
+        """
+        return slice(*self.obs_layout[name])
+
+    def find_episodes(
+        self, env_name: str | None = None, task: int | None = None
+    ) -> list[int]:
+        """Returns the indices of the episodes of an env, or of a task of it.
+
+        Args:
+            env_name: The env of the episodes, `None` for all of them.
+            task: The task of the episodes, `None` for all of them.
+        """
+        return [
+            i
+            for i, episode in enumerate(self.episodes)
+            if (env_name is None or episode["env_name"] == env_name)
+            and (task is None or episode["task"] == task)
+        ]
+
+    def episode(self, i: int) -> dict[str, npt.NDArray[Any]]:
+        """Returns the fields of an episode.
+
+        Args:
+            i: The index of the episode in `episodes`.
+
+        Returns:
+            Read-only memory-mapped views of the fields, one row per step.
+        """
+        episode = self.episodes[i]
+        chunk = self._chunks[episode["chunk"]]
+        return {
+            field: array[episode["start"] : episode["stop"]]
+            for field, array in chunk.items()
+        }
+
+    def episode_steps(
+        self, episodes: Sequence[int] | None = None
+    ) -> npt.NDArray[np.intp]:
+        """Returns the steps of some episodes, numbered across all the chunks in order.
+
+        Args:
+            episodes: The indices of the episodes, `None` for all of them.
+        """
+        if episodes is None:
+            return np.arange(self.num_steps)
+        ranges = [
+            np.arange(ep["start"], ep["stop"]) + self._chunk_starts[ep["chunk"]]
+            for ep in (self.episodes[i] for i in episodes)
+        ]
+        return np.concatenate(ranges) if ranges else np.zeros(0, dtype=np.intp)
+
+    def get_steps(
+        self,
+        steps: npt.NDArray[np.integer],
+        fields: Sequence[str] = ("obs", "action", "reward", "next_obs"),
+    ) -> dict[str, npt.NDArray[Any]]:
+        """Reads some steps of the dataset.
+
+        Args:
+            steps: The steps to read, numbered as in `episode_steps()`.
+            fields: The fields to read.
+
+        Returns:
+            A map from the fields to arrays with a row per step, in the order of `steps`.
+
+        Raises:
+            IndexError: If a step is outside `[0, num_steps)`.
+        """
+        steps = np.asarray(steps)
+        if len(steps) and (steps.min() < 0 or steps.max() >= self.num_steps):
+            raise IndexError(
+                f"steps must be in [0, {self.num_steps}), "
+                f"got steps from {steps.min()} to {steps.max()}"
+            )
+        out = {
+            field: np.empty(
+                (len(steps), *self.fields[field]["shape"]),
+                dtype=self.fields[field]["dtype"],
+            )
+            for field in fields
+        }
+        # Read each chunk's rows in storage order, which is much faster from disk
+        order = np.argsort(steps, kind="stable")
+        sorted_steps = steps[order]
+        bounds = np.searchsorted(sorted_steps, self._chunk_starts)
+        for c, chunk in enumerate(self._chunks):
+            lo, hi = bounds[c], bounds[c + 1]
+            if lo == hi:
+                continue
+            rows = sorted_steps[lo:hi] - self._chunk_starts[c]
+            for field in fields:
+                out[field][order[lo:hi]] = chunk[field][rows]
+        return out
+
+    def iter_batches(
+        self,
+        batch_size: int,
+        fields: Sequence[str] = ("obs", "action", "reward", "next_obs"),
+        episodes: Sequence[int] | None = None,
+        shuffle: bool = True,
+        drop_last: bool = False,
+        seed: int | None = None,
+        prefetch: int = 2,
+    ) -> Iterator[dict[str, npt.NDArray[Any]]]:
+        """Iterates once over the steps of the dataset in minibatches.
+
+        With `shuffle`, the steps of all the envs and tasks are shuffled together, so every
+        batch mixes them.
+
+        Args:
+            batch_size: The number of steps in a batch.
+            fields: The fields to read.
+            episodes: The indices of the episodes to read, `None` for all of them.
+            shuffle: Whether to shuffle the steps, rather than read them in order.
+            drop_last: Whether to drop the last batch if it is smaller than `batch_size`.
+            seed: The seed of the shuffle.
+            prefetch: The number of batches read ahead in a background thread. With 0,
+                batches are read when they are requested.
+
+        Returns:
+            An iterator over the batches, maps from the fields to arrays with a row per step.
+
+        Raises:
+            ValueError: If `batch_size` is not positive.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        steps = self.episode_steps(episodes)
+        if shuffle:
+            steps = np.random.default_rng(seed).permutation(steps)
+        stop = len(steps) - len(steps) % batch_size if drop_last else len(steps)
+        batches = (
+            self.get_steps(steps[start : start + batch_size], fields)
+            for start in range(0, stop, batch_size)
+        )
+        if prefetch > 0:
+            batches = _prefetch(batches, prefetch)
+        return batches
+
+
+def _make_benchmark(name: str, env_name: str | None, seed: int) -> metaworld.Benchmark:
+    if name in ("MT1", "ML1"):
+        if env_name is None:
+            raise ValueError(f"{name} needs an --env-name")
+        return getattr(metaworld, name)(env_name, seed=seed)
+    return getattr(metaworld, name)(seed=seed)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Generates a dataset from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Generate a dataset of expert demonstrations with the scripted policies."
+    )
+    parser.add_argument(
+        "benchmark", choices=["MT1", "MT10", "MT50", "ML1", "ML10", "ML45"]
+    )
+    parser.add_argument("path", help="The directory to write the dataset to.")
+    parser.add_argument("--env-name", help="The env of MT1 and ML1.")
+    parser.add_argument("--split", choices=["train", "test"], default="train")
+    parser.add_argument("--episodes-per-task", type=int, default=1)
+    parser.add_argument("--tasks-per-env", type=int, default=None)
+    parser.add_argument("--act-noise-pct", type=float, default=0.1)
+    parser.add_argument("--max-episode-steps", type=int, default=None)
+    parser.add_argument("--end-on-success", action="store_true")
+    parser.add_argument("--chunk-steps", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--num-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    index = generate_dataset(
+        _make_benchmark(args.benchmark, args.env_name, args.seed),
+        args.path,
+        split=args.split,
+        episodes_per_task=args.episodes_per_task,
+        tasks_per_env=args.tasks_per_env,
+        act_noise_pct=args.act_noise_pct,
+        max_episode_steps=args.max_episode_steps,
+        end_on_success=args.end_on_success,
+        chunk_steps=args.chunk_steps,
+        seed=args.seed,
+        num_workers=args.num_workers,
+    )
+    num_steps = sum(chunk["num_steps"] for chunk in index["chunks"])
+    print(
+        f"Wrote {len(index['episodes'])} episodes ({num_steps} steps) "
+        f"in {len(index['chunks'])} chunks to {args.path}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""A persistent cache of the compiled `MjModel` of every asset XML.
+
+It lives in the `models` subdirectory of the cache directory and is enabled by the same
+`METAWORLD_CACHE_DIR` environment variable as the task cache (see `metaworld.utils`).
+Each model is stored as an `.mjb` binary keyed by a hash of the MuJoCo version and the
+contents of the XML file, of every file it (transitively) includes and of every mesh,
+texture and other asset file they reference. Changing any of those files invalidates
+the entry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import xml.etree.ElementTree as ET
+
+import mujoco
+import numpy as np
+
+from metaworld.utils import atomic_write, get_cache_dir
+
+_COMPILER_DIRS = {"mesh": "meshdir", "texture": "texturedir", "hfield": "assetdir"}
+"""The `compiler` attribute that sets the directory of each kind of asset (besides `assetdir`)."""
+
+
+def _file_digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def _resolve(candidates: list[str]) -> str | None:
+    for path in candidates:
+        if os.path.isfile(path):
+            return os.path.normpath(path)
+    return None
+
+
+def xml_tree_files(xml_path: str) -> list[tuple[str, str | None]]:
+    """Lists the files a model XML depends on.
+
+    Included files are resolved relative to the file that includes them, assets
+    relative to the directory of the main file (and the `compiler` asset directories).
+
+    Args:
+        xml_path: The path to the main XML file of the model.
+
+    Returns:
+        A `(file, resolved_path)` pair for `xml_path` and each file it references, in document
+        order. `resolved_path` is `None` for files that do not exist.
+    """
+    main_dir = os.path.dirname(os.path.abspath(xml_path))
+    compiler_dirs: dict[str, str] = {}
+    files: list[tuple[str, str | None]] = [(xml_path, os.path.abspath(xml_path))]
+
+    def visit(path: str) -> None:
+        including_dir = os.path.dirname(path)
+        for element in ET.parse(path).iter():
+            if element.tag == "compiler":
+                compiler_dirs.update(
+                    {k: v for k, v in element.attrib.items() if k.endswith("dir")}
+                )
+            file_name = element.get("file")
+            if file_name is None:
+                continue
+            if element.tag == "include":
+                resolved = _resolve(
+                    [
+                        os.path.join(including_dir, file_name),
+                        os.path.join(main_dir, file_name),
+                    ]
+                )
+                files.append((file_name, resolved))
+                if resolved is not None:
+                    visit(resolved)
+            else:
+                asset_dirs = [
+                    compiler_dirs.get(_COMPILER_DIRS.get(element.tag, "assetdir"), ""),
+                    compiler_dirs.get("assetdir", ""),
+                ]
+                files.append(
+                    (
+                        file_name,
+                        _resolve(
+                            [
+                                os.path.join(main_dir, asset_dir, file_name)
+                                for asset_dir in asset_dirs
+                            ]
+                            + [os.path.join(including_dir, file_name)]
+                        ),
+                    )
+                )
+
+    visit(os.path.abspath(xml_path))
+    return files
+
+
+def model_cache_key(xml_path: str) -> str:
+    """Computes the cache key of the model compiled from the given XML file.
+
+    Args:
+        xml_path: The path to the main XML file of the model.
+
+    Returns:
+        The key, a hex digest.
+    """
+    h = hashlib.blake2b(mujoco.__version__.encode(), digest_size=20)
+    for file_name, resolved in xml_tree_files(xml_path):
+        h.update(file_name.encode())
+        h.update(b"\0" if resolved is None else _file_digest(resolved).encode())
+    return h.hexdigest()
+
+
+def load_model(xml_path: str) -> mujoco.MjModel:
+    """Loads the compiled model of the given XML file from the cache, compiling and storing it on a miss.
+
+    Compiles the model without caching it if the cache is disabled.
+
+    Args:
+        xml_path: The path to the main XML file of the model.
+
+    Returns:
+        The model.
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return mujoco.MjModel.from_xml_path(xml_path)
+
+    model_dir = os.path.join(cache_dir, "models")
+    path = os.path.join(model_dir, f"{model_cache_key(xml_path)}.mjb")
+    if os.path.isfile(path):
+        try:
+            return mujoco.MjModel.from_binary_path(path)
+        except ValueError:
+            pass  # A corrupt entry, overwrite it
+
+    model = mujoco.MjModel.from_xml_path(xml_path)
+    buffer = np.empty(mujoco.mj_sizeModel(model), dtype=np.uint8)
+    mujoco.mj_saveModel(model, None, buffer)
+    os.makedirs(model_dir, exist_ok=True)
+    atomic_write(path, lambda f: f.write(buffer), "wb")
+    return model
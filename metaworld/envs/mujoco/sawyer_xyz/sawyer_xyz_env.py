@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import copy
+import functools
+import math
 import pickle
+from collections import OrderedDict
 from typing import Any, Callable, Literal, SupportsFloat
 
 import mujoco
@@ -13,13 +16,38 @@ from gymnasium.envs.mujoco import MujocoEnv as mjenv_gym
 from gymnasium.spaces import Box, Discrete, Space
 from gymnasium.utils import seeding
 from gymnasium.utils.ezpickle import EzPickle
-from typing_extensions import TypeAlias
-
-from metaworld.envs.mujoco.utils import reward_utils
-from metaworld.types import XYZ, EnvironmentStateDict, ObservationDict, Task
+from typing_extensions import Self, TypeAlias
+
+from metaworld.envs.mujoco.model_cache import load_model
+from metaworld.envs.mujoco.utils import reward_utils, step_timing
+from metaworld.envs.mujoco.utils.contacts import ContactQuery
+from metaworld.types import (
+    XYZ,
+    EnvironmentStateDict,
+    ObservationDict,
+    ResetStateDict,
+    SavedStateDict,
+    Task,
+)
 
 RenderMode: TypeAlias = "Literal['human', 'rgb_array', 'depth_array']"
 
+_PER_INSTANCE_MODEL_FIELDS = ("body_pos", "site_pos")
+"""The `MjModel` fields the environments set on reset, kept per instance when the model is shared."""
+
+_DATA_VIEW_FIELDS = (
+    "qpos",
+    "qvel",
+    "xpos",
+    "xquat",
+    "xipos",
+    "site_xpos",
+    "geom_xpos",
+    "mocap_pos",
+    "mocap_quat",
+)
+"""The `MjData` fields that environment attributes may be views of (e.g. `self.get_body_com()`)."""
+
 
 class SawyerMocapBase(mjenv_gym):
     """Provides some commonly-shared functions for Sawyer Mujoco envs that use mocap for XYZ control."""
@@ -35,6 +63,22 @@ class SawyerMocapBase(mjenv_gym):
         "render_fps": 80,
     }
 
+    _BODY_NAMES: tuple[str, ...] = (
+        "hand",
+        "mocap",
+        "leftpad",
+        "rightpad",
+        "leftclaw",
+        "rightclaw",
+    )
+    """The bodies whose data the environment reads. Subclasses declare the names they use on top of those of their bases."""
+    _SITE_NAMES: tuple[str, ...] = ("leftEndEffector", "rightEndEffector")
+    """The sites whose data the environment reads, see `_BODY_NAMES`."""
+    _GEOM_NAMES: tuple[str, ...] = ("leftpad_geom", "rightpad_geom")
+    """The geoms whose data the environment reads, see `_BODY_NAMES`."""
+    _JOINT_NAMES: tuple[str, ...] = ()
+    """The joints whose position the environment reads, see `_BODY_NAMES`."""
+
     @property
     def sawyer_observation_space(self) -> Space:
         raise NotImplementedError
@@ -47,6 +91,7 @@ class SawyerMocapBase(mjenv_gym):
         camera_name: str | None = None,
         camera_id: int | None = None,
     ) -> None:
+        self._kinematics_stale = False
         mjenv_gym.__init__(
             self,
             model_name,
@@ -58,10 +103,130 @@ class SawyerMocapBase(mjenv_gym):
         )
         self.reset_mocap_welds()
         self.frame_skip = frame_skip
+        self._resolve_entity_names()
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _declared_names(cls, attribute: str) -> tuple[str, ...]:
+        """Collects the names declared in the given class attribute by the class and its bases."""
+        names: dict[str, None] = {}
+        for klass in reversed(cls.__mro__):
+            names.update(dict.fromkeys(klass.__dict__.get(attribute, ())))
+        return tuple(names)
+
+    def _resolve_entity_names(self) -> None:
+        """Resolves the declared entity names to indices and caches views of their `MjData` fields.
+
+        The views stay valid for the lifetime of `self.data`, so this must be called again
+        whenever it is replaced. Reading the tables is plain dict and array indexing, unlike
+        `self.data.body(name)` and friends, which look the name up and build a new accessor
+        on every call. Also creates the `ContactQuery` of `self.data`.
+        """
+        model, data = self.model, self.data
+        self._body_ids = {
+            name: model.body(name).id for name in self._declared_names("_BODY_NAMES")
+        }
+        self._site_ids = {
+            name: model.site(name).id for name in self._declared_names("_SITE_NAMES")
+        }
+        self._geom_ids = {
+            name: model.geom(name).id for name in self._declared_names("_GEOM_NAMES")
+        }
+        self._body_xpos = {name: data.xpos[i] for name, i in self._body_ids.items()}
+        self._body_xquat = {name: data.xquat[i] for name, i in self._body_ids.items()}
+        self._body_xmat = {name: data.xmat[i] for name, i in self._body_ids.items()}
+        self._site_xpos = {
+            name: data.site_xpos[i] for name, i in self._site_ids.items()
+        }
+        self._site_xmat = {
+            name: data.site_xmat[i] for name, i in self._site_ids.items()
+        }
+        self._geom_xpos = {
+            name: data.geom_xpos[i] for name, i in self._geom_ids.items()
+        }
+        self._geom_xmat = {
+            name: data.geom_xmat[i] for name, i in self._geom_ids.items()
+        }
+        self._joint_qpos = {
+            name: data.joint(name).qpos for name in self._declared_names("_JOINT_NAMES")
+        }
+        self._contacts = ContactQuery(data)
+
+    def do_simulation(self, ctrl: Any, n_frames: int) -> None:
+        """Steps the simulation `n_frames` times, applying the control `ctrl`."""
+        super().do_simulation(ctrl, n_frames)
+        # `mj_step` runs the forward pass of the state it starts from, so the kinematics
+        # include any state set before, as they would if that had run its own pass
+        self._kinematics_stale = False
+        self._contacts.invalidate()
+
+    def set_state(
+        self, qpos: npt.NDArray[np.float64], qvel: npt.NDArray[np.float64]
+    ) -> None:
+        """Sets the joint positions and velocities and runs a forward pass."""
+        self._set_state_deferred(qpos, qvel)
+        self._forward()
+
+    def _set_state_deferred(
+        self, qpos: npt.NDArray[np.float64], qvel: npt.NDArray[np.float64]
+    ) -> None:
+        """Sets the joint positions and velocities, without running a forward pass.
+
+        The kinematics are marked stale instead, and `_forward()` updates them before they are
+        next read, so that the several states set during a reset take a single forward pass.
+        """
+        assert qpos.shape == (self.model.nq,) and qvel.shape == (self.model.nv,)
+        self.data.qpos[:] = qpos
+        self.data.qvel[:] = qvel
+        if self.model.na == 0:
+            self.data.act[:] = None
+        self._invalidate_kinematics()
+
+    def _invalidate_kinematics(self) -> None:
+        """Marks the kinematics as stale, e.g. after setting the position of a body of the model."""
+        self._kinematics_stale = True
+        self._contacts.invalidate()
+
+    def _forward(self) -> None:
+        """Runs a forward pass if the kinematics are stale.
+
+        Everything that reads the positions, orientations or contacts of the simulation calls
+        this first (`get_body_com()`, `_get_site_pos()`, `_get_obs()`, ...), except for the raw
+        `MjData` views of `_resolve_entity_names()`.
+        """
+        if self._kinematics_stale:
+            mujoco.mj_forward(self.model, self.data)
+            self._kinematics_stale = False
+            self._contacts.invalidate()
+
+    def _initialize_simulation(self) -> tuple[mujoco.MjModel, mujoco.MjData]:
+        """Loads the model (see `model_cache.load_model()`), or only creates a new `MjData` if this instance shares the model of another one."""
+        shared_model = getattr(self, "_shared_model", None)
+        if shared_model is not None:
+            return shared_model, mujoco.MjData(shared_model)
+        model = load_model(self.fullpath)
+        # Only grow the offscreen framebuffer, as `MujocoEnv` does
+        model.vis.global_.offwidth = max(model.vis.global_.offwidth, self.width)
+        model.vis.global_.offheight = max(model.vis.global_.offheight, self.height)
+        return model, mujoco.MjData(model)
 
     def get_endeff_pos(self) -> npt.NDArray[Any]:
         """Returns the position of the end effector."""
-        return self.data.body("hand").xpos
+        self._forward()
+        return self._body_xpos["hand"]
+
+    def get_body_com(self, body_name: str) -> npt.NDArray[np.float64]:
+        """Returns the position of a body, a view of `self.data.xpos`.
+
+        Args:
+            body_name: The name of the body.
+
+        Returns:
+            Flat, 3 element array indicating the body's position.
+        """
+        self._forward()
+        xpos = self._body_xpos.get(body_name)
+        return self.data.body(body_name).xpos if xpos is None else xpos
 
     @property
     def tcp_center(self) -> npt.NDArray[Any]:
@@ -70,9 +235,10 @@ class SawyerMocapBase(mjenv_gym):
         Returns:
             3-element position.
         """
-        right_finger_pos = self.data.site("rightEndEffector")
-        left_finger_pos = self.data.site("leftEndEffector")
-        tcp_center = (right_finger_pos.xpos + left_finger_pos.xpos) / 2.0
+        self._forward()
+        right_finger_pos = self._site_xpos["rightEndEffector"]
+        left_finger_pos = self._site_xpos["leftEndEffector"]
+        tcp_center = (right_finger_pos + left_finger_pos) / 2.0
         return tcp_center
 
     @property
@@ -123,6 +289,7 @@ class SawyerMocapBase(mjenv_gym):
             frame_skip=self.frame_skip,
             observation_space=self.sawyer_observation_space,
         )
+        self._resolve_entity_names()
         self.set_env_state(state["mocap"])
 
     def reset_mocap_welds(self) -> None:
@@ -151,6 +318,32 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
     TARGET_RADIUS: float = 0.05
     """Upper bound for distance from the target when checking for task completion."""
 
+    _MOCAP_QUAT = np.array([1.0, 0.0, 1.0, 0.0])
+    """The orientation the mocap body (and with it the hand) is held at."""
+
+    _HAND_RESET_CACHE_SIZE: int = 64
+    """The number of settled hand states `_reset_hand()` keeps, the least recently used are evicted first. More than the 50 tasks of an environment in a benchmark."""
+
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = (
+        "curr_path_length",
+        "_prev_obs",
+        "_last_stable_obs",
+        "_did_see_sim_exception",
+        "_kinematics_stale",
+        "_last_rand_vec",
+        "_target_pos",
+        "obj_init_pos",
+        "init_tcp",
+        "init_left_pad",
+        "init_right_pad",
+    )
+    """The attributes that `reset()` and `step()` assign, saved by `save_state()`. Subclasses declare the ones they assign on top of those of their bases."""
+
+    _RAND_VEC_MIN_XY_DISTANCE: float | None = None
+    """If set, `reset_model()` resamples the rand vec until the XY positions it holds (elements 0:2 and 3:5) are at least this far apart.
+
+    Environments that check the distance differently override `_is_valid_rand_vec()`."""
+
     class _Decorators:
         @classmethod
         def assert_task_is_set(cls, func: Callable) -> Callable:
@@ -204,6 +397,12 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         self.active_discrete_goal: int | None = None
 
         self._partially_observable: bool = True
+        self.cache_hand_resets: bool = True
+        self._hand_reset_states: OrderedDict[bytes, npt.NDArray[np.float64]] = (
+            OrderedDict()
+        )
+        self._reset_state: ResetStateDict | None = None
+        self._model_fields: dict[str, npt.NDArray[np.float64]] | None = None
 
         super().__init__(
             self.model_name,
@@ -227,6 +426,14 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
             dtype=np.float32,
         )
         self._obs_obj_max_len: int = 14
+        self._obs_bounds: dict[
+            bool, tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]
+        ] = {}
+        # `_get_obs()` alternates between these, so `_prev_obs` is never overwritten
+        self._curr_obs_buffers = (
+            np.zeros(4 + self._obs_obj_max_len),
+            np.zeros(4 + self._obs_obj_max_len),
+        )
         self._set_task_called: bool = False
         self.hand_init_pos: npt.NDArray[Any] | None = None  # OVERRIDE ME
         self._target_pos: npt.NDArray[Any] | None = None  # OVERRIDE ME
@@ -255,6 +462,115 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
             action_rot_scale,
         )
 
+    @classmethod
+    def make_instances(cls, num_instances: int, **kwargs: Any) -> list[Self]:
+        """Creates instances of the environment that share a single compiled `MjModel`.
+
+        Only the first instance parses and compiles the XML, the others just allocate their own `MjData`.
+        The model fields the environments set on reset (body and site positions) are kept per
+        instance and loaded into the shared model whenever an instance uses it, so the instances
+        must not be stepped concurrently.
+
+        Args:
+            num_instances: The number of instances to create.
+            **kwargs: The keyword arguments passed to the constructor of each instance.
+
+        Returns:
+            The instances.
+        """
+        assert num_instances > 0, f"num_instances must be positive, got {num_instances}"
+        envs = [cls(**kwargs)]
+        for _ in range(num_instances - 1):
+            env = cls.__new__(cls)
+            env._shared_model = envs[0].model
+            env.__init__(**kwargs)
+            envs.append(env)
+        for env in envs:
+            env._save_model_fields(create=True)
+        return envs
+
+    def clone(self) -> Self:
+        """Returns a copy of the environment that shares its compiled `MjModel`.
+
+        The copy gets a copy of this instance's `MjData` and of its task and episode
+        attributes, so it continues the current episode exactly as this instance would. Unlike
+        pickling, nothing is recompiled. As with `make_instances()`, the model fields the
+        environments set on reset are kept per instance, so the copy and this instance must
+        not be stepped concurrently.
+
+        Returns:
+            The copy.
+        """
+        if self._model_fields is None:
+            self._save_model_fields(create=True)
+        data = copy.copy(self.data)
+        memo: dict[int, Any] = {
+            id(self.model): self.model,
+            id(self.data): data,
+            # Caches that only depend on the task, shared rather than copied
+            id(self._hand_reset_states): self._hand_reset_states,
+            id(self._reset_state): self._reset_state,
+            id(self.mujoco_renderer): None,
+        }
+        state = copy.deepcopy(self.__dict__, memo)
+
+        env = self.__class__.__new__(self.__class__)
+        env.__dict__.update(state)
+        env._shared_model = self.model
+        renderer = self.mujoco_renderer
+        env.mujoco_renderer = type(renderer)(
+            self.model,
+            data,
+            renderer.default_cam_config,
+            renderer.width,
+            renderer.height,
+            renderer.max_geom,
+            renderer.camera_id,
+            None,
+            renderer._vopt,
+        )
+        env._resolve_entity_names()
+        # Point the attributes that are views of this instance's data at the copy's
+        env._set_data_views(
+            {
+                name: view
+                for name, value in self.__dict__.items()
+                if (view := self._find_data_view(value)) is not None
+            }
+        )
+        return env
+
+    def _save_model_fields(self, create: bool = False) -> None:
+        """Copies this instance's values of the per-instance model fields out of a shared model.
+
+        Args:
+            create: Whether to start keeping the fields, for an instance that did not yet.
+        """
+        if create:
+            self._model_fields = {
+                name: getattr(self.model, name).copy()
+                for name in _PER_INSTANCE_MODEL_FIELDS
+            }
+        elif self._model_fields is not None:
+            for name, value in self._model_fields.items():
+                value[:] = getattr(self.model, name)
+
+    def _load_model_fields(self) -> None:
+        """Writes this instance's values of the per-instance model fields into a shared model."""
+        if self._model_fields is not None:
+            for name, value in self._model_fields.items():
+                getattr(self.model, name)[:] = value
+
+    def render(self) -> npt.NDArray[np.uint8] | None:
+        """Renders the environment.
+
+        Returns:
+            The rendered frame, depending on `render_mode`.
+        """
+        self._load_model_fields()
+        self._forward()
+        return super().render()
+
     def seed(self, seed: int) -> list[int]:
         """Seeds the environment.
 
@@ -293,6 +609,7 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         del data["rand_vec"]
         self._partially_observable = data["partially_observable"]
         del data["partially_observable"]
+        self._reset_state = data.pop("reset_state", None)
         self._set_task_inner(**data)
 
     def set_xyz_action(self, action: npt.NDArray[Any]) -> None:
@@ -302,16 +619,12 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         Args:
             action: The action to apply (in offsets between :math:`[-1, 1]` for each axis in XYZ).
         """
-        action = np.clip(action, -1, 1)
-        pos_delta = action * self.action_scale
-        new_mocap_pos = self.data.mocap_pos + pos_delta[None]
-        new_mocap_pos[0, :] = np.clip(
-            new_mocap_pos[0, :],
-            self.mocap_low,
-            self.mocap_high,
-        )
-        self.data.mocap_pos = new_mocap_pos
-        self.data.mocap_quat = np.array([1, 0, 1, 0])
+        pos_delta = np.clip(action, -1, 1) * self.action_scale
+        mocap_pos = self.data.mocap_pos
+        mocap_pos += pos_delta
+        np.maximum(mocap_pos[0], self.mocap_low, out=mocap_pos[0])
+        np.minimum(mocap_pos[0], self.mocap_high, out=mocap_pos[0])
+        self.data.mocap_quat[:] = self._MOCAP_QUAT
 
     def discretize_goal_space(self, goals: list) -> None:
         """Discretizes the goal space into a Discrete space.
@@ -336,7 +649,7 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         qvel = self.data.qvel.flat.copy()
         qpos[9:12] = pos.copy()
         qvel[9:15] = 0
-        self.set_state(qpos, qvel)
+        self._set_state_deferred(qpos, qvel)
 
     def _get_site_pos(self, site_name: str) -> npt.NDArray[np.float64]:
         """Gets the position of a given site.
@@ -347,11 +660,17 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         Returns:
             Flat, 3 element array indicating site's location.
         """
-        return self.data.site(site_name).xpos.copy()
+        self._forward()
+        xpos = self._site_xpos.get(site_name)
+        return (self.data.site(site_name).xpos if xpos is None else xpos).copy()
 
     def _set_pos_site(self, name: str, pos: npt.NDArray[Any]) -> None:
         """Sets the position of a given site.
 
+        Sets the position of the site in the model (`model.site_pos`, relative to the body the
+        site is attached to), so that later forward passes keep it, as well as its current
+        position (`data.site_xpos`), so that no forward pass is needed to update it.
+
         Args:
             name: The site's name
             pos: Flat, 3 element array indicating site's location
@@ -359,7 +678,12 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         assert isinstance(pos, np.ndarray)
         assert pos.ndim == 1
 
-        self.data.site(name).xpos = pos[:3]
+        self._forward()
+        site = self.model.site(name)
+        body_id = site.bodyid[0]
+        body_xmat = self.data.xmat[body_id].reshape(3, 3)
+        site.pos = body_xmat.T @ (pos[:3] - self.data.xpos[body_id])
+        self.data.site_xpos[site.id] = pos[:3]
 
     @property
     def _target_site_config(self) -> list[tuple[str, npt.NDArray[Any]]]:
@@ -385,40 +709,48 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         Returns:
             Whether the gripper is touching the object
         """
-
-        leftpad_geom_id = self.data.geom("leftpad_geom").id
-        rightpad_geom_id = self.data.geom("rightpad_geom").id
-
-        leftpad_object_contacts = [
-            x
-            for x in self.data.contact
-            if (
-                leftpad_geom_id in (x.geom1, x.geom2)
-                and object_geom_id in (x.geom1, x.geom2)
+        self._forward()
+        leftpad_object_contact_force, rightpad_object_contact_force = (
+            self._contacts.pair_forces(
+                [
+                    (self._geom_ids["leftpad_geom"], object_geom_id),
+                    (self._geom_ids["rightpad_geom"], object_geom_id),
+                ]
             )
-        ]
+        )
+        return 0 < leftpad_object_contact_force and 0 < rightpad_object_contact_force
 
-        rightpad_object_contacts = [
-            x
-            for x in self.data.contact
-            if (
-                rightpad_geom_id in (x.geom1, x.geom2)
-                and object_geom_id in (x.geom1, x.geom2)
-            )
-        ]
+    @staticmethod
+    def _xmat_to_quat(xmat: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """Converts a rotation matrix (e.g. the `xmat` of a geom, site or body) to a quaternion.
 
-        leftpad_object_contact_force = sum(
-            self.data.efc_force[x.efc_address] for x in leftpad_object_contacts
-        )
+        Gives bit for bit the same result as `scipy.spatial.transform.Rotation.from_matrix(xmat).as_quat()`
+        (the same algorithm, in the same order of operations), at a fraction of its cost. The
+        orthogonalization scipy applies to matrices that are not orthogonal is skipped, as MuJoCo's
+        matrices are orthogonal up to rounding.
 
-        rightpad_object_contact_force = sum(
-            self.data.efc_force[x.efc_address] for x in rightpad_object_contacts
-        )
+        Args:
+            xmat: The rotation matrix, flat (9 elements, as stored by MuJoCo) or 3x3.
 
-        return 0 < leftpad_object_contact_force and 0 < rightpad_object_contact_force
+        Returns:
+            The quaternion, scalar-last (x, y, z, w).
+        """
+        m00, m01, m02, m10, m11, m12, m20, m21, m22 = xmat.ravel().tolist()
+        trace = m00 + m11 + m22
+        # Start from the largest of the diagonal elements and the trace (the first one on ties)
+        if m00 >= m11 and m00 >= m22 and m00 >= trace:
+            x, y, z, w = 1 - trace + 2 * m00, m10 + m01, m20 + m02, m21 - m12
+        elif m11 >= m22 and m11 >= trace:
+            x, y, z, w = m10 + m01, 1 - trace + 2 * m11, m21 + m12, m02 - m20
+        elif m22 >= trace:
+            x, y, z, w = m20 + m02, m21 + m12, 1 - trace + 2 * m22, m10 - m01
+        else:
+            x, y, z, w = m21 - m12, m02 - m20, m10 - m01, 1 + trace
+        norm = math.sqrt(x * x + y * y + z * z + w * w)
+        return np.array([x / norm, y / norm, z / norm, w / norm])
 
     def _get_id_main_object(self) -> int:
-        return self.data.geom("objGeom").id
+        return self._geom_ids["objGeom"]
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
         """Retrieves object position(s) from mujoco properties or instance vars.
@@ -450,20 +782,28 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         assert self._target_pos.ndim == 1
         return self._target_pos
 
-    def _get_curr_obs_combined_no_goal(self) -> npt.NDArray[np.float64]:
+    def _get_curr_obs_combined_no_goal(
+        self, out: npt.NDArray[np.float64] | None = None
+    ) -> npt.NDArray[np.float64]:
         """Combines the end effector's {pos, closed amount} and the object(s)' {pos, quat} into a single flat observation.
 
         Note: The goal's position is *not* included in this.
 
+        Args:
+            out: The array to write the observation into. A new one is allocated if `None`.
+
         Returns:
             The flat observation array (18 elements)
         """
+        if out is None:
+            out = np.empty(4 + self._obs_obj_max_len, dtype=np.float64)
 
-        pos_hand = self.get_endeff_pos()
+        self._forward()
+        out[:3] = self.get_endeff_pos()
 
         finger_right, finger_left = (
-            self.data.body("rightclaw"),
-            self.data.body("leftclaw"),
+            self._body_xpos["rightclaw"],
+            self._body_xpos["leftclaw"],
         )
         # the gripper can be at maximum about ~0.1 m apart.
         # dividing by 0.1 normalized the gripper distance between
@@ -472,37 +812,46 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         # clipping removes the effects of this random extra distance
         # that is produced by mujoco
 
-        gripper_distance_apart = np.linalg.norm(finger_right.xpos - finger_left.xpos)
-        gripper_distance_apart = np.clip(gripper_distance_apart / 0.1, 0.0, 1.0)
+        gripper_distance_apart = np.linalg.norm(finger_right - finger_left)
+        out[3] = min(max(gripper_distance_apart / 0.1, 0.0), 1.0)
 
-        obs_obj_padded = np.zeros(self._obs_obj_max_len)
         obj_pos = self._get_pos_objects()
         assert len(obj_pos) % 3 == 0
-        obj_pos_split = np.split(obj_pos, len(obj_pos) // 3)
-
         obj_quat = self._get_quat_objects()
         assert len(obj_quat) % 4 == 0
-        obj_quat_split = np.split(obj_quat, len(obj_quat) // 4)
-        obs_obj_padded[: len(obj_pos) + len(obj_quat)] = np.hstack(
-            [np.hstack((pos, quat)) for pos, quat in zip(obj_pos_split, obj_quat_split)]
-        )
-        return np.hstack((pos_hand, gripper_distance_apart, obs_obj_padded))
-
-    def _get_obs(self) -> npt.NDArray[np.float64]:
+        num_objs = len(obj_pos) // 3
+        obs_obj = out[4:]
+        for i in range(num_objs):
+            obs_obj[7 * i : 7 * i + 3] = obj_pos[3 * i : 3 * i + 3]
+            obs_obj[7 * i + 3 : 7 * i + 7] = obj_quat[4 * i : 4 * i + 4]
+        obs_obj[7 * num_objs :] = 0.0
+        return out
+
+    def _get_obs(
+        self, out: npt.NDArray[np.float64] | None = None
+    ) -> npt.NDArray[np.float64]:
         """Frame stacks `_get_curr_obs_combined_no_goal()` and concatenates the goal position to form a single flat observation.
 
+        Args:
+            out: The array to write the observation into. A new one is allocated if `None`.
+
         Returns:
             The flat observation array (39 elements)
         """
+        if out is None:
+            out = np.empty(2 * (4 + self._obs_obj_max_len) + 3, dtype=np.float64)
+        curr_obs = self._curr_obs_buffers[self._prev_obs is self._curr_obs_buffers[0]]
+        self._get_curr_obs_combined_no_goal(out=curr_obs)
         # do frame stacking
-        pos_goal = self._get_pos_goal()
+        curr_len = len(curr_obs)
+        out[:curr_len] = curr_obs
+        out[curr_len : 2 * curr_len] = self._prev_obs
         if self._partially_observable:
-            pos_goal = np.zeros_like(pos_goal)
-        curr_obs = self._get_curr_obs_combined_no_goal()
-        # do frame stacking
-        obs = np.hstack((curr_obs, self._prev_obs, pos_goal))
+            out[2 * curr_len :] = 0.0
+        else:
+            out[2 * curr_len :] = self._get_pos_goal()
         self._prev_obs = curr_obs
-        return obs
+        return out
 
     def _get_obs_dict(self) -> ObservationDict:
         obs = self._get_obs()
@@ -554,34 +903,57 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
             dtype=np.float64,
         )
 
+    def _get_obs_bounds(
+        self,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Returns the bounds of `sawyer_observation_space`, which are computed once for each value of `_partially_observable`.
+
+        Returns:
+            The `(low, high)` tuple.
+        """
+        bounds = self._obs_bounds.get(self._partially_observable)
+        if bounds is None:
+            space = self.sawyer_observation_space
+            bounds = (space.low, space.high)
+            self._obs_bounds[self._partially_observable] = bounds
+        return bounds
+
     @_Decorators.assert_task_is_set
     def step(
-        self, action: npt.NDArray[np.float32]
+        self,
+        action: npt.NDArray[np.float32],
+        out: npt.NDArray[np.float64] | None = None,
     ) -> tuple[npt.NDArray[np.float64], SupportsFloat, bool, bool, dict[str, Any]]:
         """Step the environment.
 
         Args:
             action: The action to take. Must be a 4 element array of floats.
+            out: The array to write the next observation into (and return). A new one is allocated if `None`.
 
         Returns:
             The (next_obs, reward, terminated, truncated, info) tuple.
         """
         assert len(action) == 4, f"Actions should be size 4, got {len(action)}"
+        # Records the phases if `step_timing` is enabled, does nothing otherwise
+        timer = step_timing.timer_for(type(self))
+        t = timer.start()
+        self._load_model_fields()
         self.set_xyz_action(action[:3])
+        t = timer.lap("set_xyz_action", t)
         if self.curr_path_length >= self.max_path_length:
             raise ValueError("You must reset the env manually once truncate==True")
         self.do_simulation([action[-1], -action[-1]], n_frames=self.frame_skip)
         self.curr_path_length += 1
-
-        # Running the simulator can sometimes mess up site positions, so
-        # re-position them here to make sure they're accurate
-        for site in self._target_site_config:
-            self._set_pos_site(*site)
+        t = timer.lap("do_simulation", t)
 
         if self._did_see_sim_exception:
             assert self._last_stable_obs is not None
+            if out is None:
+                out = self._last_stable_obs.copy()
+            else:
+                out[:] = self._last_stable_obs
             return (
-                self._last_stable_obs,  # observation just before going unstable
+                out,  # observation just before going unstable
                 0.0,  # reward (penalize for causing instability)
                 False,
                 False,  # termination flag always False
@@ -595,24 +967,34 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
                     "unscaled_reward": 0.0,
                 },
             )
-        mujoco.mj_forward(self.model, self.data)
-        self._last_stable_obs = self._get_obs()
-
-        self._last_stable_obs = np.clip(
-            self._last_stable_obs,
-            a_max=self.sawyer_observation_space.high,
-            a_min=self.sawyer_observation_space.low,
-            dtype=np.float64,
-        )
-        assert isinstance(self._last_stable_obs, np.ndarray)
-        reward, info = self.evaluate_state(self._last_stable_obs, action)
+        # `mj_step` computes the kinematics before integrating, so they lag the new state
+        self._invalidate_kinematics()
+        self._forward()
+        t = timer.lap("mj_forward", t)
+        if self._last_stable_obs is None:
+            self._last_stable_obs = np.empty(
+                2 * (4 + self._obs_obj_max_len) + 3, dtype=np.float64
+            )
+        obs = self._get_obs(out=self._last_stable_obs)
+        t = timer.lap("get_obs", t)
+        obs_low, obs_high = self._get_obs_bounds()
+        # Clips in place (`np.clip(out=...)` leaves garbage behind on every call)
+        np.maximum(obs, obs_low, out=obs)
+        np.minimum(obs, obs_high, out=obs)
+        t = timer.lap("clip_obs", t)
+        reward, info = self.evaluate_state(obs, action)
+        timer.lap("evaluate_state", t)
         # step will never return a terminate==True if there is a success
         # but we can return truncate=True if the current path length == max path length
         truncate = False
         if self.curr_path_length == self.max_path_length:
             truncate = True
+        if out is None:
+            out = obs.copy()
+        else:
+            out[:] = obs
         return (
-            np.array(self._last_stable_obs, dtype=np.float64),
+            out,
             reward,
             False,
             truncate,
@@ -633,10 +1015,127 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
         # V1 environments don't have to implement it
         raise NotImplementedError
 
+    def reward_state(self) -> dict[str, npt.NDArray[np.float64]]:
+        """Returns the simulator state `batched_reward()` reads besides the observation.
+
+        Returns:
+            Named arrays for the current step (copies): the TCP center and the positions of
+            the gripper pads, and any task specific state.
+        """
+        return {
+            "tcp_center": self.tcp_center,
+            "left_pad": self.get_body_com("leftpad").copy(),
+            "right_pad": self.get_body_com("rightpad").copy(),
+        }
+
+    def reward_params(self) -> dict[str, npt.NDArray[np.float64]]:
+        """Returns the task parameters `batched_reward()` reads, constant over an episode.
+
+        Returns:
+            Named arrays (copies): the target, the initial object, TCP and hand positions,
+            and any task specific parameters.
+        """
+        assert (
+            self._target_pos is not None
+            and self.obj_init_pos is not None
+            and self.hand_init_pos is not None
+        ), "`reset()` must be called before `reward_params()`."
+        return {
+            "target_pos": np.array(self._target_pos, dtype=np.float64),
+            "obj_init_pos": np.array(self.obj_init_pos, dtype=np.float64),
+            "init_tcp": np.array(self.init_tcp, dtype=np.float64),
+            "hand_init_pos": np.array(self.hand_init_pos, dtype=np.float64),
+        }
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Computes the rewards of a batch of steps, as `compute_reward()` does for a single one.
+
+        A pure function of its inputs, so it can compute the rewards of many environment
+        instances, or relabel stored transitions, at once.
+
+        Args:
+            obs: The observations, of shape `(N, 39)`.
+            action: The actions, of shape `(N, 4)`.
+            state: The stacked `reward_state()` of each step, each of shape `(N, ...)`.
+            params: The `reward_params()` of the task, either shared (unbatched) or stacked per step.
+
+        Returns:
+            The rewards, of shape `(N,)`.
+        """
+        # Throw error rather than making this an @abc.abstractmethod so that
+        # V1 environments don't have to implement it
+        raise NotImplementedError
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Computes the successes of a batch of steps, as `evaluate_state()` does for a single one.
+
+        Args:
+            obs: The observations, of shape `(N, 39)`.
+            action: The actions, of shape `(N, 4)`.
+            state: The stacked `reward_state()` of each step, each of shape `(N, ...)`.
+            params: The `reward_params()` of the task, either shared (unbatched) or stacked per step.
+
+        Returns:
+            Whether each step is a success, of shape `(N,)`.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def relabel(
+        cls,
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+        goals: npt.ArrayLike,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_]]:
+        """Computes the rewards and successes of stored steps for substitute goals.
+
+        Meant for hindsight goal relabeling: with the `reward_params()` exported once per
+        episode and the `reward_state()` recorded at each step, any number of goals can be
+        evaluated without a simulator. Only the target is substituted, the other params
+        (e.g. the initial distances some tasks scale their rewards by) are kept as exported.
+        The goal in `obs` is not read, so it is left to the caller to replace it where the
+        relabeled observations need it.
+
+        Args:
+            obs: The observations, of shape `(N, 39)`.
+            action: The actions, of shape `(N, 4)`.
+            state: The stacked `reward_state()` of each step, each of shape `(N, ...)`.
+            params: The `reward_params()` of the task, either shared (unbatched) or stacked per step.
+            goals: The substitute target positions, of shape `(N, 3)`, or `(3,)` for one goal
+                shared by all steps.
+
+        Returns:
+            The rewards and whether each step is a success, both of shape `(N,)`.
+        """
+        goals = np.asarray(goals, dtype=np.float64)
+        if goals.shape not in ((3,), (len(obs), 3)):
+            raise ValueError(
+                f"Expected goals of shape (3,) or ({len(obs)}, 3), got {goals.shape}."
+            )
+        params = {**params, "target_pos": goals}
+        return (
+            cls.batched_reward(obs, action, state, params),
+            cls.batched_success(obs, action, state, params),
+        )
+
     def reset_model(self) -> npt.NDArray[np.float64]:
         qpos = self.init_qpos
         qvel = self.init_qvel
-        self.set_state(qpos, qvel)
+        self._set_state_deferred(qpos, qvel)
         return self._get_obs()
 
     def reset(
@@ -644,31 +1143,301 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
     ) -> tuple[npt.NDArray[np.float64], dict[str, Any]]:
         """Resets the environment.
 
+        If the task was created with a precomputed reset state, that state is restored instead
+        of simulating the reset.
+
         Args:
             seed: The seed to use. Ignored, use `seed()` instead.
             options: Additional options to pass to the environment. Ignored.
 
+        Returns:
+            The `(obs, info)` tuple.
+        """
+        if self._reset_state is not None:
+            return self._restore_reset_state(self._reset_state), {}
+        return self._simulate_reset()
+
+    def _simulate_reset(self) -> tuple[npt.NDArray[np.float64], dict[str, Any]]:
+        """Resets the environment by simulating `reset_model()`.
+
         Returns:
             The `(obs, info)` tuple.
         """
         self.curr_path_length = 0
+        self._load_model_fields()
+        # `MujocoEnv.reset()` resets the simulation and runs `reset_model()` again, discarding the
+        # simulation state of this first run. Starting it from a reset simulation as well lets
+        # it use the hand reset cache too
+        mujoco.mj_resetData(self.model, self.data)
         self.reset_model()
         obs, info = super().reset()
+        self._contacts.invalidate()
+        self._save_model_fields()
         self._prev_obs = obs[:18].copy()
         obs[18:36] = self._prev_obs
         obs = obs.astype(np.float64)
         return obs, info
 
+    def _get_integration_state(self) -> npt.NDArray[np.float64]:
+        """Returns the full integration state (`mjSTATE_INTEGRATION`) of the simulation."""
+        spec = mujoco.mjtState.mjSTATE_INTEGRATION
+        state = np.empty(mujoco.mj_stateSize(self.model, spec), dtype=np.float64)
+        mujoco.mj_getState(self.model, self.data, state, spec)
+        return state
+
+    def _hand_reset_key(self, steps: int) -> bytes:
+        """Returns the key of the hand reset cache for the current simulation state.
+
+        The settled state only depends on the state the hand starts from (including the mocap
+        pose), the target hand position and the (task dependent) positions of the bodies of the
+        model. The objects settle during the hand reset too, and where they rest depends on the
+        bodies around them (e.g. the box of box-close-v2 or the lever of lever-pull-v2), so the
+        body positions can not be left out. The site positions can: sites do not take part in
+        the dynamics of any of the environments.
+
+        Args:
+            steps: The number of steps the hand reset takes.
+        """
+        return b"".join(
+            (
+                np.array([steps, self.frame_skip], dtype=np.int64).tobytes(),
+                np.asarray(self.hand_init_pos, dtype=np.float64).tobytes(),
+                self.model.body_pos.tobytes(),
+                self._get_integration_state().tobytes(),
+            )
+        )
+
+    def capture_reset_state(self) -> ResetStateDict:
+        """Resets the environment by simulating it and captures the resulting state.
+
+        The state contains the integration state of the simulation, the positions of the
+        bodies and sites of the model and the `_EPISODE_ATTRIBUTES`. It only
+        depends on the task, so it can be restored by any instance of the environment
+        class to reset into that task without simulating.
+
+        Returns:
+            The reset state.
+        """
+        obs, _ = self._simulate_reset()
+
+        attributes: dict[str, Any] = {}
+        data_views: dict[str, tuple[str, int, tuple[int, ...]]] = {}
+        for name in self._declared_names("_EPISODE_ATTRIBUTES"):
+            if name not in self.__dict__:
+                continue
+            value = self.__dict__[name]
+            view = self._find_data_view(value)
+            if view is not None:
+                data_views[name] = view
+            else:
+                attributes[name] = copy.deepcopy(value)
+        return {
+            "integration_state": self._get_integration_state(),
+            "model_fields": {
+                name: getattr(self.model, name).copy()
+                for name in _PER_INSTANCE_MODEL_FIELDS
+            },
+            "attributes": attributes,
+            "data_views": data_views,
+            "obs": obs.copy(),
+        }
+
+    def _find_data_view(self, value: Any) -> tuple[str, int, tuple[int, ...]] | None:
+        """Finds the `MjData` field an array is a view of.
+
+        Args:
+            value: The attribute value.
+
+        Returns:
+            The field name, the offset into the flattened field and the shape of the view,
+            or `None` if the value is not a view of one of `_DATA_VIEW_FIELDS`.
+        """
+        if not isinstance(value, np.ndarray) or value.base is None:
+            return None
+        base = value
+        while isinstance(base.base, np.ndarray):
+            base = base.base
+        if base.base is None:
+            # A view of an array numpy allocated, the arrays of `MjData` wrap its memory
+            return None
+        for field in _DATA_VIEW_FIELDS:
+            array = getattr(self.data, field)
+            if np.shares_memory(value, array):
+                start = (
+                    value.__array_interface__["data"][0]
+                    - array.__array_interface__["data"][0]
+                ) // array.itemsize
+                return field, start, value.shape
+        return None
+
+    def _restore_reset_state(
+        self, reset_state: ResetStateDict
+    ) -> npt.NDArray[np.float64]:
+        """Restores a state captured by `capture_reset_state()`.
+
+        Args:
+            reset_state: The reset state.
+
+        Returns:
+            The observation of the reset.
+        """
+        self.curr_path_length = 0
+        for name, value in reset_state["model_fields"].items():
+            getattr(self.model, name)[:] = value
+        self._save_model_fields()
+        for name, value in reset_state["attributes"].items():
+            setattr(self, name, copy.deepcopy(value))
+        self._set_data_views(reset_state["data_views"])
+        self._set_integration_state(reset_state["integration_state"])
+
+        if self.render_mode == "human":
+            self.render()
+        return reset_state["obs"].copy()
+
+    def _set_data_views(
+        self, data_views: dict[str, tuple[str, int, tuple[int, ...]]]
+    ) -> None:
+        """Points attributes at the `MjData` views found by `_find_data_view()`."""
+        for name, (field, start, shape) in data_views.items():
+            flat = getattr(self.data, field).reshape(-1)
+            setattr(
+                self, name, flat[start : start + int(np.prod(shape))].reshape(shape)
+            )
+
+    def _set_integration_state(self, state: npt.NDArray[np.float64]) -> None:
+        """Sets the integration state (`mjSTATE_INTEGRATION`) of the simulation and runs a forward pass."""
+        spec = mujoco.mjtState.mjSTATE_INTEGRATION
+        mujoco.mj_setState(self.model, self.data, state, spec)
+        # Recompute the derived quantities (positions, contacts, ...) for the restored state,
+        # then restore the state again in case the forward pass touched the warmstart
+        mujoco.mj_forward(self.model, self.data)
+        mujoco.mj_setState(self.model, self.data, state, spec)
+        self._kinematics_stale = False
+        self._contacts.invalidate()
+
+    def save_state(self, out: SavedStateDict | None = None) -> SavedStateDict:
+        """Saves the state of the current episode, for `restore_state()`.
+
+        The state is the integration state of the simulation (`mj_getState()`: positions,
+        velocities, actuator activations, warmstart, mocap poses, ...), the per-instance model
+        fields and the `_EPISODE_ATTRIBUTES` (path length, previous observation, target and
+        initial positions, ...). Saving does not depend on the task, so a state can be restored
+        by any instance of the environment class.
+
+        Args:
+            out: A state saved by this environment before, whose arrays are overwritten
+                (and which is returned) instead of allocating new ones.
+
+        Returns:
+            The state.
+        """
+        if out is None:
+            spec = mujoco.mjtState.mjSTATE_INTEGRATION
+            out = {
+                "integration_state": np.empty(
+                    mujoco.mj_stateSize(self.model, spec), dtype=np.float64
+                ),
+                "model_fields": {
+                    name: np.empty_like(getattr(self.model, name))
+                    for name in _PER_INSTANCE_MODEL_FIELDS
+                },
+                "attributes": {},
+                "data_views": {},
+            }
+        mujoco.mj_getState(
+            self.model,
+            self.data,
+            out["integration_state"],
+            mujoco.mjtState.mjSTATE_INTEGRATION,
+        )
+        # A shared model may hold the fields of another instance
+        model_fields = self._model_fields
+        for name, value in out["model_fields"].items():
+            value[:] = (
+                getattr(self.model, name)
+                if model_fields is None
+                else model_fields[name]
+            )
+
+        attributes, data_views = out["attributes"], out["data_views"]
+        for name in self._declared_names("_EPISODE_ATTRIBUTES"):
+            if name not in self.__dict__:
+                continue
+            value = self.__dict__[name]
+            view = None
+            if isinstance(value, np.ndarray) and value.base is not None:
+                view = self._find_data_view(value)
+            if view is not None:
+                data_views[name] = view
+                attributes.pop(name, None)
+                continue
+            data_views.pop(name, None)
+            if not isinstance(value, np.ndarray):
+                attributes[name] = copy.deepcopy(value)
+                continue
+            saved = attributes.get(name)
+            if (
+                isinstance(saved, np.ndarray)
+                and saved.shape == value.shape
+                and saved.dtype == value.dtype
+            ):
+                saved[...] = value
+            else:
+                attributes[name] = value.copy()
+        return out
+
+    def restore_state(self, state: SavedStateDict) -> None:
+        """Restores a state saved by `save_state()`.
+
+        Stepping the environment from the restored state gives exactly the same observations,
+        rewards and infos as stepping it from the saved one.
+
+        Args:
+            state: The state.
+        """
+        for name, value in state["model_fields"].items():
+            getattr(self.model, name)[:] = value
+        self._save_model_fields()
+        for name, value in state["attributes"].items():
+            setattr(
+                self,
+                name,
+                value.copy() if isinstance(value, np.ndarray) else copy.deepcopy(value),
+            )
+        self._set_data_views(state["data_views"])
+        self._set_integration_state(state["integration_state"])
+
     def _reset_hand(self, steps: int = 50) -> None:
         """Resets the hand position.
 
+        When the simulation was just reset (and `cache_hand_resets` is set), the state before the
+        last step is cached, so that later resets from the same state only simulate that step.
+        This gives exactly the same result as simulating every step. The cache keeps the
+        `_HAND_RESET_CACHE_SIZE` most recently used states, so resets with a new rand vec every
+        time (unfrozen or seeded) do not grow it without bound.
+
         Args:
             steps: The number of steps to take to reset the hand.
         """
-        mocap_id = self.model.body_mocapid[self.data.body("mocap").id]
-        for _ in range(steps):
+        mocap_id = self.model.body_mocapid[self._body_ids["mocap"]]
+        key = None
+        start = 0
+        if self.cache_hand_resets and steps > 0 and self.data.time == 0.0:
+            key = self._hand_reset_key(steps)
+            state = self._hand_reset_states.get(key)
+            if state is not None:
+                self._hand_reset_states.move_to_end(key)
+                mujoco.mj_setState(
+                    self.model, self.data, state, mujoco.mjtState.mjSTATE_INTEGRATION
+                )
+                start = steps - 1
+        for step in range(start, steps):
+            if key is not None and start == 0 and step == steps - 1:
+                self._hand_reset_states[key] = self._get_integration_state()
+                if len(self._hand_reset_states) > self._HAND_RESET_CACHE_SIZE:
+                    self._hand_reset_states.popitem(last=False)
             self.data.mocap_pos[mocap_id][:] = self.hand_init_pos
-            self.data.mocap_quat[mocap_id][:] = np.array([1, 0, 1, 0])
+            self.data.mocap_quat[mocap_id][:] = self._MOCAP_QUAT
             self.do_simulation([-1, 1], self.frame_skip)
         self.init_tcp = self.tcp_center
 
@@ -696,6 +1465,39 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
             self._last_rand_vec = rand_vec
             return rand_vec
 
+    def _sample_state_rand_vec(self) -> npt.NDArray[np.float64]:
+        """Samples the rand vec `reset_model()` would end up using, without simulating.
+
+        Draws from the global `np.random` exactly like `reset_model()` does when the rand vec is
+        neither frozen nor seeded, including the resampling for `_RAND_VEC_MIN_XY_DISTANCE`.
+
+        Returns:
+            The rand vec.
+        """
+        assert self._random_reset_space is not None
+        low, high = self._random_reset_space.low, self._random_reset_space.high
+        while True:
+            rand_vec: npt.NDArray[np.float64] = np.random.uniform(  # type: ignore
+                low, high, size=low.size
+            ).astype(np.float64)
+            if self._is_valid_rand_vec(rand_vec):
+                return rand_vec
+
+    def _is_valid_rand_vec(self, rand_vec: npt.NDArray[np.float64]) -> bool:
+        """Whether `reset_model()` keeps the given rand vec rather than resampling it.
+
+        Args:
+            rand_vec: The rand vec.
+
+        Returns:
+            Whether its XY positions are at least `_RAND_VEC_MIN_XY_DISTANCE` apart (if that is set).
+        """
+        return (
+            self._RAND_VEC_MIN_XY_DISTANCE is None
+            or np.linalg.norm(rand_vec[:2] - rand_vec[3:5])
+            >= self._RAND_VEC_MIN_XY_DISTANCE
+        )
+
     def _gripper_caging_reward(
         self,
         action: npt.NDArray[np.float32],
@@ -834,3 +1636,92 @@ class SawyerXYZEnv(SawyerMocapBase, EzPickle):
             caging_and_gripping = (caging_and_gripping + float(reach)) / 2
 
         return caging_and_gripping
+
+    @staticmethod
+    def _batched_gripper_caging_reward(
+        action: npt.NDArray[np.float32],
+        obj_pos: npt.NDArray[np.float64],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+        obj_radius: float,
+        pad_success_thresh: float,
+        object_reach_radius: float,
+        xz_thresh: float,
+        desired_gripper_effort: float = 1.0,
+        high_density: bool = False,
+        medium_density: bool = False,
+    ) -> npt.NDArray[np.float64]:
+        """Batched `_gripper_caging_reward()`, see `batched_reward()`.
+
+        Args:
+            action: The actions, of shape `(N, 4)`.
+            obj_pos: The object positions, of shape `(N, 3)`.
+            state: The reward state.
+            params: The reward params.
+            obj_radius: See `_gripper_caging_reward()`.
+            pad_success_thresh: See `_gripper_caging_reward()`.
+            object_reach_radius: See `_gripper_caging_reward()`.
+            xz_thresh: See `_gripper_caging_reward()`.
+            desired_gripper_effort: See `_gripper_caging_reward()`.
+            high_density: See `_gripper_caging_reward()`.
+            medium_density: See `_gripper_caging_reward()`.
+
+        Returns:
+            The rewards, of shape `(N,)`.
+        """
+        if high_density and medium_density:
+            raise ValueError("Can only be either high_density or medium_density")
+        obj_init_pos, init_tcp = params["obj_init_pos"], params["init_tcp"]
+
+        # The left and right caging rewards, see `_gripper_caging_reward()`
+        caging_y = reward_utils.batched_hamacher_product(
+            *(
+                reward_utils.batched_tolerance(
+                    np.abs(state[pad][:, 1] - obj_pos[:, 1]),
+                    bounds=(obj_radius, pad_success_thresh),
+                    margin=np.abs(
+                        np.abs(state[pad][:, 1] - obj_init_pos[..., 1])
+                        - pad_success_thresh
+                    ),
+                    sigmoid="long_tail",
+                )
+                for pad in ("left_pad", "right_pad")
+            )
+        )
+
+        tcp = state["tcp_center"]
+        xz = [0, 2]
+        caging_xz_margin = np.linalg.norm(
+            obj_init_pos[..., xz] - init_tcp[..., xz], axis=-1
+        )
+        caging_xz_margin -= xz_thresh
+        caging_xz = reward_utils.batched_tolerance(
+            np.linalg.norm(tcp[:, xz] - obj_pos[:, xz], axis=-1),
+            bounds=(0, xz_thresh),
+            margin=caging_xz_margin,
+            sigmoid="long_tail",
+        )
+
+        gripper_closed = (
+            np.minimum(np.maximum(0, action[:, -1]), desired_gripper_effort)
+            / desired_gripper_effort
+        )
+
+        caging = reward_utils.batched_hamacher_product(caging_y, caging_xz)
+        gripping = np.where(caging > 0.97, gripper_closed, 0.0)
+        caging_and_gripping = reward_utils.batched_hamacher_product(caging, gripping)
+
+        if high_density:
+            caging_and_gripping = (caging_and_gripping + caging) / 2
+        if medium_density:
+            tcp_to_obj = np.linalg.norm(obj_pos - tcp, axis=-1)
+            tcp_to_obj_init = np.linalg.norm(obj_init_pos - init_tcp, axis=-1)
+            reach = reward_utils.batched_tolerance(
+                tcp_to_obj,
+                bounds=(0, object_reach_radius),
+                margin=np.abs(tcp_to_obj_init - object_reach_radius),
+                sigmoid="long_tail",
+            )
+            caging_and_gripping = (caging_and_gripping + reach) / 2
+
+        return caging_and_gripping
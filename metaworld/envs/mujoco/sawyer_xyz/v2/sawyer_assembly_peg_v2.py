@@ -8,12 +8,15 @@ from gymnasium.spaces import Box
 
 from metaworld.envs.asset_path_utils import full_v2_path_for
 from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import RenderMode, SawyerXYZEnv
-from metaworld.envs.mujoco.utils.reward_utils import tolerance
+from metaworld.envs.mujoco.utils.reward_utils import batched_tolerance, tolerance
 from metaworld.types import InitConfigDict, ObservationDict
 
 
 class SawyerNutAssemblyEnvV2(SawyerXYZEnv):
     WRENCH_HANDLE_LENGTH: float = 0.02
+    _RAND_VEC_MIN_XY_DISTANCE: float = 0.1
+    _BODY_NAMES: tuple[str, ...] = ("RoundNut",)
+    _SITE_NAMES: tuple[str, ...] = ("RoundNut-8", "RoundNut")
 
     def __init__(
         self,
@@ -94,10 +97,10 @@ class SawyerNutAssemblyEnvV2(SawyerXYZEnv):
         return self.model.geom_name2id("WrenchHandle")
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
-        return self.data.site("RoundNut-8").xpos
+        return self._site_xpos["RoundNut-8"]
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("RoundNut").xquat
+        return self._body_xquat["RoundNut"]
 
     def _get_obs_dict(self) -> ObservationDict:
         obs_dict = super()._get_obs_dict()
@@ -107,7 +110,10 @@ class SawyerNutAssemblyEnvV2(SawyerXYZEnv):
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
         goal_pos = self._get_state_rand_vec()
-        while np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1]) < 0.1:
+        while (
+            np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1])
+            < self._RAND_VEC_MIN_XY_DISTANCE
+        ):
             goal_pos = self._get_state_rand_vec()
         self.obj_init_pos = goal_pos[:3]
         self._target_pos = goal_pos[-3:]
@@ -208,3 +214,79 @@ class SawyerNutAssemblyEnvV2(SawyerXYZEnv):
             reward_in_place,
             success,
         )
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        hand = obs[:, :3]
+        wrench = obs[:, 4:7]
+        wrench_center = state["wrench_center"]
+        threshold = SawyerNutAssemblyEnvV2.WRENCH_HANDLE_LENGTH / 2.0
+        wrench_threshed = wrench.copy()
+        wrench_threshed[:, 0] = np.where(
+            np.abs(wrench[:, 0] - hand[:, 0]) < threshold, hand[:, 0], wrench[:, 0]
+        )
+
+        ideal = np.array([0.707, 0, 0, 0.707])
+        error = np.linalg.norm(obs[:, 7:11] - ideal, axis=-1)
+        reward_quat = np.maximum(1.0 - error / 0.4, 0.0)
+
+        reward_grab = SawyerNutAssemblyEnvV2._batched_gripper_caging_reward(
+            action,
+            wrench_threshed,
+            state,
+            params,
+            object_reach_radius=0.01,
+            obj_radius=0.015,
+            pad_success_thresh=0.02,
+            xz_thresh=0.01,
+            medium_density=True,
+        )
+
+        pos_error = params["target_pos"] - wrench_center
+        radius = np.linalg.norm(pos_error[:, :2], axis=-1)
+        aligned = radius < 0.02
+        hooked = pos_error[:, 2] > 0.0
+        success = aligned & hooked
+        pos_threshold = np.where(success, 0.02, 0.01)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            target_height = np.where(
+                radius > pos_threshold,
+                0.02 * np.log(radius - pos_threshold) + 0.2,
+                0.0,
+            )
+        pos_error[:, 2] = target_height - wrench_center[:, 2]
+        scale = np.array([1.0, 1.0, 3.0])
+        lifted = (wrench_center[:, 2] > 0.02) | (radius < pos_threshold)
+        reward_in_place = 0.1 * lifted + 0.9 * batched_tolerance(
+            np.linalg.norm(pos_error * scale, axis=-1),
+            bounds=(0, 0.02),
+            margin=0.4,
+            sigmoid="long_tail",
+        )
+
+        reward = (2.0 * reward_grab + 6.0 * reward_in_place) * reward_quat
+        return np.where(success, 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        pos_error = params["target_pos"] - state["wrench_center"]
+        aligned = np.linalg.norm(pos_error[:, :2], axis=-1) < 0.02
+        return aligned & (pos_error[:, 2] > 0.0)
+
+    def reward_state(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_state(),
+            "wrench_center": self._get_site_pos("RoundNut").copy(),
+        }
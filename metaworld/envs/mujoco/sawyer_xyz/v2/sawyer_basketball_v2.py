@@ -15,6 +15,10 @@ from metaworld.types import InitConfigDict
 class SawyerBasketballEnvV2(SawyerXYZEnv):
     PAD_SUCCESS_MARGIN: float = 0.06
     TARGET_RADIUS: float = 0.08
+    _RAND_VEC_MIN_XY_DISTANCE: float = 0.15
+    _BODY_NAMES: tuple[str, ...] = ("bsktball",)
+    _SITE_NAMES: tuple[str, ...] = ("goal",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("prev_obs",)
 
     def __init__(
         self,
@@ -98,20 +102,23 @@ class SawyerBasketballEnvV2(SawyerXYZEnv):
         return self.get_body_com("bsktball")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("bsktball").xquat
+        return self._body_xquat["bsktball"]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
         self.prev_obs = self._get_curr_obs_combined_no_goal()
         goal_pos = self._get_state_rand_vec()
         basket_pos = goal_pos[3:]
-        while np.linalg.norm(goal_pos[:2] - basket_pos[:2]) < 0.15:
+        while (
+            np.linalg.norm(goal_pos[:2] - basket_pos[:2])
+            < self._RAND_VEC_MIN_XY_DISTANCE
+        ):
             goal_pos = self._get_state_rand_vec()
             basket_pos = goal_pos[3:]
         assert self.obj_init_pos is not None
         self.obj_init_pos = np.concatenate([goal_pos[:2], [self.obj_init_pos[-1]]])
         self.model.body("basket_goal").pos = basket_pos
-        self._target_pos = self.data.site("goal").xpos
+        self._target_pos = self._site_xpos["goal"]
         self._set_obj_xyz(self.obj_init_pos)
         self.model.site("goal").pos = self._target_pos
         return self._get_obs()
@@ -170,3 +177,61 @@ class SawyerBasketballEnvV2(SawyerXYZEnv):
         if target_to_obj < self.TARGET_RADIUS:
             reward = 10.0
         return (reward, tcp_to_obj, tcp_opened, target_to_obj, object_grasped, in_place)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        obj = obs[:, 4:7]
+        obj_init_pos = params["obj_init_pos"]
+        target = np.where([True, True, False], params["target_pos"], 0.3)
+        scale = np.array([1.0, 1.0, 2.0])
+        target_to_obj = np.linalg.norm((obj - target) * scale, axis=-1)
+        target_to_obj_init = np.linalg.norm((obj_init_pos - target) * scale, axis=-1)
+        in_place = reward_utils.batched_tolerance(
+            target_to_obj,
+            bounds=(0, SawyerBasketballEnvV2.TARGET_RADIUS),
+            margin=target_to_obj_init,
+            sigmoid="long_tail",
+        )
+        tcp_opened = obs[:, 3]
+        tcp_to_obj = np.linalg.norm(obj - state["tcp_center"], axis=-1)
+        object_grasped = SawyerBasketballEnvV2._batched_gripper_caging_reward(
+            action,
+            obj,
+            state,
+            params,
+            object_reach_radius=0.01,
+            obj_radius=0.025,
+            pad_success_thresh=0.06,
+            xz_thresh=0.005,
+            high_density=True,
+        )
+        grasped = (
+            (tcp_to_obj < 0.035)
+            & (tcp_opened > 0)
+            & (obj[:, 2] - 0.01 > obj_init_pos[..., 2])
+        )
+        object_grasped = np.where(grasped, 1.0, object_grasped)
+        reward = reward_utils.batched_hamacher_product(object_grasped, in_place)
+        reward = np.where(grasped, reward + (1.0 + 5.0 * in_place), reward)
+        return np.where(
+            target_to_obj < SawyerBasketballEnvV2.TARGET_RADIUS, 10.0, reward
+        )
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        target = np.where([True, True, False], params["target_pos"], 0.3)
+        scale = np.array([1.0, 1.0, 2.0])
+        target_to_obj = np.linalg.norm((obs[:, 4:7] - target) * scale, axis=-1)
+        return target_to_obj <= SawyerBasketballEnvV2.TARGET_RADIUS
@@ -26,6 +26,9 @@ class SawyerBinPickingEnvV2(SawyerXYZEnv):
         - (11/23/20) Updated reward function to new pick-place style
     """
 
+    _BODY_NAMES: tuple[str, ...] = ("obj", "bin_goal")
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("_target_to_obj_init", "obj_init_angle")
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -118,7 +121,7 @@ class SawyerBinPickingEnvV2(SawyerXYZEnv):
         return self.get_body_com("obj")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("obj").xquat
+        return self._body_xquat["obj"]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -214,3 +217,103 @@ class SawyerBinPickingEnvV2(SawyerXYZEnv):
             object_grasped,
             in_place,
         )
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        hand = obs[:, :3]
+        obj = obs[:, 4:7]
+        target = params["target_pos"]
+        obj_init_pos = params["obj_init_pos"]
+        target_to_obj = np.linalg.norm(obj - target, axis=-1)
+        # Before the first step of an episode the margin is the current distance
+        target_to_obj_init = params["target_to_obj_init"]
+        target_to_obj_init = np.where(
+            np.isnan(target_to_obj_init), target_to_obj, target_to_obj_init
+        )
+        in_place = reward_utils.batched_tolerance(
+            target_to_obj,
+            bounds=(0, SawyerBinPickingEnvV2.TARGET_RADIUS),
+            margin=target_to_obj_init,
+            sigmoid="long_tail",
+        )
+
+        threshold = 0.03
+        radii = np.stack(
+            [
+                np.linalg.norm(hand[:, :2] - obj_init_pos[..., :2], axis=-1),
+                np.linalg.norm(hand[:, :2] - target[..., :2], axis=-1),
+            ]
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            floor = np.where(
+                radii > threshold, 0.02 * np.log(radii - threshold) + 0.2, 0.0
+            ).min(axis=0)
+        above_floor = np.where(
+            hand[:, 2] >= floor,
+            1.0,
+            reward_utils.batched_tolerance(
+                np.maximum(floor - hand[:, 2], 0.0),
+                bounds=(0.0, 0.01),
+                margin=0.05,
+                sigmoid="long_tail",
+            ),
+        )
+        object_grasped = SawyerBinPickingEnvV2._batched_gripper_caging_reward(
+            action,
+            obj,
+            state,
+            params,
+            obj_radius=0.015,
+            pad_success_thresh=0.05,
+            object_reach_radius=0.01,
+            xz_thresh=0.01,
+            desired_gripper_effort=0.7,
+            high_density=True,
+        )
+        reward = reward_utils.batched_hamacher_product(object_grasped, in_place)
+        near_object = np.linalg.norm(obj - hand, axis=-1) < 0.04
+        pinched_without_obj = obs[:, 3] < 0.43
+        lifted = obj[:, 2] - 0.02 > obj_init_pos[..., 2]
+        grasp_success = near_object & lifted & ~pinched_without_obj
+        reward = np.where(
+            grasp_success,
+            reward
+            + (
+                1.0 + 5.0 * reward_utils.batched_hamacher_product(above_floor, in_place)
+            ),
+            reward,
+        )
+        return np.where(
+            target_to_obj < SawyerBinPickingEnvV2.TARGET_RADIUS, 10.0, reward
+        )
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj_to_target = np.linalg.norm(obs[:, 4:7] - params["target_pos"], axis=-1)
+        return obj_to_target <= 0.05
+
+    def reward_params(self) -> dict[str, npt.NDArray[np.float64]]:
+        # `compute_reward()` sets the margin at the first step of an episode, NaN until then
+        return {
+            **super().reward_params(),
+            "target_to_obj_init": np.array(
+                (
+                    np.nan
+                    if self._target_to_obj_init is None
+                    else self._target_to_obj_init
+                ),
+                dtype=np.float64,
+            ),
+        }
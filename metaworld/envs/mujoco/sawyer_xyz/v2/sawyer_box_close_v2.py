@@ -14,6 +14,10 @@ from metaworld.types import InitConfigDict
 
 
 class SawyerBoxCloseEnvV2(SawyerXYZEnv):
+    _RAND_VEC_MIN_XY_DISTANCE: float = 0.25
+    _BODY_NAMES: tuple[str, ...] = ("top_link", "boxbody")
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("obj_init_angle",)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -95,7 +99,7 @@ class SawyerBoxCloseEnvV2(SawyerXYZEnv):
         return self.get_body_com("top_link")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("top_link").xquat
+        return self._body_xquat["top_link"]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -104,7 +108,10 @@ class SawyerBoxCloseEnvV2(SawyerXYZEnv):
         box_height = self.get_body_com("boxbody")[2]
 
         goal_pos = self._get_state_rand_vec()
-        while np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1]) < 0.25:
+        while (
+            np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1])
+            < self._RAND_VEC_MIN_XY_DISTANCE
+        ):
             goal_pos = self._get_state_rand_vec()
         self.obj_init_pos = np.concatenate([goal_pos[:2], [self.obj_init_pos[-1]]])
         self._target_pos = goal_pos[-3:]
@@ -214,3 +221,70 @@ class SawyerBoxCloseEnvV2(SawyerXYZEnv):
             *reward_steps,
             success,
         )
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        reward_grab = (np.clip(action[:, 3], -1, 1) + 1.0) / 2.0
+
+        ideal = np.array([0.707, 0, 0, 0.707])
+        error = np.linalg.norm(obs[:, 7:11] - ideal, axis=-1)
+        reward_quat = np.maximum(1.0 - error / 0.2, 0.0)
+
+        hand = obs[:, :3]
+        lid = obs[:, 4:7] + np.array([0.0, 0.0, 0.02])
+        threshold = 0.02
+        radius = np.linalg.norm(hand[:, :2] - lid[:, :2], axis=-1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            floor = np.where(
+                radius <= threshold, 0.0, 0.04 * np.log(radius - threshold) + 0.4
+            )
+        above_floor = np.where(
+            hand[:, 2] >= floor,
+            1.0,
+            reward_utils.batched_tolerance(
+                floor - hand[:, 2],
+                bounds=(0.0, 0.01),
+                margin=np.maximum(floor / 2.0, 0.0),
+                sigmoid="long_tail",
+            ),
+        )
+        in_place = reward_utils.batched_tolerance(
+            np.linalg.norm(hand - lid, axis=-1),
+            bounds=(0, 0.02),
+            margin=0.5,
+            sigmoid="long_tail",
+        )
+        ready_to_lift = reward_utils.batched_hamacher_product(above_floor, in_place)
+        target = params["target_pos"]
+        pos_error = target - lid
+        error_scale = np.array([1.0, 1.0, 3.0])  # Emphasize Z error
+        lifted = 0.2 * (lid[:, 2] > 0.04) + 0.8 * reward_utils.batched_tolerance(
+            np.linalg.norm(pos_error * error_scale, axis=-1),
+            bounds=(0, 0.05),
+            margin=0.25,
+            sigmoid="long_tail",
+        )
+
+        reward = (
+            2.0 * reward_utils.batched_hamacher_product(reward_grab, ready_to_lift)
+            + 8.0 * lifted
+        )
+        success = np.linalg.norm(obs[:, 4:7] - target, axis=-1) < 0.08
+        return np.where(success, 10.0, reward) * reward_quat
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj_to_target = np.linalg.norm(obs[:, 4:7] - params["target_pos"], axis=-1)
+        return obj_to_target < 0.08
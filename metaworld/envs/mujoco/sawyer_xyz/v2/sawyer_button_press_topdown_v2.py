@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import Any
 
-import mujoco
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
@@ -14,6 +13,10 @@ from metaworld.types import InitConfigDict
 
 
 class SawyerButtonPressTopdownEnvV2(SawyerXYZEnv):
+    _BODY_NAMES: tuple[str, ...] = ("button",)
+    _SITE_NAMES: tuple[str, ...] = ("hole", "buttonStart")
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("_obj_to_target_init",)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -87,21 +90,21 @@ class SawyerButtonPressTopdownEnvV2(SawyerXYZEnv):
         return self.get_body_com("button") + np.array([0.0, 0.0, 0.193])
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("button").xquat
+        return self._body_xquat["button"]
 
     def _set_obj_xyz(self, pos: npt.NDArray[Any]) -> None:
         qpos = self.data.qpos.flat.copy()
         qvel = self.data.qvel.flat.copy()
         qpos[9] = pos
         qvel[9] = 0
-        self.set_state(qpos, qvel)
+        self._set_state_deferred(qpos, qvel)
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
         goal_pos = self._get_state_rand_vec()
         self.obj_init_pos = goal_pos
         self.model.body("box").pos = self.obj_init_pos
-        mujoco.mj_forward(self.model, self.data)
+        self._invalidate_kinematics()
         self._target_pos = self._get_site_pos("hole")
 
         self._obj_to_target_init = abs(
@@ -142,3 +145,47 @@ class SawyerButtonPressTopdownEnvV2(SawyerXYZEnv):
             reward += 5 * button_pressed
 
         return (reward, tcp_to_obj, obs[3], obj_to_target, near_button, button_pressed)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        obj = obs[:, 4:7]
+        tcp_to_obj = np.linalg.norm(obj - state["tcp_center"], axis=-1)
+        tcp_to_obj_init = np.linalg.norm(obj - params["init_tcp"], axis=-1)
+        obj_to_target = np.abs(params["target_pos"][..., 2] - obj[:, 2])
+        tcp_closed = 1 - obs[:, 3]
+        near_button = reward_utils.batched_tolerance(
+            tcp_to_obj,
+            bounds=(0, 0.01),
+            margin=tcp_to_obj_init,
+            sigmoid="long_tail",
+        )
+        button_pressed = reward_utils.batched_tolerance(
+            obj_to_target,
+            bounds=(0, 0.005),
+            margin=params["obj_to_target_init"],
+            sigmoid="long_tail",
+        )
+        reward = 5 * reward_utils.batched_hamacher_product(tcp_closed, near_button)
+        return np.where(tcp_to_obj <= 0.03, reward + 5 * button_pressed, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        return np.abs(params["target_pos"][..., 2] - obs[:, 6]) <= 0.024
+
+    def reward_params(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_params(),
+            "obj_to_target_init": np.array(self._obj_to_target_init, dtype=np.float64),
+        }
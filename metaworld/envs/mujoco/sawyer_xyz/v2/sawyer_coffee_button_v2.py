@@ -13,6 +13,8 @@ from metaworld.types import InitConfigDict
 
 
 class SawyerCoffeeButtonEnvV2(SawyerXYZEnv):
+    _SITE_NAMES: tuple[str, ...] = ("buttonStart",)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -103,7 +105,7 @@ class SawyerCoffeeButtonEnvV2(SawyerXYZEnv):
         qvel = self.data.qvel.flatten()
         qpos[0:3] = pos.copy()
         qvel[9:15] = 0
-        self.set_state(qpos, qvel)
+        self._set_state_deferred(qpos, qvel)
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -152,3 +154,47 @@ class SawyerCoffeeButtonEnvV2(SawyerXYZEnv):
             reward += 8 * button_pressed
 
         return (reward, tcp_to_obj, obs[3], obj_to_target, near_button, button_pressed)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        obj = obs[:, 4:7]
+        tcp_to_obj = np.linalg.norm(obj - state["tcp_center"], axis=-1)
+        tcp_to_obj_init = np.linalg.norm(obj - params["init_tcp"], axis=-1)
+        obj_to_target = np.abs(params["target_pos"][..., 1] - obj[:, 1])
+        tcp_closed = np.maximum(obs[:, 3], 0.0)
+        near_button = reward_utils.batched_tolerance(
+            tcp_to_obj,
+            bounds=(0, 0.05),
+            margin=tcp_to_obj_init,
+            sigmoid="long_tail",
+        )
+        button_pressed = reward_utils.batched_tolerance(
+            obj_to_target,
+            bounds=(0, 0.005),
+            margin=params["max_dist"],
+            sigmoid="long_tail",
+        )
+        reward = 2 * reward_utils.batched_hamacher_product(tcp_closed, near_button)
+        return np.where(tcp_to_obj <= 0.05, reward + 8 * button_pressed, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        return np.abs(params["target_pos"][..., 1] - obs[:, 5]) <= 0.02
+
+    def reward_params(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_params(),
+            "max_dist": np.array(self.max_dist, dtype=np.float64),
+        }
@@ -5,7 +5,6 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.envs.asset_path_utils import full_v2_path_for
 from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import RenderMode, SawyerXYZEnv
@@ -14,6 +13,10 @@ from metaworld.types import InitConfigDict
 
 
 class SawyerCoffeePushEnvV2(SawyerXYZEnv):
+    _RAND_VEC_MIN_XY_DISTANCE: float = 0.15
+    _BODY_NAMES: tuple[str, ...] = ("obj",)
+    _GEOM_NAMES: tuple[str, ...] = ("mug",)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -92,27 +95,29 @@ class SawyerCoffeePushEnvV2(SawyerXYZEnv):
         return [("coffee_goal", self._target_pos)]
 
     def _get_id_main_object(self) -> int:
-        return self.data.geom("mug").id
+        return self._geom_ids["mug"]
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
         return self.get_body_com("obj")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.geom("mug").xmat.reshape(3, 3)
-        return Rotation.from_matrix(geom_xmat).as_quat()
+        return self._xmat_to_quat(self._geom_xmat["mug"])
 
     def _set_obj_xyz(self, pos: npt.NDArray[Any]) -> None:
         qpos = self.data.qpos.flatten()
         qvel = self.data.qvel.flatten()
         qpos[0:3] = pos.copy()
         qvel[9:15] = 0
-        self.set_state(qpos, qvel)
+        self._set_state_deferred(qpos, qvel)
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
 
         pos_mug_init, pos_mug_goal = np.split(self._get_state_rand_vec(), 2)
-        while np.linalg.norm(pos_mug_init[:2] - pos_mug_goal[:2]) < 0.15:
+        while (
+            np.linalg.norm(pos_mug_init[:2] - pos_mug_goal[:2])
+            < self._RAND_VEC_MIN_XY_DISTANCE
+        ):
             pos_mug_init, pos_mug_goal = np.split(self._get_state_rand_vec(), 2)
 
         self._set_obj_xyz(pos_mug_init)
@@ -176,3 +181,57 @@ class SawyerCoffeePushEnvV2(SawyerXYZEnv):
             object_grasped,
             in_place,
         )
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        obj = obs[:, 4:7]
+        target = params["target_pos"]
+        scale = np.array([2.0, 2.0, 1.0])
+        target_to_obj = np.linalg.norm((obj - target) * scale, axis=-1)
+        target_to_obj_init = np.linalg.norm(
+            (params["obj_init_pos"] - target) * scale, axis=-1
+        )
+        in_place = reward_utils.batched_tolerance(
+            target_to_obj,
+            bounds=(0, 0.05),
+            margin=target_to_obj_init,
+            sigmoid="long_tail",
+        )
+        tcp_opened = obs[:, 3]
+        tcp_to_obj = np.linalg.norm(obj - state["tcp_center"], axis=-1)
+        object_grasped = SawyerCoffeePushEnvV2._batched_gripper_caging_reward(
+            action,
+            obj,
+            state,
+            params,
+            object_reach_radius=0.04,
+            obj_radius=0.02,
+            pad_success_thresh=0.05,
+            xz_thresh=0.05,
+            desired_gripper_effort=0.7,
+            medium_density=True,
+        )
+        reward = reward_utils.batched_hamacher_product(object_grasped, in_place)
+        reward = np.where(
+            (tcp_to_obj < 0.04) & (tcp_opened > 0),
+            reward + (1.0 + 5.0 * in_place),
+            reward,
+        )
+        return np.where(target_to_obj < 0.05, 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj_to_target = np.linalg.norm(obs[:, 4:7] - params["target_pos"], axis=-1)
+        return obj_to_target <= 0.07
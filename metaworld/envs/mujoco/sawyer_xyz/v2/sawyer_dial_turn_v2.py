@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import Any
 
-import mujoco
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
@@ -15,6 +14,9 @@ from metaworld.types import InitConfigDict
 
 class SawyerDialTurnEnvV2(SawyerXYZEnv):
     TARGET_RADIUS: float = 0.07
+    _BODY_NAMES: tuple[str, ...] = ("dial",)
+    _JOINT_NAMES: tuple[str, ...] = ("knob_Joint_1",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("dial_push_position", "prev_obs")
 
     def __init__(
         self,
@@ -81,7 +83,7 @@ class SawyerDialTurnEnvV2(SawyerXYZEnv):
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
         dial_center = self.get_body_com("dial").copy()
-        dial_angle_rad = self.data.joint("knob_Joint_1").qpos
+        dial_angle_rad = self._joint_qpos["knob_Joint_1"]
 
         offset = np.array(
             [np.sin(dial_angle_rad).item(), -np.cos(dial_angle_rad).item(), 0.0]
@@ -93,7 +95,7 @@ class SawyerDialTurnEnvV2(SawyerXYZEnv):
         return dial_center + offset
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("dial").xquat
+        return self._body_xquat["dial"]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -108,7 +110,7 @@ class SawyerDialTurnEnvV2(SawyerXYZEnv):
         self.model.body("dial").pos = self.obj_init_pos
         self.dial_push_position = self._get_pos_objects() + np.array([0.05, 0.02, 0.09])
         self.model.site("goal").pos = self._target_pos
-        mujoco.mj_forward(self.model, self.data)
+        self._invalidate_kinematics()
         return self._get_obs()
 
     def compute_reward(
@@ -160,3 +162,56 @@ class SawyerDialTurnEnvV2(SawyerXYZEnv):
             object_grasped,
             in_place,
         )
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        obj = obs[:, 4:7]
+        dial_push_position = obj + np.array([0.05, 0.02, 0.09])
+        target = params["target_pos"]
+        target_to_obj = np.linalg.norm(obj - target, axis=-1)
+        target_to_obj_init = np.linalg.norm(
+            params["dial_push_position"] - target, axis=-1
+        )
+        in_place = reward_utils.batched_tolerance(
+            target_to_obj,
+            bounds=(0, SawyerDialTurnEnvV2.TARGET_RADIUS),
+            margin=np.abs(target_to_obj_init - SawyerDialTurnEnvV2.TARGET_RADIUS),
+            sigmoid="long_tail",
+        )
+        dial_reach_radius = 0.005
+        tcp_to_obj = np.linalg.norm(dial_push_position - state["tcp_center"], axis=-1)
+        tcp_to_obj_init = np.linalg.norm(
+            params["dial_push_position"] - params["init_tcp"], axis=-1
+        )
+        reach = reward_utils.batched_tolerance(
+            tcp_to_obj,
+            bounds=(0, dial_reach_radius),
+            margin=np.abs(tcp_to_obj_init - dial_reach_radius),
+            sigmoid="gaussian",
+        )
+        gripper_closed = np.minimum(np.maximum(0, action[:, -1]), 1)
+        reach = reward_utils.batched_hamacher_product(reach, gripper_closed)
+        return 10 * reward_utils.batched_hamacher_product(reach, in_place)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj_to_target = np.linalg.norm(obs[:, 4:7] - params["target_pos"], axis=-1)
+        return obj_to_target <= SawyerDialTurnEnvV2.TARGET_RADIUS
+
+    def reward_params(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_params(),
+            "dial_push_position": np.array(self.dial_push_position, dtype=np.float64),
+        }
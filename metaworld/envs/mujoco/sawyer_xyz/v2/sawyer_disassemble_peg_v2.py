@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import Any
 
-import mujoco
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
@@ -15,6 +14,10 @@ from metaworld.types import InitConfigDict
 
 class SawyerNutDisassembleEnvV2(SawyerXYZEnv):
     WRENCH_HANDLE_LENGTH: float = 0.02
+    _RAND_VEC_MIN_XY_DISTANCE: float = 0.1
+    _BODY_NAMES: tuple[str, ...] = ("RoundNut",)
+    _SITE_NAMES: tuple[str, ...] = ("RoundNut-8", "RoundNut")
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("obj_init_angle",)
 
     def __init__(
         self,
@@ -100,7 +103,7 @@ class SawyerNutDisassembleEnvV2(SawyerXYZEnv):
         return self._get_site_pos("RoundNut-8")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("RoundNut").xquat
+        return self._body_xquat["RoundNut"]
 
     def _get_obs_dict(self):
         obs_dict = super()._get_obs_dict()
@@ -114,7 +117,10 @@ class SawyerNutDisassembleEnvV2(SawyerXYZEnv):
         self.obj_init_angle = self.init_config["obj_init_angle"]
 
         goal_pos = self._get_state_rand_vec()
-        while np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1]) < 0.1:
+        while (
+            np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1])
+            < self._RAND_VEC_MIN_XY_DISTANCE
+        ):
             goal_pos = self._get_state_rand_vec()
         self.obj_init_pos = goal_pos[:3]
         self._target_pos = goal_pos[:3] + np.array([0, 0, 0.15])
@@ -123,7 +129,7 @@ class SawyerNutDisassembleEnvV2(SawyerXYZEnv):
         peg_top_pos = self.obj_init_pos + np.array([0.0, 0.0, 0.08])
         self.model.body("peg").pos = peg_pos
         self.model.site("pegTop").pos = peg_top_pos
-        mujoco.mj_forward(self.model, self.data)
+        self._invalidate_kinematics()
         self._set_obj_xyz(self.obj_init_pos)
         return self._get_obs()
 
@@ -201,3 +207,65 @@ class SawyerNutDisassembleEnvV2(SawyerXYZEnv):
             reward_in_place,
             success,
         )
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        hand = obs[:, :3]
+        wrench = obs[:, 4:7]
+        wrench_center = state["wrench_center"]
+        target = params["target_pos"]
+        threshold = SawyerNutDisassembleEnvV2.WRENCH_HANDLE_LENGTH / 2.0
+        wrench_threshed = wrench.copy()
+        wrench_threshed[:, 0] = np.where(
+            np.abs(wrench[:, 0] - hand[:, 0]) < threshold, hand[:, 0], wrench[:, 0]
+        )
+
+        ideal = np.array([0.707, 0, 0, 0.707])
+        error = np.linalg.norm(obs[:, 7:11] - ideal, axis=-1)
+        reward_quat = np.maximum(1.0 - error / 0.4, 0.0)
+
+        reward_grab = SawyerNutDisassembleEnvV2._batched_gripper_caging_reward(
+            action,
+            wrench_threshed,
+            state,
+            params,
+            object_reach_radius=0.01,
+            obj_radius=0.015,
+            pad_success_thresh=0.02,
+            xz_thresh=0.01,
+            high_density=True,
+        )
+
+        pos_error = target + np.array([0.0, 0.0, 0.1]) - wrench_center
+        lifted = wrench_center[:, 2] > 0.02
+        reward_in_place = 0.1 * lifted + 0.9 * reward_utils.batched_tolerance(
+            np.linalg.norm(pos_error, axis=-1),
+            bounds=(0, 0.02),
+            margin=0.2,
+            sigmoid="long_tail",
+        )
+
+        reward = (2.0 * reward_grab + 6.0 * reward_in_place) * reward_quat
+        return np.where(obs[:, 6] > target[..., 2], 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        return obs[:, 6] > params["target_pos"][..., 2]
+
+    def reward_state(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_state(),
+            "wrench_center": self._get_site_pos("RoundNut").copy(),
+        }
@@ -5,7 +5,6 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.envs.asset_path_utils import full_v2_path_for
 from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import RenderMode, SawyerXYZEnv
@@ -14,6 +13,9 @@ from metaworld.types import InitConfigDict
 
 
 class SawyerDoorCloseEnvV2(SawyerXYZEnv):
+    _GEOM_NAMES: tuple[str, ...] = ("handle",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("objHeight",)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -59,23 +61,21 @@ class SawyerDoorCloseEnvV2(SawyerXYZEnv):
         return full_v2_path_for("sawyer_xyz/sawyer_door_pull.xml")
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
-        return self.data.geom("handle").xpos.copy()
+        return self._geom_xpos["handle"].copy()
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return Rotation.from_matrix(
-            self.data.geom("handle").xmat.reshape(3, 3)
-        ).as_quat()
+        return self._xmat_to_quat(self._geom_xmat["handle"])
 
     def _set_obj_xyz(self, pos: npt.NDArray[Any]) -> None:
         qpos = self.data.qpos.copy()
         qvel = self.data.qvel.copy()
         qpos[self.door_qpos_adr] = pos
         qvel[self.door_qvel_adr] = 0
-        self.set_state(qpos.flatten(), qvel.flatten())
+        self._set_state_deferred(qpos.flatten(), qvel.flatten())
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
-        self.objHeight = self.data.geom("handle").xpos[2]
+        self.objHeight = self._geom_xpos["handle"][2]
         obj_pos = self._get_state_rand_vec()
         self.obj_init_pos = obj_pos
         goal_pos = obj_pos.copy() + np.array([0.2, -0.2, 0.0])
@@ -142,3 +142,44 @@ class SawyerDoorCloseEnvV2(SawyerXYZEnv):
             reward = 10
 
         return (reward, obj_to_target, hand_in_place)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        _TARGET_RADIUS: float = 0.05
+        obj = obs[:, 4:7]
+        target = params["target_pos"]
+        tcp_to_target = np.linalg.norm(state["tcp_center"] - target, axis=-1)
+        obj_to_target = np.linalg.norm(obj - target, axis=-1)
+        in_place_margin = np.linalg.norm(params["obj_init_pos"] - target, axis=-1)
+        in_place = reward_utils.batched_tolerance(
+            obj_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=in_place_margin,
+            sigmoid="gaussian",
+        )
+        hand_margin = np.linalg.norm(params["hand_init_pos"] - obj, axis=-1) + 0.1
+        hand_in_place = reward_utils.batched_tolerance(
+            tcp_to_target,
+            bounds=(0, 0.25 * _TARGET_RADIUS),
+            margin=hand_margin,
+            sigmoid="gaussian",
+        )
+        reward = 3 * hand_in_place + 6 * in_place
+        return np.where(obj_to_target < _TARGET_RADIUS, 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj_to_target = np.linalg.norm(obs[:, 4:7] - params["target_pos"], axis=-1)
+        return obj_to_target <= 0.08
@@ -14,6 +14,9 @@ from metaworld.types import InitConfigDict
 
 
 class SawyerDoorLockEnvV2(SawyerXYZEnv):
+    _BODY_NAMES: tuple[str, ...] = ("lock_link", "door_link")
+    _SITE_NAMES: tuple[str, ...] = ("lockStartLock",)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -97,7 +100,7 @@ class SawyerDoorLockEnvV2(SawyerXYZEnv):
         return self._get_site_pos("lockStartLock")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("door_link").xquat
+        return self._body_xquat["door_link"]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -106,7 +109,7 @@ class SawyerDoorLockEnvV2(SawyerXYZEnv):
 
         for _ in range(self.frame_skip):
             mujoco.mj_step(self.model, self.data)
-        self.obj_init_pos = self.data.body("lock_link").xpos
+        self.obj_init_pos = self._body_xpos["lock_link"]
         self._target_pos = self.obj_init_pos + np.array([0.0, -0.04, -0.1])
         return self._get_obs()
 
@@ -144,3 +147,50 @@ class SawyerDoorLockEnvV2(SawyerXYZEnv):
         reward += 8 * lock_pressed
 
         return (reward, tcp_to_obj, obs[3], obj_to_target, near_lock, lock_pressed)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        obj = obs[:, 4:7]
+        tcp = state["left_pad"]
+        scale = np.array([0.25, 1.0, 0.5])
+        tcp_to_obj = np.linalg.norm((obj - tcp) * scale, axis=-1)
+        # `init_left_pad` is a view of the current position of the pad
+        tcp_to_obj_init = tcp_to_obj
+        obj_to_target = np.abs(params["target_pos"][..., 2] - obj[:, 2])
+        tcp_opened = np.maximum(obs[:, 3], 0.0)
+        near_lock = reward_utils.batched_tolerance(
+            tcp_to_obj,
+            bounds=(0, 0.01),
+            margin=tcp_to_obj_init,
+            sigmoid="long_tail",
+        )
+        lock_pressed = reward_utils.batched_tolerance(
+            obj_to_target,
+            bounds=(0, 0.005),
+            margin=params["lock_length"],
+            sigmoid="long_tail",
+        )
+        reward = 2 * reward_utils.batched_hamacher_product(tcp_opened, near_lock)
+        return reward + 8 * lock_pressed
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        return np.abs(params["target_pos"][..., 2] - obs[:, 6]) <= 0.02
+
+    def reward_params(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_params(),
+            "lock_length": np.array(self._lock_length, dtype=np.float64),
+        }
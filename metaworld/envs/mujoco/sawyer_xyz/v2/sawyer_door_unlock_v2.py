@@ -13,6 +13,9 @@ from metaworld.types import InitConfigDict
 
 
 class SawyerDoorUnlockEnvV2(SawyerXYZEnv):
+    _BODY_NAMES: tuple[str, ...] = ("lock_link", "door_link")
+    _SITE_NAMES: tuple[str, ...] = ("lockStartUnlock",)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -95,21 +98,21 @@ class SawyerDoorUnlockEnvV2(SawyerXYZEnv):
         return self._get_site_pos("lockStartUnlock")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("door_link").xquat
+        return self._body_xquat["door_link"]
 
     def _set_obj_xyz(self, pos: npt.NDArray[Any]) -> None:
         qpos = self.data.qpos.flat.copy()
         qvel = self.data.qvel.flat.copy()
         qpos[9] = pos
         qvel[9] = 0
-        self.set_state(qpos, qvel)
+        self._set_state_deferred(qpos, qvel)
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
         self.model.body("door").pos = self._get_state_rand_vec()
         self._set_obj_xyz(np.array(1.5708))
 
-        self.obj_init_pos = self.data.body("lock_link").xpos
+        self.obj_init_pos = self.get_body_com("lock_link")
         self._target_pos = self.obj_init_pos + np.array([0.1, -0.04, 0.0])
 
         return self._get_obs()
@@ -159,3 +162,50 @@ class SawyerDoorUnlockEnvV2(SawyerXYZEnv):
             ready_to_push,
             pushed,
         )
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        gripper = obs[:, :3]
+        lock = obs[:, 4:7]
+        offset = np.array([0.0, 0.055, 0.07])
+        scale = np.array([0.25, 1.0, 0.5])
+        shoulder_to_lock = (gripper + offset - lock) * scale
+        shoulder_to_lock_init = (
+            params["init_tcp"] + offset - params["obj_init_pos"]
+        ) * scale
+        ready_to_push = reward_utils.batched_tolerance(
+            np.linalg.norm(shoulder_to_lock, axis=-1),
+            bounds=(0, 0.02),
+            margin=np.linalg.norm(shoulder_to_lock_init, axis=-1),
+            sigmoid="long_tail",
+        )
+        obj_to_target = np.abs(params["target_pos"][..., 0] - lock[:, 0])
+        pushed = reward_utils.batched_tolerance(
+            obj_to_target,
+            bounds=(0, 0.005),
+            margin=params["lock_length"],
+            sigmoid="long_tail",
+        )
+        return 2 * ready_to_push + 8 * pushed
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        return np.abs(params["target_pos"][..., 0] - obs[:, 4]) <= 0.02
+
+    def reward_params(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_params(),
+            "lock_length": np.array(self._lock_length, dtype=np.float64),
+        }
@@ -5,7 +5,6 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.envs.asset_path_utils import full_v2_path_for
 from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import RenderMode, SawyerXYZEnv
@@ -14,6 +13,10 @@ from metaworld.types import InitConfigDict
 
 
 class SawyerDoorEnvV2(SawyerXYZEnv):
+    _GEOM_NAMES: tuple[str, ...] = ("handle",)
+    _JOINT_NAMES: tuple[str, ...] = ("doorjoint",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("maxPullDist", "objHeight", "target_reward")
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -89,23 +92,21 @@ class SawyerDoorEnvV2(SawyerXYZEnv):
         return []
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
-        return self.data.geom("handle").xpos.copy()
+        return self._geom_xpos["handle"].copy()
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return Rotation.from_matrix(
-            self.data.geom("handle").xmat.reshape(3, 3)
-        ).as_quat()
+        return self._xmat_to_quat(self._geom_xmat["handle"])
 
     def _set_obj_xyz(self, pos: npt.NDArray[Any]) -> None:
         qpos = self.data.qpos.copy()
         qvel = self.data.qvel.copy()
         qpos[self.door_qpos_adr] = pos
         qvel[self.door_qvel_adr] = 0
-        self.set_state(qpos.flatten(), qvel.flatten())
+        self._set_state_deferred(qpos.flatten(), qvel.flatten())
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
-        self.objHeight = self.data.geom("handle").xpos[2]
+        self.objHeight = self._geom_xpos["handle"][2]
 
         self.obj_init_pos = self._get_state_rand_vec()
         self._target_pos = self.obj_init_pos + np.array([-0.3, -0.45, 0.0])
@@ -113,9 +114,10 @@ class SawyerDoorEnvV2(SawyerXYZEnv):
         self.model.body("door").pos = self.obj_init_pos
         self.model.site("goal").pos = self._target_pos
         self._set_obj_xyz(np.array(0))
+        self._forward()
         assert self._target_pos is not None
         self.maxPullDist = np.linalg.norm(
-            self.data.geom("handle").xpos[:-1] - self._target_pos[:-1]
+            self._geom_xpos["handle"][:-1] - self._target_pos[:-1]
         )
         self.target_reward = 1000 * self.maxPullDist + 1000 * 2
         self.model.site("goal").pos = self._target_pos
@@ -177,7 +179,7 @@ class SawyerDoorEnvV2(SawyerXYZEnv):
         assert (
             self._target_pos is not None
         ), "`reset_model()` must be called before `compute_reward()`."
-        theta = float(self.data.joint("doorjoint").qpos.item())
+        theta = float(self._joint_qpos["doorjoint"].item())
 
         reward_grab = SawyerDoorEnvV2._reward_grab_effort(actions)
         reward_steps = SawyerDoorEnvV2._reward_pos(obs, theta)
@@ -198,3 +200,71 @@ class SawyerDoorEnvV2(SawyerXYZEnv):
             reward_grab,
             *reward_steps,
         )
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        theta = state["door_angle"]
+        reward_grab = (np.clip(action[:, 3], -1, 1) + 1.0) / 2.0
+
+        hand = obs[:, :3]
+        door = obs[:, 4:7] + np.array([-0.05, 0, 0])
+        threshold = 0.12
+        radius = np.linalg.norm(hand[:, :2] - door[:, :2], axis=-1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            floor = np.where(
+                radius <= threshold, 0.0, 0.04 * np.log(radius - threshold) + 0.4
+            )
+        above_floor = np.where(
+            hand[:, 2] >= floor,
+            1.0,
+            reward_utils.batched_tolerance(
+                floor - hand[:, 2],
+                bounds=(0.0, 0.01),
+                margin=np.maximum(floor / 2.0, 0.0),
+                sigmoid="long_tail",
+            ),
+        )
+        in_place = reward_utils.batched_tolerance(
+            np.linalg.norm(hand - door - np.array([0.05, 0.03, -0.01]), axis=-1),
+            bounds=(0, threshold / 2.0),
+            margin=0.5,
+            sigmoid="long_tail",
+        )
+        ready_to_open = reward_utils.batched_hamacher_product(above_floor, in_place)
+        door_angle = -theta
+        opened = 0.2 * (theta < -np.pi / 90.0) + 0.8 * reward_utils.batched_tolerance(
+            np.pi / 2.0 + np.pi / 6 - door_angle,
+            bounds=(0, 0.5),
+            margin=np.pi / 3.0,
+            sigmoid="long_tail",
+        )
+
+        reward = (
+            2.0 * reward_utils.batched_hamacher_product(ready_to_open, reward_grab)
+            + 8.0 * opened
+        )
+        return np.where(
+            np.abs(obs[:, 4] - params["target_pos"][..., 0]) <= 0.08, 10.0, reward
+        )
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        return np.abs(obs[:, 4] - params["target_pos"][..., 0]) <= 0.08
+
+    def reward_state(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_state(),
+            "door_angle": np.array(self._joint_qpos["doorjoint"].item()),
+        }
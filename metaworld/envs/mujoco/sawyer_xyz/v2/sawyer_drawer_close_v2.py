@@ -14,6 +14,7 @@ from metaworld.types import InitConfigDict
 
 class SawyerDrawerCloseEnvV2(SawyerXYZEnv):
     _TARGET_RADIUS: float = 0.04
+    _BODY_NAMES: tuple[str, ...] = ("drawer_link",)
 
     def __init__(
         self,
@@ -93,7 +94,7 @@ class SawyerDrawerCloseEnvV2(SawyerXYZEnv):
         qpos = self.data.qpos.flat.copy()
         qvel = self.data.qvel.flat.copy()
         qpos[9] = pos
-        self.set_state(qpos, qvel)
+        self._set_state_deferred(qpos, qvel)
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -156,3 +157,50 @@ class SawyerDrawerCloseEnvV2(SawyerXYZEnv):
         reward *= 10
 
         return (reward, tcp_to_obj, tcp_opened, target_to_obj, object_grasped, in_place)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        obj = obs[:, 4:7]
+        target = params["target_pos"]
+        target_radius = SawyerDrawerCloseEnvV2.TARGET_RADIUS
+        target_to_obj = np.linalg.norm(obj - target, axis=-1)
+        target_to_obj_init = np.linalg.norm(params["obj_init_pos"] - target, axis=-1)
+        in_place = reward_utils.batched_tolerance(
+            target_to_obj,
+            bounds=(0, target_radius),
+            margin=np.abs(target_to_obj_init - target_radius),
+            sigmoid="long_tail",
+        )
+        handle_reach_radius = 0.005
+        tcp_to_obj = np.linalg.norm(obj - state["tcp_center"], axis=-1)
+        tcp_to_obj_init = np.linalg.norm(
+            params["obj_init_pos"] - params["init_tcp"], axis=-1
+        )
+        reach = reward_utils.batched_tolerance(
+            tcp_to_obj,
+            bounds=(0, handle_reach_radius),
+            margin=np.abs(tcp_to_obj_init - handle_reach_radius),
+            sigmoid="gaussian",
+        )
+        gripper_closed = np.minimum(np.maximum(0, action[:, -1]), 1)
+        reach = reward_utils.batched_hamacher_product(reach, gripper_closed)
+        reward = reward_utils.batched_hamacher_product(reach, in_place)
+        reward = np.where(target_to_obj <= target_radius + 0.015, 1.0, reward)
+        return reward * 10
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj_to_target = np.linalg.norm(obs[:, 4:7] - params["target_pos"], axis=-1)
+        return obj_to_target <= SawyerDrawerCloseEnvV2.TARGET_RADIUS + 0.015
@@ -13,6 +13,9 @@ from metaworld.types import InitConfigDict
 
 
 class SawyerDrawerOpenEnvV2(SawyerXYZEnv):
+    _BODY_NAMES: tuple[str, ...] = ("drawer_link",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("prev_obs",)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -88,7 +91,7 @@ class SawyerDrawerOpenEnvV2(SawyerXYZEnv):
         return self.get_body_com("drawer_link") + np.array([0.0, -0.16, 0.0])
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("drawer_link").xquat
+        return self._body_xquat["drawer_link"]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -149,3 +152,48 @@ class SawyerDrawerOpenEnvV2(SawyerXYZEnv):
             reward_for_caging,
             reward_for_opening,
         )
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        gripper = obs[:, :3]
+        handle = obs[:, 4:7]
+        target = params["target_pos"]
+        max_dist = params["max_dist"]
+        handle_error = np.linalg.norm(handle - target, axis=-1)
+        reward_for_opening = reward_utils.batched_tolerance(
+            handle_error, bounds=(0, 0.02), margin=max_dist, sigmoid="long_tail"
+        )
+        handle_pos_init = target + max_dist[..., None] * np.array([0.0, 1.0, 0.0])
+        scale = np.array([3.0, 3.0, 1.0])
+        gripper_error = (handle - gripper) * scale
+        gripper_error_init = (handle_pos_init - params["init_tcp"]) * scale
+        reward_for_caging = reward_utils.batched_tolerance(
+            np.linalg.norm(gripper_error, axis=-1),
+            bounds=(0, 0.01),
+            margin=np.linalg.norm(gripper_error_init, axis=-1),
+            sigmoid="long_tail",
+        )
+        return (reward_for_caging + reward_for_opening) * 5.0
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj_to_target = np.linalg.norm(obs[:, 4:7] - params["target_pos"], axis=-1)
+        return obj_to_target <= 0.03
+
+    def reward_params(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_params(),
+            "max_dist": np.array(self.maxDist, dtype=np.float64),
+        }
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import Any
 
-import mujoco
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
@@ -14,6 +13,10 @@ from metaworld.types import InitConfigDict
 
 
 class SawyerFaucetCloseEnvV2(SawyerXYZEnv):
+    _BODY_NAMES: tuple[str, ...] = ("faucetBase",)
+    _SITE_NAMES: tuple[str, ...] = ("handleStartClose",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("reachCompleted",)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -90,7 +93,7 @@ class SawyerFaucetCloseEnvV2(SawyerXYZEnv):
         ]
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("faucetBase").xquat
+        return self._body_xquat["faucetBase"]
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
         return self._get_site_pos("handleStartClose") + np.array([0.0, 0.0, -0.01])
@@ -106,7 +109,7 @@ class SawyerFaucetCloseEnvV2(SawyerXYZEnv):
         self._target_pos = self.obj_init_pos + np.array(
             [-self._handle_length, 0.0, 0.125]
         )
-        mujoco.mj_forward(self.model, self.data)
+        self._invalidate_kinematics()
         self.model.site("goal_close").pos = self._target_pos
         return self._get_obs()
 
@@ -154,3 +157,53 @@ class SawyerFaucetCloseEnvV2(SawyerXYZEnv):
         reward = 10 if target_to_obj <= self._target_radius else reward
 
         return (reward, tcp_to_obj, tcp_opened, target_to_obj, object_grasped, in_place)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        obj = obs[:, 4:7]
+        target = params["target_pos"]
+        target_radius = params["target_radius"]
+        target_to_obj = np.linalg.norm(obj - target, axis=-1)
+        target_to_obj_init = np.linalg.norm(params["obj_init_pos"] - target, axis=-1)
+        in_place = reward_utils.batched_tolerance(
+            target_to_obj,
+            bounds=(0, target_radius),
+            margin=np.abs(target_to_obj_init - target_radius),
+            sigmoid="long_tail",
+        )
+        faucet_reach_radius = 0.01
+        tcp_to_obj = np.linalg.norm(obj - state["tcp_center"], axis=-1)
+        tcp_to_obj_init = np.linalg.norm(
+            params["obj_init_pos"] - params["init_tcp"], axis=-1
+        )
+        reach = reward_utils.batched_tolerance(
+            tcp_to_obj,
+            bounds=(0, faucet_reach_radius),
+            margin=np.abs(tcp_to_obj_init - faucet_reach_radius),
+            sigmoid="gaussian",
+        )
+        reward = (2 * reach + 3 * in_place) * 2
+        return np.where(target_to_obj <= target_radius, 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj_to_target = np.linalg.norm(obs[:, 4:7] - params["target_pos"], axis=-1)
+        return obj_to_target <= 0.07
+
+    def reward_params(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_params(),
+            "target_radius": np.array(self._target_radius, dtype=np.float64),
+        }
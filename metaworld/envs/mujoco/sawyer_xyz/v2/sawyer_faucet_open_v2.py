@@ -13,6 +13,10 @@ from metaworld.types import InitConfigDict
 
 
 class SawyerFaucetOpenEnvV2(SawyerXYZEnv):
+    _BODY_NAMES: tuple[str, ...] = ("faucetBase",)
+    _SITE_NAMES: tuple[str, ...] = ("handleStartOpen",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("reachCompleted",)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -92,7 +96,7 @@ class SawyerFaucetOpenEnvV2(SawyerXYZEnv):
         return self._get_site_pos("handleStartOpen") + np.array([0.0, 0.0, -0.01])
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("faucetBase").xquat
+        return self._body_xquat["faucetBase"]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -155,3 +159,53 @@ class SawyerFaucetOpenEnvV2(SawyerXYZEnv):
         reward = 10 if target_to_obj <= self._target_radius else reward
 
         return (reward, tcp_to_obj, tcp_opened, target_to_obj, object_grasped, in_place)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        obj = obs[:, 4:7] + np.array([-0.04, 0.0, 0.03])
+        target = params["target_pos"]
+        target_radius = params["target_radius"]
+        target_to_obj = np.linalg.norm(obj - target, axis=-1)
+        target_to_obj_init = np.linalg.norm(params["obj_init_pos"] - target, axis=-1)
+        in_place = reward_utils.batched_tolerance(
+            target_to_obj,
+            bounds=(0, target_radius),
+            margin=np.abs(target_to_obj_init - target_radius),
+            sigmoid="long_tail",
+        )
+        faucet_reach_radius = 0.01
+        tcp_to_obj = np.linalg.norm(obj - state["tcp_center"], axis=-1)
+        tcp_to_obj_init = np.linalg.norm(
+            params["obj_init_pos"] - params["init_tcp"], axis=-1
+        )
+        reach = reward_utils.batched_tolerance(
+            tcp_to_obj,
+            bounds=(0, faucet_reach_radius),
+            margin=np.abs(tcp_to_obj_init - faucet_reach_radius),
+            sigmoid="gaussian",
+        )
+        reward = (2 * reach + 3 * in_place) * 2
+        return np.where(target_to_obj <= target_radius, 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj = obs[:, 4:7] + np.array([-0.04, 0.0, 0.03])
+        return np.linalg.norm(obj - params["target_pos"], axis=-1) <= 0.07
+
+    def reward_params(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_params(),
+            "target_radius": np.array(self._target_radius, dtype=np.float64),
+        }
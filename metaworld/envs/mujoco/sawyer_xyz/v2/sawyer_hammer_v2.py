@@ -15,6 +15,11 @@ from metaworld.types import HammerInitConfigDict
 class SawyerHammerEnvV2(SawyerXYZEnv):
     HAMMER_HANDLE_LENGTH = 0.14
 
+    _BODY_NAMES: tuple[str, ...] = ("hammer", "nail_link")
+    _SITE_NAMES: tuple[str, ...] = ("goal", "nailHead")
+    _JOINT_NAMES: tuple[str, ...] = ("NailSlideJoint",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("hammer_init_pos", "nail_init_pos")
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -88,16 +93,14 @@ class SawyerHammerEnvV2(SawyerXYZEnv):
         )
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return np.hstack(
-            (self.data.body("hammer").xquat, self.data.body("nail_link").xquat)
-        )
+        return np.hstack((self._body_xquat["hammer"], self._body_xquat["nail_link"]))
 
     def _set_hammer_xyz(self, pos: npt.NDArray[Any]) -> None:
         qpos = self.data.qpos.flat.copy()
         qvel = self.data.qvel.flat.copy()
         qpos[9:12] = pos.copy()
         qvel[9:15] = 0
-        self.set_state(qpos, qvel)
+        self._set_state_deferred(qpos, qvel)
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -170,7 +173,7 @@ class SawyerHammerEnvV2(SawyerXYZEnv):
         reward = (2.0 * reward_grab + 6.0 * reward_in_place) * reward_quat
         # Override reward on success. We check that reward is above a threshold
         # because this env's success metric could be hacked easily
-        success = bool(self.data.joint("NailSlideJoint").qpos > 0.09)
+        success = bool(self._joint_qpos["NailSlideJoint"] > 0.09)
         if success and reward > 5.0:
             reward = 10.0
 
@@ -181,3 +184,65 @@ class SawyerHammerEnvV2(SawyerXYZEnv):
             reward_in_place,
             success,
         )
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        hand = obs[:, :3]
+        hammer = obs[:, 4:7]
+        hammer_head = hammer + np.array([0.16, 0.06, 0.0])
+        threshold = SawyerHammerEnvV2.HAMMER_HANDLE_LENGTH / 2.0
+        hammer_threshed = hammer.copy()
+        hammer_threshed[:, 0] = np.where(
+            np.abs(hammer[:, 0] - hand[:, 0]) < threshold, hand[:, 0], hammer[:, 0]
+        )
+
+        ideal = np.array([1.0, 0.0, 0.0, 0.0])
+        error = np.linalg.norm(obs[:, 7:11] - ideal, axis=-1)
+        reward_quat = np.maximum(1.0 - error / 0.4, 0.0)
+
+        reward_grab = SawyerHammerEnvV2._batched_gripper_caging_reward(
+            action,
+            hammer_threshed,
+            state,
+            params,
+            object_reach_radius=0.01,
+            obj_radius=0.015,
+            pad_success_thresh=0.02,
+            xz_thresh=0.01,
+            high_density=True,
+        )
+
+        pos_error = params["target_pos"] - hammer_head
+        lifted = hammer_head[:, 2] > 0.02
+        reward_in_place = 0.1 * lifted + 0.9 * reward_utils.batched_tolerance(
+            np.linalg.norm(pos_error, axis=-1),
+            bounds=(0, 0.02),
+            margin=0.2,
+            sigmoid="long_tail",
+        )
+
+        reward = (2.0 * reward_grab + 6.0 * reward_in_place) * reward_quat
+        success = state["nail_depth"] > 0.09
+        return np.where(success & (reward > 5.0), 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        return state["nail_depth"] > 0.09
+
+    def reward_state(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_state(),
+            "nail_depth": np.array(self._joint_qpos["NailSlideJoint"].item()),
+        }
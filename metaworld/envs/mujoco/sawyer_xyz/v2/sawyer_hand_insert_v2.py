@@ -14,6 +14,10 @@ from metaworld.types import InitConfigDict
 
 class SawyerHandInsertEnvV2(SawyerXYZEnv):
     TARGET_RADIUS: float = 0.05
+    _RAND_VEC_MIN_XY_DISTANCE: float = 0.15
+    _BODY_NAMES: tuple[str, ...] = ("obj",)
+    _GEOM_NAMES: tuple[str, ...] = ("objGeom",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("objHeight", "obj_init_angle", "prev_obs")
 
     def __init__(
         self,
@@ -91,13 +95,13 @@ class SawyerHandInsertEnvV2(SawyerXYZEnv):
         return reward, info
 
     def _get_id_main_object(self) -> int:
-        return self.model.geom("objGeom").id
+        return self._geom_ids["objGeom"]
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
         return self.get_body_com("obj")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("obj").xquat
+        return self._body_xquat["obj"]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -106,7 +110,10 @@ class SawyerHandInsertEnvV2(SawyerXYZEnv):
         self.objHeight = self.get_body_com("obj")[2]
 
         goal_pos = self._get_state_rand_vec()
-        while np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1]) < 0.15:
+        while (
+            np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1])
+            < self._RAND_VEC_MIN_XY_DISTANCE
+        ):
             goal_pos = self._get_state_rand_vec()
         assert self.obj_init_pos is not None
         self.obj_init_pos = np.concatenate([goal_pos[:2], [self.obj_init_pos[-1]]])
@@ -153,3 +160,55 @@ class SawyerHandInsertEnvV2(SawyerXYZEnv):
         if target_to_obj < self.TARGET_RADIUS:
             reward = 10.0
         return (reward, tcp_to_obj, tcp_opened, target_to_obj, object_grasped, in_place)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        obj = obs[:, 4:7]
+        target = params["target_pos"]
+        target_to_obj = np.linalg.norm(obj - target, axis=-1)
+        target_to_obj_init = np.linalg.norm(params["obj_init_pos"] - target, axis=-1)
+        in_place = reward_utils.batched_tolerance(
+            target_to_obj,
+            bounds=(0, SawyerHandInsertEnvV2.TARGET_RADIUS),
+            margin=target_to_obj_init,
+            sigmoid="long_tail",
+        )
+        object_grasped = SawyerHandInsertEnvV2._batched_gripper_caging_reward(
+            action,
+            obj,
+            state,
+            params,
+            object_reach_radius=0.01,
+            obj_radius=0.015,
+            pad_success_thresh=0.05,
+            xz_thresh=0.005,
+            high_density=True,
+        )
+        reward = reward_utils.batched_hamacher_product(object_grasped, in_place)
+        tcp_opened = obs[:, 3]
+        tcp_to_obj = np.linalg.norm(obj - state["tcp_center"], axis=-1)
+        reward = np.where(
+            (tcp_to_obj < 0.02) & (tcp_opened > 0),
+            reward + (1.0 + 7.0 * in_place),
+            reward,
+        )
+        return np.where(
+            target_to_obj < SawyerHandInsertEnvV2.TARGET_RADIUS, 10.0, reward
+        )
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj_to_target = np.linalg.norm(obs[:, 4:7] - params["target_pos"], axis=-1)
+        return obj_to_target <= 0.05
@@ -14,6 +14,12 @@ from metaworld.types import InitConfigDict
 
 class SawyerHandlePressEnvV2(SawyerXYZEnv):
     TARGET_RADIUS: float = 0.02
+    _SITE_NAMES: tuple[str, ...] = ("handleStart", "goalPress")
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = (
+        "_handle_init_pos",
+        "maxDist",
+        "target_reward",
+    )
 
     def __init__(
         self,
@@ -95,7 +101,7 @@ class SawyerHandlePressEnvV2(SawyerXYZEnv):
         qvel = self.data.qvel.flat.copy()
         qpos[9] = pos
         qvel[9] = 0
-        self.set_state(qpos, qvel)
+        self._set_state_deferred(qpos, qvel)
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -104,9 +110,7 @@ class SawyerHandlePressEnvV2(SawyerXYZEnv):
         self.model.body("box").pos = self.obj_init_pos
         self._set_obj_xyz(np.array(-0.001))
         self._target_pos = self._get_site_pos("goalPress")
-        self.maxDist = np.abs(
-            self.data.site("handleStart").xpos[-1] - self._target_pos[-1]
-        )
+        self.maxDist = np.abs(self._site_xpos["handleStart"][-1] - self._target_pos[-1])
         self.target_reward = 1000 * self.maxDist + 1000 * 2
         self._handle_init_pos = self._get_pos_objects()
 
@@ -151,3 +155,52 @@ class SawyerHandlePressEnvV2(SawyerXYZEnv):
         reward = 1.0 if target_to_obj <= self.TARGET_RADIUS else reward
         reward *= 10
         return (reward, tcp_to_obj, tcp_opened, target_to_obj, object_grasped, in_place)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        obj = obs[:, 4:7]
+        target = params["target_pos"]
+        handle_init_pos = params["handle_init_pos"]
+        target_radius = SawyerHandlePressEnvV2.TARGET_RADIUS
+        target_to_obj = np.abs(obj[:, 2] - target[..., 2])
+        target_to_obj_init = np.abs(handle_init_pos[..., 2] - target[..., 2])
+        in_place = reward_utils.batched_tolerance(
+            target_to_obj,
+            bounds=(0, target_radius),
+            margin=np.abs(target_to_obj_init - target_radius),
+            sigmoid="long_tail",
+        )
+        handle_radius = 0.02
+        tcp_to_obj = np.linalg.norm(obj - state["tcp_center"], axis=-1)
+        tcp_to_obj_init = np.linalg.norm(handle_init_pos - params["init_tcp"], axis=-1)
+        reach = reward_utils.batched_tolerance(
+            tcp_to_obj,
+            bounds=(0, handle_radius),
+            margin=np.abs(tcp_to_obj_init - handle_radius),
+            sigmoid="long_tail",
+        )
+        reward = reward_utils.batched_hamacher_product(reach, in_place)
+        return np.where(target_to_obj <= target_radius, 1.0, reward) * 10
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        target_to_obj = np.abs(obs[:, 6] - params["target_pos"][..., 2])
+        return target_to_obj <= SawyerHandlePressEnvV2.TARGET_RADIUS
+
+    def reward_params(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_params(),
+            "handle_init_pos": np.array(self._handle_init_pos, dtype=np.float64),
+        }
@@ -13,6 +13,9 @@ from metaworld.types import InitConfigDict
 
 
 class SawyerHandlePullSideEnvV2(SawyerXYZEnv):
+    _SITE_NAMES: tuple[str, ...] = ("handleStart", "handleCenter", "goalPull")
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("maxDist", "target_reward")
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -98,7 +101,7 @@ class SawyerHandlePullSideEnvV2(SawyerXYZEnv):
         qvel = self.data.qvel.flat.copy()
         qpos[9] = pos
         qvel[9] = 0
-        self.set_state(qpos, qvel)
+        self._set_state_deferred(qpos, qvel)
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -107,9 +110,7 @@ class SawyerHandlePullSideEnvV2(SawyerXYZEnv):
         self.model.body("box").pos = self.obj_init_pos
         self._set_obj_xyz(np.array(-0.1))
         self._target_pos = self._get_site_pos("goalPull")
-        self.maxDist = np.abs(
-            self.data.site("handleStart").xpos[-1] - self._target_pos[-1]
-        )
+        self.maxDist = np.abs(self._site_xpos["handleStart"][-1] - self._target_pos[-1])
         self.target_reward = 1000 * self.maxDist + 1000 * 2
         self.obj_init_pos = self._get_pos_objects()
 
@@ -163,3 +164,57 @@ class SawyerHandlePullSideEnvV2(SawyerXYZEnv):
         if target_to_obj < self.TARGET_RADIUS:
             reward = 10.0
         return (reward, tcp_to_obj, tcp_opened, target_to_obj, object_grasped, in_place)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        obj = obs[:, 4:7]
+        target = params["target_pos"]
+        obj_init_pos = params["obj_init_pos"]
+        target_radius = SawyerHandlePullSideEnvV2.TARGET_RADIUS
+        target_to_obj = np.linalg.norm(obj - target, axis=-1)
+        target_to_obj_init = np.linalg.norm(obj_init_pos - target, axis=-1)
+        in_place = reward_utils.batched_tolerance(
+            target_to_obj,
+            bounds=(0, target_radius),
+            margin=target_to_obj_init,
+            sigmoid="long_tail",
+        )
+        object_grasped = SawyerHandlePullSideEnvV2._batched_gripper_caging_reward(
+            action,
+            obj,
+            state,
+            params,
+            pad_success_thresh=0.06,
+            obj_radius=0.032,
+            object_reach_radius=0.01,
+            xz_thresh=0.01,
+            high_density=True,
+        )
+        reward = reward_utils.batched_hamacher_product(object_grasped, in_place)
+        tcp_opened = obs[:, 3]
+        tcp_to_obj = np.linalg.norm(obj - state["tcp_center"], axis=-1)
+        reward = np.where(
+            (tcp_to_obj < 0.035)
+            & (tcp_opened > 0)
+            & (obj[:, 2] - 0.01 > obj_init_pos[..., 2]),
+            reward + (1.0 + 5.0 * in_place),
+            reward,
+        )
+        return np.where(target_to_obj < target_radius, 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj_to_target = np.linalg.norm(obs[:, 4:7] - params["target_pos"], axis=-1)
+        return obj_to_target <= 0.08
@@ -13,6 +13,8 @@ from metaworld.types import InitConfigDict
 
 
 class SawyerHandlePullEnvV2(SawyerXYZEnv):
+    _SITE_NAMES: tuple[str, ...] = ("handleRight", "goalPull")
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -97,7 +99,7 @@ class SawyerHandlePullEnvV2(SawyerXYZEnv):
         qvel = self.data.qvel.flat.copy()
         qpos[9] = pos
         qvel[9] = 0
-        self.set_state(qpos, qvel)
+        self._set_state_deferred(qpos, qvel)
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -151,3 +153,57 @@ class SawyerHandlePullEnvV2(SawyerXYZEnv):
         if target_to_obj < self.TARGET_RADIUS:
             reward = 10.0
         return (reward, tcp_to_obj, tcp_opened, target_to_obj, object_grasped, in_place)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        obj = obs[:, 4:7]
+        target = params["target_pos"]
+        obj_init_pos = params["obj_init_pos"]
+        target_radius = SawyerHandlePullEnvV2.TARGET_RADIUS
+        target_to_obj = np.abs(target[..., 2] - obj[:, 2])
+        target_to_obj_init = np.abs(target[..., 2] - obj_init_pos[..., 2])
+        in_place = reward_utils.batched_tolerance(
+            target_to_obj,
+            bounds=(0, target_radius),
+            margin=target_to_obj_init,
+            sigmoid="long_tail",
+        )
+        object_grasped = SawyerHandlePullEnvV2._batched_gripper_caging_reward(
+            action,
+            obj,
+            state,
+            params,
+            pad_success_thresh=0.05,
+            obj_radius=0.022,
+            object_reach_radius=0.01,
+            xz_thresh=0.01,
+            high_density=True,
+        )
+        reward = reward_utils.batched_hamacher_product(object_grasped, in_place)
+        tcp_opened = obs[:, 3]
+        tcp_to_obj = np.linalg.norm(obj - state["tcp_center"], axis=-1)
+        reward = np.where(
+            (tcp_to_obj < 0.035)
+            & (tcp_opened > 0)
+            & (obj[:, 1] - 0.01 > obj_init_pos[..., 2]),
+            reward + (1.0 + 5.0 * in_place),
+            reward,
+        )
+        return np.where(target_to_obj < target_radius, 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        target_to_obj = np.abs(params["target_pos"][..., 2] - obs[:, 6])
+        return target_to_obj <= SawyerHandlePullEnvV2.TARGET_RADIUS
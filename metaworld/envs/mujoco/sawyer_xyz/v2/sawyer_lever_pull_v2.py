@@ -6,7 +6,6 @@ import mujoco
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.envs.asset_path_utils import full_v2_path_for
 from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import RenderMode, SawyerXYZEnv
@@ -30,6 +29,11 @@ class SawyerLeverPullEnvV2(SawyerXYZEnv):
 
     LEVER_RADIUS = 0.2
 
+    _SITE_NAMES: tuple[str, ...] = ("leverStart",)
+    _GEOM_NAMES: tuple[str, ...] = ("objGeom",)
+    _JOINT_NAMES: tuple[str, ...] = ("LeverAxis",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("_lever_pos_init",)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -101,8 +105,7 @@ class SawyerLeverPullEnvV2(SawyerXYZEnv):
         return self._get_site_pos("leverStart")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.geom("objGeom").xmat.reshape(3, 3)
-        return Rotation.from_matrix(geom_xmat).as_quat()
+        return self._xmat_to_quat(self._geom_xmat["objGeom"])
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -149,7 +152,7 @@ class SawyerLeverPullEnvV2(SawyerXYZEnv):
         # The skill of the agent should be measured by its ability to get the
         # lever to point straight upward. This means we'll be measuring the
         # current angle of the lever's joint, and comparing with 90deg.
-        lever_angle = float(-self.data.joint("LeverAxis").qpos.item())
+        lever_angle = float(-self._joint_qpos["LeverAxis"].item())
         lever_angle_desired = np.pi / 2.0
 
         lever_error = abs(lever_angle - lever_angle_desired)
@@ -184,3 +187,59 @@ class SawyerLeverPullEnvV2(SawyerXYZEnv):
             lever_error,
             lever_engagement,
         )
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        gripper = obs[:, :3]
+        lever = obs[:, 4:7]
+        lever_pos_init = params["lever_pos_init"]
+        scale = np.array([4.0, 1.0, 4.0])
+        offset = np.array([0.0, 0.055, 0.07])
+        shoulder_to_lever = (gripper + offset - lever) * scale
+        shoulder_to_lever_init = (params["init_tcp"] + offset - lever_pos_init) * scale
+        ready_to_lift = reward_utils.batched_tolerance(
+            np.linalg.norm(shoulder_to_lever, axis=-1),
+            bounds=(0, 0.02),
+            margin=np.linalg.norm(shoulder_to_lever_init, axis=-1),
+            sigmoid="long_tail",
+        )
+        target = params["target_pos"]
+        obj_to_target = np.linalg.norm(lever - target, axis=-1)
+        in_place_margin = np.linalg.norm(lever_pos_init - target, axis=-1)
+        in_place = reward_utils.batched_tolerance(
+            obj_to_target,
+            bounds=(0, 0.04),
+            margin=in_place_margin,
+            sigmoid="long_tail",
+        )
+        return 10.0 * reward_utils.batched_hamacher_product(ready_to_lift, in_place)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        # Whether the lever is pulled up is judged by its angle, not the target
+        return np.abs(state["lever_angle"] - np.pi / 2.0) <= np.pi / 24
+
+    def reward_state(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_state(),
+            "lever_angle": np.array(-self._joint_qpos["LeverAxis"].item()),
+        }
+
+    def reward_params(self) -> dict[str, npt.NDArray[np.float64]]:
+        assert self._lever_pos_init is not None
+        return {
+            **super().reward_params(),
+            "lever_pos_init": np.array(self._lever_pos_init, dtype=np.float64),
+        }
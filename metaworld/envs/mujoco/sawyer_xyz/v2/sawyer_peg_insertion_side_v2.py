@@ -5,7 +5,6 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.envs.asset_path_utils import full_v2_path_for
 from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import RenderMode, SawyerXYZEnv
@@ -32,6 +31,17 @@ class SawyerPegInsertionSideEnvV2(SawyerXYZEnv):
             the hole's position, as opposed to hand_low and hand_high
     """
 
+    _RAND_VEC_MIN_XY_DISTANCE: float = 0.1
+    _SITE_NAMES: tuple[str, ...] = (
+        "pegGrasp",
+        "pegHead",
+        "bottom_right_corner_collision_box_1",
+        "top_left_corner_collision_box_1",
+        "bottom_right_corner_collision_box_2",
+        "top_left_corner_collision_box_2",
+    )
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("peg_head_pos_init",)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -123,13 +133,14 @@ class SawyerPegInsertionSideEnvV2(SawyerXYZEnv):
         return self._get_site_pos("pegGrasp")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.site("pegGrasp").xmat.reshape(3, 3)
-        return Rotation.from_matrix(geom_xmat).as_quat()
+        return self._xmat_to_quat(self._site_xmat["pegGrasp"])
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
         pos_peg, pos_box = np.split(self._get_state_rand_vec(), 2)
-        while np.linalg.norm(pos_peg[:2] - pos_box[:2]) < 0.1:
+        while (
+            np.linalg.norm(pos_peg[:2] - pos_box[:2]) < self._RAND_VEC_MIN_XY_DISTANCE
+        ):
             pos_peg, pos_box = np.split(self._get_state_rand_vec(), 2)
         self.obj_init_pos = pos_peg
         self.peg_head_pos_init = self._get_site_pos("pegHead")
@@ -224,3 +235,98 @@ class SawyerPegInsertionSideEnvV2(SawyerXYZEnv):
             collision_boxes,
             ip_orig,
         )
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        obj = obs[:, 4:7]
+        obj_head = state["peg_head"]
+        tcp_opened = obs[:, 3]
+        target = params["target_pos"]
+        obj_init_pos = params["obj_init_pos"]
+        tcp_to_obj = np.linalg.norm(obj - state["tcp_center"], axis=-1)
+        scale = np.array([1.0, 2.0, 2.0])
+        obj_to_target = np.linalg.norm((obj_head - target) * scale, axis=-1)
+        in_place_margin = np.linalg.norm(
+            (params["peg_head_pos_init"] - target) * scale, axis=-1
+        )
+        in_place = reward_utils.batched_tolerance(
+            obj_to_target,
+            bounds=(0, SawyerPegInsertionSideEnvV2.TARGET_RADIUS),
+            margin=in_place_margin,
+            sigmoid="long_tail",
+        )
+
+        # The bottom right and top left corners of each collision box
+        brc_col_box_1, tlc_col_box_1, brc_col_box_2, tlc_col_box_2 = np.moveaxis(
+            state["collision_box_corners"], -2, 0
+        )
+        collision_box_bottom_1 = reward_utils.batched_rect_prism_tolerance(
+            curr=obj_head, one=tlc_col_box_1, zero=brc_col_box_1
+        )
+        collision_box_bottom_2 = reward_utils.batched_rect_prism_tolerance(
+            curr=obj_head, one=tlc_col_box_2, zero=brc_col_box_2
+        )
+        collision_boxes = reward_utils.batched_hamacher_product(
+            collision_box_bottom_2, collision_box_bottom_1
+        )
+        in_place = reward_utils.batched_hamacher_product(in_place, collision_boxes)
+
+        object_grasped = SawyerPegInsertionSideEnvV2._batched_gripper_caging_reward(
+            action,
+            obj,
+            state,
+            params,
+            object_reach_radius=0.01,
+            obj_radius=0.0075,
+            pad_success_thresh=0.03,
+            xz_thresh=0.005,
+            high_density=True,
+        )
+        grasped = (
+            (tcp_to_obj < 0.08)
+            & (tcp_opened > 0)
+            & (obj[:, 2] - 0.01 > obj_init_pos[..., 2])
+        )
+        object_grasped = np.where(grasped, 1.0, object_grasped)
+        reward = reward_utils.batched_hamacher_product(object_grasped, in_place)
+        reward = np.where(grasped, reward + (1.0 + 5 * in_place), reward)
+        return np.where(obj_to_target <= 0.07, 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        scale = np.array([1.0, 2.0, 2.0])
+        obj_to_target = np.linalg.norm(
+            (state["peg_head"] - params["target_pos"]) * scale, axis=-1
+        )
+        return obj_to_target <= 0.07
+
+    def reward_state(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_state(),
+            "peg_head": self._get_site_pos("pegHead").copy(),
+            "collision_box_corners": np.stack(
+                [
+                    self._get_site_pos(f"{corner}_corner_collision_box_{box}")
+                    for box in (1, 2)
+                    for corner in ("bottom_right", "top_left")
+                ]
+            ),
+        }
+
+    def reward_params(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_params(),
+            "peg_head_pos_init": np.array(self.peg_head_pos_init, dtype=np.float64),
+        }
@@ -13,6 +13,9 @@ from metaworld.types import InitConfigDict
 
 
 class SawyerPegUnplugSideEnvV2(SawyerXYZEnv):
+    _BODY_NAMES: tuple[str, ...] = ("plug1",)
+    _SITE_NAMES: tuple[str, ...] = ("pegEnd",)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -85,7 +88,7 @@ class SawyerPegUnplugSideEnvV2(SawyerXYZEnv):
         return self._get_site_pos("pegEnd")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("plug1").xquat
+        return self._body_xquat["plug1"]
 
     def _set_obj_xyz(self, pos: npt.NDArray[Any]) -> None:
         qpos = self.data.qpos.flat.copy()
@@ -93,7 +96,7 @@ class SawyerPegUnplugSideEnvV2(SawyerXYZEnv):
         qpos[9:12] = pos
         qpos[12:16] = np.array([1.0, 0.0, 0.0, 0.0])
         qvel[9:12] = 0
-        self.set_state(qpos, qvel)
+        self._set_state_deferred(qpos, qvel)
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -160,3 +163,55 @@ class SawyerPegUnplugSideEnvV2(SawyerXYZEnv):
             in_place,
             float(grasp_success),
         )
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        obj = obs[:, 4:7]
+        tcp_opened = obs[:, 3]
+        target = params["target_pos"]
+        obj_init_pos = params["obj_init_pos"]
+        tcp_to_obj = np.linalg.norm(obj - state["tcp_center"], axis=-1)
+        obj_to_target = np.linalg.norm(obj - target, axis=-1)
+        object_grasped = SawyerPegUnplugSideEnvV2._batched_gripper_caging_reward(
+            action,
+            obj,
+            state,
+            params,
+            object_reach_radius=0.01,
+            obj_radius=0.025,
+            pad_success_thresh=0.05,
+            xz_thresh=0.005,
+            desired_gripper_effort=0.8,
+            high_density=True,
+        )
+        in_place_margin = np.linalg.norm(obj_init_pos - target, axis=-1)
+        in_place = reward_utils.batched_tolerance(
+            obj_to_target,
+            bounds=(0, 0.05),
+            margin=in_place_margin,
+            sigmoid="long_tail",
+        )
+        grasp_success = (tcp_opened > 0.5) & (obj[:, 0] - obj_init_pos[..., 0] > 0.015)
+        reward = np.where(
+            grasp_success & (tcp_to_obj < 0.035),
+            1 + 2 * object_grasped + 5 * in_place,
+            2 * object_grasped,
+        )
+        return np.where(obj_to_target <= 0.05, 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj_to_target = np.linalg.norm(obs[:, 4:7] - params["target_pos"], axis=-1)
+        return obj_to_target <= 0.07
@@ -14,6 +14,8 @@ from metaworld.types import InitConfigDict
 
 class SawyerPickOutOfHoleEnvV2(SawyerXYZEnv):
     _TARGET_RADIUS: float = 0.02
+    _RAND_VEC_MIN_XY_DISTANCE: float = 0.15
+    _BODY_NAMES: tuple[str, ...] = ("obj",)
 
     def __init__(
         self,
@@ -100,13 +102,15 @@ class SawyerPickOutOfHoleEnvV2(SawyerXYZEnv):
         return self.get_body_com("obj")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("obj").xquat
+        return self._body_xquat["obj"]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
 
         pos_obj, pos_goal = np.split(self._get_state_rand_vec(), 2)
-        while np.linalg.norm(pos_obj[:2] - pos_goal[:2]) < 0.15:
+        while (
+            np.linalg.norm(pos_obj[:2] - pos_goal[:2]) < self._RAND_VEC_MIN_XY_DISTANCE
+        ):
             pos_obj, pos_goal = np.split(self._get_state_rand_vec(), 2)
 
         self.obj_init_pos = pos_obj
@@ -178,3 +182,79 @@ class SawyerPickOutOfHoleEnvV2(SawyerXYZEnv):
             object_grasped,
             in_place,
         )
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        obj = obs[:, 4:7]
+        gripper = state["tcp_center"]
+        target = params["target_pos"]
+        obj_init_pos = params["obj_init_pos"]
+        obj_to_target = np.linalg.norm(obj - target, axis=-1)
+        tcp_to_obj = np.linalg.norm(obj - gripper, axis=-1)
+        in_place_margin = np.linalg.norm(obj_init_pos - target, axis=-1)
+
+        threshold = 0.03
+        radius = np.linalg.norm(gripper[:, :2] - obj_init_pos[..., :2], axis=-1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            floor = np.where(
+                radius <= threshold, 0.0, 0.015 * np.log(radius - threshold) + 0.15
+            )
+        above_floor = np.where(
+            gripper[:, 2] >= floor,
+            1.0,
+            reward_utils.batched_tolerance(
+                np.maximum(floor - gripper[:, 2], 0.0),
+                bounds=(0.0, 0.01),
+                margin=0.02,
+                sigmoid="long_tail",
+            ),
+        )
+        object_grasped = SawyerPickOutOfHoleEnvV2._batched_gripper_caging_reward(
+            action,
+            obj,
+            state,
+            params,
+            object_reach_radius=0.01,
+            obj_radius=0.015,
+            pad_success_thresh=0.02,
+            xz_thresh=0.03,
+            desired_gripper_effort=0.1,
+            high_density=True,
+        )
+        in_place = reward_utils.batched_tolerance(
+            obj_to_target, bounds=(0, 0.02), margin=in_place_margin, sigmoid="long_tail"
+        )
+        reward = reward_utils.batched_hamacher_product(object_grasped, in_place)
+
+        near_object = tcp_to_obj < 0.04
+        pinched_without_obj = obs[:, 3] < 0.33
+        lifted = obj[:, 2] - 0.02 > obj_init_pos[..., 2]
+        grasp_success = near_object & lifted & ~pinched_without_obj
+        reward = np.where(
+            grasp_success,
+            reward
+            + (
+                1.0 + 5.0 * reward_utils.batched_hamacher_product(in_place, above_floor)
+            ),
+            reward,
+        )
+        return np.where(
+            obj_to_target < SawyerPickOutOfHoleEnvV2.TARGET_RADIUS, 10.0, reward
+        )
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj_to_target = np.linalg.norm(obs[:, 4:7] - params["target_pos"], axis=-1)
+        return obj_to_target <= 0.07
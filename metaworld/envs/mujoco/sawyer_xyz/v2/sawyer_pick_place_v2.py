@@ -5,7 +5,6 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.envs.asset_path_utils import full_v2_path_for
 from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import RenderMode, SawyerXYZEnv
@@ -28,6 +27,11 @@ class SawyerPickPlaceEnvV2(SawyerXYZEnv):
         - (6/15/20) Separated reach-push-pick-place into 3 separate envs.
     """
 
+    _RAND_VEC_MIN_XY_DISTANCE: float = 0.15
+    _BODY_NAMES: tuple[str, ...] = ("obj",)
+    _GEOM_NAMES: tuple[str, ...] = ("objGeom",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("obj_init_angle",)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -110,15 +114,13 @@ class SawyerPickPlaceEnvV2(SawyerXYZEnv):
         return reward, info
 
     def _get_id_main_object(self) -> int:
-        return self.data.geom("objGeom").id
+        return self._geom_ids["objGeom"]
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
         return self.get_body_com("obj")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return Rotation.from_matrix(
-            self.data.geom("objGeom").xmat.reshape(3, 3)
-        ).as_quat()
+        return self._xmat_to_quat(self._geom_xmat["objGeom"])
 
     def fix_extreme_obj_pos(self, orig_init_pos: npt.NDArray[Any]) -> npt.NDArray[Any]:
         # This is to account for meshes for the geom and object are not
@@ -140,7 +142,10 @@ class SawyerPickPlaceEnvV2(SawyerXYZEnv):
 
         goal_pos = self._get_state_rand_vec()
         self._target_pos = goal_pos[3:]
-        while np.linalg.norm(goal_pos[:2] - self._target_pos[:2]) < 0.15:
+        while (
+            np.linalg.norm(goal_pos[:2] - self._target_pos[:2])
+            < self._RAND_VEC_MIN_XY_DISTANCE
+        ):
             goal_pos = self._get_state_rand_vec()
             self._target_pos = goal_pos[3:]
         self._target_pos = goal_pos[-3:]
@@ -259,3 +264,109 @@ class SawyerPickPlaceEnvV2(SawyerXYZEnv):
         if obj_to_target < _TARGET_RADIUS:
             reward = 10.0
         return (reward, tcp_to_obj, tcp_opened, obj_to_target, object_grasped, in_place)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        _TARGET_RADIUS: float = 0.05
+        obj = obs[:, 4:7]
+        tcp_opened = obs[:, 3]
+        target = params["target_pos"]
+        obj_init_pos = params["obj_init_pos"]
+        obj_to_target = np.linalg.norm(obj - target, axis=-1)
+        tcp_to_obj = np.linalg.norm(obj - state["tcp_center"], axis=-1)
+        in_place_margin = np.linalg.norm(obj_init_pos - target, axis=-1)
+        in_place = reward_utils.batched_tolerance(
+            obj_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=in_place_margin,
+            sigmoid="long_tail",
+        )
+        object_grasped = SawyerPickPlaceEnvV2._batched_gripper_caging_reward(
+            action, obj, state, params
+        )
+        in_place_and_object_grasped = reward_utils.batched_hamacher_product(
+            object_grasped, in_place
+        )
+        reward = np.where(
+            (tcp_to_obj < 0.02)
+            & (tcp_opened > 0)
+            & (obj[:, 2] - 0.01 > obj_init_pos[..., 2]),
+            in_place_and_object_grasped + (1.0 + 5.0 * in_place),
+            in_place_and_object_grasped,
+        )
+        return np.where(obj_to_target < _TARGET_RADIUS, 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj_to_target = np.linalg.norm(obs[:, 4:7] - params["target_pos"], axis=-1)
+        return obj_to_target <= 0.07
+
+    @staticmethod
+    def _batched_gripper_caging_reward(
+        action: npt.NDArray[np.float32],
+        obj_pos: npt.NDArray[np.float64],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+        obj_radius: float = 0,  # All of these args are unused, just here to match
+        pad_success_thresh: float = 0,  # the parent's type signature
+        object_reach_radius: float = 0,
+        xz_thresh: float = 0,
+        desired_gripper_effort: float = 1.0,
+        high_density: bool = False,
+        medium_density: bool = False,
+    ) -> npt.NDArray[np.float64]:
+        pad_success_margin = 0.05
+        x_z_success_margin = 0.005
+        obj_radius = 0.015
+
+        # The initial pad positions are views of the current ones
+        left_pad, right_pad = state["left_pad"], state["right_pad"]
+        right_caging = reward_utils.batched_tolerance(
+            obj_pos[:, 1] - right_pad[:, 1],
+            bounds=(obj_radius, pad_success_margin),
+            margin=np.abs(np.abs(obj_pos[:, 1] - right_pad[:, 1]) - pad_success_margin),
+            sigmoid="long_tail",
+        )
+        left_caging = reward_utils.batched_tolerance(
+            left_pad[:, 1] - obj_pos[:, 1],
+            bounds=(obj_radius, pad_success_margin),
+            margin=np.abs(np.abs(obj_pos[:, 1] - left_pad[:, 1]) - pad_success_margin),
+            sigmoid="long_tail",
+        )
+        y_caging = reward_utils.batched_hamacher_product(left_caging, right_caging)
+
+        # The tcp to object distance in the x_z plane, and its initial value
+        xz = [0, 2]
+        tcp_obj_norm_x_z = np.linalg.norm(
+            state["tcp_center"][:, xz] - obj_pos[:, xz], axis=-1
+        )
+        tcp_obj_x_z_margin = (
+            np.linalg.norm(
+                params["obj_init_pos"][..., xz] - params["init_tcp"][..., xz], axis=-1
+            )
+            - x_z_success_margin
+        )
+        x_z_caging = reward_utils.batched_tolerance(
+            tcp_obj_norm_x_z,
+            bounds=(0, x_z_success_margin),
+            margin=tcp_obj_x_z_margin,
+            sigmoid="long_tail",
+        )
+
+        gripper_closed = np.minimum(np.maximum(0, action[:, -1]), 1)
+        caging = reward_utils.batched_hamacher_product(y_caging, x_z_caging)
+        gripping = np.where(caging > 0.97, gripper_closed, 0.0)
+        caging_and_gripping = reward_utils.batched_hamacher_product(caging, gripping)
+        return (caging_and_gripping + caging) / 2
@@ -5,7 +5,6 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.envs.asset_path_utils import full_v2_path_for
 from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import RenderMode, SawyerXYZEnv
@@ -29,6 +28,8 @@ class SawyerPlateSlideBackSideEnvV2(SawyerXYZEnv):
         - (6/22/20) Cabinet now sits on ground, instead of .02 units above it
     """
 
+    _GEOM_NAMES: tuple[str, ...] = ("puck",)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -99,11 +100,10 @@ class SawyerPlateSlideBackSideEnvV2(SawyerXYZEnv):
         return reward, info
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
-        return self.data.geom("puck").xpos
+        return self._geom_xpos["puck"]
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.geom("puck").xmat.reshape(3, 3)
-        return Rotation.from_matrix(geom_xmat).as_quat()
+        return self._xmat_to_quat(self._geom_xmat["puck"])
 
     def _get_obs_dict(self):
         return dict(
@@ -116,7 +116,7 @@ class SawyerPlateSlideBackSideEnvV2(SawyerXYZEnv):
         qpos = self.data.qpos.flat.copy()
         qvel = self.data.qvel.flat.copy()
         qpos[9:11] = pos
-        self.set_state(qpos, qvel)
+        self._set_state_deferred(qpos, qvel)
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -172,3 +172,50 @@ class SawyerPlateSlideBackSideEnvV2(SawyerXYZEnv):
         if obj_to_target < _TARGET_RADIUS:
             reward = 10.0
         return (reward, tcp_to_obj, tcp_opened, obj_to_target, object_grasped, in_place)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        _TARGET_RADIUS: float = 0.05
+        tcp = state["tcp_center"]
+        obj = obs[:, 4:7]
+        target = params["target_pos"]
+        obj_init_pos = params["obj_init_pos"]
+        obj_to_target = np.linalg.norm(obj - target, axis=-1)
+        in_place_margin = np.linalg.norm(obj_init_pos - target, axis=-1)
+        in_place = reward_utils.batched_tolerance(
+            obj_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=in_place_margin - _TARGET_RADIUS,
+            sigmoid="long_tail",
+        )
+        tcp_to_obj = np.linalg.norm(tcp - obj, axis=-1)
+        obj_grasped_margin = np.linalg.norm(params["init_tcp"] - obj_init_pos, axis=-1)
+        object_grasped = reward_utils.batched_tolerance(
+            tcp_to_obj,
+            bounds=(0, _TARGET_RADIUS),
+            margin=obj_grasped_margin - _TARGET_RADIUS,
+            sigmoid="long_tail",
+        )
+        reward = np.where(
+            (tcp[:, 2] <= 0.03) & (tcp_to_obj < 0.07),
+            2.0 + (7.0 * in_place),
+            1.5 * object_grasped,
+        )
+        return np.where(obj_to_target < _TARGET_RADIUS, 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj_to_target = np.linalg.norm(obs[:, 4:7] - params["target_pos"], axis=-1)
+        return obj_to_target <= 0.07
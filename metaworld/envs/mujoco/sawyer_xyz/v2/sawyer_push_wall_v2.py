@@ -7,7 +7,6 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.envs.asset_path_utils import full_v2_path_for
 from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import RenderMode, SawyerXYZEnv
@@ -32,6 +31,10 @@ class SawyerPushWallEnvV2(SawyerXYZEnv):
     """
 
     OBJ_RADIUS: float = 0.02
+    _RAND_VEC_MIN_XY_DISTANCE: float = 0.15
+    _BODY_NAMES: tuple[str, ...] = ("obj",)
+    _GEOM_NAMES: tuple[str, ...] = ("objGeom",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("obj_init_angle",)
 
     def __init__(
         self,
@@ -113,17 +116,16 @@ class SawyerPushWallEnvV2(SawyerXYZEnv):
         return reward, info
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
-        return self.data.geom("objGeom").xpos
+        return self._geom_xpos["objGeom"]
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.geom("objGeom").xmat.reshape(3, 3)
-        return Rotation.from_matrix(geom_xmat).as_quat()
+        return self._xmat_to_quat(self._geom_xmat["objGeom"])
 
     def adjust_initObjPos(self, orig_init_pos: npt.NDArray[Any]) -> npt.NDArray[Any]:
-        diff = self.get_body_com("obj")[:2] - self.data.geom("objGeom").xpos[:2]
+        diff = self.get_body_com("obj")[:2] - self._geom_xpos["objGeom"][:2]
         adjustedPos = orig_init_pos[:2] + diff
         return np.array(
-            [adjustedPos[0], adjustedPos[1], self.data.geom("objGeom").xpos[-1]]
+            [adjustedPos[0], adjustedPos[1], self._geom_xpos["objGeom"][-1]]
         )
 
     def reset_model(self) -> npt.NDArray[np.float64]:
@@ -134,7 +136,10 @@ class SawyerPushWallEnvV2(SawyerXYZEnv):
 
         goal_pos = self._get_state_rand_vec()
         self._target_pos = goal_pos[3:]
-        while np.linalg.norm(goal_pos[:2] - self._target_pos[:2]) < 0.15:
+        while (
+            np.linalg.norm(goal_pos[:2] - self._target_pos[:2])
+            < self._RAND_VEC_MIN_XY_DISTANCE
+        ):
             goal_pos = self._get_state_rand_vec()
             self._target_pos = goal_pos[3:]
         self._target_pos = np.concatenate([goal_pos[-3:-1], [self.obj_init_pos[-1]]])
@@ -207,3 +212,72 @@ class SawyerPushWallEnvV2(SawyerXYZEnv):
             object_grasped,
             in_place_part2,
         )
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        _TARGET_RADIUS: float = 0.05
+        obj = obs[:, 4:7]
+        tcp_opened = obs[:, 3]
+        midpoint = obj.copy()
+        midpoint[:, :2] = (-0.05, 0.77)
+        target = params["target_pos"]
+        obj_init_pos = params["obj_init_pos"]
+        tcp_to_obj = np.linalg.norm(obj - state["tcp_center"], axis=-1)
+        in_place_scaling = np.array([3.0, 1.0, 1.0])
+        obj_to_midpoint = np.linalg.norm((obj - midpoint) * in_place_scaling, axis=-1)
+        obj_to_midpoint_init = np.linalg.norm(
+            (obj_init_pos - midpoint) * in_place_scaling, axis=-1
+        )
+        obj_to_target = np.linalg.norm(obj - target, axis=-1)
+        obj_to_target_init = np.linalg.norm(obj_init_pos - target, axis=-1)
+        in_place_part1 = reward_utils.batched_tolerance(
+            obj_to_midpoint,
+            bounds=(0, _TARGET_RADIUS),
+            margin=obj_to_midpoint_init,
+            sigmoid="long_tail",
+        )
+        in_place_part2 = reward_utils.batched_tolerance(
+            obj_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=obj_to_target_init,
+            sigmoid="long_tail",
+        )
+        object_grasped = SawyerPushWallEnvV2._batched_gripper_caging_reward(
+            action,
+            obj,
+            state,
+            params,
+            object_reach_radius=0.01,
+            obj_radius=0.015,
+            pad_success_thresh=0.05,
+            xz_thresh=0.005,
+            high_density=True,
+        )
+        reward = 2 * object_grasped
+        reward = np.where(
+            (tcp_to_obj < 0.02) & (tcp_opened > 0),
+            np.where(
+                obj[:, 1] > 0.75,
+                2 * object_grasped + 1.0 + 4.0 + 3.0 * in_place_part2,
+                2.0 * object_grasped + 1.0 + 4.0 * in_place_part1,
+            ),
+            reward,
+        )
+        return np.where(obj_to_target < _TARGET_RADIUS, 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj_to_target = np.linalg.norm(obs[:, 4:7] - params["target_pos"], axis=-1)
+        return obj_to_target <= 0.07
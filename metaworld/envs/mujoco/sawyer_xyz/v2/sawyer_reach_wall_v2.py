@@ -5,7 +5,6 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.envs.asset_path_utils import full_v2_path_for
 from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import RenderMode, SawyerXYZEnv
@@ -28,6 +27,11 @@ class SawyerReachWallEnvV2(SawyerXYZEnv):
             i.e. (self._target_pos - pos_hand)
     """
 
+    _RAND_VEC_MIN_XY_DISTANCE: float = 0.15
+    _BODY_NAMES: tuple[str, ...] = ("obj",)
+    _GEOM_NAMES: tuple[str, ...] = ("objGeom",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("obj_init_angle",)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -97,8 +101,7 @@ class SawyerReachWallEnvV2(SawyerXYZEnv):
         return self.get_body_com("obj")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.geom("objGeom").xmat.reshape(3, 3)
-        return Rotation.from_matrix(geom_xmat).as_quat()
+        return self._xmat_to_quat(self._geom_xmat["objGeom"])
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -107,7 +110,10 @@ class SawyerReachWallEnvV2(SawyerXYZEnv):
 
         goal_pos = self._get_state_rand_vec()
         self._target_pos = goal_pos[3:]
-        while np.linalg.norm(goal_pos[:2] - self._target_pos[:2]) < 0.15:
+        while (
+            np.linalg.norm(goal_pos[:2] - self._target_pos[:2])
+            < self._RAND_VEC_MIN_XY_DISTANCE
+        ):
             goal_pos = self._get_state_rand_vec()
             self._target_pos = goal_pos[3:]
         self._target_pos = goal_pos[-3:]
@@ -139,3 +145,36 @@ class SawyerReachWallEnvV2(SawyerXYZEnv):
         )
 
         return (10 * in_place, tcp_to_target, in_place)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        _TARGET_RADIUS: float = 0.05
+        target = params["target_pos"]
+        tcp_to_target = np.linalg.norm(state["tcp_center"] - target, axis=-1)
+        in_place_margin = np.linalg.norm(params["hand_init_pos"] - target, axis=-1)
+        in_place = reward_utils.batched_tolerance(
+            tcp_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=in_place_margin,
+            sigmoid="long_tail",
+        )
+        return 10 * in_place
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        tcp_to_target = np.linalg.norm(
+            state["tcp_center"] - params["target_pos"], axis=-1
+        )
+        return tcp_to_target <= 0.05
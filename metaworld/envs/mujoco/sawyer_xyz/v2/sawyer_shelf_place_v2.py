@@ -2,11 +2,9 @@ from __future__ import annotations
 
 from typing import Any
 
-import mujoco
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.envs.asset_path_utils import full_v2_path_for
 from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import RenderMode, SawyerXYZEnv
@@ -15,6 +13,11 @@ from metaworld.types import InitConfigDict
 
 
 class SawyerShelfPlaceEnvV2(SawyerXYZEnv):
+    _RAND_VEC_MIN_XY_DISTANCE: float = 0.1
+    _BODY_NAMES: tuple[str, ...] = ("obj",)
+    _GEOM_NAMES: tuple[str, ...] = ("objGeom",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("obj_init_angle",)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -97,13 +100,12 @@ class SawyerShelfPlaceEnvV2(SawyerXYZEnv):
         return self.get_body_com("obj")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.geom("objGeom").xmat.reshape(3, 3)
-        return Rotation.from_matrix(geom_xmat).as_quat()
+        return self._xmat_to_quat(self._geom_xmat["objGeom"])
 
     def adjust_initObjPos(self, orig_init_pos: npt.NDArray[Any]) -> npt.NDArray[Any]:
         # This is to account for meshes for the geom and object are not aligned
         # If this is not done, the object could be initialized in an extreme position
-        diff = self.get_body_com("obj")[:2] - self.data.geom("objGeom").xpos[:2]
+        diff = self.get_body_com("obj")[:2] - self._geom_xpos["objGeom"][:2]
         adjustedPos = orig_init_pos[:2] + diff
 
         # The convention we follow is that body_com[2] is always 0, and geom_pos[2] is the object height
@@ -115,7 +117,10 @@ class SawyerShelfPlaceEnvV2(SawyerXYZEnv):
         self.obj_init_angle = self.init_config["obj_init_angle"]
 
         goal_pos = self._get_state_rand_vec()
-        while np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1]) < 0.1:
+        while (
+            np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1])
+            < self._RAND_VEC_MIN_XY_DISTANCE
+        ):
             goal_pos = self._get_state_rand_vec()
         base_shelf_pos = goal_pos - np.array([0, 0, 0, 0, 0, 0.3])
         self.obj_init_pos = np.concatenate(
@@ -123,7 +128,7 @@ class SawyerShelfPlaceEnvV2(SawyerXYZEnv):
         )
 
         self.model.body("shelf").pos = base_shelf_pos[-3:]
-        mujoco.mj_forward(self.model, self.data)
+        self._invalidate_kinematics()
         self._target_pos = self.model.site("goal").pos + self.model.body("shelf").pos
 
         assert self.obj_init_pos is not None
@@ -193,3 +198,80 @@ class SawyerShelfPlaceEnvV2(SawyerXYZEnv):
         if obj_to_target < _TARGET_RADIUS:
             reward = 10.0
         return (reward, tcp_to_obj, tcp_opened, obj_to_target, object_grasped, in_place)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        _TARGET_RADIUS: float = 0.05
+        obj = obs[:, 4:7]
+        tcp_opened = obs[:, 3]
+        target = params["target_pos"]
+        obj_init_pos = params["obj_init_pos"]
+        obj_to_target = np.linalg.norm(obj - target, axis=-1)
+        tcp_to_obj = np.linalg.norm(obj - state["tcp_center"], axis=-1)
+        in_place_margin = np.linalg.norm(obj_init_pos - target, axis=-1)
+        in_place = reward_utils.batched_tolerance(
+            obj_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=in_place_margin,
+            sigmoid="long_tail",
+        )
+        object_grasped = SawyerShelfPlaceEnvV2._batched_gripper_caging_reward(
+            action=action,
+            obj_pos=obj,
+            state=state,
+            params=params,
+            obj_radius=0.02,
+            pad_success_thresh=0.05,
+            object_reach_radius=0.01,
+            xz_thresh=0.01,
+            high_density=False,
+        )
+        reward = reward_utils.batched_hamacher_product(object_grasped, in_place)
+
+        below_shelf_top = (0.0 < obj[:, 2]) & (obj[:, 2] < 0.24)
+        within_shelf_x = (target[..., 0] - 0.15 < obj[:, 0]) & (
+            obj[:, 0] < target[..., 0] + 0.15
+        )
+        shelf_front = target[..., 1] - 3 * _TARGET_RADIUS
+        in_front_of_shelf = (shelf_front < obj[:, 1]) & (obj[:, 1] < target[..., 1])
+        z_scaling = (0.24 - obj[:, 2]) / 0.24
+        y_scaling = (obj[:, 1] - shelf_front) / (3 * _TARGET_RADIUS)
+        # The scalings are only in [0, 1] (and used) in front of the shelf
+        bound_loss = reward_utils.batched_hamacher_product(
+            np.clip(y_scaling, 0.0, 1.0), np.clip(z_scaling, 0.0, 1.0)
+        )
+        in_place = np.where(
+            below_shelf_top & within_shelf_x & in_front_of_shelf,
+            np.clip(in_place - bound_loss, 0.0, 1.0),
+            in_place,
+        )
+        in_place = np.where(
+            below_shelf_top & within_shelf_x & (obj[:, 1] > target[..., 1]),
+            0.0,
+            in_place,
+        )
+        reward = np.where(
+            (tcp_to_obj < 0.025)
+            & (tcp_opened > 0)
+            & (obj[:, 2] - 0.01 > obj_init_pos[..., 2]),
+            reward + (1.0 + 5.0 * in_place),
+            reward,
+        )
+        return np.where(obj_to_target < _TARGET_RADIUS, 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj_to_target = np.linalg.norm(obs[:, 4:7] - params["target_pos"], axis=-1)
+        return obj_to_target <= 0.07
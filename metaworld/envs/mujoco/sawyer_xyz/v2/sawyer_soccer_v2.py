@@ -5,7 +5,6 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.envs.asset_path_utils import full_v2_path_for
 from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import RenderMode, SawyerXYZEnv
@@ -16,6 +15,10 @@ from metaworld.types import InitConfigDict
 class SawyerSoccerEnvV2(SawyerXYZEnv):
     OBJ_RADIUS: float = 0.013
     TARGET_RADIUS: float = 0.07
+    _RAND_VEC_MIN_XY_DISTANCE: float = 0.15
+    _BODY_NAMES: tuple[str, ...] = ("soccer_ball",)
+    _GEOM_NAMES: tuple[str, ...] = ("objGeom",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("maxPushDist", "obj_init_angle")
 
     def __init__(
         self,
@@ -97,8 +100,7 @@ class SawyerSoccerEnvV2(SawyerXYZEnv):
         return self.get_body_com("soccer_ball")
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.body("soccer_ball").xmat.reshape(3, 3)
-        return Rotation.from_matrix(geom_xmat).as_quat()
+        return self._xmat_to_quat(self._body_xmat["soccer_ball"])
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -107,7 +109,10 @@ class SawyerSoccerEnvV2(SawyerXYZEnv):
 
         goal_pos = self._get_state_rand_vec()
         self._target_pos = goal_pos[3:]
-        while np.linalg.norm(goal_pos[:2] - self._target_pos[:2]) < 0.15:
+        while (
+            np.linalg.norm(goal_pos[:2] - self._target_pos[:2])
+            < self._RAND_VEC_MIN_XY_DISTANCE
+        ):
             goal_pos = self._get_state_rand_vec()
             self._target_pos = goal_pos[3:]
         assert self.obj_init_pos is not None
@@ -258,3 +263,116 @@ class SawyerSoccerEnvV2(SawyerXYZEnv):
             object_grasped,
             in_place,
         )
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        obj = obs[:, 4:7]
+        target = params["target_pos"]
+        x_scaling = np.array([3.0, 1.0, 1.0])
+        target_to_obj = np.linalg.norm((obj - target) * x_scaling, axis=-1)
+        target_to_obj_init = np.linalg.norm(
+            (obj - params["obj_init_pos"]) * x_scaling, axis=-1
+        )
+        in_place = reward_utils.batched_tolerance(
+            target_to_obj,
+            bounds=(0, SawyerSoccerEnvV2.TARGET_RADIUS),
+            margin=target_to_obj_init,
+            sigmoid="long_tail",
+        )
+        goal_line = target[..., 1] - 0.1
+        in_place = np.where(
+            (obj[:, 1] > goal_line) & (np.abs(obj[:, 0] - target[..., 0]) > 0.10),
+            np.clip(
+                in_place - 2 * ((obj[:, 1] - goal_line) / (1 - goal_line)), 0.0, 1.0
+            ),
+            in_place,
+        )
+        object_grasped = SawyerSoccerEnvV2._batched_gripper_caging_reward(
+            action, obj, state, params, SawyerSoccerEnvV2.OBJ_RADIUS
+        )
+        reward = (3 * object_grasped) + (6.5 * in_place)
+        return np.where(target_to_obj < SawyerSoccerEnvV2.TARGET_RADIUS, 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj_to_target = np.linalg.norm(obs[:, 4:7] - params["target_pos"], axis=-1)
+        return obj_to_target <= 0.07
+
+    @staticmethod
+    def _batched_gripper_caging_reward(
+        action: npt.NDArray[np.float32],
+        obj_pos: npt.NDArray[np.float64],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+        obj_radius: float = 0,
+        pad_success_thresh: float = 0,  # All of these args are unused
+        object_reach_radius: float = 0,  # just here to match the parent's type signature
+        xz_thresh: float = 0,
+        desired_gripper_effort: float = 1.0,
+        high_density: bool = False,
+        medium_density: bool = False,
+    ) -> npt.NDArray[np.float64]:
+        pad_success_margin = 0.05
+        grip_success_margin = obj_radius + 0.01
+        x_z_success_margin = 0.005
+
+        # The initial pad positions are views of the current ones
+        left_pad, right_pad = state["left_pad"], state["right_pad"]
+        delta_object_y_left_pad = left_pad[:, 1] - obj_pos[:, 1]
+        delta_object_y_right_pad = obj_pos[:, 1] - right_pad[:, 1]
+        right_caging_margin = np.abs(
+            np.abs(obj_pos[:, 1] - right_pad[:, 1]) - pad_success_margin
+        )
+        left_caging_margin = np.abs(
+            np.abs(obj_pos[:, 1] - left_pad[:, 1]) - pad_success_margin
+        )
+        right_caging, left_caging, right_gripping, left_gripping = (
+            reward_utils.batched_tolerance(
+                delta,
+                bounds=(obj_radius, success_margin),
+                margin=caging_margin,
+                sigmoid="long_tail",
+            )
+            for success_margin in (pad_success_margin, grip_success_margin)
+            for delta, caging_margin in (
+                (delta_object_y_right_pad, right_caging_margin),
+                (delta_object_y_left_pad, left_caging_margin),
+            )
+        )
+        y_caging = reward_utils.batched_hamacher_product(right_caging, left_caging)
+        y_gripping = reward_utils.batched_hamacher_product(
+            right_gripping, left_gripping
+        )
+
+        xz = [0, 2]
+        tcp_obj_norm_x_z = np.linalg.norm(
+            state["tcp_center"][:, xz] - obj_pos[:, xz], axis=-1
+        )
+        tcp_obj_x_z_margin = (
+            np.linalg.norm(
+                params["obj_init_pos"][..., xz] - params["init_tcp"][..., xz], axis=-1
+            )
+            - x_z_success_margin
+        )
+        x_z_caging = reward_utils.batched_tolerance(
+            tcp_obj_norm_x_z,
+            bounds=(0, x_z_success_margin),
+            margin=tcp_obj_x_z_margin,
+            sigmoid="long_tail",
+        )
+
+        caging = reward_utils.batched_hamacher_product(y_caging, x_z_caging)
+        gripping = np.where(caging > 0.95, y_gripping, 0.0)
+        return (caging + gripping) / 2
@@ -5,7 +5,6 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.envs.asset_path_utils import full_v2_path_for
 from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import RenderMode, SawyerXYZEnv
@@ -14,6 +13,12 @@ from metaworld.types import ObservationDict, StickInitConfigDict
 
 
 class SawyerStickPullEnvV2(SawyerXYZEnv):
+    _RAND_VEC_MIN_XY_DISTANCE: float = 0.1
+    _BODY_NAMES: tuple[str, ...] = ("stick", "object")
+    _SITE_NAMES: tuple[str, ...] = ("stick_end", "insertion")
+    _GEOM_NAMES: tuple[str, ...] = ("objGeom",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("obj_init_qpos", "stick_init_pos")
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -107,10 +112,9 @@ class SawyerStickPullEnvV2(SawyerXYZEnv):
         )
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.body("stick").xmat.reshape(3, 3)
         return np.hstack(
             (
-                Rotation.from_matrix(geom_xmat).as_quat(),
+                self._xmat_to_quat(self._body_xmat["stick"]),
                 np.array(
                     [
                         0.0,
@@ -132,14 +136,14 @@ class SawyerStickPullEnvV2(SawyerXYZEnv):
         qvel = self.data.qvel.flat.copy()
         qpos[9:12] = pos.copy()
         qvel[9:15] = 0
-        self.set_state(qpos, qvel)
+        self._set_state_deferred(qpos, qvel)
 
     def _set_obj_xyz(self, pos: npt.NDArray[Any]) -> None:
         qpos = self.data.qpos.flat.copy()
         qvel = self.data.qvel.flat.copy()
         qpos[16:18] = pos.copy()
         qvel[16:18] = 0
-        self.set_state(qpos, qvel)
+        self._set_state_deferred(qpos, qvel)
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -149,7 +153,10 @@ class SawyerStickPullEnvV2(SawyerXYZEnv):
         self._target_pos = np.array([0.3, 0.4, self.stick_init_pos[-1]])
 
         goal_pos = self._get_state_rand_vec()
-        while np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1]) < 0.1:
+        while (
+            np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1])
+            < self._RAND_VEC_MIN_XY_DISTANCE
+        ):
             goal_pos = self._get_state_rand_vec()
         self.stick_init_pos = np.concatenate([goal_pos[:2], [self.stick_init_pos[-1]]])
         self._target_pos = np.concatenate([goal_pos[-3:-1], [self.stick_init_pos[-1]]])
@@ -262,3 +269,129 @@ class SawyerStickPullEnvV2(SawyerXYZEnv):
             object_grasped,
             stick_in_place,
         )
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        _TARGET_RADIUS: float = 0.05
+        stick = obs[:, 4:7]
+        end_of_stick = state["stick_end"]
+        container = obs[:, 11:14] + np.array([0.05, 0.0, 0.0])
+        container_init_pos = params["obj_init_pos"] + np.array([0.05, 0.0, 0.0])
+        handle = obs[:, 11:14]
+        tcp_opened = obs[:, 3]
+        target = params["target_pos"]
+        stick_init_pos = params["stick_init_pos"]
+        tcp_to_stick = np.linalg.norm(stick - state["tcp_center"], axis=-1)
+        handle_to_target = np.linalg.norm(handle - target, axis=-1)
+
+        yz_scaling = np.array([1.0, 1.0, 2.0])
+        stick_to_container = np.linalg.norm((stick - container) * yz_scaling, axis=-1)
+        stick_in_place_margin = np.linalg.norm(
+            (stick_init_pos - container_init_pos) * yz_scaling, axis=-1
+        )
+        stick_in_place = reward_utils.batched_tolerance(
+            stick_to_container,
+            bounds=(0, _TARGET_RADIUS),
+            margin=stick_in_place_margin,
+            sigmoid="long_tail",
+        )
+
+        stick_to_target = np.linalg.norm(stick - target, axis=-1)
+        stick_in_place_margin_2 = np.linalg.norm(stick_init_pos - target, axis=-1)
+        stick_in_place_2 = reward_utils.batched_tolerance(
+            stick_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=stick_in_place_margin_2,
+            sigmoid="long_tail",
+        )
+
+        container_to_target = np.linalg.norm(container - target, axis=-1)
+        container_in_place_margin = np.linalg.norm(
+            params["obj_init_pos"] - target, axis=-1
+        )
+        container_in_place = reward_utils.batched_tolerance(
+            container_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=container_in_place_margin,
+            sigmoid="long_tail",
+        )
+
+        object_grasped = SawyerStickPullEnvV2._batched_gripper_caging_reward(
+            action=action,
+            obj_pos=stick,
+            state=state,
+            params=params,
+            obj_radius=0.014,
+            pad_success_thresh=0.05,
+            object_reach_radius=0.01,
+            xz_thresh=0.01,
+            high_density=True,
+        )
+        grasp_success = (
+            (tcp_to_stick < 0.02)
+            & (tcp_opened > 0)
+            & (stick[:, 2] - 0.01 > stick_init_pos[..., 2])
+        )
+        object_grasped = np.where(grasp_success, 1.0, object_grasped)
+        in_place_and_object_grasped = reward_utils.batched_hamacher_product(
+            object_grasped, stick_in_place
+        )
+        stick_is_inserted = (
+            (end_of_stick[:, 0] >= handle[:, 0])
+            & (np.abs(end_of_stick[:, 1] - handle[:, 1]) <= 0.040)
+            & (np.abs(end_of_stick[:, 2] - handle[:, 2]) <= 0.060)
+        )
+        reward = np.select(
+            [
+                grasp_success & stick_is_inserted & (handle_to_target <= 0.12),
+                grasp_success & stick_is_inserted,
+                grasp_success,
+            ],
+            [
+                10.0,
+                1.0
+                + in_place_and_object_grasped
+                + 5.0
+                + 2.0 * stick_in_place_2
+                + 1.0 * container_in_place,
+                1.0 + in_place_and_object_grasped + 5.0 * stick_in_place,
+            ],
+            in_place_and_object_grasped,
+        )
+        return reward
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        end_of_stick = state["stick_end"]
+        handle = obs[:, 11:14]
+        stick_is_inserted = (
+            (end_of_stick[:, 0] >= handle[:, 0])
+            & (np.abs(end_of_stick[:, 1] - handle[:, 1]) <= 0.040)
+            & (np.abs(end_of_stick[:, 2] - handle[:, 2]) <= 0.060)
+        )
+        handle_to_target = np.linalg.norm(handle - params["target_pos"], axis=-1)
+        return (handle_to_target <= 0.12) & stick_is_inserted
+
+    def reward_state(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_state(),
+            "stick_end": self._get_site_pos("stick_end").copy(),
+        }
+
+    def reward_params(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_params(),
+            "stick_init_pos": np.array(self.stick_init_pos, dtype=np.float64),
+        }
@@ -5,7 +5,6 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.envs.asset_path_utils import full_v2_path_for
 from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import RenderMode, SawyerXYZEnv
@@ -14,6 +13,12 @@ from metaworld.types import ObservationDict, StickInitConfigDict
 
 
 class SawyerStickPushEnvV2(SawyerXYZEnv):
+    _RAND_VEC_MIN_XY_DISTANCE: float = 0.1
+    _BODY_NAMES: tuple[str, ...] = ("stick", "object")
+    _SITE_NAMES: tuple[str, ...] = ("insertion",)
+    _GEOM_NAMES: tuple[str, ...] = ("objGeom",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("stick_init_pos",)
+
     def __init__(
         self,
         render_mode: RenderMode | None = None,
@@ -102,10 +107,9 @@ class SawyerStickPushEnvV2(SawyerXYZEnv):
         )
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.body("stick").xmat.reshape(3, 3)
         return np.hstack(
             (
-                Rotation.from_matrix(geom_xmat).as_quat(),
+                self._xmat_to_quat(self._body_xmat["stick"]),
                 np.array(
                     [
                         0.0,
@@ -129,14 +133,14 @@ class SawyerStickPushEnvV2(SawyerXYZEnv):
         qvel = self.data.qvel.flat.copy()
         qpos[9:12] = pos.copy()
         qvel[9:15] = 0
-        self.set_state(qpos, qvel)
+        self._set_state_deferred(qpos, qvel)
 
     def _set_obj_xyz(self, pos: npt.NDArray[Any]) -> None:
         qpos = self.data.qpos.flat.copy()
         qvel = self.data.qvel.flat.copy()
         qpos[16:18] = pos.copy()
         qvel[16:18] = 0
-        self.set_state(qpos, qvel)
+        self._set_state_deferred(qpos, qvel)
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -144,7 +148,10 @@ class SawyerStickPushEnvV2(SawyerXYZEnv):
         self._target_pos = np.array([0.4, 0.6, self.stick_init_pos[-1]])
 
         goal_pos = self._get_state_rand_vec()
-        while np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1]) < 0.1:
+        while (
+            np.linalg.norm(goal_pos[:2] - goal_pos[-3:-1])
+            < self._RAND_VEC_MIN_XY_DISTANCE
+        ):
             goal_pos = self._get_state_rand_vec()
         self.stick_init_pos = np.concatenate([goal_pos[:2], [self.stick_init_pos[-1]]])
         self._target_pos = np.concatenate(
@@ -320,3 +327,120 @@ class SawyerStickPushEnvV2(SawyerXYZEnv):
             object_grasped,
             stick_in_place,
         )
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        _TARGET_RADIUS: float = 0.12
+        stick = obs[:, 4:7] + np.array([0.015, 0.0, 0.0])
+        container = obs[:, 11:14]
+        tcp_opened = obs[:, 3]
+        target = params["target_pos"]
+        stick_init_pos = params["stick_init_pos"]
+        tcp_to_stick = np.linalg.norm(stick - state["tcp_center"], axis=-1)
+        stick_to_target = np.linalg.norm(stick - target, axis=-1)
+        stick_in_place_margin = (
+            np.linalg.norm(stick_init_pos - target, axis=-1) - _TARGET_RADIUS
+        )
+        stick_in_place = reward_utils.batched_tolerance(
+            stick_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=stick_in_place_margin,
+            sigmoid="long_tail",
+        )
+        container_to_target = np.linalg.norm(container - target, axis=-1)
+        container_in_place_margin = (
+            np.linalg.norm(params["obj_init_pos"] - target, axis=-1) - _TARGET_RADIUS
+        )
+        container_in_place = reward_utils.batched_tolerance(
+            container_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=container_in_place_margin,
+            sigmoid="long_tail",
+        )
+        object_grasped = SawyerStickPushEnvV2._batched_gripper_caging_reward(
+            action=action,
+            obj_pos=stick,
+            state=state,
+            params=params,
+            obj_radius=0.04,
+            pad_success_thresh=0.05,
+            object_reach_radius=0.01,
+            xz_thresh=0.01,
+            high_density=True,
+        )
+        grasped = (
+            (tcp_to_stick < 0.02)
+            & (tcp_opened > 0)
+            & (stick[:, 2] - 0.01 > stick_init_pos[..., 2])
+        )
+        reward = np.where(
+            grasped,
+            2.0 + 5.0 * stick_in_place + 3.0 * container_in_place,
+            object_grasped,
+        )
+        return np.where(grasped & (container_to_target <= _TARGET_RADIUS), 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        grasp_success = (
+            (state["touching_main_object"] > 0)
+            & (obs[:, 3] > 0)
+            & (obs[:, 6] - 0.01 > params["stick_init_pos"][..., 2])
+        )
+        container_to_target = np.linalg.norm(
+            obs[:, 11:14] - params["target_pos"], axis=-1
+        )
+        return grasp_success & (container_to_target <= 0.12)
+
+    def reward_state(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_state(),
+            "touching_main_object": np.array(float(self.touching_main_object)),
+        }
+
+    def reward_params(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_params(),
+            "stick_init_pos": np.array(self.stick_init_pos, dtype=np.float64),
+        }
+
+    @staticmethod
+    def _batched_gripper_caging_reward(
+        action: npt.NDArray[np.float32],
+        obj_pos: npt.NDArray[np.float64],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+        obj_radius: float,
+        pad_success_thresh: float,
+        object_reach_radius: float,
+        xz_thresh: float,
+        desired_gripper_effort: float = 1.0,
+        high_density: bool = False,
+        medium_density: bool = False,
+    ) -> npt.NDArray[np.float64]:
+        # `_gripper_caging_reward()` measures from the initial stick position
+        return SawyerXYZEnv._batched_gripper_caging_reward(
+            action,
+            obj_pos,
+            state,
+            {**params, "obj_init_pos": params["stick_init_pos"]},
+            obj_radius,
+            pad_success_thresh,
+            object_reach_radius,
+            xz_thresh,
+            desired_gripper_effort,
+            high_density,
+            medium_density,
+        )
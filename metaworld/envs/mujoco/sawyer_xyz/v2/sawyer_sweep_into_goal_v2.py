@@ -5,7 +5,6 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 from gymnasium.spaces import Box
-from scipy.spatial.transform import Rotation
 
 from metaworld.envs.asset_path_utils import full_v2_path_for
 from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import RenderMode, SawyerXYZEnv
@@ -15,6 +14,10 @@ from metaworld.types import InitConfigDict
 
 class SawyerSweepIntoGoalEnvV2(SawyerXYZEnv):
     OBJ_RADIUS: float = 0.02
+    _RAND_VEC_MIN_XY_DISTANCE: float = 0.15
+    _BODY_NAMES: tuple[str, ...] = ("obj",)
+    _GEOM_NAMES: tuple[str, ...] = ("objGeom",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("objHeight", "obj_init_angle")
 
     def __init__(
         self,
@@ -86,12 +89,18 @@ class SawyerSweepIntoGoalEnvV2(SawyerXYZEnv):
         return reward, info
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        geom_xmat = self.data.geom("objGeom").xmat.reshape(3, 3)
-        return Rotation.from_matrix(geom_xmat).as_quat()
+        return self._xmat_to_quat(self._geom_xmat["objGeom"])
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
         return self.get_body_com("obj")
 
+    def _is_valid_rand_vec(self, rand_vec: npt.NDArray[np.float64]) -> bool:
+        # `reset_model()` checks the object position against the default goal
+        return bool(
+            np.linalg.norm(rand_vec[:2] - self.goal[:2])
+            >= self._RAND_VEC_MIN_XY_DISTANCE
+        )
+
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
         self._target_pos = self.goal.copy()
@@ -100,7 +109,10 @@ class SawyerSweepIntoGoalEnvV2(SawyerXYZEnv):
         self.objHeight = self.get_body_com("obj")[2]
 
         goal_pos = self._get_state_rand_vec()
-        while np.linalg.norm(goal_pos[:2] - self._target_pos[:2]) < 0.15:
+        while (
+            np.linalg.norm(goal_pos[:2] - self._target_pos[:2])
+            < self._RAND_VEC_MIN_XY_DISTANCE
+        ):
             goal_pos = self._get_state_rand_vec()
         assert self.obj_init_pos is not None
         self.obj_init_pos = np.concatenate([goal_pos[:2], [self.obj_init_pos[-1]]])
@@ -236,3 +248,110 @@ class SawyerSweepIntoGoalEnvV2(SawyerXYZEnv):
         if obj_to_target < _TARGET_RADIUS:
             reward = 10.0
         return (reward, tcp_to_obj, tcp_opened, obj_to_target, object_grasped, in_place)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        _TARGET_RADIUS: float = 0.05
+        obj = obs[:, 4:7]
+        target = np.where([True, True, False], params["target_pos"], obj)
+        obj_to_target = np.linalg.norm(obj - target, axis=-1)
+        in_place_margin = np.linalg.norm(params["obj_init_pos"] - target, axis=-1)
+        in_place = reward_utils.batched_tolerance(
+            obj_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=in_place_margin,
+            sigmoid="long_tail",
+        )
+        object_grasped = SawyerSweepIntoGoalEnvV2._batched_gripper_caging_reward(
+            action, obj, state, params, SawyerSweepIntoGoalEnvV2.OBJ_RADIUS
+        )
+        in_place_and_object_grasped = reward_utils.batched_hamacher_product(
+            object_grasped, in_place
+        )
+        reward = (2 * object_grasped) + (6 * in_place_and_object_grasped)
+        return np.where(obj_to_target < _TARGET_RADIUS, 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj = obs[:, 4:7]
+        target = np.where([True, True, False], params["target_pos"], obj)
+        return np.linalg.norm(obj - target, axis=-1) <= 0.05
+
+    @staticmethod
+    def _batched_gripper_caging_reward(
+        action: npt.NDArray[np.float32],
+        obj_pos: npt.NDArray[np.float64],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+        obj_radius: float = 0,
+        pad_success_thresh: float = 0,  # All of these args are unused
+        object_reach_radius: float = 0,  # just here to match the parent's type signature
+        xz_thresh: float = 0,
+        desired_gripper_effort: float = 1.0,
+        high_density: bool = False,
+        medium_density: bool = False,
+    ) -> npt.NDArray[np.float64]:
+        pad_success_margin = 0.05
+        grip_success_margin = obj_radius + 0.005
+        x_z_success_margin = 0.01
+
+        # The initial pad positions are views of the current ones
+        left_pad, right_pad = state["left_pad"], state["right_pad"]
+        delta_object_y_left_pad = left_pad[:, 1] - obj_pos[:, 1]
+        delta_object_y_right_pad = obj_pos[:, 1] - right_pad[:, 1]
+        right_caging_margin = np.abs(
+            np.abs(obj_pos[:, 1] - right_pad[:, 1]) - pad_success_margin
+        )
+        left_caging_margin = np.abs(
+            np.abs(obj_pos[:, 1] - left_pad[:, 1]) - pad_success_margin
+        )
+        right_caging, left_caging, right_gripping, left_gripping = (
+            reward_utils.batched_tolerance(
+                delta,
+                bounds=(obj_radius, success_margin),
+                margin=caging_margin,
+                sigmoid="long_tail",
+            )
+            for success_margin in (pad_success_margin, grip_success_margin)
+            for delta, caging_margin in (
+                (delta_object_y_right_pad, right_caging_margin),
+                (delta_object_y_left_pad, left_caging_margin),
+            )
+        )
+        y_caging = reward_utils.batched_hamacher_product(right_caging, left_caging)
+        y_gripping = reward_utils.batched_hamacher_product(
+            right_gripping, left_gripping
+        )
+
+        xz = [0, 2]
+        tcp_obj_norm_x_z = np.linalg.norm(
+            state["tcp_center"][:, xz] - obj_pos[:, xz], axis=-1
+        )
+        tcp_obj_x_z_margin = (
+            np.linalg.norm(
+                params["obj_init_pos"][..., xz] - params["init_tcp"][..., xz], axis=-1
+            )
+            - x_z_success_margin
+        )
+        x_z_caging = reward_utils.batched_tolerance(
+            tcp_obj_norm_x_z,
+            bounds=(0, x_z_success_margin),
+            margin=tcp_obj_x_z_margin,
+            sigmoid="long_tail",
+        )
+
+        caging = reward_utils.batched_hamacher_product(y_caging, x_z_caging)
+        gripping = np.where(caging > 0.95, y_gripping, 0.0)
+        return (caging + gripping) / 2
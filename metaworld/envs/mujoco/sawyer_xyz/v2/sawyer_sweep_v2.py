@@ -14,6 +14,9 @@ from metaworld.types import InitConfigDict
 
 class SawyerSweepEnvV2(SawyerXYZEnv):
     OBJ_RADIUS: float = 0.02
+    _BODY_NAMES: tuple[str, ...] = ("obj",)
+    _GEOM_NAMES: tuple[str, ...] = ("objGeom",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("objHeight",)
 
     def __init__(
         self,
@@ -85,10 +88,10 @@ class SawyerSweepEnvV2(SawyerXYZEnv):
         return reward, info
 
     def _get_quat_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("obj").xquat
+        return self._body_xquat["obj"]
 
     def _get_pos_objects(self) -> npt.NDArray[Any]:
-        return self.data.body("obj").xpos
+        return self._body_xpos["obj"]
 
     def reset_model(self) -> npt.NDArray[np.float64]:
         self._reset_hand()
@@ -231,3 +234,109 @@ class SawyerSweepEnvV2(SawyerXYZEnv):
         if obj_to_target < _TARGET_RADIUS:
             reward = 10.0
         return (reward, tcp_to_obj, tcp_opened, obj_to_target, object_grasped, in_place)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        _TARGET_RADIUS: float = 0.05
+        obj = obs[:, 4:7]
+        target = params["target_pos"]
+        obj_to_target = np.linalg.norm(obj - target, axis=-1)
+        in_place_margin = np.linalg.norm(params["obj_init_pos"] - target, axis=-1)
+        in_place = reward_utils.batched_tolerance(
+            obj_to_target,
+            bounds=(0, _TARGET_RADIUS),
+            margin=in_place_margin,
+            sigmoid="long_tail",
+        )
+        object_grasped = SawyerSweepEnvV2._batched_gripper_caging_reward(
+            action, obj, state, params, SawyerSweepEnvV2.OBJ_RADIUS
+        )
+        in_place_and_object_grasped = reward_utils.batched_hamacher_product(
+            object_grasped, in_place
+        )
+        reward = (2 * object_grasped) + (6 * in_place_and_object_grasped)
+        return np.where(obj_to_target < _TARGET_RADIUS, 10.0, reward)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        obj_to_target = np.linalg.norm(obs[:, 4:7] - params["target_pos"], axis=-1)
+        return obj_to_target <= 0.05
+
+    @staticmethod
+    def _batched_gripper_caging_reward(
+        action: npt.NDArray[np.float32],
+        obj_pos: npt.NDArray[np.float64],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+        obj_radius: float = 0,
+        pad_success_thresh: float = 0,  # All of these args are unused
+        object_reach_radius: float = 0,  # just here to match the parent's type signature
+        xz_thresh: float = 0,
+        desired_gripper_effort: float = 1.0,
+        high_density: bool = False,
+        medium_density: bool = False,
+    ) -> npt.NDArray[np.float64]:
+        pad_success_margin = 0.05
+        grip_success_margin = obj_radius + 0.01
+        x_z_success_margin = 0.005
+
+        # The initial pad positions are views of the current ones
+        left_pad, right_pad = state["left_pad"], state["right_pad"]
+        delta_object_y_left_pad = left_pad[:, 1] - obj_pos[:, 1]
+        delta_object_y_right_pad = obj_pos[:, 1] - right_pad[:, 1]
+        right_caging_margin = np.abs(
+            np.abs(obj_pos[:, 1] - right_pad[:, 1]) - pad_success_margin
+        )
+        left_caging_margin = np.abs(
+            np.abs(obj_pos[:, 1] - left_pad[:, 1]) - pad_success_margin
+        )
+        right_caging, left_caging, right_gripping, left_gripping = (
+            reward_utils.batched_tolerance(
+                delta,
+                bounds=(obj_radius, success_margin),
+                margin=caging_margin,
+                sigmoid="long_tail",
+            )
+            for success_margin in (pad_success_margin, grip_success_margin)
+            for delta, caging_margin in (
+                (delta_object_y_right_pad, right_caging_margin),
+                (delta_object_y_left_pad, left_caging_margin),
+            )
+        )
+        y_caging = reward_utils.batched_hamacher_product(right_caging, left_caging)
+        y_gripping = reward_utils.batched_hamacher_product(
+            right_gripping, left_gripping
+        )
+
+        xz = [0, 2]
+        tcp_obj_norm_x_z = np.linalg.norm(
+            state["tcp_center"][:, xz] - obj_pos[:, xz], axis=-1
+        )
+        tcp_obj_x_z_margin = (
+            np.linalg.norm(
+                params["obj_init_pos"][..., xz] - params["init_tcp"][..., xz], axis=-1
+            )
+            - x_z_success_margin
+        )
+        x_z_caging = reward_utils.batched_tolerance(
+            tcp_obj_norm_x_z,
+            bounds=(0, x_z_success_margin),
+            margin=tcp_obj_x_z_margin,
+            sigmoid="long_tail",
+        )
+
+        caging = reward_utils.batched_hamacher_product(y_caging, x_z_caging)
+        gripping = np.where(caging > 0.95, y_gripping, 0.0)
+        return (caging + gripping) / 2
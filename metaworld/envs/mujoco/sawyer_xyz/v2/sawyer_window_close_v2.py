@@ -26,6 +26,8 @@ class SawyerWindowCloseEnvV2(SawyerXYZEnv):
     """
 
     TARGET_RADIUS: float = 0.05
+    _SITE_NAMES: tuple[str, ...] = ("handleCloseStart",)
+    _EPISODE_ATTRIBUTES: tuple[str, ...] = ("prev_obs", "window_handle_pos_init")
 
     def __init__(
         self,
@@ -163,3 +165,55 @@ class SawyerWindowCloseEnvV2(SawyerXYZEnv):
         reward = 10 * reward_utils.hamacher_product(reach, in_place)
 
         return (reward, tcp_to_obj, tcp_opened, target_to_obj, object_grasped, in_place)
+
+    @staticmethod
+    def batched_reward(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
+        """Batched `compute_reward()`, see `SawyerXYZEnv.batched_reward()`."""
+        obj = obs[:, 4:7]
+        target = params["target_pos"]
+        window_handle_pos_init = params["window_handle_pos_init"]
+        target_radius = SawyerWindowCloseEnvV2.TARGET_RADIUS
+        target_to_obj = np.abs(obj[:, 0] - target[..., 0])
+        target_to_obj_init = np.abs(window_handle_pos_init[..., 0] - target[..., 0])
+        in_place = reward_utils.batched_tolerance(
+            target_to_obj,
+            bounds=(0, target_radius),
+            margin=np.abs(target_to_obj_init - target_radius),
+            sigmoid="long_tail",
+        )
+        handle_radius = 0.02
+        tcp_to_obj = np.linalg.norm(obj - state["tcp_center"], axis=-1)
+        tcp_to_obj_init = np.linalg.norm(
+            window_handle_pos_init - params["init_tcp"], axis=-1
+        )
+        reach = reward_utils.batched_tolerance(
+            tcp_to_obj,
+            bounds=(0, handle_radius),
+            margin=np.abs(tcp_to_obj_init - handle_radius),
+            sigmoid="gaussian",
+        )
+        return 10 * reward_utils.batched_hamacher_product(reach, in_place)
+
+    @staticmethod
+    def batched_success(
+        obs: npt.NDArray[np.float64],
+        action: npt.NDArray[np.float32],
+        state: dict[str, npt.NDArray[np.float64]],
+        params: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.bool_]:
+        """Batched success of `evaluate_state()`, see `SawyerXYZEnv.batched_success()`."""
+        target_to_obj = np.abs(obs[:, 4] - params["target_pos"][..., 0])
+        return target_to_obj <= SawyerWindowCloseEnvV2.TARGET_RADIUS
+
+    def reward_params(self) -> dict[str, npt.NDArray[np.float64]]:
+        return {
+            **super().reward_params(),
+            "window_handle_pos_init": np.array(
+                self.window_handle_pos_init, dtype=np.float64
+            ),
+        }
@@ -0,0 +1,78 @@
+"""Queries on the contacts of a simulation, answered with NumPy reductions over the contact list."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import mujoco
+import numpy as np
+import numpy.typing as npt
+
+
+class ContactQuery:
+    """Answers queries about the contacts of an `MjData`.
+
+    The contact list is read as arrays (`contact.geom1`, `contact.geom2`, `contact.efc_address`)
+    once, and the answers are memoized, until `invalidate()` is called. The owner of the data
+    must call it whenever the simulation state changes (i.e. after every step or forward pass).
+
+    Args:
+        data: The simulation data to query.
+    """
+
+    def __init__(self, data: mujoco.MjData) -> None:
+        self._data = data
+        self._geom1: npt.NDArray[np.int32] | None = None
+        self._geom2: npt.NDArray[np.int32] | None = None
+        self._force: npt.NDArray[np.float64] | None = None
+        self._pair_forces: dict[tuple[int, int], float] = {}
+
+    def invalidate(self) -> None:
+        """Discards the contact list and the memoized answers."""
+        self._geom1 = self._geom2 = self._force = None
+        self._pair_forces.clear()
+
+    def _read_contacts(self) -> None:
+        contact = self._data.contact
+        self._geom1 = contact.geom1.copy()
+        self._geom2 = contact.geom2.copy()
+        # `efc_force` at the contact's first constraint row, the normal force for elliptic cones
+        self._force = self._data.efc_force[contact.efc_address]
+
+    def pair_forces(self, pairs: Sequence[tuple[int, int]]) -> list[float]:
+        """Sums the force of the contacts between each of the given pairs of geoms.
+
+        A contact is between a pair if both geoms of the pair take part in it, in either order.
+        The forces are summed in contact order, so the result does not depend on the batching.
+
+        Args:
+            pairs: The `(geom_id, geom_id)` pairs.
+
+        Returns:
+            The summed contact force for each pair, 0 for pairs that are not in contact.
+        """
+        missing = [pair for pair in pairs if pair not in self._pair_forces]
+        if missing:
+            if self._force is None:
+                self._read_contacts()
+            assert self._geom1 is not None and self._geom2 is not None
+            first, second = np.array(missing, dtype=np.int32).T[:, :, None]
+            geom1, geom2 = self._geom1[None], self._geom2[None]
+            in_contact = ((geom1 == first) | (geom2 == first)) & (
+                (geom1 == second) | (geom2 == second)
+            )
+            for pair, mask in zip(missing, in_contact):
+                self._pair_forces[pair] = sum(self._force[mask].tolist(), 0.0)
+        return [self._pair_forces[pair] for pair in pairs]
+
+    def pair_force(self, geom_a: int, geom_b: int) -> float:
+        """Sums the force of the contacts between two geoms, see `pair_forces()`.
+
+        Args:
+            geom_a: The ID of the first geom.
+            geom_b: The ID of the second geom.
+
+        Returns:
+            The summed contact force, 0 if the geoms are not in contact.
+        """
+        return self.pair_forces([(geom_a, geom_b)])[0]
@@ -242,3 +242,99 @@ def hamacher_product(a: float, b: float) -> float:
 
     assert 0.0 <= h_prod <= 1.0
     return h_prod
+
+
+def batched_tolerance(
+    x: npt.ArrayLike,
+    bounds: tuple[npt.ArrayLike, npt.ArrayLike] = (0.0, 0.0),
+    margin: npt.ArrayLike = 0.0,
+    sigmoid: SIGMOID_TYPE = "gaussian",
+    value_at_margin: float = _DEFAULT_VALUE_AT_MARGIN,
+) -> npt.NDArray[np.float64]:
+    """Batched `tolerance()`: the bounds and the margin may be arrays too, broadcast against `x`.
+
+    Elements with a margin of 0 are 0 outside of their bounds, as in `tolerance()`.
+
+    Args:
+        x: The inputs.
+        bounds: The inclusive `(lower, upper)` bounds.
+        margin: The margins, non-negative.
+        sigmoid: Choice of sigmoid type, see `tolerance()`.
+        value_at_margin: The output when the distance from `x` to the nearest bound is equal to `margin`.
+
+    Returns:
+        An array with values between 0.0 and 1.0.
+
+    Raises:
+        ValueError: If any lower bound is greater than its upper bound.
+        ValueError: If any margin is negative.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    lower, upper = np.asarray(bounds[0]), np.asarray(bounds[1])
+    margin = np.asarray(margin)
+    if np.any(lower > upper):
+        raise ValueError("Lower bound must be <= upper bound.")
+    if np.any(margin < 0):
+        raise ValueError(f"`margin` must be non-negative. Current value: {margin}")
+
+    in_bounds = np.logical_and(lower <= x, x <= upper)
+    # Elements with a margin of 0 go through the sigmoid as inf or NaN, then are discarded
+    with np.errstate(all="ignore"):
+        d = np.where(x < lower, lower - x, x - upper) / margin
+        out_of_bounds = np.where(
+            margin == 0, 0.0, _sigmoids(d, value_at_margin, sigmoid)
+        )
+    return np.where(in_bounds, 1.0, out_of_bounds)
+
+
+def batched_rect_prism_tolerance(
+    curr: npt.NDArray[np.float64],
+    zero: npt.NDArray[np.float64],
+    one: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Batched `rect_prism_tolerance()`.
+
+    Args:
+        curr: The points, of shape `(..., 3)`.
+        zero: The corners of the prisms with reward 0, broadcast against `curr`.
+        one: The corners of the prisms with reward 1, broadcast against `curr`.
+
+    Returns:
+        The rewards, of shape `curr.shape[:-1]`.
+    """
+    in_prism = np.all(
+        np.where(
+            one >= zero,
+            (zero <= curr) & (curr <= one),
+            (one <= curr) & (curr <= zero),
+        ),
+        axis=-1,
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = (curr - zero) / (one - zero)
+    return np.where(in_prism, scale[..., 0] * scale[..., 1] * scale[..., 2], 1.0)
+
+
+def batched_hamacher_product(
+    a: npt.ArrayLike, b: npt.ArrayLike
+) -> npt.NDArray[np.float64]:
+    """Batched `hamacher_product()`, element-wise over `a` and `b` (broadcast together).
+
+    Args:
+        a: 1st terms of the hamacher product.
+        b: 2nd terms of the hamacher product.
+
+    Returns:
+        The hamacher products of a and b.
+
+    Raises:
+        ValueError: a and b must range between 0 and 1
+    """
+    a, b = np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+    if not (np.all((0.0 <= a) & (a <= 1.0)) and np.all((0.0 <= b) & (b <= 1.0))):
+        raise ValueError("a and b must range between 0 and 1")
+
+    product = a * b
+    denominator = a + b - product
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, product / denominator, 0.0)
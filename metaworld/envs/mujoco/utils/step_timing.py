@@ -0,0 +1,191 @@
+"""Opt-in wall time measurement of the phases of `SawyerXYZEnv.step()`, aggregated per env class.
+
+Timing is off by default. While it is off, `step()` only gets the shared `NULL_TIMER`, whose
+methods do nothing, so the instrumentation costs a few no-op calls per step. The timers are safe
+to use from several threads at once (e.g. the sub-environments of a `ThreadedBenchmarkVectorEnv`
+stepping instances of the same class)::
+
+    from metaworld.envs.mujoco.utils import step_timing
+
+    step_timing.enable()
+    ...  # step some environments
+    step_timing.disable()
+    for env_name, phases in step_timing.stats().items():
+        print(env_name, phases["do_simulation"]["p99_s"], phases["evaluate_state"]["p99_s"])
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+
+import numpy as np
+import numpy.typing as npt
+
+from metaworld.types import PhaseTimingDict
+
+PHASES = (
+    "set_xyz_action",
+    "do_simulation",
+    "mj_forward",
+    "get_obs",
+    "clip_obs",
+    "evaluate_state",
+)
+"""The phases of `step()`, in the order they run."""
+
+_BUCKETS_PER_OCTAVE = 8
+_NUM_BUCKETS = 40 * _BUCKETS_PER_OCTAVE
+"""The histograms cover durations from 1 ns up to 2^40 ns (about 18 minutes)."""
+
+
+class StepTimer:
+    """Accumulates the durations of the step phases of one env class.
+
+    Each phase keeps a count, a total and a histogram with logarithmic buckets (8 per
+    octave), so recording is constant time and memory, and the percentiles are accurate
+    to within 9%. The start of the current phase is kept by the caller rather than by the
+    timer, and the recording is guarded by a lock, so several threads can time their steps
+    with the same timer::
+
+        t = timer.start()
+        ...  # the first phase
+        t = timer.lap("set_xyz_action", t)
+
+    Args:
+        name: The name of the env class, for reporting.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._phase_index = {phase: i for i, phase in enumerate(PHASES)}
+        self._counts = [0] * len(PHASES)
+        self._totals_ns = [0] * len(PHASES)
+        self._histograms = np.zeros((len(PHASES), _NUM_BUCKETS), dtype=np.int64)
+        self._lock = threading.Lock()
+
+    def start(self) -> int:
+        """Starts timing the first phase of a step.
+
+        Returns:
+            The start time of the phase, to pass to `lap()`.
+        """
+        return time.perf_counter_ns()
+
+    def lap(self, phase: str, start_ns: int) -> int:
+        """Records the time since `start_ns` as the duration of `phase`.
+
+        Args:
+            phase: The phase that just ended.
+            start_ns: The time the phase started, returned by `start()` or the previous `lap()`.
+
+        Returns:
+            The start time of the next phase.
+        """
+        now = time.perf_counter_ns()
+        duration = now - start_ns
+        i = self._phase_index[phase]
+        bucket = int(math.log2(duration) * _BUCKETS_PER_OCTAVE) if duration > 1 else 0
+        with self._lock:
+            self._counts[i] += 1
+            self._totals_ns[i] += duration
+            self._histograms[i, min(bucket, _NUM_BUCKETS - 1)] += 1
+        return now
+
+    def _percentile_s(self, histogram: npt.NDArray[np.int64], q: float) -> float:
+        # The upper edge of the bucket holding the q-th duration
+        rank = math.ceil(q * histogram.sum())
+        bucket = int(np.searchsorted(np.cumsum(histogram), max(rank, 1)))
+        return 2.0 ** ((bucket + 1) / _BUCKETS_PER_OCTAVE) * 1e-9
+
+    def stats(self) -> dict[str, PhaseTimingDict]:
+        """Summarizes the recorded durations.
+
+        Returns:
+            For each phase that was recorded: the number of times, the total and mean
+            duration and the 50th and 99th percentile durations, in seconds.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            totals_ns = list(self._totals_ns)
+            histograms = self._histograms.copy()
+        stats: dict[str, PhaseTimingDict] = {}
+        for phase, i in self._phase_index.items():
+            count = counts[i]
+            if count == 0:
+                continue
+            stats[phase] = {
+                "count": count,
+                "total_s": totals_ns[i] * 1e-9,
+                "mean_s": totals_ns[i] * 1e-9 / count,
+                "p50_s": self._percentile_s(histograms[i], 0.5),
+                "p99_s": self._percentile_s(histograms[i], 0.99),
+            }
+        return stats
+
+
+class _NullTimer(StepTimer):
+    """The timer of all env classes while timing is disabled, records nothing."""
+
+    def start(self) -> int:
+        return 0
+
+    def lap(self, phase: str, start_ns: int) -> int:
+        return 0
+
+
+NULL_TIMER: StepTimer = _NullTimer("")
+"""The timer `timer_for()` returns while timing is disabled."""
+
+_enabled = False
+_timers: dict[type, StepTimer] = {}
+
+
+def enable() -> None:
+    """Starts timing the steps of all environments."""
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    """Stops timing steps. The recorded durations are kept until `reset()`."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    """Returns whether steps are being timed."""
+    return _enabled
+
+
+def reset() -> None:
+    """Discards the recorded durations of all env classes."""
+    _timers.clear()
+
+
+def timer_for(env_cls: type) -> StepTimer:
+    """Returns the timer the steps of the given env class record into.
+
+    Args:
+        env_cls: The env class.
+
+    Returns:
+        The timer of the class, or `NULL_TIMER` if timing is disabled.
+    """
+    if not _enabled:
+        return NULL_TIMER
+    timer = _timers.get(env_cls)
+    if timer is None:
+        # `setdefault()` is atomic, so threads that race here all get the same timer
+        timer = _timers.setdefault(env_cls, StepTimer(env_cls.__name__))
+    return timer
+
+
+def stats() -> dict[str, dict[str, PhaseTimingDict]]:
+    """Summarizes the recorded durations of every env class that was timed.
+
+    Returns:
+        The `StepTimer.stats()` of each env class, by class name.
+    """
+    return {timer.name: timer.stats() for timer in list(_timers.values())}
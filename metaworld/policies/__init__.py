@@ -1,3 +1,4 @@
+from metaworld.policies.multi_task_policy import MultiTaskPolicy
 from metaworld.policies.sawyer_assembly_v1_policy import SawyerAssemblyV1Policy
 from metaworld.policies.sawyer_assembly_v2_policy import SawyerAssemblyV2Policy
 from metaworld.policies.sawyer_basketball_v1_policy import SawyerBasketballV1Policy
@@ -126,7 +127,62 @@ from metaworld.policies.sawyer_sweep_v2_policy import SawyerSweepV2Policy
 from metaworld.policies.sawyer_window_close_v2_policy import SawyerWindowCloseV2Policy
 from metaworld.policies.sawyer_window_open_v2_policy import SawyerWindowOpenV2Policy
 
+ENV_POLICY_MAP = {
+    "assembly-v2": SawyerAssemblyV2Policy,
+    "basketball-v2": SawyerBasketballV2Policy,
+    "bin-picking-v2": SawyerBinPickingV2Policy,
+    "box-close-v2": SawyerBoxCloseV2Policy,
+    "button-press-topdown-v2": SawyerButtonPressTopdownV2Policy,
+    "button-press-topdown-wall-v2": SawyerButtonPressTopdownWallV2Policy,
+    "button-press-v2": SawyerButtonPressV2Policy,
+    "button-press-wall-v2": SawyerButtonPressWallV2Policy,
+    "coffee-button-v2": SawyerCoffeeButtonV2Policy,
+    "coffee-pull-v2": SawyerCoffeePullV2Policy,
+    "coffee-push-v2": SawyerCoffeePushV2Policy,
+    "dial-turn-v2": SawyerDialTurnV2Policy,
+    "disassemble-v2": SawyerDisassembleV2Policy,
+    "door-close-v2": SawyerDoorCloseV2Policy,
+    "door-lock-v2": SawyerDoorLockV2Policy,
+    "door-open-v2": SawyerDoorOpenV2Policy,
+    "door-unlock-v2": SawyerDoorUnlockV2Policy,
+    "drawer-close-v2": SawyerDrawerCloseV2Policy,
+    "drawer-open-v2": SawyerDrawerOpenV2Policy,
+    "faucet-close-v2": SawyerFaucetCloseV2Policy,
+    "faucet-open-v2": SawyerFaucetOpenV2Policy,
+    "hammer-v2": SawyerHammerV2Policy,
+    "hand-insert-v2": SawyerHandInsertV2Policy,
+    "handle-press-side-v2": SawyerHandlePressSideV2Policy,
+    "handle-press-v2": SawyerHandlePressV2Policy,
+    "handle-pull-v2": SawyerHandlePullV2Policy,
+    "handle-pull-side-v2": SawyerHandlePullSideV2Policy,
+    "peg-insert-side-v2": SawyerPegInsertionSideV2Policy,
+    "lever-pull-v2": SawyerLeverPullV2Policy,
+    "peg-unplug-side-v2": SawyerPegUnplugSideV2Policy,
+    "pick-out-of-hole-v2": SawyerPickOutOfHoleV2Policy,
+    "pick-place-v2": SawyerPickPlaceV2Policy,
+    "pick-place-wall-v2": SawyerPickPlaceWallV2Policy,
+    "plate-slide-back-side-v2": SawyerPlateSlideBackSideV2Policy,
+    "plate-slide-back-v2": SawyerPlateSlideBackV2Policy,
+    "plate-slide-side-v2": SawyerPlateSlideSideV2Policy,
+    "plate-slide-v2": SawyerPlateSlideV2Policy,
+    "reach-v2": SawyerReachV2Policy,
+    "reach-wall-v2": SawyerReachWallV2Policy,
+    "push-back-v2": SawyerPushBackV2Policy,
+    "push-v2": SawyerPushV2Policy,
+    "push-wall-v2": SawyerPushWallV2Policy,
+    "shelf-place-v2": SawyerShelfPlaceV2Policy,
+    "soccer-v2": SawyerSoccerV2Policy,
+    "stick-pull-v2": SawyerStickPullV2Policy,
+    "stick-push-v2": SawyerStickPushV2Policy,
+    "sweep-into-v2": SawyerSweepIntoV2Policy,
+    "sweep-v2": SawyerSweepV2Policy,
+    "window-close-v2": SawyerWindowCloseV2Policy,
+    "window-open-v2": SawyerWindowOpenV2Policy,
+}
+"""The expert policy class of each V2 environment, by environment name."""
 __all__ = [
+    "ENV_POLICY_MAP",
+    "MultiTaskPolicy",
     "SawyerAssemblyV1Policy",
     "SawyerAssemblyV2Policy",
     "SawyerBasketballV1Policy",
@@ -12,16 +12,25 @@ class Action:
     Once initialized, fields can be assigned as if the action
     is a dictionary. Once filled, the corresponding array is
     available as an instance variable.
+
+    With a `batch_size`, the array holds a batch of actions, one per row,
+    and fields are assigned for all the rows at once.
     """
 
-    def __init__(self, structure: dict[str, npt.NDArray[Any] | int]) -> None:
+    def __init__(
+        self,
+        structure: dict[str, npt.NDArray[Any] | int],
+        batch_size: int | None = None,
+    ) -> None:
         """Action.
 
         Args:
             structure: Map from field names to output array indices
+            batch_size: The number of actions in the batch, `None` for a single action
         """
         self._structure = structure
-        self.array = np.zeros(len(self), dtype=np.float32)
+        shape = (len(self),) if batch_size is None else (batch_size, len(self))
+        self.array = np.zeros(shape, dtype=np.float32)
 
     def __len__(self) -> int:
         return sum(
@@ -32,8 +41,8 @@ class Action:
         assert key in self._structure, (
             "This action's structure does not contain %s" % key
         )
-        return self.array[self._structure[key]]
+        return self.array[..., self._structure[key]]
 
     def __setitem__(self, key: str, value) -> None:
         assert key in self._structure, f"This action's structure does not contain {key}"
-        self.array[self._structure[key]] = value
+        self.array[..., self._structure[key]] = value
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from metaworld.policies.policy import Policy
+
+
+class MultiTaskPolicy:
+    """Expert policy for a batch of observations from a mix of tasks.
+
+    The rows of a batch are grouped by task, and each group is passed to the
+    `get_actions()` of its task's policy in one call.
+
+    Args:
+        policies: The policy of each task, indexed by task index. For MT50, e.g.
+            `[ENV_POLICY_MAP[name]() for name in mt50.train_classes]`.
+    """
+
+    def __init__(self, policies: Sequence[Policy]) -> None:
+        self.policies = list(policies)
+
+    def get_actions(
+        self, obs: npt.NDArray[np.float64], task_idx: npt.NDArray[np.int_]
+    ) -> npt.NDArray[np.float32]:
+        """Gets the actions in response to a batch of observations from a mix of tasks.
+
+        Args:
+            obs: The `[N, obs_dim]` observations.
+            task_idx: The `[N]` task index of each observation.
+
+        Returns:
+            The `[N, 4]` actions, one per observation.
+
+        Raises:
+            ValueError: If `task_idx` does not hold a valid task index per observation.
+        """
+        obs = np.asarray(obs, dtype=np.float64)
+        task_idx = np.asarray(task_idx)
+        if task_idx.shape != obs.shape[:1]:
+            raise ValueError(
+                f"Expected {len(obs)} task indices, got shape {task_idx.shape}"
+            )
+        if len(task_idx) and (
+            task_idx.min() < 0 or task_idx.max() >= len(self.policies)
+        ):
+            raise ValueError(
+                f"Task indices must be in [0, {len(self.policies)}), "
+                f"got {task_idx.min()} to {task_idx.max()}"
+            )
+
+        actions = np.zeros((len(obs), 4), dtype=np.float32)
+        # A stable sort lists the rows of each task together, in their original order
+        rows = np.argsort(task_idx, kind="stable")
+        tasks, starts = np.unique(task_idx[rows], return_index=True)
+        for task, task_rows in zip(tasks, np.split(rows, starts[1:])):
+            actions[task_rows] = self.policies[task].get_actions(obs[task_rows])
+        return actions
+
+    __call__ = get_actions
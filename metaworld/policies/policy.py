@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import functools
 import warnings
 from typing import Any, Callable
 
@@ -31,14 +32,18 @@ def assert_fully_parsed(
 
 
 def move(
-    from_xyz: npt.NDArray[Any], to_xyz: npt.NDArray[Any], p: float
+    from_xyz: npt.NDArray[Any],
+    to_xyz: npt.NDArray[Any],
+    p: float | npt.NDArray[Any],
 ) -> npt.NDArray[Any]:
     """Computes action components that help move from 1 position to another.
 
+    Works on a single `[3]` position or on `[N, 3]` batches, warning at most once per batch.
+
     Args:
         from_xyz: The coordinates to move from (usually current position)
         to_xyz: The coordinates to move to
-        p: constant to scale response
+        p: constant to scale response, either shared or per row (`[N, 1]`)
 
     Returns:
         Response that will decrease abs(to_xyz - from_xyz)
@@ -53,6 +58,41 @@ def move(
     return response
 
 
+def batched_xyz(x: Any, y: Any, z: Any) -> npt.NDArray[np.float64]:
+    """Stacks `[N]` (or scalar) coordinates into `[N, 3]` positions.
+
+    Args:
+        x: The X coordinates
+        y: The Y coordinates
+        z: The Z coordinates
+
+    Returns:
+        The `[N, 3]` positions
+    """
+    x, y, z = np.asarray(x), np.asarray(y), np.asarray(z)
+    out = np.empty(np.broadcast_shapes(x.shape, y.shape, z.shape) + (3,))
+    out[..., 0], out[..., 1], out[..., 2] = x, y, z
+    return out
+
+
+@functools.lru_cache(maxsize=None)
+def _obs_columns(
+    parse_obs: Callable[[npt.NDArray[np.float64]], dict[str, Any]], obs_dim: int
+) -> dict[str, int | slice | npt.NDArray[np.intp]]:
+    # `_parse_obs()` only slices, so parsing the column indices yields the columns of each field.
+    # Contiguous fields become ints or slices, so that the parsed fields are views.
+    columns: dict[str, int | slice | npt.NDArray[np.intp]] = {}
+    for key, idx in parse_obs(np.arange(obs_dim, dtype=np.float64)).items():
+        idx = np.asarray(idx).astype(np.intp)
+        if idx.ndim == 0:
+            columns[key] = int(idx)
+        elif len(idx) and np.array_equal(idx, np.arange(idx[0], idx[0] + len(idx))):
+            columns[key] = slice(int(idx[0]), int(idx[0]) + len(idx))
+        else:
+            columns[key] = idx
+    return columns
+
+
 class Policy(abc.ABC):
     """Abstract base class for policies."""
 
@@ -69,14 +109,64 @@ class Policy(abc.ABC):
         """
         raise NotImplementedError
 
-    @abc.abstractmethod
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # `get_action()` and `get_actions()` are implemented in terms of each other
+        if (
+            cls.get_action is Policy.get_action
+            and cls.get_actions is Policy.get_actions
+        ):
+            raise TypeError(
+                f"{cls.__name__} must override get_action() or get_actions()"
+            )
+
     def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
         """Gets an action in response to an observation.
 
+        Policies override this or `get_actions()`. The default returns the action for a
+        batch of one observation, so policies implementing `get_actions()` have a single
+        implementation of their logic.
+
         Args:
             obs: Observation which conforms to env.observation_space
 
         Returns:
             Array (usually 4 elements) representing the action to take
         """
-        raise NotImplementedError
+        return self.get_actions(np.asarray(obs)[None])[0]
+
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        """Gets the actions in response to a batch of observations.
+
+        The V2 policies override this with a vectorized version. The default calls
+        `get_action()` row by row (on a copy, as some policies modify the observation they
+        are given), for the policies that only override `get_action()`.
+
+        Args:
+            obs: The `[N, obs_dim]` observations, each conforming to env.observation_space
+
+        Returns:
+            The `[N, 4]` actions, one per observation
+        """
+        return np.stack(
+            [self.get_action(row) for row in np.array(obs, dtype=np.float64)]
+        )
+
+    @classmethod
+    def _parse_obs_batch(
+        cls, obs: npt.NDArray[np.float64]
+    ) -> dict[str, npt.NDArray[np.float64]]:
+        """Batched `_parse_obs()`, for `[N, obs_dim]` observations.
+
+        The columns of each field are found once per policy class, by parsing the column
+        indices. Scalar fields become `[N]` arrays and array fields `[N, k]` arrays.
+
+        Args:
+            obs: The `[N, obs_dim]` observations
+
+        Returns:
+            dict: Dictionary which contains the batched information from the observations
+        """
+        obs = np.asarray(obs, dtype=np.float64)
+        columns = _obs_columns(cls._parse_obs, obs.shape[-1])
+        return {key: obs[:, idx] for key, idx in columns.items()}
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batched_xyz,
+    move,
+)
 
 
 class SawyerAssemblyV2Policy(Policy):
@@ -21,49 +24,64 @@ class SawyerAssemblyV2Policy(Policy):
             "unused_info": obs[7:-3],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=10.0
         )
         action["grab_effort"] = self._grab_effort(o_d)
+
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_wrench = o_d["wrench_pos"] + np.array([-0.02, 0.0, 0.0])
         pos_peg = o_d["peg_pos"] + np.array([0.12, 0.0, 0.14])
 
-        # If XY error is greater than 0.02, place end effector above the wrench
-        if np.linalg.norm(pos_curr[:2] - pos_wrench[:2]) > 0.02:
-            return pos_wrench + np.array([0.0, 0.0, 0.1])
-        # (For later) if lined up with peg, drop down on top of it
-        elif np.linalg.norm(pos_curr[:2] - pos_peg[:2]) <= 0.02:
-            return pos_peg + np.array([0.0, 0.0, -0.2])
-        # Once XY error is low enough, drop end effector down on top of wrench
-        elif abs(pos_curr[2] - pos_wrench[2]) > 0.05:
-            return pos_wrench + np.array([0.0, 0.0, 0.03])
-        # If not at the same Z height as the goal, move up to that plane
-        elif abs(pos_curr[2] - pos_peg[2]) > 0.04:
-            return np.array([pos_curr[0], pos_curr[1], pos_peg[2]])
-        # If XY error is greater than 0.02, place end effector above the peg
-        else:
-            return pos_peg
+        return np.select(
+            [
+                # If XY error is greater than 0.02, place end effector above the wrench
+                np.linalg.norm(
+                    pos_curr[:, :2] - pos_wrench[:, :2], axis=-1, keepdims=True
+                )
+                > 0.02,
+                # (For later) if lined up with peg, drop down on top of it
+                np.linalg.norm(pos_curr[:, :2] - pos_peg[:, :2], axis=-1, keepdims=True)
+                <= 0.02,
+                # Once XY error is low enough, drop end effector down on top of wrench
+                np.abs(pos_curr[:, 2:] - pos_wrench[:, 2:]) > 0.05,
+                # If not at the same Z height as the goal, move up to that plane
+                np.abs(pos_curr[:, 2:] - pos_peg[:, 2:]) > 0.04,
+            ],
+            [
+                pos_wrench + np.array([0.0, 0.0, 0.1]),
+                pos_peg + np.array([0.0, 0.0, -0.2]),
+                pos_wrench + np.array([0.0, 0.0, 0.03]),
+                batched_xyz(pos_curr[:, 0], pos_curr[:, 1], pos_peg[:, 2]),
+            ],
+            # If XY error is greater than 0.02, place end effector above the peg
+            pos_peg,
+        )
 
     @staticmethod
-    def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
+    def _grab_effort(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_wrench = o_d["wrench_pos"] + np.array([-0.02, 0.0, 0.0])
-        # pos_peg = o_d["peg_pos"] + np.array([0.12, 0.0, 0.14])
 
-        if (
-            np.linalg.norm(pos_curr[:2] - pos_wrench[:2]) > 0.02
-            or abs(pos_curr[2] - pos_wrench[2]) > 0.12
-        ):
-            return 0.0
         # Until hovering over peg, keep hold of wrench
-        else:
-            return 0.6
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_wrench[:, :2], axis=-1) > 0.02)
+            | (np.abs(pos_curr[:, 2] - pos_wrench[:, 2]) > 0.12),
+            0.0,
+            0.6,
+        )
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
@@ -20,10 +18,12 @@ class SawyerBinPickingV2Policy(Policy):
             "extra_info": obs[7:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=25.0
@@ -33,7 +33,9 @@ class SawyerBinPickingV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_cube = o_d["cube_pos"] + np.array([0.0, 0.0, 0.03])
         pos_bin = np.array([0.12, 0.7, 0.02])
@@ -42,31 +44,43 @@ class SawyerBinPickingV2Policy(Policy):
         # more centrally in the bin (in Y direction). When the fingers close,
         # they'll drag the cube so that it's no longer located near an edge.
         # This ensures that the fingers don't get caught outside of the bin.
-        pos_cube[1] = max(0.675, min(pos_cube[1], 0.725))
+        pos_cube[:, 1] = np.maximum(0.675, np.minimum(pos_cube[:, 1], 0.725))
 
-        if np.linalg.norm(pos_curr[:2] - pos_cube[:2]) > 0.02:
-            return pos_cube + np.array([0.0, 0.0, 0.15])
-        elif abs(pos_curr[2] - pos_cube[2]) > 0.01:
-            return pos_cube
-        elif np.linalg.norm(pos_curr[:2] - pos_bin[:2]) > 0.02:
-            if pos_curr[2] < 0.15:
-                return pos_curr + np.array([0.0, 0.0, 0.1])
-            return np.array([*pos_bin[:2], 0.18])
-        else:
-            return pos_bin
+        return np.select(
+            [
+                np.linalg.norm(
+                    pos_curr[:, :2] - pos_cube[:, :2], axis=-1, keepdims=True
+                )
+                > 0.02,
+                np.abs(pos_curr[:, 2:] - pos_cube[:, 2:]) > 0.01,
+                np.linalg.norm(pos_curr[:, :2] - pos_bin[:2], axis=-1, keepdims=True)
+                > 0.02,
+            ],
+            [
+                pos_cube + np.array([0.0, 0.0, 0.15]),
+                pos_cube,
+                np.where(
+                    pos_curr[:, 2:] < 0.15,
+                    pos_curr + np.array([0.0, 0.0, 0.1]),
+                    np.array([*pos_bin[:2], 0.18]),
+                ),
+            ],
+            pos_bin,
+        )
 
     @staticmethod
-    def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
+    def _grab_effort(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_cube = o_d["cube_pos"] + np.array([0.0, 0.0, 0.03])
 
         # See note above in `_desired_pos`
-        pos_cube[1] = max(0.675, min(pos_cube[1], 0.725))
+        pos_cube[:, 1] = np.maximum(0.675, np.minimum(pos_cube[:, 1], 0.725))
 
-        if (
-            np.linalg.norm(pos_curr[:2] - pos_cube[:2]) > 0.02
-            or abs(pos_curr[2] - pos_cube[2]) > 0.02
-        ):
-            return -1.0
-        else:
-            return 0.6
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_cube[:, :2], axis=-1) > 0.02)
+            | (np.abs(pos_curr[:, 2] - pos_cube[:, 2]) > 0.02),
+            -1.0,
+            0.6,
+        )
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batched_xyz,
+    move,
+)
 
 
 class SawyerBoxCloseV2Policy(Policy):
@@ -22,10 +25,13 @@ class SawyerBoxCloseV2Policy(Policy):
             "extra_info_2": obs[-1],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
+
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=25.0
         )
@@ -34,34 +40,43 @@ class SawyerBoxCloseV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_lid = o_d["lid_pos"] + np.array([0.0, 0.0, +0.02])
-        pos_box = np.array([*o_d["box_pos"], 0.15]) + np.array([0.0, 0.0, 0.0])
+        pos_box = batched_xyz(o_d["box_pos"][:, 0], o_d["box_pos"][:, 1], 0.15)
 
-        # If error in the XY plane is greater than 0.02, place end effector above the puck
-        if np.linalg.norm(pos_curr[:2] - pos_lid[:2]) > 0.01:
-            return np.array([*pos_lid[:2], 0.2])
-        # Once XY error is low enough, drop end effector down on top of puck
-        elif abs(pos_curr[2] - pos_lid[2]) > 0.05:
-            return pos_lid
-        # If not at the same Z height as the goal, move up to that plane
-        elif abs(pos_curr[2] - pos_box[2]) > 0.04:
-            return np.array([pos_curr[0], pos_curr[1], pos_box[2]])
-        # Move to the goal
-        else:
-            return pos_box
+        return np.select(
+            [
+                # If error in the XY plane is greater than 0.02, place end effector above the puck
+                np.linalg.norm(pos_curr[:, :2] - pos_lid[:, :2], axis=-1, keepdims=True)
+                > 0.01,
+                # Once XY error is low enough, drop end effector down on top of puck
+                np.abs(pos_curr[:, 2:] - pos_lid[:, 2:]) > 0.05,
+                # If not at the same Z height as the goal, move up to that plane
+                np.abs(pos_curr[:, 2:] - pos_box[:, 2:]) > 0.04,
+            ],
+            [
+                batched_xyz(pos_lid[:, 0], pos_lid[:, 1], 0.2),
+                pos_lid,
+                batched_xyz(pos_curr[:, 0], pos_curr[:, 1], pos_box[:, 2]),
+            ],
+            # Move to the goal
+            pos_box,
+        )
 
     @staticmethod
-    def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
+    def _grab_effort(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_lid = o_d["lid_pos"] + np.array([0.0, 0.0, +0.02])
 
-        if (
-            np.linalg.norm(pos_curr[:2] - pos_lid[:2]) > 0.01
-            or abs(pos_curr[2] - pos_lid[2]) > 0.13
-        ):
-            return 0.5
         # While end effector is moving down toward the puck, begin closing the grabber
-        else:
-            return 1.0
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_lid[:, :2], axis=-1) > 0.01)
+            | (np.abs(pos_curr[:, 2] - pos_lid[:, 2]) > 0.13),
+            0.5,
+            1.0,
+        )
@@ -1,12 +1,10 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, move
+from metaworld.policies.policy import Policy, batched_xyz, move
 
 
 class SawyerButtonPressV2Policy(Policy):
@@ -19,10 +17,12 @@ class SawyerButtonPressV2Policy(Policy):
             "unused_info": obs[7:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=25.0
@@ -32,25 +32,20 @@ class SawyerButtonPressV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_button = o_d["button_pos"] + np.array([0.0, 0.0, -0.07])
 
         # align the gripper with the button if the gripper does not have
-        # the same x and z position as the button.
-        hand_x, hand_y, hand_z = pos_curr
-        button_initial_x, button_initial_y, button_initial_z = pos_button
-        if not np.all(
-            np.isclose(
-                np.array([hand_x, hand_z]),
-                np.array([button_initial_x, button_initial_z]),
-                atol=0.02,
-            )
-        ):
-            pos_button[1] = pos_curr[1] - 0.1
-            return pos_button
-        # if the hand is aligned with the button, push the button in, by
-        # increasing the hand's y position
-        pos_button[1] += 0.02
-
-        return pos_button
+        # the same x and z position as the button, otherwise push the button in
+        aligned = np.all(
+            np.isclose(pos_curr[:, [0, 2]], pos_button[:, [0, 2]], atol=0.02),
+            axis=-1,
+        )
+        return batched_xyz(
+            pos_button[:, 0],
+            np.where(aligned, pos_button[:, 1] + 0.02, pos_curr[:, 1] - 0.1),
+            pos_button[:, 2],
+        )
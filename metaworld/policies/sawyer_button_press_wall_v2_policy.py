@@ -1,12 +1,10 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, move
+from metaworld.policies.policy import Policy, batched_xyz, move
 
 
 class SawyerButtonPressWallV2Policy(Policy):
@@ -19,10 +17,12 @@ class SawyerButtonPressWallV2Policy(Policy):
             "unused_info": obs[7:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=15.0
@@ -32,29 +32,37 @@ class SawyerButtonPressWallV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_button = o_d["button_pos"] + np.array([0.0, 0.0, 0.04])
 
-        if abs(pos_curr[0] - pos_button[0]) > 0.02:
-            return np.array([pos_button[0], pos_curr[1], 0.3])
-        elif pos_button[1] - pos_curr[1] > 0.09:
-            return np.array([pos_button[0], pos_button[1], 0.3])
-        elif abs(pos_curr[2] - pos_button[2]) > 0.02:
-            return pos_button + np.array([0.0, -0.05, 0.0])
-        else:
-            return pos_button + np.array([0.0, -0.02, 0.0])
+        return np.select(
+            [
+                np.abs(pos_curr[:, :1] - pos_button[:, :1]) > 0.02,
+                pos_button[:, 1:2] - pos_curr[:, 1:2] > 0.09,
+                np.abs(pos_curr[:, 2:] - pos_button[:, 2:]) > 0.02,
+            ],
+            [
+                batched_xyz(pos_button[:, 0], pos_curr[:, 1], 0.3),
+                batched_xyz(pos_button[:, 0], pos_button[:, 1], 0.3),
+                pos_button + np.array([0.0, -0.05, 0.0]),
+            ],
+            pos_button + np.array([0.0, -0.02, 0.0]),
+        )
 
     @staticmethod
-    def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
+    def _grab_effort(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_button = o_d["button_pos"] + np.array([0.0, 0.0, 0.04])
 
-        if (
-            abs(pos_curr[0] - pos_button[0]) > 0.02
-            or pos_button[1] - pos_curr[1] > 0.09
-            or abs(pos_curr[2] - pos_button[2]) > 0.02
-        ):
-            return 1.0
-        else:
-            return -1.0
+        return np.where(
+            (np.abs(pos_curr[:, 0] - pos_button[:, 0]) > 0.02)
+            | (pos_button[:, 1] - pos_curr[:, 1] > 0.09)
+            | (np.abs(pos_curr[:, 2] - pos_button[:, 2]) > 0.02),
+            1.0,
+            -1.0,
+        )
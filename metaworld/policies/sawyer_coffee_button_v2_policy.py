@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batched_xyz,
+    move,
+)
 
 
 class SawyerCoffeeButtonV2Policy(Policy):
@@ -20,10 +23,12 @@ class SawyerCoffeeButtonV2Policy(Policy):
             "unused_info": obs[7:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=10.0
@@ -33,11 +38,17 @@ class SawyerCoffeeButtonV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_button = o_d["button_pos"] + np.array([0.0, 0.0, -0.07])
 
-        if np.linalg.norm(pos_curr[[0, 2]] - pos_button[[0, 2]]) > 0.02:
-            return np.array([pos_button[0], pos_curr[1], pos_button[2]])
-        else:
-            return pos_button + np.array([0.0, 0.2, 0.0])
+        return np.where(
+            np.linalg.norm(
+                pos_curr[:, [0, 2]] - pos_button[:, [0, 2]], axis=-1, keepdims=True
+            )
+            > 0.02,
+            batched_xyz(pos_button[:, 0], pos_curr[:, 1], pos_button[:, 2]),
+            pos_button + np.array([0.0, 0.2, 0.0]),
+        )
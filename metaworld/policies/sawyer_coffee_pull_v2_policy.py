@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
@@ -21,10 +19,12 @@ class SawyerCoffeePullV2Policy(Policy):
             "target_pos": obs[-3:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=10.0
@@ -34,26 +34,32 @@ class SawyerCoffeePullV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_mug = o_d["mug_pos"] + np.array([-0.005, 0.0, 0.05])
 
-        if np.linalg.norm(pos_curr[:2] - pos_mug[:2]) > 0.06:
-            return pos_mug + np.array([0.0, 0.0, 0.15])
-        elif abs(pos_curr[2] - pos_mug[2]) > 0.02:
-            return pos_mug
-        else:
-            return o_d["target_pos"]
+        return np.select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_mug[:, :2], axis=-1, keepdims=True)
+                > 0.06,
+                np.abs(pos_curr[:, 2:] - pos_mug[:, 2:]) > 0.02,
+            ],
+            [pos_mug + np.array([0.0, 0.0, 0.15]), pos_mug],
+            o_d["target_pos"],
+        )
 
     @staticmethod
-    def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
+    def _grab_effort(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_mug = o_d["mug_pos"] + np.array([0.01, 0.0, 0.05])
 
-        if (
-            np.linalg.norm(pos_curr[:2] - pos_mug[:2]) > 0.06
-            or abs(pos_curr[2] - pos_mug[2]) > 0.1
-        ):
-            return -1.0
-        else:
-            return 0.7
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_mug[:, :2], axis=-1) > 0.06)
+            | (np.abs(pos_curr[:, 2] - pos_mug[:, 2]) > 0.1),
+            -1.0,
+            0.7,
+        )
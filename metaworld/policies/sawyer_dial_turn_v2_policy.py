@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batched_xyz,
+    move,
+)
 
 
 class SawyerDialTurnV2Policy(Policy):
@@ -20,10 +23,10 @@ class SawyerDialTurnV2Policy(Policy):
             "extra_info": obs[7:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_pow": 3})
+        action = Action({"delta_pos": np.arange(3), "grab_pow": 3}, batch_size=len(obs))
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=10.0
@@ -33,12 +36,20 @@ class SawyerDialTurnV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         hand_pos = o_d["hand_pos"]
         dial_pos = o_d["dial_pos"] + np.array([0.05, 0.02, 0.09])
 
-        if np.linalg.norm(hand_pos[:2] - dial_pos[:2]) > 0.02:
-            return np.array([*dial_pos[:2], 0.2])
-        if abs(hand_pos[2] - dial_pos[2]) > 0.02:
-            return dial_pos
-        return dial_pos + np.array([-0.05, 0.005, 0.0])
+        return np.select(
+            [
+                np.linalg.norm(
+                    hand_pos[:, :2] - dial_pos[:, :2], axis=-1, keepdims=True
+                )
+                > 0.02,
+                np.abs(hand_pos[:, 2:] - dial_pos[:, 2:]) > 0.02,
+            ],
+            [batched_xyz(dial_pos[:, 0], dial_pos[:, 1], 0.2), dial_pos],
+            dial_pos + np.array([-0.05, 0.005, 0.0]),
+        )
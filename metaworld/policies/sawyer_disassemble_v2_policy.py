@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
@@ -21,10 +19,12 @@ class SawyerDisassembleV2Policy(Policy):
             "unused_info": obs[7:-3],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=10.0
@@ -34,30 +34,37 @@ class SawyerDisassembleV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_wrench = o_d["wrench_pos"] + np.array([-0.02, 0.0, 0.01])
-        # pos_peg = o_d["peg_pos"] + np.array([0.12, 0.0, 0.14])
-
-        # If XY error is greater than 0.02, place end effector above the wrench
-        if np.linalg.norm(pos_curr[:2] - pos_wrench[:2]) > 0.02:
-            return pos_wrench + np.array([0.0, 0.0, 0.1])
-        # Once XY error is low enough, drop end effector down on top of wrench
-        elif abs(pos_curr[2] - pos_wrench[2]) > 0.03:
-            return pos_wrench
-        # Move upwards
-        else:
-            return pos_curr + np.array([0.0, 0.0, 0.1])
+
+        return np.select(
+            [
+                # If XY error is greater than 0.02, place end effector above the wrench
+                np.linalg.norm(
+                    pos_curr[:, :2] - pos_wrench[:, :2], axis=-1, keepdims=True
+                )
+                > 0.02,
+                # Once XY error is low enough, drop end effector down on top of wrench
+                np.abs(pos_curr[:, 2:] - pos_wrench[:, 2:]) > 0.03,
+            ],
+            [pos_wrench + np.array([0.0, 0.0, 0.1]), pos_wrench],
+            # Move upwards
+            pos_curr + np.array([0.0, 0.0, 0.1]),
+        )
 
     @staticmethod
-    def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
+    def _grab_effort(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_wrench = o_d["wrench_pos"] + np.array([-0.02, 0.0, 0.01])
 
-        if (
-            np.linalg.norm(pos_curr[:2] - pos_wrench[:2]) > 0.02
-            or abs(pos_curr[2] - pos_wrench[2]) > 0.07
-        ):
-            return 0.0
-        else:
-            return 0.8
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_wrench[:, :2], axis=-1) > 0.02)
+            | (np.abs(pos_curr[:, 2] - pos_wrench[:, 2]) > 0.07),
+            0.0,
+            0.8,
+        )
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
@@ -20,10 +18,12 @@ class SawyerDoorOpenV2Policy(Policy):
             "unused_info": obs[7:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=25.0
@@ -33,17 +33,26 @@ class SawyerDoorOpenV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
-        pos_door = o_d["door_pos"]
-        pos_door[0] -= 0.05
-
-        # align end effector's Z axis with door handle's Z axis
-        if np.linalg.norm(pos_curr[:2] - pos_door[:2]) > 0.12:
-            return pos_door + np.array([0.06, 0.02, 0.2])
-        # drop down on front edge of door handle
-        elif abs(pos_curr[2] - pos_door[2]) > 0.04:
-            return pos_door + np.array([0.06, 0.02, 0.0])
-        # push from front edge toward door handle's centroid
-        else:
-            return pos_door
+        pos_door = o_d["door_pos"] - np.array([0.05, 0.0, 0.0])
+
+        return np.select(
+            [
+                # align end effector's Z axis with door handle's Z axis
+                np.linalg.norm(
+                    pos_curr[:, :2] - pos_door[:, :2], axis=-1, keepdims=True
+                )
+                > 0.12,
+                # drop down on front edge of door handle
+                np.abs(pos_curr[:, 2:] - pos_door[:, 2:]) > 0.04,
+            ],
+            [
+                pos_door + np.array([0.06, 0.02, 0.2]),
+                pos_door + np.array([0.06, 0.02, 0.0]),
+            ],
+            # push from front edge toward door handle's centroid
+            pos_door,
+        )
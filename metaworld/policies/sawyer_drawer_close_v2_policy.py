@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batched_xyz,
+    move,
+)
 
 
 class SawyerDrawerCloseV2Policy(Policy):
@@ -20,10 +23,12 @@ class SawyerDrawerCloseV2Policy(Policy):
             "unused_info": obs[7:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=25.0
@@ -33,21 +38,29 @@ class SawyerDrawerCloseV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_drwr = o_d["drwr_pos"] + np.array([0.0, 0.0, -0.02])
 
-        # if further forward than the drawer...
-        if pos_curr[1] > pos_drwr[1]:
-            if pos_curr[2] < pos_drwr[2] + 0.23:
-                # rise up quickly (Z direction)
-                return np.array([pos_curr[0], pos_curr[1], pos_drwr[2] + 0.5])
-            else:
-                # move to front edge of drawer handle, but stay high in Z
-                return pos_drwr + np.array([0.0, -0.075, 0.23])
-        # drop down to touch drawer handle
-        elif abs(pos_curr[2] - pos_drwr[2]) > 0.04:
-            return pos_drwr + np.array([0.0, -0.075, 0.0])
-        # push toward drawer handle's centroid
-        else:
-            return pos_drwr
+        return np.select(
+            [
+                # if further forward than the drawer...
+                pos_curr[:, 1:2] > pos_drwr[:, 1:2],
+                # drop down to touch drawer handle
+                np.abs(pos_curr[:, 2:] - pos_drwr[:, 2:]) > 0.04,
+            ],
+            [
+                np.where(
+                    pos_curr[:, 2:] < pos_drwr[:, 2:] + 0.23,
+                    # rise up quickly (Z direction)
+                    batched_xyz(pos_curr[:, 0], pos_curr[:, 1], pos_drwr[:, 2] + 0.5),
+                    # move to front edge of drawer handle, but stay high in Z
+                    pos_drwr + np.array([0.0, -0.075, 0.23]),
+                ),
+                pos_drwr + np.array([0.0, -0.075, 0.0]),
+            ],
+            # push toward drawer handle's centroid
+            pos_drwr,
+        )
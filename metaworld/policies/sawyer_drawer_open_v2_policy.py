@@ -18,29 +18,37 @@ class SawyerDrawerOpenV2Policy(Policy):
             "unused_info": obs[7:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         # NOTE this policy looks different from the others because it must
         # modify its p constant part-way through the task
         pos_curr = o_d["hand_pos"]
         pos_drwr = o_d["drwr_pos"] + np.array([0.0, 0.0, -0.02])
 
-        # align end effector's Z axis with drawer handle's Z axis
-        if np.linalg.norm(pos_curr[:2] - pos_drwr[:2]) > 0.06:
-            to_pos = pos_drwr + np.array([0.0, 0.0, 0.3])
-            action["delta_pos"] = move(o_d["hand_pos"], to_pos, p=4.0)
-        # drop down to touch drawer handle
-        elif abs(pos_curr[2] - pos_drwr[2]) > 0.04:
-            to_pos = pos_drwr
-            action["delta_pos"] = move(o_d["hand_pos"], to_pos, p=4.0)
-        # push toward a point just behind the drawer handle
+        not_aligned = (
+            np.linalg.norm(pos_curr[:, :2] - pos_drwr[:, :2], axis=-1, keepdims=True)
+            > 0.06
+        )
+        not_touching = np.abs(pos_curr[:, 2:] - pos_drwr[:, 2:]) > 0.04
+        to_pos = np.select(
+            [
+                # align end effector's Z axis with drawer handle's Z axis
+                not_aligned,
+                # drop down to touch drawer handle
+                not_touching,
+            ],
+            [pos_drwr + np.array([0.0, 0.0, 0.3]), pos_drwr],
+            # push toward a point just behind the drawer handle
+            pos_drwr + np.array([0.0, -0.06, 0.0]),
+        )
         # also increase p value to apply more force
-        else:
-            to_pos = pos_drwr + np.array([0.0, -0.06, 0.0])
-            action["delta_pos"] = move(o_d["hand_pos"], to_pos, p=50.0)
+        p = np.where(not_aligned | not_touching, 4.0, 50.0)
+        action["delta_pos"] = move(o_d["hand_pos"], to_pos, p=p)
 
         # keep gripper open
         action["grab_effort"] = -1.0
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batched_xyz,
+    move,
+)
 
 
 class SawyerHandInsertV2Policy(Policy):
@@ -21,10 +24,12 @@ class SawyerHandInsertV2Policy(Policy):
             "unused_info": obs[7:-3],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=10.0
@@ -34,31 +39,44 @@ class SawyerHandInsertV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         hand_pos = o_d["hand_pos"]
         obj_pos = o_d["obj_pos"]
         goal_pos = o_d["goal_pos"]
 
-        # If error in the XY plane is greater than 0.02, place end effector above the puck
-        if np.linalg.norm(hand_pos[:2] - obj_pos[:2]) > 0.02:
-            return obj_pos + np.array([0.0, 0.0, 0.1])
-        # Once XY error is low enough, drop end effector down on top of puck
-        elif abs(hand_pos[2] - obj_pos[2]) > 0.05:
-            return obj_pos + np.array([0.0, 0.0, 0.03])
-        # If not above goal, move to be directly above goal
-        elif np.linalg.norm(hand_pos[:2] - goal_pos[:2]) > 0.04:
-            return np.array([goal_pos[0], goal_pos[1], hand_pos[2]])
-        else:
-            return goal_pos
+        return np.select(
+            [
+                # If error in the XY plane is greater than 0.02, place end effector above the puck
+                np.linalg.norm(hand_pos[:, :2] - obj_pos[:, :2], axis=-1, keepdims=True)
+                > 0.02,
+                # Once XY error is low enough, drop end effector down on top of puck
+                np.abs(hand_pos[:, 2:] - obj_pos[:, 2:]) > 0.05,
+                # If not above goal, move to be directly above goal
+                np.linalg.norm(
+                    hand_pos[:, :2] - goal_pos[:, :2], axis=-1, keepdims=True
+                )
+                > 0.04,
+            ],
+            [
+                obj_pos + np.array([0.0, 0.0, 0.1]),
+                obj_pos + np.array([0.0, 0.0, 0.03]),
+                batched_xyz(goal_pos[:, 0], goal_pos[:, 1], hand_pos[:, 2]),
+            ],
+            goal_pos,
+        )
 
     @staticmethod
-    def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
+    def _grab_effort(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         hand_pos = o_d["hand_pos"]
         obj_pos = o_d["obj_pos"]
-        if (
-            np.linalg.norm(hand_pos[:2] - obj_pos[:2]) > 0.02
-            or abs(hand_pos[2] - obj_pos[2]) > 0.1
-        ):
-            return 0.0
-        else:
-            return 0.65
+
+        return np.where(
+            (np.linalg.norm(hand_pos[:, :2] - obj_pos[:, :2], axis=-1) > 0.02)
+            | (np.abs(hand_pos[:, 2] - obj_pos[:, 2]) > 0.1),
+            0.0,
+            0.65,
+        )
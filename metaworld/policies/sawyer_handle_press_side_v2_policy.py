@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
@@ -20,10 +18,12 @@ class SawyerHandlePressSideV2Policy(Policy):
             "unused_info": obs[7:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=25.0
@@ -33,11 +33,15 @@ class SawyerHandlePressSideV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_button = o_d["handle_pos"]
 
-        if np.linalg.norm(pos_curr[:2] - pos_button[:2]) > 0.02:
-            return pos_button + np.array([0.0, 0.0, 0.2])
-        else:
-            return pos_button + np.array([0.0, 0.0, -0.5])
+        return np.where(
+            np.linalg.norm(pos_curr[:, :2] - pos_button[:, :2], axis=-1, keepdims=True)
+            > 0.02,
+            pos_button + np.array([0.0, 0.0, 0.2]),
+            pos_button + np.array([0.0, 0.0, -0.5]),
+        )
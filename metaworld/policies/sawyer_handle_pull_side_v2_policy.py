@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
@@ -19,10 +17,12 @@ class SawyerHandlePullSideV2Policy(Policy):
             "unused_info": obs[6:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=25.0
@@ -32,23 +32,34 @@ class SawyerHandlePullSideV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_handle = o_d["handle_pos"]
-        if np.linalg.norm(pos_curr[:2] - pos_handle[:2]) > 0.04:
-            return pos_handle + np.array([0.0, 0.0, 0.1])
-        if abs(pos_curr[2] - pos_handle[2]) > 0.03:
-            return pos_handle
-        return pos_handle + np.array([0.0, 0.0, 1.0])
+
+        return np.select(
+            [
+                np.linalg.norm(
+                    pos_curr[:, :2] - pos_handle[:, :2], axis=-1, keepdims=True
+                )
+                > 0.04,
+                np.abs(pos_curr[:, 2:] - pos_handle[:, 2:]) > 0.03,
+            ],
+            [pos_handle + np.array([0.0, 0.0, 0.1]), pos_handle],
+            pos_handle + np.array([0.0, 0.0, 1.0]),
+        )
 
     @staticmethod
-    def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
+    def _grab_effort(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_handle = o_d["handle_pos"]
-        if (
-            np.linalg.norm(pos_curr[:2] - pos_handle[:2]) > 0.04
-            or abs(pos_curr[2] - pos_handle[2]) > 0.04
-        ):
-            return 0.0
-        else:
-            return 0.6
+
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_handle[:, :2], axis=-1) > 0.04)
+            | (np.abs(pos_curr[:, 2] - pos_handle[:, 2]) > 0.04),
+            0.0,
+            0.6,
+        )
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
@@ -19,29 +17,36 @@ class SawyerHandlePullV2Policy(Policy):
             "unused_info": obs[6:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=25.0
         )
-        action["grab_effort"] = self._grab_effort(o_d)
+        action["grab_effort"] = 1.0
 
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_handle = o_d["handle_pos"] + np.array([0, -0.04, 0])
 
-        if np.linalg.norm(pos_curr[:2] - pos_handle[:2]) > 0.02:
-            return pos_handle
-        if abs(pos_curr[2] - pos_handle[2]) > 0.02:
-            return pos_handle[2]
-        return pos_handle + np.array([0.0, 0.0, 0.1])
-
-    @staticmethod
-    def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
-        return 1.0
+        return np.select(
+            [
+                np.linalg.norm(
+                    pos_curr[:, :2] - pos_handle[:, :2], axis=-1, keepdims=True
+                )
+                > 0.02,
+                # Only the Z of the handle here, which is broadcast to every axis
+                np.abs(pos_curr[:, 2:] - pos_handle[:, 2:]) > 0.02,
+            ],
+            [pos_handle, pos_handle[:, 2:]],
+            pos_handle + np.array([0.0, 0.0, 0.1]),
+        )
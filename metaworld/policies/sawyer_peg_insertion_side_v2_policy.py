@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batched_xyz,
+    move,
+)
 
 
 class SawyerPegInsertionSideV2Policy(Policy):
@@ -23,10 +26,12 @@ class SawyerPegInsertionSideV2Policy(Policy):
             "_prev_obs": obs[18:36],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=25.0
@@ -36,32 +41,42 @@ class SawyerPegInsertionSideV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_peg = o_d["peg_pos"]
         # lowest X is -.35, doesn't matter if we overshoot
         # Y is given by hole_vec
         # Z is constant at .16
-        pos_hole = np.array([-0.35, o_d["goal_pos"][1], 0.16])
+        pos_hole = batched_xyz(-0.35, o_d["goal_pos"][:, 1], 0.16)
 
-        if np.linalg.norm(pos_curr[:2] - pos_peg[:2]) > 0.04:
-            return pos_peg + np.array([0.0, 0.0, 0.3])
-        elif abs(pos_curr[2] - pos_peg[2]) > 0.025:
-            return pos_peg
-        elif np.linalg.norm(pos_peg[1:] - pos_hole[1:]) > 0.03:
-            return pos_hole + np.array([0.4, 0.0, 0.0])
-        else:
-            return pos_hole
+        return np.select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_peg[:, :2], axis=-1, keepdims=True)
+                > 0.04,
+                np.abs(pos_curr[:, 2:] - pos_peg[:, 2:]) > 0.025,
+                np.linalg.norm(pos_peg[:, 1:] - pos_hole[:, 1:], axis=-1, keepdims=True)
+                > 0.03,
+            ],
+            [
+                pos_peg + np.array([0.0, 0.0, 0.3]),
+                pos_peg,
+                pos_hole + np.array([0.4, 0.0, 0.0]),
+            ],
+            pos_hole,
+        )
 
     @staticmethod
-    def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
+    def _grab_effort(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_peg = o_d["peg_pos"]
 
-        if (
-            np.linalg.norm(pos_curr[:2] - pos_peg[:2]) > 0.04
-            or abs(pos_curr[2] - pos_peg[2]) > 0.15
-        ):
-            return -1.0
-        else:
-            return 0.6
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_peg[:, :2], axis=-1) > 0.04)
+            | (np.abs(pos_curr[:, 2] - pos_peg[:, 2]) > 0.15),
+            -1.0,
+            0.6,
+        )
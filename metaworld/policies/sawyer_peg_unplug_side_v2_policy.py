@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batched_xyz,
+    move,
+)
 
 
 class SawyerPegUnplugSideV2Policy(Policy):
@@ -20,10 +23,12 @@ class SawyerPegUnplugSideV2Policy(Policy):
             "unused_info": obs[7:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=25.0
@@ -33,26 +38,35 @@ class SawyerPegUnplugSideV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_peg = o_d["peg_pos"] + np.array([-0.02, 0.0, 0.035])
 
-        if np.linalg.norm(pos_curr[:2] - pos_peg[:2]) > 0.04:
-            return pos_peg + np.array([0.0, 0.0, 0.2])
-        elif abs(pos_curr[2] - 0.15) > 0.02:
-            return np.array([*pos_peg[:2], 0.15])
-        else:
-            return pos_curr + np.array([0.01, 0.0, 0.0])
+        return np.select(
+            [
+                np.linalg.norm(pos_curr[:, :2] - pos_peg[:, :2], axis=-1, keepdims=True)
+                > 0.04,
+                np.abs(pos_curr[:, 2:] - 0.15) > 0.02,
+            ],
+            [
+                pos_peg + np.array([0.0, 0.0, 0.2]),
+                batched_xyz(pos_peg[:, 0], pos_peg[:, 1], 0.15),
+            ],
+            pos_curr + np.array([0.01, 0.0, 0.0]),
+        )
 
     @staticmethod
-    def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
+    def _grab_effort(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_peg = o_d["peg_pos"] + np.array([-0.02, 0.0, 0.035])
 
-        if (
-            np.linalg.norm(pos_curr[:2] - pos_peg[:2]) > 0.04
-            or abs(pos_curr[2] - pos_peg[2]) > 0.15
-        ):
-            return -1.0
-        else:
-            return 0.1
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_peg[:, :2], axis=-1) > 0.04)
+            | (np.abs(pos_curr[:, 2] - pos_peg[:, 2]) > 0.15),
+            -1.0,
+            0.1,
+        )
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
@@ -23,10 +21,12 @@ class SawyerPickPlaceV2Policy(Policy):
             "_prev_obs": obs[18:36],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=10.0
@@ -36,29 +36,41 @@ class SawyerPickPlaceV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_puck = o_d["puck_pos"] + np.array([-0.005, 0, 0])
         pos_goal = o_d["goal_pos"]
-        gripper_separation = o_d["gripper_distance_apart"]
-        # If error in the XY plane is greater than 0.02, place end effector above the puck
-        if np.linalg.norm(pos_curr[:2] - pos_puck[:2]) > 0.02:
-            return pos_puck + np.array([0.0, 0.0, 0.1])
-        # Once XY error is low enough, drop end effector down on top of puck
-        elif abs(pos_curr[2] - pos_puck[2]) > 0.05 and pos_puck[-1] < 0.04:
-            return pos_puck + np.array([0.0, 0.0, 0.03])
-        # Wait for gripper to close before continuing to move
-        elif gripper_separation > 0.73:
-            return pos_curr
-        # Move to goal
-        else:
-            return pos_goal
+        gripper_separation = o_d["gripper_distance_apart"][:, None]
+
+        return np.select(
+            [
+                # If error in the XY plane is greater than 0.02, place end effector above the puck
+                np.linalg.norm(
+                    pos_curr[:, :2] - pos_puck[:, :2], axis=-1, keepdims=True
+                )
+                > 0.02,
+                # Once XY error is low enough, drop end effector down on top of puck
+                (np.abs(pos_curr[:, 2:] - pos_puck[:, 2:]) > 0.05)
+                & (pos_puck[:, 2:] < 0.04),
+                # Wait for gripper to close before continuing to move
+                gripper_separation > 0.73,
+            ],
+            [
+                pos_puck + np.array([0.0, 0.0, 0.1]),
+                pos_puck + np.array([0.0, 0.0, 0.03]),
+                pos_curr,
+            ],
+            # Move to goal
+            pos_goal,
+        )
 
     @staticmethod
-    def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
+    def _grab_effort(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_puck = o_d["puck_pos"]
-        if np.linalg.norm(pos_curr - pos_puck) < 0.07:
-            return 1.0
-        else:
-            return 0.0
+
+        return np.where(np.linalg.norm(pos_curr - pos_puck, axis=-1) < 0.07, 1.0, 0.0)
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batched_xyz,
+    move,
+)
 
 
 class SawyerPickPlaceWallV2Policy(Policy):
@@ -21,10 +24,12 @@ class SawyerPickPlaceWallV2Policy(Policy):
             "goal_pos": obs[-3:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=10.0
@@ -34,48 +39,58 @@ class SawyerPickPlaceWallV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_puck = o_d["puck_pos"] + np.array([-0.005, 0, 0])
         pos_goal = o_d["goal_pos"]
 
-        # If error in the XY plane is greater than 0.02, place end effector above the puck
-        if np.linalg.norm(pos_curr[:2] - pos_puck[:2]) > 0.015:
-            return pos_puck + np.array([0.0, 0.0, 0.1])
-        # Once XY error is low enough, drop end effector down on top of puck
-        elif abs(pos_curr[2] - pos_puck[2]) > 0.04 and pos_puck[-1] < 0.03:
-            return pos_puck + np.array([0.0, 0.0, 0.03])
-        # Move to the goal
-        else:
-            # if wall is in the way of arm, straight up above the wall
-            if (
-                -0.15 <= pos_curr[0] <= 0.35
-                and 0.60 <= pos_curr[1] <= 0.80
-                and pos_curr[2] < 0.25
-            ):
-                return pos_curr + [0, 0, 1]
-            # move towards the goal while staying above the wall
-            elif (
-                -0.15 <= pos_curr[0] <= 0.35
-                and 0.60 <= pos_curr[1] <= 0.80
-                and pos_curr[2] < 0.35
-            ):
-                return np.array([pos_goal[0], pos_goal[1], pos_curr[2]])
-            # If not at the same Z height as the goal, move up to that plane
-            elif abs(pos_curr[2] - pos_goal[2]) > 0.01:
-                return np.array([pos_curr[0], pos_curr[1], pos_goal[2]])
-            return pos_goal
+        over_wall = (
+            (-0.15 <= pos_curr[:, :1])
+            & (pos_curr[:, :1] <= 0.35)
+            & (0.60 <= pos_curr[:, 1:2])
+            & (pos_curr[:, 1:2] <= 0.80)
+        )
+        return np.select(
+            [
+                # If error in the XY plane is greater than 0.02, place end effector above the puck
+                np.linalg.norm(
+                    pos_curr[:, :2] - pos_puck[:, :2], axis=-1, keepdims=True
+                )
+                > 0.015,
+                # Once XY error is low enough, drop end effector down on top of puck
+                (np.abs(pos_curr[:, 2:] - pos_puck[:, 2:]) > 0.04)
+                & (pos_puck[:, 2:] < 0.03),
+                # if wall is in the way of arm, straight up above the wall
+                over_wall & (pos_curr[:, 2:] < 0.25),
+                # move towards the goal while staying above the wall
+                over_wall & (pos_curr[:, 2:] < 0.35),
+                # If not at the same Z height as the goal, move up to that plane
+                np.abs(pos_curr[:, 2:] - pos_goal[:, 2:]) > 0.01,
+            ],
+            [
+                pos_puck + np.array([0.0, 0.0, 0.1]),
+                pos_puck + np.array([0.0, 0.0, 0.03]),
+                pos_curr + np.array([0, 0, 1]),
+                batched_xyz(pos_goal[:, 0], pos_goal[:, 1], pos_curr[:, 2]),
+                batched_xyz(pos_curr[:, 0], pos_curr[:, 1], pos_goal[:, 2]),
+            ],
+            # Move to the goal
+            pos_goal,
+        )
 
     @staticmethod
-    def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
+    def _grab_effort(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_puck = o_d["puck_pos"]
-        if (
-            np.linalg.norm(pos_curr[:2] - pos_puck[:2]) > 0.015
-            or abs(pos_curr[2] - pos_puck[2]) > 0.1
-        ):
-            return 0.0
 
         # While end effector is moving down toward the puck, begin closing the grabber
-        else:
-            return 0.9
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_puck[:, :2], axis=-1) > 0.015)
+            | (np.abs(pos_curr[:, 2] - pos_puck[:, 2]) > 0.1),
+            0.0,
+            0.9,
+        )
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batched_xyz,
+    move,
+)
 
 
 class SawyerPlateSlideBackV2Policy(Policy):
@@ -20,10 +23,12 @@ class SawyerPlateSlideBackV2Policy(Policy):
             "unused_2": obs[7:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=10.0
@@ -33,17 +38,27 @@ class SawyerPlateSlideBackV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_puck = o_d["puck_pos"] + np.array([0.0, -0.065, 0.025])
 
-        if np.linalg.norm(pos_curr[:2] - pos_puck[:2]) > 0.01:
-            return pos_puck + np.array([0.0, 0.0, 0.1])
-        elif abs(pos_curr[2] - pos_puck[2]) > 0.04:
-            return pos_puck
-        elif pos_curr[1] > 0.7:
-            return pos_curr + np.array([0.0, -0.1, 0.0])
-        elif pos_curr[1] > 0.6:
-            return np.array([0.15, 0.55, pos_curr[2]])
-        else:
-            return np.array([pos_curr[0] - 0.1, 0.55, pos_curr[2]])
+        return np.select(
+            [
+                np.linalg.norm(
+                    pos_curr[:, :2] - pos_puck[:, :2], axis=-1, keepdims=True
+                )
+                > 0.01,
+                np.abs(pos_curr[:, 2:] - pos_puck[:, 2:]) > 0.04,
+                pos_curr[:, 1:2] > 0.7,
+                pos_curr[:, 1:2] > 0.6,
+            ],
+            [
+                pos_puck + np.array([0.0, 0.0, 0.1]),
+                pos_puck,
+                pos_curr + np.array([0.0, -0.1, 0.0]),
+                batched_xyz(0.15, 0.55, pos_curr[:, 2]),
+            ],
+            batched_xyz(pos_curr[:, 0] - 0.1, 0.55, pos_curr[:, 2]),
+        )
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batched_xyz,
+    move,
+)
 
 
 class SawyerPlateSlideSideV2Policy(Policy):
@@ -25,10 +28,12 @@ class SawyerPlateSlideSideV2Policy(Policy):
             "unused_2": obs[7:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=25.0
@@ -38,15 +43,25 @@ class SawyerPlateSlideSideV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_puck = o_d["puck_pos"] + np.array([0.07, 0.0, -0.005])
 
-        if np.linalg.norm(pos_curr[:2] - pos_puck[:2]) > 0.04:
-            return pos_puck + np.array([0.0, 0.0, 0.1])
-        elif abs(pos_curr[2] - pos_puck[2]) > 0.04:
-            return pos_puck
-        elif pos_curr[0] > -0.2:
-            return np.array([pos_curr[0] - 0.1, 0.6, pos_curr[2]])
-        else:
-            return pos_puck + np.array([-0.1, 0.0, 0.0])
+        return np.select(
+            [
+                np.linalg.norm(
+                    pos_curr[:, :2] - pos_puck[:, :2], axis=-1, keepdims=True
+                )
+                > 0.04,
+                np.abs(pos_curr[:, 2:] - pos_puck[:, 2:]) > 0.04,
+                pos_curr[:, :1] > -0.2,
+            ],
+            [
+                pos_puck + np.array([0.0, 0.0, 0.1]),
+                pos_puck,
+                batched_xyz(pos_curr[:, 0] - 0.1, 0.6, pos_curr[:, 2]),
+            ],
+            pos_puck + np.array([-0.1, 0.0, 0.0]),
+        )
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batched_xyz,
+    move,
+)
 
 
 class SawyerPlateSlideV2Policy(Policy):
@@ -22,10 +25,12 @@ class SawyerPlateSlideV2Policy(Policy):
             "unused_3": obs[-2:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=10.0
@@ -35,15 +40,19 @@ class SawyerPlateSlideV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_puck = o_d["puck_pos"] + np.array([0.0, -0.055, 0.03])
 
-        aligned_with_puck = np.linalg.norm(pos_curr[:2] - pos_puck[:2]) <= 0.03
+        aligned_with_puck = (
+            np.linalg.norm(pos_curr[:, :2] - pos_puck[:, :2], axis=-1, keepdims=True)
+            <= 0.03
+        )
 
-        if not aligned_with_puck:
-            return pos_puck + np.array([0.0, 0.0, 0.1])
-        elif abs(pos_curr[2] - pos_puck[2]) > 0.04:
-            return pos_puck
-        else:
-            return np.array([o_d["shelf_x"], 0.9, pos_puck[2]])
+        return np.select(
+            [~aligned_with_puck, np.abs(pos_curr[:, 2:] - pos_puck[:, 2:]) > 0.04],
+            [pos_puck + np.array([0.0, 0.0, 0.1]), pos_puck],
+            batched_xyz(o_d["shelf_x"], 0.9, pos_puck[:, 2]),
+        )
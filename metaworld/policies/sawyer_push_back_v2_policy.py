@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batched_xyz,
+    move,
+)
 
 
 class SawyerPushBackV2Policy(Policy):
@@ -21,10 +24,12 @@ class SawyerPushBackV2Policy(Policy):
             "goal_pos": obs[-3:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=10.0
@@ -34,30 +39,41 @@ class SawyerPushBackV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_puck = o_d["puck_pos"]
+        pos_goal = o_d["goal_pos"]
 
-        # If error in the XY plane is greater than 0.02, place end effector above the puck
-        if np.linalg.norm(pos_curr[:2] - pos_puck[:2]) > 0.04:
-            return pos_puck + np.array([0.0, 0.0, 0.3])
-        # Once XY error is low enough, drop end effector down on top of puck
-        elif abs(pos_curr[2] - pos_puck[2]) > 0.055:
-            return pos_puck
-        # Move to the goal
-        else:
-            return o_d["goal_pos"] + np.array([0.0, 0.0, pos_curr[2]])
+        return np.select(
+            [
+                # If error in the XY plane is greater than 0.02, place end effector above the puck
+                np.linalg.norm(
+                    pos_curr[:, :2] - pos_puck[:, :2], axis=-1, keepdims=True
+                )
+                > 0.04,
+                # Once XY error is low enough, drop end effector down on top of puck
+                np.abs(pos_curr[:, 2:] - pos_puck[:, 2:]) > 0.055,
+            ],
+            [pos_puck + np.array([0.0, 0.0, 0.3]), pos_puck],
+            # Move to the goal
+            batched_xyz(
+                pos_goal[:, 0], pos_goal[:, 1], pos_goal[:, 2] + pos_curr[:, 2]
+            ),
+        )
 
     @staticmethod
-    def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
+    def _grab_effort(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_puck = o_d["puck_pos"]
 
-        if (
-            np.linalg.norm(pos_curr[:2] - pos_puck[:2]) > 0.04
-            or abs(pos_curr[2] - pos_puck[2]) > 0.05
-        ):
-            return 0.0
         # While end effector is moving down toward the puck, begin closing the grabber
-        else:
-            return 0.9
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_puck[:, :2], axis=-1) > 0.04)
+            | (np.abs(pos_curr[:, 2] - pos_puck[:, 2]) > 0.05),
+            0.0,
+            0.9,
+        )
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
@@ -21,10 +19,12 @@ class SawyerPushWallV2Policy(Policy):
             "goal_pos": obs[-3:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=10.0
@@ -34,36 +34,47 @@ class SawyerPushWallV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_obj = o_d["obj_pos"] + np.array([-0.005, 0, 0])
+        obj_x, obj_y = pos_obj[:, :1], pos_obj[:, 1:2]
 
-        # If error in the XY plane is greater than 0.02, place end effector above the puck
-        if np.linalg.norm(pos_curr[:2] - pos_obj[:2]) > 0.02:
-            return pos_obj + np.array([0.0, 0.0, 0.2])
-        # Once XY error is low enough, drop end effector down on top of obj
-        elif abs(pos_curr[2] - pos_obj[2]) > 0.04:
-            return pos_obj + np.array([0.0, 0.0, 0.03])
-        # Move to the goal
-        else:
-            # if the wall is between the puck and the goal, go around the wall
-            if -0.1 <= pos_obj[0] <= 0.3 and 0.65 <= pos_obj[1] <= 0.75:
-                return pos_curr + np.array([-1, 0, 0])
-            elif (
-                -0.15 < pos_obj[0] < 0.05 or 0.15 < pos_obj[0] < 0.35
-            ) and 0.695 <= pos_obj[1] <= 0.755:
-                return pos_curr + np.array([0, 1, 0])
-            return o_d["goal_pos"]
+        return np.select(
+            [
+                # If error in the XY plane is greater than 0.02, place end effector above the puck
+                np.linalg.norm(pos_curr[:, :2] - pos_obj[:, :2], axis=-1, keepdims=True)
+                > 0.02,
+                # Once XY error is low enough, drop end effector down on top of obj
+                np.abs(pos_curr[:, 2:] - pos_obj[:, 2:]) > 0.04,
+                # if the wall is between the puck and the goal, go around the wall
+                (-0.1 <= obj_x) & (obj_x <= 0.3) & (0.65 <= obj_y) & (obj_y <= 0.75),
+                (((-0.15 < obj_x) & (obj_x < 0.05)) | ((0.15 < obj_x) & (obj_x < 0.35)))
+                & (0.695 <= obj_y)
+                & (obj_y <= 0.755),
+            ],
+            [
+                pos_obj + np.array([0.0, 0.0, 0.2]),
+                pos_obj + np.array([0.0, 0.0, 0.03]),
+                pos_curr + np.array([-1, 0, 0]),
+                pos_curr + np.array([0, 1, 0]),
+            ],
+            # Move to the goal
+            o_d["goal_pos"],
+        )
 
     @staticmethod
-    def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
+    def _grab_effort(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_obj = o_d["obj_pos"]
-        if (
-            np.linalg.norm(pos_curr[:2] - pos_obj[:2]) > 0.02
-            or abs(pos_curr[2] - pos_obj[2]) > 0.1
-        ):
-            return 0.0
+
         # While end effector is moving down toward the obj, begin closing the grabber
-        else:
-            return 0.6
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_obj[:, :2], axis=-1) > 0.02)
+            | (np.abs(pos_curr[:, 2] - pos_obj[:, 2]) > 0.1),
+            0.0,
+            0.6,
+        )
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
@@ -20,10 +18,12 @@ class SawyerReachWallV2Policy(Policy):
             "goal_pos": obs[-3:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=5.0
@@ -33,15 +33,19 @@ class SawyerReachWallV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_hand = o_d["hand_pos"]
         pos_goal = o_d["goal_pos"]
         # if the hand is going to run into the wall, go up while still moving
         # towards the goal position.
-        if (
-            -0.1 <= pos_hand[0] <= 0.3
-            and 0.60 <= pos_hand[1] <= 0.80
-            and pos_hand[2] < 0.25
-        ):
-            return pos_goal + np.array([0.0, 0.0, 1.0])
-        return pos_goal
+        return np.where(
+            (-0.1 <= pos_hand[:, :1])
+            & (pos_hand[:, :1] <= 0.3)
+            & (0.60 <= pos_hand[:, 1:2])
+            & (pos_hand[:, 1:2] <= 0.80)
+            & (pos_hand[:, 2:] < 0.25),
+            pos_goal + np.array([0.0, 0.0, 1.0]),
+            pos_goal,
+        )
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batched_xyz,
+    move,
+)
 
 
 class SawyerShelfPlaceV2Policy(Policy):
@@ -22,10 +25,12 @@ class SawyerShelfPlaceV2Policy(Policy):
             "unused_3": obs[-2:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=25.0
@@ -35,37 +40,47 @@ class SawyerShelfPlaceV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_block = o_d["block_pos"] + np.array([-0.005, 0.0, 0.015])
         pos_shelf_x = o_d["shelf_x"]
-        if np.linalg.norm(pos_curr[:2] - pos_block[:2]) > 0.04:
-            # positioning over block
-            return pos_block + np.array([0.0, 0.0, 0.3])
-        elif abs(pos_curr[2] - pos_block[2]) > 0.04:
-            # grabbing block
-            return pos_block
-        elif np.abs(pos_curr[0] - pos_shelf_x) > 0.02:
-            # centering with goal pos
-            return np.array([pos_shelf_x, pos_curr[1], 0.3])
-        elif pos_curr[2] < 0.30:
-            # move up to correct height
-            pos_new = pos_curr + np.array([0.0, 0.0, 0.30])
-            return pos_new
-        else:
+
+        return np.select(
+            [
+                # positioning over block
+                np.linalg.norm(
+                    pos_curr[:, :2] - pos_block[:, :2], axis=-1, keepdims=True
+                )
+                > 0.04,
+                # grabbing block
+                np.abs(pos_curr[:, 2:] - pos_block[:, 2:]) > 0.04,
+                # centering with goal pos
+                np.abs(pos_curr[:, :1] - pos_shelf_x[:, None]) > 0.02,
+                # move up to correct height
+                pos_curr[:, 2:] < 0.30,
+            ],
+            [
+                pos_block + np.array([0.0, 0.0, 0.3]),
+                pos_block,
+                batched_xyz(pos_shelf_x, pos_curr[:, 1], 0.3),
+                pos_curr + np.array([0.0, 0.0, 0.30]),
+            ],
             # move forward to goal
-            pos_new = pos_curr + np.array([0.0, 0.05, 0.0])
-            return pos_new
+            pos_curr + np.array([0.0, 0.05, 0.0]),
+        )
 
     @staticmethod
-    def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
+    def _grab_effort(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_block = o_d["block_pos"]
 
-        if (
-            np.linalg.norm(pos_curr[:2] - pos_block[:2]) > 0.04
-            or abs(pos_curr[2] - pos_block[2]) > 0.15
-        ):
-            return -1.0
-        else:
-            return 0.7
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_block[:, :2], axis=-1) > 0.04)
+            | (np.abs(pos_curr[:, 2] - pos_block[:, 2]) > 0.15),
+            -1.0,
+            0.7,
+        )
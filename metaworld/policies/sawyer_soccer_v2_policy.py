@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
@@ -21,10 +19,12 @@ class SawyerSoccerV2Policy(Policy):
             "goal_pos": obs[-3:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=25.0
@@ -34,25 +34,33 @@ class SawyerSoccerV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_ball = o_d["ball_pos"] + np.array([0.0, 0.0, 0.03])
         pos_goal = o_d["goal_pos"]
 
-        desired_z = 0.1 if np.linalg.norm(pos_curr[:2] - pos_ball[:2]) < 0.02 else 0.03
+        desired_z = np.where(
+            np.linalg.norm(pos_curr[:, :2] - pos_ball[:, :2], axis=-1) < 0.02, 0.1, 0.03
+        )
 
-        to_left_of_goal = pos_ball[0] - pos_goal[0] < -0.05
-        to_right_of_goal = pos_ball[0] - pos_goal[0] > 0.05
+        to_left_of_goal = pos_ball[:, :1] - pos_goal[:, :1] < -0.05
+        to_right_of_goal = pos_ball[:, :1] - pos_goal[:, :1] > 0.05
 
         offset = 0.03
-        push_location = pos_ball + np.array([0.0, -offset, 0.0])
-        if to_left_of_goal:
-            push_location = pos_ball + np.array([-offset, 0.0, 0.0])
-        elif to_right_of_goal:
-            push_location = pos_ball + np.array([+offset, 0.0, 0.0])
-
-        push_location[2] = desired_z
+        push_location = np.select(
+            [to_left_of_goal, to_right_of_goal],
+            [
+                pos_ball + np.array([-offset, 0.0, 0.0]),
+                pos_ball + np.array([+offset, 0.0, 0.0]),
+            ],
+            pos_ball + np.array([0.0, -offset, 0.0]),
+        )
+        push_location[:, 2] = desired_z
 
-        if np.linalg.norm(pos_curr - push_location) > 0.01:
-            return push_location
-        return pos_ball
+        return np.where(
+            np.linalg.norm(pos_curr - push_location, axis=-1, keepdims=True) > 0.01,
+            push_location,
+            pos_ball,
+        )
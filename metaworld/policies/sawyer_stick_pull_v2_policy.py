@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
 from metaworld.policies.action import Action
-from metaworld.policies.policy import Policy, assert_fully_parsed, move
+from metaworld.policies.policy import (
+    Policy,
+    assert_fully_parsed,
+    batched_xyz,
+    move,
+)
 
 
 class SawyerStickPullV2Policy(Policy):
@@ -23,10 +26,10 @@ class SawyerStickPullV2Policy(Policy):
             "goal_pos": obs[-3:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_pow": 3})
+        action = Action({"delta_pos": np.arange(3), "grab_pow": 3}, batch_size=len(obs))
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=25.0
@@ -36,35 +39,45 @@ class SawyerStickPullV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         hand_pos = o_d["hand_pos"]
         stick_pos = o_d["stick_pos"] + np.array([-0.015, 0.0, 0.03])
         thermos_pos = o_d["obj_pos"] + np.array([-0.015, 0.0, 0.03])
         goal_pos = o_d["goal_pos"] + np.array([-0.05, 0.0, 0.0])
 
-        if abs(stick_pos[0] - thermos_pos[0]) > 0.04:
-            if np.linalg.norm(hand_pos[:2] - stick_pos[:2]) > 0.02:
-                return stick_pos + np.array([0.0, 0.0, 0.1])
-            elif abs(hand_pos[2] - stick_pos[2]) > 0.02:
-                return stick_pos
-            elif abs(stick_pos[1] - thermos_pos[1]) > 0.02:
-                return np.array([stick_pos[0], thermos_pos[1], stick_pos[2]])
-            elif abs(stick_pos[2] - thermos_pos[2]) > 0.02:
-                return np.array([stick_pos[0], *thermos_pos[1:]])
-            else:
-                return thermos_pos
-        else:
-            return goal_pos
+        return np.select(
+            [
+                np.abs(stick_pos[:, :1] - thermos_pos[:, :1]) <= 0.04,
+                np.linalg.norm(
+                    hand_pos[:, :2] - stick_pos[:, :2], axis=-1, keepdims=True
+                )
+                > 0.02,
+                np.abs(hand_pos[:, 2:] - stick_pos[:, 2:]) > 0.02,
+                np.abs(stick_pos[:, 1:2] - thermos_pos[:, 1:2]) > 0.02,
+                np.abs(stick_pos[:, 2:] - thermos_pos[:, 2:]) > 0.02,
+            ],
+            [
+                goal_pos,
+                stick_pos + np.array([0.0, 0.0, 0.1]),
+                stick_pos,
+                batched_xyz(stick_pos[:, 0], thermos_pos[:, 1], stick_pos[:, 2]),
+                batched_xyz(stick_pos[:, 0], thermos_pos[:, 1], thermos_pos[:, 2]),
+            ],
+            thermos_pos,
+        )
 
     @staticmethod
-    def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
+    def _grab_effort(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         hand_pos = o_d["hand_pos"]
         stick_pos = o_d["stick_pos"] + np.array([-0.015, 0.0, 0.03])
 
-        if (
-            np.linalg.norm(hand_pos[:2] - stick_pos[:2]) > 0.02
-            or abs(hand_pos[2] - stick_pos[2]) > 0.1
-        ):
-            return -1.0
-        else:
-            return +0.7
+        return np.where(
+            (np.linalg.norm(hand_pos[:, :2] - stick_pos[:, :2], axis=-1) > 0.02)
+            | (np.abs(hand_pos[:, 2] - stick_pos[:, 2]) > 0.1),
+            -1.0,
+            +0.7,
+        )
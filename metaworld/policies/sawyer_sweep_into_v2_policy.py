@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
@@ -21,10 +19,12 @@ class SawyerSweepIntoV2Policy(Policy):
             "goal_pos": obs[-3:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=25.0
@@ -34,27 +34,35 @@ class SawyerSweepIntoV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_cube = o_d["cube_pos"] + np.array([-0.005, 0.0, 0.01])
         pos_goal = o_d["goal_pos"]
 
-        if np.linalg.norm(pos_curr[:2] - pos_cube[:2]) > 0.04:
-            return pos_cube + np.array([0.0, 0.0, 0.3])
-        elif abs(pos_curr[2] - pos_cube[2]) > 0.04:
-            return pos_cube
-        else:
-            return pos_goal
+        return np.select(
+            [
+                np.linalg.norm(
+                    pos_curr[:, :2] - pos_cube[:, :2], axis=-1, keepdims=True
+                )
+                > 0.04,
+                np.abs(pos_curr[:, 2:] - pos_cube[:, 2:]) > 0.04,
+            ],
+            [pos_cube + np.array([0.0, 0.0, 0.3]), pos_cube],
+            pos_goal,
+        )
 
     @staticmethod
-    def _grab_effort(o_d: dict[str, npt.NDArray[np.float64]]) -> float:
+    def _grab_effort(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_cube = o_d["cube_pos"]
 
-        if (
-            np.linalg.norm(pos_curr[:2] - pos_cube[:2]) > 0.04
-            or abs(pos_curr[2] - pos_cube[2]) > 0.15
-        ):
-            return -1.0
-        else:
-            return 0.7
+        return np.where(
+            (np.linalg.norm(pos_curr[:, :2] - pos_cube[:, :2], axis=-1) > 0.04)
+            | (np.abs(pos_curr[:, 2] - pos_cube[:, 2]) > 0.15),
+            -1.0,
+            0.7,
+        )
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from typing import Any
-
 import numpy as np
 import numpy.typing as npt
 
@@ -20,10 +18,12 @@ class SawyerWindowOpenV2Policy(Policy):
             "unused_info": obs[7:],
         }
 
-    def get_action(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
-        o_d = self._parse_obs(obs)
+    def get_actions(self, obs: npt.NDArray[np.float64]) -> npt.NDArray[np.float32]:
+        o_d = self._parse_obs_batch(obs)
 
-        action = Action({"delta_pos": np.arange(3), "grab_effort": 3})
+        action = Action(
+            {"delta_pos": np.arange(3), "grab_effort": 3}, batch_size=len(obs)
+        )
 
         action["delta_pos"] = move(
             o_d["hand_pos"], to_xyz=self._desired_pos(o_d), p=25.0
@@ -33,13 +33,20 @@ class SawyerWindowOpenV2Policy(Policy):
         return action.array
 
     @staticmethod
-    def _desired_pos(o_d: dict[str, npt.NDArray[np.float64]]) -> npt.NDArray[Any]:
+    def _desired_pos(
+        o_d: dict[str, npt.NDArray[np.float64]],
+    ) -> npt.NDArray[np.float64]:
         pos_curr = o_d["hand_pos"]
         pos_wndw = o_d["wndw_pos"] + np.array([-0.03, -0.03, -0.08])
 
-        if np.linalg.norm(pos_curr[:2] - pos_wndw[:2]) > 0.04:
-            return pos_wndw + np.array([0.0, 0.0, 0.3])
-        elif abs(pos_curr[2] - pos_wndw[2]) > 0.02:
-            return pos_wndw
-        else:
-            return pos_wndw + np.array([0.1, 0.0, 0.0])
+        return np.select(
+            [
+                np.linalg.norm(
+                    pos_curr[:, :2] - pos_wndw[:, :2], axis=-1, keepdims=True
+                )
+                > 0.04,
+                np.abs(pos_curr[:, 2:] - pos_wndw[:, 2:]) > 0.02,
+            ],
+            [pos_wndw + np.array([0.0, 0.0, 0.3]), pos_wndw],
+            pos_wndw + np.array([0.1, 0.0, 0.0]),
+        )
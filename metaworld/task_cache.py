@@ -0,0 +1,148 @@
+"""An on-disk cache of the tasks generated for the benchmarks.
+
+Set the `METAWORLD_CACHE_DIR` environment variable to enable it. Only tasks generated
+with a seed are cached. Entries are content-addressed: the key covers the environments
+and their task kwargs, the seed, the metaworld version and the source code of the
+environment classes and of the goal sampling, so changing any of those invalidates them.
+
+Each entry is an `.npy` file holding the pickled data of all its tasks back to back
+(loaded memory-mapped), plus a `.json` index with the name and byte range of each task.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib.metadata
+import json
+import os
+import sys
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from metaworld.types import Task
+from metaworld.utils import atomic_write, get_cache_dir
+
+if TYPE_CHECKING:
+    from metaworld.envs.mujoco.env_dict import EnvArgsKwargsDict, EnvDict
+
+
+@functools.lru_cache(maxsize=None)
+def _file_digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def _metaworld_version() -> str:
+    try:
+        return importlib.metadata.version("metaworld")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _source_files(classes: EnvDict) -> list[str]:
+    """Returns the source files of the environment classes (and their metaworld bases) and of the goal sampling."""
+    files = {sys.modules["metaworld"].__file__}
+    for env_cls in classes.values():
+        for cls in env_cls.__mro__:
+            if cls.__module__.split(".")[0] == "metaworld":
+                files.add(sys.modules[cls.__module__].__file__)
+    return sorted(f for f in files if f is not None)
+
+
+def cache_key(
+    classes: EnvDict,
+    args_kwargs: EnvArgsKwargsDict,
+    kwargs_override: dict[str, Any],
+    seed: int,
+) -> str:
+    """Computes the cache key of the tasks `_make_tasks()` generates for the given arguments.
+
+    Args:
+        classes: The environment classes as an `EnvDict`.
+        args_kwargs: The environment arguments and keyword arguments.
+        kwargs_override: Any kwarg overrides.
+        seed: The random seed.
+
+    Returns:
+        The key, a hex digest.
+    """
+    content = {
+        "version": _metaworld_version(),
+        "seed": seed,
+        "override": sorted(kwargs_override.items()),
+        "envs": [
+            [
+                env_name,
+                f"{classes[env_name].__module__}.{classes[env_name].__qualname__}",
+                sorted(args["kwargs"].items()),  # type: ignore
+            ]
+            for env_name, args in args_kwargs.items()
+        ],
+        "sources": [
+            [os.path.basename(path), _file_digest(path)]
+            for path in _source_files(classes)
+        ],
+    }
+    return hashlib.blake2b(json.dumps(content).encode(), digest_size=20).hexdigest()
+
+
+def load_tasks(key: str) -> list[Task] | None:
+    """Loads the tasks stored under the given key.
+
+    Args:
+        key: The cache key.
+
+    Returns:
+        The tasks, or `None` if the cache is disabled or has no (readable) entry for the key.
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+    try:
+        with open(os.path.join(cache_dir, f"{key}.json")) as f:
+            index = json.load(f)
+        if index["num_bytes"] == 0:
+            return [
+                Task(env_name=env_name, data=b"") for env_name, _, _ in index["tasks"]
+            ]
+        blob = np.load(os.path.join(cache_dir, f"{key}.npy"), mmap_mode="r")
+        if blob.shape != (index["num_bytes"],):
+            return None
+        return [
+            Task(env_name=env_name, data=blob[start:end].tobytes())
+            for env_name, start, end in index["tasks"]
+        ]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_tasks(key: str, tasks: list[Task]) -> None:
+    """Stores the tasks under the given key, if the cache is enabled.
+
+    The index is written last, so an entry is never read before it is complete.
+
+    Args:
+        key: The cache key.
+        tasks: The tasks.
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return
+    os.makedirs(cache_dir, exist_ok=True)
+
+    entries, start = [], 0
+    for task in tasks:
+        entries.append([task.env_name, start, start + len(task.data)])
+        start += len(task.data)
+    blob = np.frombuffer(b"".join(task.data for task in tasks), dtype=np.uint8)
+
+    atomic_write(
+        os.path.join(cache_dir, f"{key}.npy"), lambda f: np.save(f, blob), "wb"
+    )
+    atomic_write(
+        os.path.join(cache_dir, f"{key}.json"),
+        lambda f: json.dump({"num_bytes": start, "tasks": entries}, f),
+        "w",
+    )
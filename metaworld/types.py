@@ -27,6 +27,29 @@ class EnvironmentStateDict(TypedDict):
     mocap: tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]
 
 
+class ResetStateDict(TypedDict):
+    integration_state: npt.NDArray[np.float64]
+    model_fields: dict[str, npt.NDArray[np.float64]]
+    attributes: dict[str, Any]
+    data_views: dict[str, tuple[str, int, tuple[int, ...]]]
+    obs: npt.NDArray[np.float64]
+
+
+class SavedStateDict(TypedDict):
+    integration_state: npt.NDArray[np.float64]
+    model_fields: dict[str, npt.NDArray[np.float64]]
+    attributes: dict[str, Any]
+    data_views: dict[str, tuple[str, int, tuple[int, ...]]]
+
+
+class PhaseTimingDict(TypedDict):
+    count: int
+    total_s: float
+    mean_s: float
+    p50_s: float
+    p99_s: float
+
+
 class ObservationDict(TypedDict):
     state_observation: npt.NDArray[np.float64]
     state_desired_goal: npt.NDArray[np.float64]
@@ -0,0 +1,33 @@
+"""File system helpers shared by the task and model caches and the datasets."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from typing import IO, Any, Callable
+
+CACHE_DIR_ENV_VAR = "METAWORLD_CACHE_DIR"
+"""The environment variable that sets the directory of the caches."""
+
+
+def get_cache_dir() -> str | None:
+    """Returns the directory of the caches, or `None` if caching is disabled."""
+    return os.environ.get(CACHE_DIR_ENV_VAR) or None
+
+
+def atomic_write(path: str, write: Callable[[IO[Any]], Any], mode: str) -> None:
+    """Writes a file through a temporary file in the same directory, which replaces it once complete.
+
+    Args:
+        path: The path of the file.
+        write: Writes the contents to the file object it is given.
+        mode: The mode to open the file in, `"w"` or `"wb"`.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode) as f:
+            write(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,14 @@
+"""Vectorized environments for stepping the environments of a `Benchmark` together."""
+
+from metaworld.vector.async_vector_env import AsyncBenchmarkVectorEnv
+from metaworld.vector.sync_vector_env import SyncBenchmarkVectorEnv
+from metaworld.vector.threaded_vector_env import ThreadedBenchmarkVectorEnv
+from metaworld.vector.vector_env import INFO_KEYS, BenchmarkVectorEnv
+
+__all__ = [
+    "INFO_KEYS",
+    "AsyncBenchmarkVectorEnv",
+    "BenchmarkVectorEnv",
+    "SyncBenchmarkVectorEnv",
+    "ThreadedBenchmarkVectorEnv",
+]
@@ -0,0 +1,311 @@
+"""A vectorized environment that steps the environments of a `Benchmark` in worker processes.
+
+The workers write observations, rewards, termination and truncation flags and the
+packed info values straight into `multiprocessing.shared_memory` blocks and read the
+actions from one. Only the commands (and the tasks of the sub-environments that are
+reset) are sent through the pipes.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+import time
+import traceback
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Literal
+
+import numpy as np
+import numpy.typing as npt
+
+from metaworld import Benchmark
+from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import SawyerXYZEnv
+from metaworld.types import Task
+from metaworld.vector.vector_env import (
+    BenchmarkVectorEnv,
+    pack_info,
+    split_env_ids,
+)
+
+
+def _worker(
+    env_ids: range,
+    env_classes: list[type[SawyerXYZEnv]],
+    tasks: list[Task],
+    pipe: Connection,
+    parent_pipe: Connection,
+) -> None:
+    """Runs a contiguous range of sub-environments until it is told to close.
+
+    Args:
+        env_ids: The indices of the sub-environments this worker runs.
+        env_classes: The class of each of the sub-environments.
+        tasks: The initial task of each of the sub-environments.
+        pipe: The worker's end of the pipe.
+        parent_pipe: The parent's end of the pipe (closed in the worker).
+    """
+    parent_pipe.close()
+    envs: dict[int, SawyerXYZEnv] = {}
+    shared_memories: list[SharedMemory] = []
+    buffers: dict[str, npt.NDArray[Any]] = {}
+    try:
+        for env_idx, env_cls, task in zip(env_ids, env_classes, tasks):
+            env = env_cls()
+            env.set_task(task)
+            envs[env_idx] = env
+        pipe.send(
+            (
+                True,
+                (
+                    [env.sawyer_observation_space for env in envs.values()],
+                    envs[env_ids[0]].action_space,
+                ),
+            )
+        )
+
+        while True:
+            command, data = pipe.recv()
+            if command == "attach":
+                for name, (shm_name, shape, dtype) in data.items():
+                    shm = SharedMemory(name=shm_name)
+                    shared_memories.append(shm)
+                    buffers[name] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+            elif command == "reset":
+                for env_idx, task in data.items():
+                    if task is not None:
+                        envs[env_idx].set_task(task)
+                    buffers["observations"][env_idx], _ = envs[env_idx].reset()
+            elif command == "step":
+                for env_idx, env in envs.items():
+                    if env_idx in data:
+                        if data[env_idx] is not None:
+                            env.set_task(data[env_idx])
+                        buffers["observations"][env_idx], _ = env.reset()
+                        continue
+                    (
+                        _,
+                        buffers["rewards"][env_idx],
+                        buffers["terminations"][env_idx],
+                        buffers["truncations"][env_idx],
+                        info,
+                    ) = env.step(
+                        buffers["actions"][env_idx],
+                        out=buffers["observations"][env_idx],
+                    )
+                    pack_info(info, buffers["infos"][env_idx])
+            elif command == "close":
+                pipe.send((True, None))
+                break
+            else:
+                raise RuntimeError(f"Received unknown command `{command}`")
+            pipe.send((True, None))
+    except (KeyboardInterrupt, Exception):
+        pipe.send((False, traceback.format_exc()))
+    finally:
+        buffers.clear()
+        for shm in shared_memories:
+            shm.close()
+        for env in envs.values():
+            env.close()
+        pipe.close()
+
+
+class AsyncBenchmarkVectorEnv(BenchmarkVectorEnv):
+    """Steps the environments of a `Benchmark` split in worker processes.
+
+    The sub-environments are split into contiguous ranges, one per worker. The output
+    buffers live in shared memory, so with `copy=False` the returned observations are
+    views that are overwritten by the next call and invalidated by `close()`.
+    """
+
+    def __init__(
+        self,
+        benchmark: Benchmark,
+        split: Literal["train", "test"] = "train",
+        sample_tasks_on_reset: bool = True,
+        copy: bool = True,
+        envs_per_class: int = 1,
+        num_workers: int | None = None,
+        context: str | None = None,
+    ) -> None:
+        """Starts the workers and creates the shared memory blocks.
+
+        Args:
+            benchmark: The benchmark whose environment classes and tasks should be used.
+            split: Whether to use the benchmark's train or test classes and tasks.
+            sample_tasks_on_reset: Whether to sample a new task for a sub-environment every time it is reset.
+                If `False`, the task sampled on the first reset is kept.
+            copy: Whether `reset()` and `step()` return a copy of the observations or the shared buffer.
+            envs_per_class: The number of sub-environments to create for each environment class.
+            num_workers: The number of worker processes. Defaults to the number of CPUs, capped at the number of sub-environments.
+            context: The `multiprocessing` start method (e.g. "fork", "spawn" or "forkserver"). Defaults to the platform's default.
+        """
+        self._shared_memories: dict[str, SharedMemory] = {}
+        self._pipes: list[Connection] = []
+        self._processes: list[mp.process.BaseProcess] = []
+        self._closed_workers = False
+        super().__init__(benchmark, split, sample_tasks_on_reset, copy, envs_per_class)
+
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        self._worker_env_ids = split_env_ids(self.num_envs, num_workers)
+
+        # Creating the first shared memory block starts the resource tracker. This must
+        # happen before the workers are forked, so that they share it instead of each
+        # starting their own (which would unlink the blocks when the worker exits).
+        self._actions = self._make_array("actions", (self.num_envs, 4), np.float32)
+
+        ctx = mp.get_context(context)
+        for worker_idx, env_ids in enumerate(self._worker_env_ids):
+            parent_pipe, child_pipe = ctx.Pipe()
+            process = ctx.Process(
+                target=_worker,
+                name=f"Worker<{type(self).__name__}>-{worker_idx}",
+                args=(
+                    env_ids,
+                    [self._env_classes[i] for i in env_ids],
+                    # The observation space depends on the task (goal observability)
+                    [self._tasks[i][0] for i in env_ids],
+                    child_pipe,
+                    parent_pipe,
+                ),
+                daemon=True,
+            )
+            self._pipes.append(parent_pipe)
+            self._processes.append(process)
+            process.start()
+            child_pipe.close()
+
+        obs_spaces = []
+        for _, (worker_obs_spaces, action_space) in self._receive():
+            obs_spaces.extend(worker_obs_spaces)
+        self._init_spaces(obs_spaces, action_space)
+
+        specs: dict[str, tuple[str, tuple[int, ...], str]] = {
+            name: (
+                shm.name,
+                getattr(self, f"_{name}").shape,
+                getattr(self, f"_{name}").dtype.str,
+            )
+            for name, shm in self._shared_memories.items()
+        }
+        for pipe in self._pipes:
+            pipe.send(("attach", specs))
+        self._receive()
+
+    def _make_array(
+        self, name: str, shape: tuple[int, ...], dtype: npt.DTypeLike
+    ) -> npt.NDArray[Any]:
+        """Allocates one of the buffers in a new shared memory block.
+
+        Args:
+            name: The name of the buffer.
+            shape: The shape of the buffer.
+            dtype: The dtype of the buffer.
+
+        Returns:
+            A zero-filled array backed by the shared memory block.
+        """
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        shm = SharedMemory(create=True, size=max(nbytes, 1))
+        self._shared_memories[name] = shm
+        array: npt.NDArray[Any] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        array.fill(0)
+        return array
+
+    def _receive(self) -> list[tuple[int, Any]]:
+        """Waits for every worker to answer the last command.
+
+        Returns:
+            The `(worker_idx, payload)` pair of each worker.
+
+        Raises:
+            RuntimeError: If any of the workers raised an exception.
+        """
+        results, errors = [], []
+        for worker_idx, pipe in enumerate(self._pipes):
+            try:
+                success, payload = pipe.recv()
+            except EOFError:
+                success, payload = False, "The worker exited unexpectedly."
+            if success:
+                results.append((worker_idx, payload))
+            else:
+                errors.append(f"Worker {worker_idx}:\n{payload}")
+        if errors:
+            self.close()
+            raise RuntimeError("\n".join(errors))
+        return results
+
+    def _send_to_workers(self, command: str, data: dict[int, Task | None]) -> None:
+        """Sends a command to every worker, with the entries of `data` for its sub-environments.
+
+        Args:
+            command: The command.
+            data: Task data keyed by sub-environment index.
+        """
+        for pipe, env_ids in zip(self._pipes, self._worker_env_ids):
+            pipe.send((command, {i: task for i, task in data.items() if i in env_ids}))
+        self._receive()
+
+    def _reset_envs(self, tasks: list[Task | None]) -> None:
+        self._send_to_workers("reset", dict(enumerate(tasks)))
+
+    def _step_envs(
+        self, actions: npt.NDArray[np.float32], resets: dict[int, Task | None]
+    ) -> None:
+        self._actions[:] = actions
+        self._send_to_workers("step", resets)
+
+    def close_extras(
+        self, timeout: float | None = 10.0, terminate: bool = False, **kwargs: Any
+    ) -> None:
+        """Stops the workers and releases the shared memory blocks.
+
+        The buffers are copied out of shared memory first, so the last results stay readable.
+
+        Args:
+            timeout: The number of seconds to wait for the workers to stop, after which those
+                still running are terminated. Waits indefinitely if `None`.
+            terminate: Whether to terminate the workers right away, rather than asking them
+                to stop.
+        """
+        if not self._closed_workers:
+            self._closed_workers = True
+            deadline = None if timeout is None else time.monotonic() + timeout
+
+            def remaining() -> float | None:
+                return (
+                    None if deadline is None else max(deadline - time.monotonic(), 0.0)
+                )
+
+            if not terminate:
+                for pipe, process in zip(self._pipes, self._processes):
+                    if process.is_alive():
+                        try:
+                            pipe.send(("close", None))
+                        except BrokenPipeError:
+                            pass
+                for pipe in self._pipes:
+                    try:
+                        if pipe.poll(remaining()):
+                            pipe.recv()
+                    except (EOFError, OSError):
+                        pass
+            for pipe, process in zip(self._pipes, self._processes):
+                process.join(0.0 if terminate else remaining())
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+                pipe.close()
+
+        for name, shm in self._shared_memories.items():
+            setattr(self, f"_{name}", np.array(getattr(self, f"_{name}")))
+            shm.close()
+            shm.unlink()
+        self._shared_memories.clear()
+
+    def __del__(self) -> None:
+        if not getattr(self, "closed", True):
+            self.close()
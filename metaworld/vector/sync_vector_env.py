@@ -0,0 +1,115 @@
+"""A vectorized environment that serially steps every environment of a `Benchmark` in a single call."""
+
+from __future__ import annotations
+
+from typing import Any, Literal
+
+import numpy as np
+import numpy.typing as npt
+
+from metaworld import Benchmark
+from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import SawyerXYZEnv
+from metaworld.types import Task
+from metaworld.vector.vector_env import BenchmarkVectorEnv, pack_info
+
+
+class SyncBenchmarkVectorEnv(BenchmarkVectorEnv):
+    """Serially steps the environments of a `Benchmark` split, in the current process."""
+
+    def __init__(
+        self,
+        benchmark: Benchmark,
+        split: Literal["train", "test"] = "train",
+        sample_tasks_on_reset: bool = True,
+        copy: bool = True,
+        envs_per_class: int = 1,
+        share_models: bool = False,
+    ) -> None:
+        """Creates the sub-environments.
+
+        Args:
+            benchmark: The benchmark whose environment classes and tasks should be used.
+            split: Whether to use the benchmark's train or test classes and tasks.
+            sample_tasks_on_reset: Whether to sample a new task for a sub-environment every time it is reset.
+                If `False`, the task sampled on the first reset is kept.
+            copy: Whether `reset()` and `step()` return a copy of the observations or the internal buffer.
+            envs_per_class: The number of sub-environments to create for each environment class.
+            share_models: Whether the sub-environments of each class share one compiled `MjModel`
+                (see `SawyerXYZEnv.make_instances()`).
+        """
+        super().__init__(benchmark, split, sample_tasks_on_reset, copy, envs_per_class)
+        self.envs: list[SawyerXYZEnv] = []
+        for start in range(0, self.num_envs, envs_per_class):
+            env_cls = self._env_classes[start]
+            if share_models:
+                self.envs.extend(env_cls.make_instances(envs_per_class))
+            else:
+                self.envs.extend(env_cls() for _ in range(envs_per_class))
+        for env, env_tasks in zip(self.envs, self._tasks):
+            # The observation space depends on the task (goal observability)
+            env.set_task(env_tasks[0])
+        self._init_spaces(
+            [env.sawyer_observation_space for env in self.envs],
+            self.envs[0].action_space,
+        )
+        self.render_mode = self.envs[0].render_mode
+
+    def _reset_env(self, env_idx: int, task: Task | None) -> None:
+        """Sets the task of the given sub-environment, then resets it into the observation buffer.
+
+        Args:
+            env_idx: The index of the sub-environment.
+            task: The task to set, or `None` to keep the current one.
+        """
+        env = self.envs[env_idx]
+        if task is not None:
+            env.set_task(task)
+        self._observations[env_idx], _ = env.reset()
+
+    def _reset_envs(self, tasks: list[Task | None]) -> None:
+        for i, task in enumerate(tasks):
+            self._reset_env(i, task)
+
+    def _step_env(
+        self,
+        env_idx: int,
+        actions: npt.NDArray[np.float32],
+        resets: dict[int, Task | None],
+    ) -> None:
+        """Steps (or resets, if it is in `resets`) the given sub-environment into the output buffers.
+
+        Args:
+            env_idx: The index of the sub-environment.
+            actions: The actions of all the sub-environments.
+            resets: The sub-environments to reset, mapped to their new task.
+        """
+        if env_idx in resets:
+            self._reset_env(env_idx, resets[env_idx])
+            return
+        (
+            _,
+            self._rewards[env_idx],
+            self._terminations[env_idx],
+            self._truncations[env_idx],
+            info,
+        ) = self.envs[env_idx].step(actions[env_idx], out=self._observations[env_idx])
+        pack_info(info, self._infos[env_idx])
+
+    def _step_envs(
+        self, actions: npt.NDArray[np.float32], resets: dict[int, Task | None]
+    ) -> None:
+        for i in range(self.num_envs):
+            self._step_env(i, actions, resets)
+
+    def render(self) -> tuple[Any, ...]:
+        """Renders every sub-environment.
+
+        Returns:
+            A tuple with the rendered frame of each sub-environment.
+        """
+        return tuple(env.render() for env in self.envs)
+
+    def close_extras(self, **kwargs: Any) -> None:
+        """Closes every sub-environment."""
+        for env in self.envs:
+            env.close()
@@ -0,0 +1,95 @@
+"""A vectorized environment that steps the environments of a `Benchmark` on a thread pool.
+
+MuJoCo releases the GIL while it simulates, so the `do_simulation` calls of different
+sub-environments run concurrently while the observation and reward code (which holds
+the GIL) is interleaved between them. Unlike `AsyncBenchmarkVectorEnv`, this needs no
+worker processes, so there is no process startup, no copy of the models per process
+and no inter-process communication.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Literal
+
+import numpy as np
+import numpy.typing as npt
+
+from metaworld import Benchmark
+from metaworld.types import Task
+from metaworld.vector.sync_vector_env import SyncBenchmarkVectorEnv
+from metaworld.vector.vector_env import split_env_ids
+
+
+class ThreadedBenchmarkVectorEnv(SyncBenchmarkVectorEnv):
+    """Steps the environments of a `Benchmark` split on a pool of threads.
+
+    The sub-environments are split into contiguous ranges, one per thread, and each
+    thread steps its range serially.
+    """
+
+    def __init__(
+        self,
+        benchmark: Benchmark,
+        split: Literal["train", "test"] = "train",
+        sample_tasks_on_reset: bool = True,
+        copy: bool = True,
+        envs_per_class: int = 1,
+        num_threads: int | None = None,
+    ) -> None:
+        """Creates the sub-environments and the thread pool.
+
+        Args:
+            benchmark: The benchmark whose environment classes and tasks should be used.
+            split: Whether to use the benchmark's train or test classes and tasks.
+            sample_tasks_on_reset: Whether to sample a new task for a sub-environment every time it is reset.
+                If `False`, the task sampled on the first reset is kept.
+            copy: Whether `reset()` and `step()` return a copy of the observations or the internal buffer.
+            envs_per_class: The number of sub-environments to create for each environment class.
+            num_threads: The number of threads. Defaults to the number of CPUs, capped at the number of sub-environments.
+        """
+        super().__init__(benchmark, split, sample_tasks_on_reset, copy, envs_per_class)
+        if num_threads is None:
+            num_threads = os.cpu_count() or 1
+        self._thread_env_ids = split_env_ids(self.num_envs, num_threads)
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self._thread_env_ids),
+            thread_name_prefix=type(self).__name__,
+        )
+
+    def _reset_range(self, env_ids: range, tasks: list[Task | None]) -> None:
+        for i in env_ids:
+            self._reset_env(i, tasks[i])
+
+    def _step_range(
+        self,
+        env_ids: range,
+        actions: npt.NDArray[np.float32],
+        resets: dict[int, Task | None],
+    ) -> None:
+        for i in env_ids:
+            self._step_env(i, actions, resets)
+
+    def _reset_envs(self, tasks: list[Task | None]) -> None:
+        futures = [
+            self._executor.submit(self._reset_range, env_ids, tasks)
+            for env_ids in self._thread_env_ids
+        ]
+        for future in futures:
+            future.result()
+
+    def _step_envs(
+        self, actions: npt.NDArray[np.float32], resets: dict[int, Task | None]
+    ) -> None:
+        futures = [
+            self._executor.submit(self._step_range, env_ids, actions, resets)
+            for env_ids in self._thread_env_ids
+        ]
+        for future in futures:
+            future.result()
+
+    def close_extras(self, **kwargs: Any) -> None:
+        """Shuts down the thread pool and closes every sub-environment."""
+        self._executor.shutdown(wait=True)
+        super().close_extras(**kwargs)
@@ -0,0 +1,289 @@
+"""Base class for the vectorized environments that step every environment of a `Benchmark` together."""
+
+from __future__ import annotations
+
+import abc
+from typing import Any, Literal
+
+import numpy as np
+import numpy.typing as npt
+from gymnasium.spaces import Box
+from gymnasium.vector import AutoresetMode, VectorEnv
+from gymnasium.vector.utils import batch_space
+
+from metaworld import Benchmark
+from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import SawyerXYZEnv
+from metaworld.types import Task
+
+INFO_KEYS = (
+    "success",
+    "near_object",
+    "grasp_success",
+    "grasp_reward",
+    "in_place_reward",
+    "obj_to_target",
+    "unscaled_reward",
+)
+"""The keys of the `info` dict returned by `SawyerXYZEnv.step`, in the order they are packed."""
+
+
+def pack_info(info: dict[str, Any], out: npt.NDArray[np.float64]) -> None:
+    """Writes the values of a `SawyerXYZEnv.step` info dict into a flat array.
+
+    Args:
+        info: The info dict.
+        out: The array to write into, with one element per key in `INFO_KEYS`.
+    """
+    for i, key in enumerate(INFO_KEYS):
+        out[i] = info[key]
+
+
+def split_env_ids(num_envs: int, num_workers: int) -> list[range]:
+    """Splits the sub-environment indices into contiguous, evenly sized ranges.
+
+    Args:
+        num_envs: The number of sub-environments.
+        num_workers: The number of ranges. Capped at `num_envs`.
+
+    Returns:
+        One range of sub-environment indices per worker.
+    """
+    num_workers = max(1, min(num_workers, num_envs))
+    return [
+        range(int(ids[0]), int(ids[-1]) + 1)
+        for ids in np.array_split(np.arange(num_envs), num_workers)
+    ]
+
+
+class BenchmarkVectorEnv(VectorEnv, abc.ABC):
+    """Steps `envs_per_class` environments per class of a `Benchmark` split.
+
+    Observations, rewards, termination and truncation flags and the info values are
+    written into arrays that are allocated once, when the observation space is known.
+    Sub-environments are reset automatically on the step after they are truncated and a
+    new task is sampled for them (from the tasks of their class) every time they are reset.
+
+    Subclasses create the sub-environments, call `_init_spaces()` and implement
+    `_reset_envs()` and `_step_envs()`.
+    """
+
+    def __init__(
+        self,
+        benchmark: Benchmark,
+        split: Literal["train", "test"] = "train",
+        sample_tasks_on_reset: bool = True,
+        copy: bool = True,
+        envs_per_class: int = 1,
+    ) -> None:
+        """Resolves the environment classes and tasks of the benchmark split.
+
+        Args:
+            benchmark: The benchmark whose environment classes and tasks should be used.
+            split: Whether to use the benchmark's train or test classes and tasks.
+            sample_tasks_on_reset: Whether to sample a new task for a sub-environment every time it is reset.
+                If `False`, the task sampled on the first reset is kept.
+            copy: Whether `reset()` and `step()` return a copy of the observations or the internal buffer.
+            envs_per_class: The number of sub-environments to create for each environment class.
+        """
+        super().__init__()
+        if split == "train":
+            classes, tasks = benchmark.train_classes, benchmark.train_tasks
+        elif split == "test":
+            classes, tasks = benchmark.test_classes, benchmark.test_tasks
+        else:
+            raise ValueError(f"split must be 'train' or 'test', got {split}")
+        if len(classes) == 0:
+            raise ValueError(f"The benchmark has no {split} classes")
+        if envs_per_class < 1:
+            raise ValueError(f"envs_per_class must be positive, got {envs_per_class}")
+
+        self.env_names: list[str] = [
+            env_name for env_name in classes.keys() for _ in range(envs_per_class)
+        ]
+        self.num_envs = len(self.env_names)
+        self.sample_tasks_on_reset = sample_tasks_on_reset
+        self.copy = copy
+
+        self._env_classes: list[type[SawyerXYZEnv]] = [
+            classes[env_name] for env_name in self.env_names
+        ]
+        class_tasks = {
+            env_name: [task for task in tasks if task.env_name == env_name]
+            for env_name in classes.keys()
+        }
+        self._tasks: list[list[Task]] = [
+            class_tasks[env_name] for env_name in self.env_names
+        ]
+        self._task_ids = np.full(self.num_envs, -1, dtype=np.int64)
+
+    def _make_array(
+        self, name: str, shape: tuple[int, ...], dtype: npt.DTypeLike
+    ) -> npt.NDArray[Any]:
+        """Allocates one of the output buffers. Override to control where the buffers live.
+
+        Args:
+            name: The name of the buffer.
+            shape: The shape of the buffer.
+            dtype: The dtype of the buffer.
+
+        Returns:
+            A zero-filled array.
+        """
+        return np.zeros(shape, dtype=dtype)
+
+    def _init_spaces(self, obs_spaces: list[Box], action_space: Box) -> None:
+        """Sets the (batched) spaces and allocates the output buffers.
+
+        Args:
+            obs_spaces: The observation space of each sub-environment.
+            action_space: The action space shared by all sub-environments.
+        """
+        self.metadata = dict(SawyerXYZEnv.metadata)
+        self.metadata["autoreset_mode"] = AutoresetMode.NEXT_STEP
+
+        self.single_action_space = action_space
+        self.action_space = batch_space(self.single_action_space, self.num_envs)
+        self.single_observation_space = Box(
+            np.min([space.low for space in obs_spaces], axis=0),
+            np.max([space.high for space in obs_spaces], axis=0),
+            dtype=np.float64,
+        )
+        self.observation_space = Box(
+            np.stack([space.low for space in obs_spaces]),
+            np.stack([space.high for space in obs_spaces]),
+            dtype=np.float64,
+        )
+
+        self._observations = self._make_array(
+            "observations",
+            (self.num_envs, *self.single_observation_space.shape),
+            np.float64,
+        )
+        self._rewards = self._make_array("rewards", (self.num_envs,), np.float64)
+        self._terminations = self._make_array(
+            "terminations", (self.num_envs,), np.bool_
+        )
+        self._truncations = self._make_array("truncations", (self.num_envs,), np.bool_)
+        self._infos = self._make_array(
+            "infos", (self.num_envs, len(INFO_KEYS)), np.float64
+        )
+        self._info_mask = np.zeros(self.num_envs, dtype=np.bool_)
+        self._autoreset_envs = np.zeros(self.num_envs, dtype=np.bool_)
+
+    @property
+    def task_ids(self) -> npt.NDArray[np.int64]:
+        """The index (within the tasks of its class) of the task each sub-environment is currently set to."""
+        return self._task_ids.copy()
+
+    def _sample_task(self, env_idx: int) -> Task | None:
+        """Samples a new task for the given sub-environment, if one is needed.
+
+        Args:
+            env_idx: The index of the sub-environment.
+
+        Returns:
+            The task the sub-environment should be set to, or `None` if it should keep its current task.
+        """
+        if self.sample_tasks_on_reset or self._task_ids[env_idx] < 0:
+            task_id = int(self.np_random.integers(len(self._tasks[env_idx])))
+            self._task_ids[env_idx] = task_id
+            return self._tasks[env_idx][task_id]
+        return None
+
+    @abc.abstractmethod
+    def _reset_envs(self, tasks: list[Task | None]) -> None:
+        """Resets every sub-environment, writing the observations into `_observations`.
+
+        Args:
+            tasks: The task to set before resetting each sub-environment (`None` to keep the current one).
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _step_envs(
+        self, actions: npt.NDArray[np.float32], resets: dict[int, Task | None]
+    ) -> None:
+        """Steps the sub-environments, writing the results into the output buffers.
+
+        Sub-environments in `resets` must be reset instead (setting their task first,
+        if not `None`), writing only their observation.
+
+        Args:
+            actions: The actions to take, an array of shape `(num_envs, 4)`.
+            resets: The sub-environments to reset, mapped to their new task.
+        """
+        raise NotImplementedError
+
+    def _batched_infos(self) -> dict[str, Any]:
+        """Builds the info dict of the vector environment from the info buffer.
+
+        Returns:
+            A dict mapping each key in `INFO_KEYS` to an `(num_envs,)` array, with
+            a `_key` mask of the sub-environments that reported it this step.
+        """
+        infos: dict[str, Any] = {}
+        for i, key in enumerate(INFO_KEYS):
+            infos[key] = self._infos[:, i].copy()
+            infos[f"_{key}"] = self._info_mask.copy()
+        return infos
+
+    def reset(
+        self, *, seed: int | None = None, options: dict[str, Any] | None = None
+    ) -> tuple[npt.NDArray[np.float64], dict[str, Any]]:
+        """Sets a task for and resets every sub-environment.
+
+        Args:
+            seed: The seed for the task sampling.
+            options: Ignored.
+
+        Returns:
+            The `(obs, info)` tuple, where `obs` has shape `(num_envs, 39)`.
+        """
+        super().reset(seed=seed)
+        self._reset_envs([self._sample_task(i) for i in range(self.num_envs)])
+        self._rewards[:] = 0.0
+        self._terminations[:] = False
+        self._truncations[:] = False
+        self._autoreset_envs[:] = False
+        obs = self._observations
+        return (obs.copy() if self.copy else obs), {}
+
+    def step(self, actions: npt.NDArray[np.float32]) -> tuple[
+        npt.NDArray[np.float64],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.bool_],
+        npt.NDArray[np.bool_],
+        dict[str, Any],
+    ]:
+        """Steps every sub-environment, resetting those that were truncated on the previous step.
+
+        Args:
+            actions: The actions to take, an array of shape `(num_envs, 4)`.
+
+        Returns:
+            The batched (next_obs, rewards, terminations, truncations, infos) tuple.
+        """
+        assert actions.shape == (
+            self.num_envs,
+            4,
+        ), f"Actions should have shape {(self.num_envs, 4)}, got {actions.shape}"
+        resets = {
+            int(i): self._sample_task(int(i))
+            for i in np.flatnonzero(self._autoreset_envs)
+        }
+        self._step_envs(actions, resets)
+
+        np.logical_not(self._autoreset_envs, out=self._info_mask)
+        self._rewards[self._autoreset_envs] = 0.0
+        self._terminations[self._autoreset_envs] = False
+        self._truncations[self._autoreset_envs] = False
+        np.logical_or(self._terminations, self._truncations, out=self._autoreset_envs)
+
+        obs = self._observations
+        return (
+            obs.copy() if self.copy else obs,
+            self._rewards.copy(),
+            self._terminations.copy(),
+            self._truncations.copy(),
+            self._batched_infos(),
+        )
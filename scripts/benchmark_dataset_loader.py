@@ -0,0 +1,61 @@
+"""Measures the read throughput of `metaworld.dataset.Dataset`.
+
+Reads a dataset written by `metaworld.dataset` (or generates a small MT1 one in a temporary
+directory), and prints the samples per second of shuffled minibatches, read synchronously and
+through the prefetch thread, and the episodes per second of random episode access.
+`--work-ms` simulates the time a training step spends on each batch, which prefetching hides.
+"""
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+import metaworld
+from metaworld.dataset import Dataset, generate_dataset
+
+
+def samples_per_second(reader, args, prefetch):
+    start = time.perf_counter()
+    num_samples = 0
+    for batch in reader.iter_batches(args.batch_size, seed=0, prefetch=prefetch):
+        num_samples += len(batch["reward"])
+        if args.work_ms:
+            time.sleep(args.work_ms / 1000)
+    return num_samples / (time.perf_counter() - start)
+
+
+def episodes_per_second(reader, num_episodes):
+    rng = np.random.default_rng(0)
+    start = time.perf_counter()
+    for i in rng.integers(len(reader), size=num_episodes):
+        episode = reader.episode(int(i))
+        np.asarray(episode["obs"]).sum()
+    return num_episodes / (time.perf_counter() - start)
+
+
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument("--path", help="The dataset to read, generated if not given.")
+parser.add_argument("--env-name", default="reach-v2")
+parser.add_argument("--batch-size", type=int, default=256)
+parser.add_argument("--prefetch", type=int, default=4)
+parser.add_argument("--work-ms", type=float, default=0.0)
+parser.add_argument("--num-episodes", type=int, default=1000)
+args = parser.parse_args()
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    path = args.path
+    if path is None:
+        path = tmp_dir
+        generate_dataset(metaworld.MT1(args.env_name, seed=0), path, chunk_steps=5000)
+    reader = Dataset(path)
+    print(f"{len(reader)} episodes, {reader.num_steps} steps")
+
+    serial = samples_per_second(reader, args, prefetch=0)
+    prefetched = samples_per_second(reader, args, prefetch=args.prefetch)
+    print(f"{'batches':<20}{'samples/s':>14}")
+    print(f"{'synchronous':<20}{serial:>14.0f}")
+    print(f"{'prefetched':<20}{prefetched:>14.0f}")
+    print(f"speedup: {prefetched / serial:.2f}x")
+    print(f"random episodes/s: {episodes_per_second(reader, args.num_episodes):.0f}")
@@ -0,0 +1,274 @@
+"""Measures the throughput and memory of every V2 environment and benchmark, and compares runs.
+
+`run` measures, for every environment of `ALL_V2_ENVIRONMENTS`, the construction time, the
+`set_task()` and `reset()` latencies and the steps per second with random actions (all
+medians) and the peak RSS, and for every benchmark (ML1, MT1, ML10, MT10, ML45, MT50) the
+construction time and peak RSS. Each measurement runs in a fresh process, so the peak RSS is that of a
+single environment or benchmark and no caches are shared between them. The on-disk caches
+are disabled in those processes, even if `METAWORLD_CACHE_DIR` is set. The results are
+written as JSON:
+
+    python scripts/benchmark_suite.py run --output results.json
+
+`compare` flags the metrics of a run that are worse than those of a baseline run by more
+than `--threshold` (relative), and exits with status 1 if there are any:
+
+    python scripts/benchmark_suite.py compare baseline.json results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+from typing import Any
+
+import mujoco
+import numpy as np
+
+import metaworld
+from metaworld.envs.mujoco.env_dict import ALL_V2_ENVIRONMENTS
+from metaworld.utils import CACHE_DIR_ENV_VAR
+
+BENCHMARKS = ("ML1", "MT1", "ML10", "MT10", "ML45", "MT50")
+SINGLE_ENV_BENCHMARKS = ("ML1", "MT1")
+"""The benchmarks of a single environment, constructed for `--benchmark-env`."""
+
+HIGHER_IS_BETTER = {"steps_per_s"}
+"""The metrics that regress when they decrease, all others regress when they increase."""
+
+
+def peak_rss_mb() -> float:
+    """Returns the peak resident set size of the current process, in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def measure_env(
+    env_name: str, num_steps: int, num_resets: int, repeats: int
+) -> dict[str, float]:
+    benchmark = metaworld.MT1(env_name, seed=0)
+    tasks = benchmark.train_tasks
+
+    construction_s = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        env = benchmark.train_classes[env_name]()
+        construction_s.append(time.perf_counter() - start)
+
+    set_task_s = []
+    for task in tasks[:num_resets]:
+        start = time.perf_counter()
+        env.set_task(task)
+        set_task_s.append(time.perf_counter() - start)
+
+    reset_s = []
+    for _ in range(num_resets):
+        start = time.perf_counter()
+        env.reset()
+        reset_s.append(time.perf_counter() - start)
+
+    env.action_space.seed(0)
+    actions = [env.action_space.sample() for _ in range(num_steps)]
+    steps_per_s = []
+    for _ in range(repeats):
+        env.reset()
+        start = time.perf_counter()
+        for action in actions:
+            _, _, _, truncated, _ = env.step(action)
+            if truncated:
+                env.reset()
+        steps_per_s.append(num_steps / (time.perf_counter() - start))
+
+    env.close()
+    return {
+        "construction_s": statistics.median(construction_s),
+        "set_task_s": statistics.median(set_task_s),
+        "reset_s": statistics.median(reset_s),
+        "steps_per_s": statistics.median(steps_per_s),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def measure_benchmark(name: str, env_name: str) -> dict[str, float]:
+    benchmark_cls = getattr(metaworld, name)
+    args = (env_name,) if name in SINGLE_ENV_BENCHMARKS else ()
+    start = time.perf_counter()
+    benchmark_cls(*args, seed=0)
+    return {
+        "construction_s": time.perf_counter() - start,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def disable_caches() -> None:
+    """Disables the on-disk caches (see `metaworld.utils`) in the current process."""
+    os.environ.pop(CACHE_DIR_ENV_VAR, None)
+
+
+def run_isolated(
+    pool_context: Any, function: Any, *args: Any
+) -> dict[str, float] | dict[str, str]:
+    """Runs the measurement in a fresh process, returning the error instead if it raises.
+
+    The process does not inherit `METAWORLD_CACHE_DIR`, so that it starts with cold caches.
+    """
+    with pool_context.Pool(1, initializer=disable_caches, maxtasksperchild=1) as pool:
+        try:
+            return pool.apply(function, args)
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+
+
+def run(args: argparse.Namespace) -> None:
+    env_names = args.envs or list(ALL_V2_ENVIRONMENTS)
+    benchmark_names = BENCHMARKS if args.benchmarks is None else args.benchmarks
+    context = multiprocessing.get_context("spawn")
+    results: dict[str, Any] = {
+        "metadata": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "mujoco": mujoco.__version__,
+            "num_steps": args.num_steps,
+            "num_resets": args.num_resets,
+            "repeats": args.repeats,
+            "benchmark_env": args.benchmark_env,
+        },
+        "envs": {},
+        "benchmarks": {},
+    }
+
+    print(
+        f"{'env':<32}{'construct ms':>14}{'set_task ms':>13}{'reset ms':>10}"
+        f"{'steps/s':>10}{'RSS MB':>9}"
+    )
+    for env_name in env_names:
+        result = run_isolated(
+            context,
+            measure_env,
+            env_name,
+            args.num_steps,
+            args.num_resets,
+            args.repeats,
+        )
+        results["envs"][env_name] = result
+        if "error" in result:
+            print(f"{env_name:<32}failed ({result['error']})")
+            continue
+        print(
+            f"{env_name:<32}{result['construction_s'] * 1e3:>14.1f}"
+            f"{result['set_task_s'] * 1e3:>13.2f}{result['reset_s'] * 1e3:>10.2f}"
+            f"{result['steps_per_s']:>10.0f}{result['peak_rss_mb']:>9.1f}"
+        )
+
+    print(f"\n{'benchmark':<32}{'construct s':>14}{'RSS MB':>9}")
+    for name in benchmark_names:
+        result = run_isolated(context, measure_benchmark, name, args.benchmark_env)
+        results["benchmarks"][name] = result
+        if "error" in result:
+            print(f"{name:<32}failed ({result['error']})")
+            continue
+        print(
+            f"{name:<32}{result['construction_s']:>14.2f}{result['peak_rss_mb']:>9.1f}"
+        )
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nWrote {args.output}")
+
+
+def compare(args: argparse.Namespace) -> None:
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.results) as f:
+        results = json.load(f)
+
+    regressions = []
+    print(f"{'':<40}{'metric':<16}{'baseline':>12}{'current':>12}{'change':>9}")
+    for section in ("envs", "benchmarks"):
+        for name, metrics in results[section].items():
+            base_metrics = baseline.get(section, {}).get(name)
+            if base_metrics is None or "error" in base_metrics:
+                continue
+            if "error" in metrics:
+                regressions.append((name, "error", metrics["error"]))
+                print(f"{name:<40}failed ({metrics['error']})")
+                continue
+            for metric, value in metrics.items():
+                base = base_metrics.get(metric)
+                if not base:
+                    continue
+                change = value / base - 1.0
+                worse = -change if metric in HIGHER_IS_BETTER else change
+                flag = ""
+                if worse > args.threshold:
+                    regressions.append((name, metric, change))
+                    flag = "  REGRESSION"
+                if flag or args.verbose:
+                    print(
+                        f"{name:<40}{metric:<16}{base:>12.4g}{value:>12.4g}"
+                        f"{change:>+9.1%}{flag}"
+                    )
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        sys.exit(1)
+    print(f"\nNo regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Measure and write the results.")
+    run_parser.add_argument("--output", default="benchmark_results.json")
+    run_parser.add_argument(
+        "--envs", nargs="+", help="The environments to measure, all if not given."
+    )
+    run_parser.add_argument(
+        "--benchmarks",
+        nargs="*",
+        choices=BENCHMARKS,
+        help="The benchmarks to construct, all if not given.",
+    )
+    run_parser.add_argument(
+        "--benchmark-env",
+        default="pick-place-v2",
+        help="The environment of the single environment benchmarks.",
+    )
+    run_parser.add_argument("--num-steps", type=int, default=2000)
+    run_parser.add_argument("--num-resets", type=int, default=20)
+    run_parser.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        help="The construction time and steps per second are the medians of this many runs.",
+    )
+    run_parser.set_defaults(function=run)
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Flag the regressions of a run against a baseline run."
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("results")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    compare_parser.add_argument(
+        "--verbose", action="store_true", help="Print all the metrics."
+    )
+    compare_parser.set_defaults(function=compare)
+
+    args = parser.parse_args()
+    args.function(args)
@@ -0,0 +1,66 @@
+"""Compares the stepping throughput of `SyncBenchmarkVectorEnv` and `ThreadedBenchmarkVectorEnv`.
+
+For every V2 environment, an MT1 benchmark is stepped with `--envs-per-class` copies of
+the environment, serially and on a thread pool, and the steps per second are printed.
+Exits with a non-zero status if any environment fails to build.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+import metaworld
+from metaworld.envs.mujoco.env_dict import ALL_V2_ENVIRONMENTS
+from metaworld.vector import SyncBenchmarkVectorEnv, ThreadedBenchmarkVectorEnv
+
+
+def steps_per_second(envs, num_steps):
+    envs.reset(seed=0)
+    actions = np.zeros((num_steps, *envs.action_space.shape), dtype=np.float32)
+    for i in range(num_steps):
+        actions[i] = envs.action_space.sample()
+    start = time.perf_counter()
+    for i in range(num_steps):
+        envs.step(actions[i])
+    return num_steps * envs.num_envs / (time.perf_counter() - start)
+
+
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument("--envs-per-class", type=int, default=8)
+parser.add_argument("--num-threads", type=int, default=os.cpu_count())
+parser.add_argument("--num-steps", type=int, default=200)
+args = parser.parse_args()
+
+print(f"{'env':<32}{'serial':>12}{'threaded':>12}{'speedup':>10}")
+speedups = []
+failures = []
+for env_name in ALL_V2_ENVIRONMENTS:
+    try:
+        benchmark = metaworld.MT1(env_name, seed=0)
+        sync_envs = SyncBenchmarkVectorEnv(
+            benchmark, envs_per_class=args.envs_per_class
+        )
+        threaded_envs = ThreadedBenchmarkVectorEnv(
+            benchmark,
+            envs_per_class=args.envs_per_class,
+            num_threads=args.num_threads,
+        )
+    except Exception as e:
+        failures.append(env_name)
+        print(f"{env_name:<32}failed ({type(e).__name__}: {e})")
+        continue
+    serial = steps_per_second(sync_envs, args.num_steps)
+    threaded = steps_per_second(threaded_envs, args.num_steps)
+    sync_envs.close()
+    threaded_envs.close()
+    speedups.append(threaded / serial)
+    print(f"{env_name:<32}{serial:>12.0f}{threaded:>12.0f}{threaded / serial:>9.2f}x")
+
+if speedups:
+    print(f"mean speedup: {np.mean(speedups):.2f}x over {len(speedups)} environments")
+if failures:
+    print(f"{len(failures)} environment(s) failed to build: {', '.join(failures)}")
+    sys.exit(1)
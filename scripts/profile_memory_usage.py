@@ -1,15 +1,16 @@
 #!/usr/bin/env python3
 """Test script for profiling average memory footprint."""
+
 import memory_profiler
 
-from metaworld.envs.mujoco.env_dict import ALL_V2_ENVIRONMENTS
+from metaworld.envs.mujoco.env_dict import ALL_V2_ENVIRONMENTS_GOAL_OBSERVABLE
 from tests.helpers import step_env
 
 
 def build_and_step(env_cls):
     env = env_cls()
     env.reset()
-    step_env(env, max_path_length=1000, iterations=10)
+    step_env(env, max_path_length=1000, iterations=10, render=False)
     return env
 
 
@@ -18,11 +19,12 @@ def build_and_step_all(classes):
     for env_cls in classes:
         env = build_and_step(env_cls)
         envs += [env]
+    return envs
 
 
 def profile_hard_mode_indepedent():
     profile = {}
-    for env_cls in ALL_V2_ENVIRONMENTS:
+    for env_cls in ALL_V2_ENVIRONMENTS_GOAL_OBSERVABLE.values():
         target = (build_and_step, [env_cls], {})
         memory_usage = memory_profiler.memory_usage(target)
         profile[env_cls] = max(memory_usage)
@@ -31,7 +33,7 @@ def profile_hard_mode_indepedent():
 
 
 def profile_hard_mode_shared():
-    target = (build_and_step_all, [ALL_V2_ENVIRONMENTS], {})
+    target = (build_and_step_all, [ALL_V2_ENVIRONMENTS_GOAL_OBSERVABLE.values()], {})
     usage = memory_profiler.memory_usage(target)
     return max(usage)
 
@@ -54,7 +56,7 @@ if __name__ == "__main__":
 
     print("---------    Shared memory footprint    ---------")
     max_usage = profile_hard_mode_shared()
-    mean_shared = max_usage / len(ALL_V2_ENVIRONMENTS)
+    mean_shared = max_usage / len(ALL_V2_ENVIRONMENTS_GOAL_OBSERVABLE)
     print(
-        f"Mean memory footprint (n = {len(ALL_V2_ENVIRONMENTS)}): {mean_shared:.1f} MB"
+        f"Mean memory footprint (n = {len(ALL_V2_ENVIRONMENTS_GOAL_OBSERVABLE)}): {mean_shared:.1f} MB"
     )
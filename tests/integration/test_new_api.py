@@ -4,7 +4,8 @@ import numpy as np
 import pytest
 
 import metaworld
-from metaworld import ML1, ML10, ML45, MT10, MT50
+from metaworld import ML1, ML10, ML45, MT1, MT10, MT50
+from metaworld.envs.mujoco.env_dict import ALL_V2_ENVIRONMENTS
 from tests.helpers import step_env
 
 STEPS = 3
@@ -321,3 +322,47 @@ def test_identical_environments():
     # test that 2 benchmarks with different seeds have different goals
     mt50_3 = metaworld.MT50(seed=50)
     helper_neq(mt50_1, mt50_3)
+
+
+@pytest.mark.parametrize("env_name", MT1.ENV_NAMES)
+def test_tasks_match_simulated_resets(env_name):
+    # The goals used to be generated by resetting an environment with an unfrozen rand vec
+    np.random.seed(metaworld._env_seed(3, env_name))
+    env = ALL_V2_ENVIRONMENTS[env_name]()
+    env._freeze_rand_vec = False
+    env._set_task_called = True
+    expected_rand_vecs = []
+    for _ in range(metaworld._N_GOALS):
+        env.reset()
+        expected_rand_vecs.append(env._last_rand_vec)
+
+    tasks = MT1(env_name, seed=3).train_tasks
+    for task, expected_rand_vec in zip(tasks, expected_rand_vecs):
+        np.testing.assert_array_equal(
+            pickle.loads(task.data)["rand_vec"], expected_rand_vec
+        )
+
+
+def test_parallel_tasks_match_serial():
+    env_names = ["pick-place-v2", "drawer-open-v2", "reach-v2"]
+    classes = {env_name: ALL_V2_ENVIRONMENTS[env_name] for env_name in env_names}
+    args_kwargs = {
+        env_name: metaworld._env_dict.ML1_args_kwargs[env_name]
+        for env_name in env_names
+    }
+    serial = metaworld._make_tasks(
+        classes, args_kwargs, metaworld._MT_OVERRIDE, seed=10
+    )
+    parallel = metaworld._make_tasks(
+        classes, args_kwargs, metaworld._MT_OVERRIDE, seed=10, num_workers=2
+    )
+    assert parallel == serial
+
+    # The goals of an environment do not depend on the other environments
+    single = metaworld._make_tasks(
+        {"reach-v2": classes["reach-v2"]},
+        {"reach-v2": args_kwargs["reach-v2"]},
+        metaworld._MT_OVERRIDE,
+        seed=10,
+    )
+    assert single == serial[-metaworld._N_GOALS :]
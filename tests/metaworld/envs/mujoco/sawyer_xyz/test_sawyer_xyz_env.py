@@ -1,8 +1,16 @@
+import pickle
 import random
+import tracemalloc
 
+import mujoco
 import numpy as np
+import pytest
+from scipy.spatial.transform import Rotation
 
 import metaworld
+from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import SawyerXYZEnv
+from metaworld.policies import SawyerPickPlaceV2Policy
+from tests.metaworld.envs.mujoco.sawyer_xyz.test_scripted_policies import policies
 
 
 def test_reset_returns_same_obj_and_goal():
@@ -43,3 +51,481 @@ def test_reset_returns_same_obj_and_goal():
             violating_envs_goals.append(env_name)
     assert not violating_envs_obs
     assert not violating_envs_goals
+
+
+def test_make_instances_shares_model():
+    # drawer-open-v2 moves the drawer body of the model to the task's position on reset
+    benchmark = metaworld.ML1("drawer-open-v2", seed=0)
+    env_cls = benchmark.train_classes["drawer-open-v2"]
+    shared_envs = env_cls.make_instances(3)
+    envs = [env_cls() for _ in range(3)]
+    assert all(env.model is shared_envs[0].model for env in shared_envs)
+
+    for shared_env, env, task in zip(shared_envs, envs, benchmark.train_tasks):
+        shared_env.set_task(task)
+        env.set_task(task)
+    for shared_env, env in zip(shared_envs, envs):
+        np.testing.assert_array_equal(shared_env.reset()[0], env.reset()[0])
+    for _ in range(20):
+        for shared_env, env in zip(shared_envs, envs):
+            action = env.action_space.sample()
+            shared_obs, shared_reward, *_ = shared_env.step(action)
+            obs, reward, *_ = env.step(action)
+            np.testing.assert_array_equal(shared_obs, obs)
+            assert shared_reward == reward
+
+
+@pytest.mark.parametrize("env_name", ["pick-place-v2", "drawer-open-v2"])
+def test_clone_shares_model_and_continues_episode(env_name):
+    benchmark = metaworld.ML1(env_name, seed=0)
+    env = benchmark.train_classes[env_name]()
+    policy = policies[env_name]()
+    env.set_task(benchmark.train_tasks[0])
+    obs, _ = env.reset()
+    for _ in range(20):
+        obs, *_ = env.step(policy.get_action(obs.copy()))
+
+    clone = env.clone()
+    assert clone.model is env.model and clone.data is not env.data
+    for xpos in clone._body_xpos.values():
+        assert np.shares_memory(xpos, clone.data.xpos)
+    for _ in range(20):
+        action = env.action_space.sample()
+        obs, *results = env.step(action)
+        clone_obs, *clone_results = clone.step(action)
+        np.testing.assert_array_equal(clone_obs, obs)
+        assert clone_results == results
+
+    # Interleaved episodes in different tasks match separate environments
+    envs = [env, clone]
+    separate_envs = [benchmark.train_classes[env_name]() for _ in envs]
+    for e, separate_env, task in zip(envs, separate_envs, benchmark.train_tasks[1:]):
+        for x in (e, separate_env):
+            x.set_task(task)
+            x.reset()
+    for _ in range(20):
+        action = env.action_space.sample()
+        for e, separate_env in zip(envs, separate_envs):
+            obs, *results = e.step(action)
+            separate_obs, *separate_results = separate_env.step(action)
+            np.testing.assert_array_equal(obs, separate_obs)
+            assert results == separate_results
+
+
+@pytest.mark.parametrize("env_name", ["pick-place-v2", "drawer-open-v2"])
+def test_cached_hand_reset_matches_simulated(env_name):
+    benchmark = metaworld.ML1(env_name, seed=0)
+    env = benchmark.train_classes[env_name]()
+    uncached_env = benchmark.train_classes[env_name]()
+    uncached_env.cache_hand_resets = False
+
+    num_cached_states = []
+    for task in benchmark.train_tasks[:2] * 2:
+        num_cached_states.append(len(env._hand_reset_states))
+        env.set_task(task)
+        uncached_env.set_task(task)
+        np.testing.assert_array_equal(env.reset()[0], uncached_env.reset()[0])
+        for _ in range(10):
+            action = env.action_space.sample()
+            obs, reward, *_ = env.step(action)
+            uncached_obs, uncached_reward, *_ = uncached_env.step(action)
+            np.testing.assert_array_equal(obs, uncached_obs)
+            assert reward == uncached_reward
+    # Resetting into a task seen before reuses its cached state
+    assert num_cached_states[2] == num_cached_states[3] == len(env._hand_reset_states)
+    assert len(uncached_env._hand_reset_states) == 0
+
+
+def test_hand_reset_cache_is_bounded():
+    benchmark = metaworld.ML1("drawer-open-v2", seed=0)
+    env = benchmark.train_classes["drawer-open-v2"]()
+    env.set_task(benchmark.train_tasks[0])
+    # Every reset moves the drawer somewhere new, so the cached states are never used again
+    env._freeze_rand_vec = False
+    env._HAND_RESET_CACHE_SIZE = 4
+    for _ in range(10):
+        env.reset()
+        assert len(env._hand_reset_states) <= 4
+    assert len(env._hand_reset_states) == 4
+
+    # Resetting into the same drawer position again uses the cached state
+    env._freeze_rand_vec = True
+    env.reset()
+    keys = list(env._hand_reset_states)
+    env.reset()
+    assert list(env._hand_reset_states) == keys
+
+
+@pytest.mark.parametrize("env_name", ["pick-place-v2", "bin-picking-v2"])
+def test_precomputed_reset_states_match_simulated(env_name):
+    benchmark = metaworld.ML1(env_name, seed=0)
+    precomputed = metaworld.ML1(env_name, seed=0, precompute_reset_states=True)
+    env = benchmark.train_classes[env_name]()
+    precomputed_env = precomputed.train_classes[env_name]()
+
+    for task, precomputed_task in (
+        list(zip(benchmark.test_tasks[:2], precomputed.test_tasks[:2])) * 2
+    ):
+        env.set_task(task)
+        precomputed_env.set_task(precomputed_task)
+        assert precomputed_env._reset_state is not None
+        np.testing.assert_array_equal(precomputed_env.reset()[0], env.reset()[0])
+        for _ in range(20):
+            action = env.action_space.sample()
+            precomputed_results = precomputed_env.step(action)
+            results = env.step(action)
+            np.testing.assert_array_equal(precomputed_results[0], results[0])
+            assert precomputed_results[1:] == results[1:]
+
+
+def test_step_writes_into_out():
+    benchmark = metaworld.MT1("pick-place-v2", seed=0)
+    env = benchmark.train_classes["pick-place-v2"]()
+    out_env = benchmark.train_classes["pick-place-v2"]()
+    for e in (env, out_env):
+        e.set_task(benchmark.train_tasks[0])
+        e.reset()
+
+    out = np.empty(39)
+    for _ in range(20):
+        action = env.action_space.sample()
+        obs, *results = env.step(action)
+        out_obs, *out_results = out_env.step(action, out=out)
+        assert out_obs is out
+        np.testing.assert_array_equal(out_obs, obs)
+        assert out_results == results
+
+
+@pytest.mark.parametrize("partially_observable", [True, False])
+def test_observation_path_allocation(partially_observable):
+    env = metaworld.envs.ALL_V2_ENVIRONMENTS_GOAL_OBSERVABLE[
+        "pick-place-v2-goal-observable"
+    ]()
+    env._partially_observable = partially_observable
+    env.reset()
+    # Leave out the object getters, which are implemented by each environment
+    obj_pos, obj_quat = env._get_pos_objects(), env._get_quat_objects()
+    env._get_pos_objects = lambda: obj_pos
+    env._get_quat_objects = lambda: obj_quat
+
+    def observe(out):
+        # The observation part of `SawyerXYZEnv.step()`
+        env._get_obs(out=out)
+        obs_low, obs_high = env._get_obs_bounds()
+        np.maximum(out, obs_low, out=out)
+        np.minimum(out, obs_high, out=out)
+
+    def measure(fn):
+        """Returns the memory retained and the peak memory allocated while calling `fn` 100 times."""
+        tracemalloc.start()
+        try:
+            for _ in range(3):
+                fn()
+            start, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            for _ in range(100):
+                fn()
+            end, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return end - start, peak - start
+
+    out = np.empty(39)
+    retained, peak = measure(lambda: observe(out))
+    _, allocating_peak = measure(lambda: env._get_obs())
+    # Only a few scalar temporaries are allocated (and freed) per step, no observation arrays
+    assert retained < out.nbytes
+    assert peak + out.nbytes <= allocating_peak
+
+
+def test_xmat_to_quat_matches_scipy():
+    # Include the matrices where the largest element is tied or the trace
+    matrices = list(Rotation.random(1000, random_state=0).as_matrix())
+    matrices += [np.eye(3), np.diag([1.0, -1.0, -1.0]), np.diag([-1.0, 1.0, -1.0])]
+    matrices += [np.diag([-1.0, -1.0, 1.0])]
+    for matrix in matrices:
+        np.testing.assert_array_equal(
+            SawyerXYZEnv._xmat_to_quat(matrix.ravel()),
+            Rotation.from_matrix(matrix).as_quat(),
+        )
+
+    env = metaworld.envs.ALL_V2_ENVIRONMENTS_GOAL_OBSERVABLE[
+        "pick-place-v2-goal-observable"
+    ](seed=0)
+    env.reset()
+    for _ in range(20):
+        env.step(env.action_space.sample())
+        xmat = env.data.geom("objGeom").xmat
+        np.testing.assert_array_equal(
+            env._get_quat_objects(), Rotation.from_matrix(xmat.reshape(3, 3)).as_quat()
+        )
+
+
+class _NameLookupRecorder:
+    """Wraps an `MjData`, recording the named lookups (`data.body("...")` etc.)."""
+
+    def __init__(self, data):
+        self._data = data
+        self.lookups = []
+
+    def __getattr__(self, name):
+        if name in ("body", "site", "geom", "joint"):
+            self.lookups.append(name)
+        return getattr(self._data, name)
+
+
+@pytest.mark.parametrize("env_name", sorted(metaworld.ML1.ENV_NAMES))
+def test_step_does_no_name_lookups(env_name):
+    benchmark = metaworld.ML1(env_name, seed=0)
+    env = benchmark.train_classes[env_name]()
+    env.set_task(benchmark.train_tasks[0])
+    env.reset()
+    for _ in range(5):
+        action = env.action_space.sample()
+        env.step(action)
+
+        data = env.data
+        env.data = _NameLookupRecorder(data)
+        try:
+            obs = env._get_obs()
+            env.evaluate_state(obs, action)
+            env.tcp_center
+            lookups = env.data.lookups
+        finally:
+            env.data = data
+        assert lookups == []
+
+
+@pytest.mark.parametrize("env_name", sorted(metaworld.ML1.ENV_NAMES))
+def test_forward_passes_per_step_and_reset(env_name, monkeypatch):
+    benchmark = metaworld.ML1(env_name, seed=0)
+    env = benchmark.train_classes[env_name]()
+    env.set_task(benchmark.train_tasks[0])
+    env.reset()
+
+    calls = []
+    mj_forward = mujoco.mj_forward
+
+    def counting_mj_forward(model, data):
+        calls.append(data)
+        mj_forward(model, data)
+
+    monkeypatch.setattr(mujoco, "mj_forward", counting_mj_forward)
+    for _ in range(2):
+        calls.clear()
+        env.reset()
+        # At most one per `reset_model()`, which `reset()` runs twice
+        assert len(calls) <= 2
+        for _ in range(5):
+            calls.clear()
+            env.step(env.action_space.sample())
+            assert len(calls) == 1
+
+
+def test_set_state_runs_forward_pass():
+    benchmark = metaworld.ML1("pick-place-v2", seed=0)
+    env = benchmark.train_classes["pick-place-v2"]()
+    env.set_task(benchmark.train_tasks[0])
+    env.reset()
+    qpos = env.data.qpos.copy()
+    qpos[9:12] += np.array([0.05, -0.05, 0.1])
+    env.set_state(qpos, np.zeros_like(env.data.qvel))
+    # The raw `MjData` views are up to date, as after `MujocoEnv.set_state()`
+    np.testing.assert_allclose(env.data.body("obj").xpos, qpos[9:12])
+
+
+def test_set_pos_site_persists():
+    benchmark = metaworld.ML1("reach-v2", seed=0)
+    env = benchmark.train_classes["reach-v2"]()
+    env.set_task(benchmark.train_tasks[0])
+    env.reset()
+    pos = np.array([0.05, 0.8, 0.2])
+    env._set_pos_site("goal", pos)
+    np.testing.assert_array_equal(env._get_site_pos("goal"), pos)
+    env.step(env.action_space.sample())
+    np.testing.assert_allclose(env._get_site_pos("goal"), pos)
+
+
+def test_entity_tables_follow_unpickled_data():
+    benchmark = metaworld.ML1("pick-place-v2", seed=0)
+    env = benchmark.train_classes["pick-place-v2"]()
+    env.set_task(benchmark.train_tasks[0])
+    env.reset()
+    unpickled = pickle.loads(pickle.dumps(env))
+    assert unpickled.data is not env.data
+    for name, xpos in unpickled._body_xpos.items():
+        assert np.shares_memory(xpos, unpickled.data.xpos)
+        np.testing.assert_array_equal(xpos, unpickled.data.body(name).xpos)
+    np.testing.assert_array_equal(unpickled.tcp_center, env.tcp_center)
+
+
+def test_touching_object_matches_contact_loop():
+    benchmark = metaworld.ML1("pick-place-v2", seed=0)
+    env = benchmark.train_classes["pick-place-v2"]()
+    env.set_task(benchmark.train_tasks[0])
+    policy = SawyerPickPlaceV2Policy()
+    object_id = env._get_id_main_object()
+    pad_ids = [env.data.geom(name).id for name in ("leftpad_geom", "rightpad_geom")]
+
+    num_touching = 0
+    for _ in range(2):
+        obs, _ = env.reset()
+        for _ in range(100):
+            obs, *_ = env.step(policy.get_action(obs))
+            forces = [
+                sum(
+                    env.data.efc_force[x.efc_address]
+                    for x in env.data.contact
+                    if pad_id in (x.geom1, x.geom2) and object_id in (x.geom1, x.geom2)
+                )
+                for pad_id in pad_ids
+            ]
+            touching = all(force > 0 for force in forces)
+            assert env.touching_main_object == touching
+            num_touching += touching
+    assert num_touching > 0
+
+
+@pytest.mark.parametrize("env_name", sorted(metaworld.ML1.ENV_NAMES))
+def test_batched_reward_matches_step(env_name):
+    benchmark = metaworld.ML1(env_name, seed=0)
+    env = benchmark.train_classes[env_name]()
+    policy = policies[env_name]()
+    rng = np.random.default_rng(0)
+
+    obs_batch, actions, states, params, rewards, successes = [], [], [], [], [], []
+    for task, scripted in zip(benchmark.train_tasks[:2], (True, False)):
+        env.set_task(task)
+        obs, _ = env.reset()
+        for _ in range(100):
+            if scripted:
+                action = policy.get_action(obs) + rng.normal(0, 0.1, 4)
+            else:
+                action = rng.uniform(-1, 1, 4)
+            obs, reward, _, _, info = env.step(action)
+            # Some scripted policies modify the observation in place
+            obs_batch.append(obs.copy())
+            actions.append(action)
+            states.append(env.reward_state())
+            params.append(env.reward_params())
+            rewards.append(reward)
+            successes.append(bool(info["success"]))
+
+    def stack(dicts):
+        return {key: np.stack([d[key] for d in dicts]) for key in dicts[0]}
+
+    batched = type(env).batched_reward(
+        np.stack(obs_batch), np.stack(actions), stack(states), stack(params)
+    )
+    assert batched.shape == (len(rewards),)
+    np.testing.assert_allclose(batched, rewards, rtol=1e-9, atol=1e-12)
+    batched_success = type(env).batched_success(
+        np.stack(obs_batch), np.stack(actions), stack(states), stack(params)
+    )
+    np.testing.assert_array_equal(batched_success, successes)
+
+    # The params of an episode can also be shared by its steps
+    shared = type(env).batched_reward(
+        np.stack(obs_batch[100:]),
+        np.stack(actions[100:]),
+        stack(states[100:]),
+        params[-1],
+    )
+    np.testing.assert_allclose(shared, rewards[100:], rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize("env_name", sorted(metaworld.ML1.ENV_NAMES))
+def test_relabel_matches_evaluate_state(env_name):
+    benchmark = metaworld.ML1(env_name, seed=0)
+    env = benchmark.train_classes[env_name]()
+    policy = policies[env_name]()
+    rng = np.random.default_rng(0)
+
+    env.set_task(benchmark.train_tasks[0])
+    obs, _ = env.reset()
+    goals, obs_batch, actions, states, rewards, successes = [], [], [], [], [], []
+    for _ in range(100):
+        action = np.clip(policy.get_action(obs.copy()) + rng.normal(0, 0.1, 4), -1, 1)
+        obs, *_ = env.step(action)
+        # The substitute goals stay near the target, where the reward is defined
+        goal = env._target_pos + rng.normal(0, 0.03, 3)
+        target_pos, env._target_pos = env._target_pos, goal
+        reward, info = env.evaluate_state(obs, action)
+        env._target_pos = target_pos
+        goals.append(goal)
+        obs_batch.append(obs)
+        actions.append(action)
+        states.append(env.reward_state())
+        rewards.append(reward)
+        successes.append(bool(info["success"]))
+
+    obs_batch, actions = np.stack(obs_batch), np.stack(actions)
+    states = {key: np.stack([s[key] for s in states]) for key in states[0]}
+    params = env.reward_params()
+    relabeled, success = type(env).relabel(
+        obs_batch, actions, states, params, np.stack(goals)
+    )
+    np.testing.assert_allclose(relabeled, rewards, rtol=1e-9, atol=1e-12)
+    np.testing.assert_array_equal(success, successes)
+
+    # A single goal can be shared by all the steps
+    relabeled, success = type(env).relabel(obs_batch, actions, states, params, goals[0])
+    assert relabeled.shape == success.shape == (len(rewards),)
+    with pytest.raises(ValueError):
+        type(env).relabel(obs_batch, actions, states, params, np.stack(goals[:2]))
+
+
+@pytest.mark.parametrize("env_name", sorted(metaworld.ML1.ENV_NAMES))
+def test_restore_state_reproduces_steps(env_name):
+    benchmark = metaworld.ML1(env_name, seed=0)
+    env = benchmark.train_classes[env_name]()
+    other_env = benchmark.train_classes[env_name]()
+    policy = policies[env_name]()
+    rng = np.random.default_rng(0)
+
+    env.set_task(benchmark.train_tasks[0])
+    obs, _ = env.reset()
+    state = env.save_state()
+    for _ in range(20):
+        obs, *_ = env.step(policy.get_action(obs.copy()))
+    assert env.save_state(out=state) is state
+    actions = [
+        np.clip(policy.get_action(obs.copy()) + rng.normal(0, 0.3, 4), -1, 1)
+        for _ in range(30)
+    ]
+    expected = [env.step(action) for action in actions]
+
+    # Restoring undoes the steps, a reset into another task, and works across instances
+    env.set_task(benchmark.train_tasks[1])
+    env.reset()
+    other_env.set_task(benchmark.train_tasks[2])
+    other_env.reset()
+    for e in (env, other_env):
+        e.restore_state(state)
+        for action, (exp_obs, *exp_results) in zip(actions, expected):
+            obs, *results = e.step(action)
+            np.testing.assert_array_equal(obs, exp_obs)
+            assert results == exp_results
+
+
+@pytest.mark.parametrize("env_name", sorted(metaworld.ML1.ENV_NAMES))
+def test_reset_assigns_only_episode_attributes(env_name, monkeypatch):
+    benchmark = metaworld.ML1(env_name, seed=0)
+    env_cls = benchmark.train_classes[env_name]
+    env = env_cls()
+    env.set_task(benchmark.train_tasks[0])
+    env.reset()
+    env.step(env.action_space.sample())
+
+    # Reset states only hold the declared attributes, so the reset must not assign others
+    assigned = set()
+    setattr_ = env_cls.__setattr__
+
+    def record_setattr(self, name, value):
+        assigned.add(name)
+        setattr_(self, name, value)
+
+    monkeypatch.setattr(env_cls, "__setattr__", record_setattr)
+    env.reset()
+    monkeypatch.undo()
+    assert assigned <= set(env._declared_names("_EPISODE_ATTRIBUTES"))
@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 
 from metaworld.envs import ALL_V2_ENVIRONMENTS_GOAL_OBSERVABLE
+from metaworld.envs.mujoco.env_dict import ALL_V2_ENVIRONMENTS
 
 
 @pytest.mark.parametrize("env_name", sorted(ALL_V2_ENVIRONMENTS_GOAL_OBSERVABLE.keys()))
@@ -25,3 +26,23 @@ def test_observations_match(env_name):
         assert r1 == r2
         assert not done1
         assert not done2
+
+
+@pytest.mark.parametrize("env_name", ["sweep-into-v2", "pick-place-v2"])
+def test_sampled_rand_vecs_match_resets(env_name):
+    env = ALL_V2_ENVIRONMENTS[env_name]()
+    env._freeze_rand_vec = False
+    env._set_task_called = True
+    # With this seed, sweep-into-v2 draws a rand vec that its `reset_model()` check against the
+    # default goal and a check against the sampled goal disagree on
+    np.random.seed(47)
+    reset_rand_vecs = []
+    for _ in range(20):
+        env.reset()
+        reset_rand_vecs.append(env._last_rand_vec)
+
+    # `reset()` samples a rand vec for each of its two `reset_model()` calls
+    np.random.seed(47)
+    for reset_rand_vec in reset_rand_vecs:
+        env._sample_state_rand_vec()
+        np.testing.assert_array_equal(env._sample_state_rand_vec(), reset_rand_vec)
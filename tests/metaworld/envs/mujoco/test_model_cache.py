@@ -0,0 +1,80 @@
+import os
+
+import numpy as np
+import pytest
+
+from metaworld.envs.mujoco import model_cache
+from metaworld.envs.mujoco.env_dict import ALL_V2_ENVIRONMENTS
+from metaworld.utils import CACHE_DIR_ENV_VAR
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def xml_tree(tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "main.xml").write_text(
+        '<mujoco><include file="assets/deps.xml"/>'
+        '<worldbody><geom type="mesh" mesh="box"/></worldbody></mujoco>'
+    )
+    (tmp_path / "assets" / "deps.xml").write_text(
+        '<mujoco><asset><mesh name="box" file="box.obj"/></asset></mujoco>'
+    )
+    (tmp_path / "box.obj").write_text(
+        "v 0 0 0\nv 1 0 0\nv 0 1 0\nv 0 0 1\nf 1 3 2\nf 1 2 4\nf 1 4 3\nf 2 3 4\n"
+    )
+    return tmp_path
+
+
+def test_xml_tree_files(xml_tree):
+    files = model_cache.xml_tree_files(str(xml_tree / "main.xml"))
+    assert [resolved for _, resolved in files] == [
+        str(xml_tree / "main.xml"),
+        str(xml_tree / "assets" / "deps.xml"),
+        str(xml_tree / "box.obj"),
+    ]
+
+
+@pytest.mark.parametrize("file_name", ["main.xml", "assets/deps.xml", "box.obj"])
+def test_key_depends_on_every_file(xml_tree, file_name):
+    key = model_cache.model_cache_key(str(xml_tree / "main.xml"))
+    with open(xml_tree / file_name, "a") as f:
+        f.write("\n")
+    assert model_cache.model_cache_key(str(xml_tree / "main.xml")) != key
+
+
+def test_cached_model_matches_compiled(cache_dir, monkeypatch):
+    env_cls = ALL_V2_ENVIRONMENTS["pick-place-v2"]
+    env_cls()  # Compiles and stores the model
+    assert len(os.listdir(cache_dir / "models")) == 1
+
+    cached_env = env_cls()  # Loads the stored model
+    monkeypatch.delenv(CACHE_DIR_ENV_VAR)
+    compiled_env = env_cls()
+    observations = []
+    for env in (cached_env, compiled_env):
+        env._partially_observable = False
+        env._freeze_rand_vec = False
+        env._set_task_called = True
+        env.action_space.seed(0)
+        np.random.seed(0)
+        obs, _ = env.reset()
+        env_obs = [obs]
+        for _ in range(20):
+            obs, *_ = env.step(env.action_space.sample())
+            env_obs.append(obs)
+        observations.append(env_obs)
+    np.testing.assert_array_equal(observations[0], observations[1])
+
+
+def test_corrupt_entry_is_recompiled(cache_dir):
+    env_cls = ALL_V2_ENVIRONMENTS["reach-v2"]
+    env_cls()
+    (path,) = (cache_dir / "models").iterdir()
+    path.write_bytes(b"corrupt")
+    env_cls()
+    assert path.stat().st_size > len(b"corrupt")
@@ -0,0 +1,69 @@
+import mujoco
+import pytest
+
+from metaworld.envs.mujoco.utils.contacts import ContactQuery
+
+# Two boxes resting on the floor and a third one resting on the second
+_XML = """
+<mujoco>
+  <worldbody>
+    <geom name="floor" type="plane" size="1 1 0.1"/>
+    <body pos="-0.3 0 0.1"><freejoint/><geom name="a" type="box" size="0.1 0.1 0.1"/></body>
+    <body pos="0.3 0 0.1"><freejoint/><geom name="b" type="box" size="0.1 0.1 0.1"/></body>
+    <body pos="0.3 0 0.3"><freejoint/><geom name="c" type="box" size="0.05 0.05 0.1"/></body>
+  </worldbody>
+</mujoco>
+"""
+
+
+@pytest.fixture
+def simulation():
+    model = mujoco.MjModel.from_xml_string(_XML)
+    data = mujoco.MjData(model)
+    for _ in range(20):
+        mujoco.mj_step(model, data)
+    return model, data
+
+
+def _loop_force(data, geom_a, geom_b):
+    return sum(
+        data.efc_force[x.efc_address]
+        for x in data.contact
+        if geom_a in (x.geom1, x.geom2) and geom_b in (x.geom1, x.geom2)
+    )
+
+
+def test_pair_forces_match_contact_loop(simulation):
+    model, data = simulation
+    floor, a, b, c = (model.geom(name).id for name in ("floor", "a", "b", "c"))
+    pairs = [(floor, a), (a, floor), (floor, b), (b, c), (a, c), (a, b)]
+    forces = ContactQuery(data).pair_forces(pairs)
+    assert forces == [_loop_force(data, *pair) for pair in pairs]
+    assert forces[0] > 0 and forces[3] > 0
+    assert forces[4] == 0.0 and forces[5] == 0.0
+
+
+def test_answers_are_memoized_until_invalidated(simulation):
+    model, data = simulation
+    floor, c = model.geom("floor").id, model.geom("c").id
+    query = ContactQuery(data)
+    assert query.pair_force(floor, c) == 0.0
+
+    # Knock the top box off onto the floor
+    data.qvel[12:15] = [3.0, 0.0, 0.0]
+    for _ in range(300):
+        mujoco.mj_step(model, data)
+    assert _loop_force(data, floor, c) > 0
+    assert query.pair_force(floor, c) == 0.0
+    query.invalidate()
+    assert query.pair_force(floor, c) == _loop_force(data, floor, c)
+
+
+def test_no_contacts():
+    model = mujoco.MjModel.from_xml_string(_XML)
+    data = mujoco.MjData(model)
+    data.qpos[[2, 9, 16]] = [2.0, 2.0, 3.0]
+    mujoco.mj_forward(model, data)
+    assert data.ncon == 0
+    assert ContactQuery(data).pair_forces([(0, 1), (1, 2)]) == [0.0, 0.0]
+    assert ContactQuery(data).pair_forces([]) == []
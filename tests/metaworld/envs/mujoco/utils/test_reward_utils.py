@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from metaworld.envs.mujoco.utils import reward_utils
+
+
+@pytest.mark.parametrize(
+    "sigmoid",
+    [
+        "gaussian",
+        "hyperbolic",
+        "long_tail",
+        "reciprocal",
+        "cosine",
+        "linear",
+        "quadratic",
+        "tanh_squared",
+    ],
+)
+def test_batched_tolerance_matches_tolerance(sigmoid):
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-1.0, 2.0, 200)
+    margin = rng.uniform(0.1, 1.0, 200)
+    margin[::10] = 0.0
+    batched = reward_utils.batched_tolerance(
+        x, bounds=(0.0, 0.5), margin=margin, sigmoid=sigmoid
+    )
+    expected = [
+        reward_utils.tolerance(xi, bounds=(0.0, 0.5), margin=mi, sigmoid=sigmoid)
+        for xi, mi in zip(x, margin)
+    ]
+    np.testing.assert_allclose(batched, expected, rtol=1e-12, atol=0)
+
+
+def test_batched_hamacher_product_matches_hamacher_product():
+    rng = np.random.default_rng(0)
+    a, b = rng.uniform(0.0, 1.0, (2, 100))
+    a[::10] = b[::10] = 0.0
+    expected = [reward_utils.hamacher_product(ai, bi) for ai, bi in zip(a, b)]
+    np.testing.assert_array_equal(reward_utils.batched_hamacher_product(a, b), expected)
+    with pytest.raises(ValueError):
+        reward_utils.batched_hamacher_product(a, b + 1.0)
+
+
+def test_batched_rect_prism_tolerance_matches_rect_prism_tolerance():
+    rng = np.random.default_rng(0)
+    curr = rng.uniform(-1.0, 1.0, (100, 3))
+    zero, one = np.array([0.5, -0.5, -0.5]), np.array([-0.5, 0.5, 0.5])
+    expected = [reward_utils.rect_prism_tolerance(c, zero, one) for c in curr]
+    np.testing.assert_array_equal(
+        reward_utils.batched_rect_prism_tolerance(curr, zero, one), expected
+    )
@@ -0,0 +1,104 @@
+import itertools
+import threading
+
+import numpy as np
+import pytest
+
+import metaworld
+from metaworld.envs.mujoco.utils import step_timing
+
+
+@pytest.fixture
+def timing():
+    step_timing.reset()
+    yield step_timing
+    step_timing.disable()
+    step_timing.reset()
+
+
+def _step(env_name, steps):
+    benchmark = metaworld.ML1(env_name, seed=0)
+    env = benchmark.train_classes[env_name]()
+    env.set_task(benchmark.train_tasks[0])
+    env.reset()
+    for _ in range(steps):
+        env.step(env.action_space.sample())
+    return env
+
+
+def test_disabled_records_nothing(timing):
+    assert not timing.is_enabled()
+    env = _step("reach-v2", 10)
+    assert timing.timer_for(type(env)) is timing.NULL_TIMER
+    assert timing.stats() == {}
+
+
+def test_records_phases_per_env_class(timing):
+    timing.enable()
+    _step("reach-v2", 10)
+    _step("reach-v2", 5)
+    _step("drawer-open-v2", 3)
+    timing.disable()
+    _step("drawer-open-v2", 3)
+
+    stats = timing.stats()
+    assert set(stats) == {"SawyerReachEnvV2", "SawyerDrawerOpenEnvV2"}
+    for name, steps in (("SawyerReachEnvV2", 15), ("SawyerDrawerOpenEnvV2", 3)):
+        assert list(stats[name]) == list(timing.PHASES)
+        for phase in stats[name].values():
+            assert phase["count"] == steps
+            assert phase["total_s"] == pytest.approx(phase["mean_s"] * steps)
+            assert 0 < phase["p50_s"] <= phase["p99_s"]
+
+    timing.reset()
+    assert timing.stats() == {}
+
+
+def test_percentiles(monkeypatch):
+    # 90 laps of 1 us and 10 laps of 1 ms
+    durations = [1_000] * 90 + [1_000_000] * 10
+    clock = itertools.accumulate([0] + durations)
+    monkeypatch.setattr(step_timing.time, "perf_counter_ns", lambda: next(clock))
+    timer = step_timing.StepTimer("test")
+    t = timer.start()
+    for _ in durations:
+        t = timer.lap("get_obs", t)
+
+    stats = timer.stats()
+    assert list(stats) == ["get_obs"]
+    assert stats["get_obs"]["count"] == 100
+    assert stats["get_obs"]["total_s"] == pytest.approx(sum(durations) * 1e-9)
+    # The percentiles are the upper edges of their buckets
+    np.testing.assert_allclose(stats["get_obs"]["p50_s"], 1e-6, rtol=0.1)
+    np.testing.assert_allclose(stats["get_obs"]["p99_s"], 1e-3, rtol=0.1)
+    assert stats["get_obs"]["p50_s"] >= 1e-6 and stats["get_obs"]["p99_s"] >= 1e-3
+
+
+def test_concurrent_laps(monkeypatch):
+    # Every thread has its own clock, which advances by 1 us per reading
+    clocks = threading.local()
+
+    def perf_counter_ns():
+        clocks.now = getattr(clocks, "now", 0) + 1_000
+        return clocks.now
+
+    monkeypatch.setattr(step_timing.time, "perf_counter_ns", perf_counter_ns)
+    timer = step_timing.StepTimer("test")
+    barrier = threading.Barrier(4)
+
+    def time_laps():
+        barrier.wait()
+        t = timer.start()
+        for _ in range(1000):
+            t = timer.lap("get_obs", t)
+
+    threads = [threading.Thread(target=time_laps) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = timer.stats()["get_obs"]
+    assert stats["count"] == 4000
+    assert stats["total_s"] == pytest.approx(4000 * 1e-6)
+    np.testing.assert_allclose(stats["p99_s"], 1e-6, rtol=0.1)
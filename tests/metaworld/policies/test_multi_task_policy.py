@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from metaworld.envs.mujoco.env_dict import MT50_V2
+from metaworld.policies import ENV_POLICY_MAP, MultiTaskPolicy
+
+
+def test_env_policy_map_covers_mt50():
+    assert set(ENV_POLICY_MAP) == set(MT50_V2)
+
+
+def test_get_actions_matches_per_task_policies():
+    policies = [ENV_POLICY_MAP[env_name]() for env_name in MT50_V2]
+    policy = MultiTaskPolicy(policies)
+    rng = np.random.default_rng(0)
+    obs = rng.uniform(-0.5, 1.0, size=(1000, 39))
+    task_idx = rng.integers(len(policies), size=len(obs))
+
+    actions = policy(obs, task_idx)
+    assert actions.shape == (len(obs), 4)
+    assert actions.dtype == np.float32
+    expected = np.stack(
+        [policies[task].get_action(o.copy()) for o, task in zip(obs, task_idx)]
+    )
+    np.testing.assert_array_equal(actions, expected)
+
+
+def test_get_actions_single_task_and_empty_batch():
+    policy = MultiTaskPolicy(
+        [ENV_POLICY_MAP["reach-v2"](), ENV_POLICY_MAP["push-v2"]()]
+    )
+    obs = np.random.default_rng(0).uniform(-0.5, 1.0, size=(10, 39))
+
+    np.testing.assert_array_equal(
+        policy(obs, np.ones(10, dtype=int)), policy.policies[1].get_actions(obs)
+    )
+    assert policy(obs[:0], np.zeros(0, dtype=int)).shape == (0, 4)
+
+
+def test_get_actions_rejects_bad_task_indices():
+    policy = MultiTaskPolicy([ENV_POLICY_MAP["reach-v2"]()])
+    obs = np.zeros((2, 39))
+
+    with pytest.raises(ValueError):
+        policy(obs, np.array([0, 1]))
+    with pytest.raises(ValueError):
+        policy(obs, np.array([0, -1]))
+    with pytest.raises(ValueError):
+        policy(obs, np.array([0]))
@@ -0,0 +1,164 @@
+import json
+import threading
+
+import numpy as np
+import pytest
+
+from metaworld import MT1, dataset
+
+
+def load_episode(path, index, episode):
+    return {
+        field: np.load(
+            dataset.chunk_path(path, index["chunks"][episode["chunk"]]["name"], field),
+            mmap_mode="r",
+        )[episode["start"] : episode["stop"]]
+        for field in index["fields"]
+    }
+
+
+@pytest.fixture(scope="module")
+def benchmark():
+    return MT1("pick-place-v2", seed=0)
+
+
+def test_generated_episodes_replay(benchmark, tmp_path):
+    index = dataset.generate_dataset(
+        benchmark,
+        str(tmp_path),
+        episodes_per_task=2,
+        tasks_per_env=3,
+        max_episode_steps=40,
+        chunk_steps=100,
+    )
+    with open(tmp_path / dataset.INDEX_FILE) as f:
+        assert json.load(f) == index
+    assert [(ep["task"], ep["episode"]) for ep in index["episodes"]] == [
+        (task, episode) for task in range(3) for episode in range(2)
+    ]
+    assert sum(chunk["num_steps"] for chunk in index["chunks"]) == 6 * 40
+    assert len(index["chunks"]) > 1
+
+    env = benchmark.train_classes["pick-place-v2"]()
+    for episode in index["episodes"]:
+        data = load_episode(str(tmp_path), index, episode)
+        for field, spec in index["fields"].items():
+            assert data[field].dtype == spec["dtype"]
+            assert data[field].shape == (40, *spec["shape"])
+        assert data["truncated"][-1] and not data["truncated"][:-1].any()
+        assert episode["success"] == data["success"].any()
+
+        env.set_task(benchmark.train_tasks[episode["task"]])
+        obs, _ = env.reset()
+        np.testing.assert_array_equal(obs, data["obs"][0])
+        for t, action in enumerate(data["action"]):
+            obs, reward, *_ = env.step(action)
+            assert reward == data["reward"][t]
+            np.testing.assert_array_equal(obs, data["next_obs"][t])
+            if t + 1 < len(data["obs"]):
+                np.testing.assert_array_equal(obs, data["obs"][t + 1])
+
+
+def test_dataset_does_not_depend_on_num_workers(benchmark, tmp_path):
+    kwargs = dict(tasks_per_env=4, max_episode_steps=20, end_on_success=True)
+    serial = dataset.generate_dataset(benchmark, str(tmp_path / "serial"), **kwargs)
+    parallel = dataset.generate_dataset(
+        benchmark, str(tmp_path / "parallel"), num_workers=3, **kwargs
+    )
+
+    assert len(parallel["chunks"]) > len(serial["chunks"])
+    for ep_serial, ep_parallel in zip(serial["episodes"], parallel["episodes"]):
+        data_serial = load_episode(str(tmp_path / "serial"), serial, ep_serial)
+        data_parallel = load_episode(str(tmp_path / "parallel"), parallel, ep_parallel)
+        for field in serial["fields"]:
+            np.testing.assert_array_equal(data_serial[field], data_parallel[field])
+
+
+def test_rejects_invalid_arguments(benchmark, tmp_path):
+    with pytest.raises(ValueError):
+        dataset.generate_dataset(benchmark, str(tmp_path), split="valid")
+    with pytest.raises(ValueError):
+        dataset.generate_dataset(benchmark, str(tmp_path), max_episode_steps=0)
+
+
+@pytest.fixture(scope="module")
+def reader(benchmark, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("dataset"))
+    dataset.generate_dataset(
+        benchmark, path, tasks_per_env=4, max_episode_steps=30, chunk_steps=50
+    )
+    return dataset.Dataset(path)
+
+
+def test_obs_layout_slices_views(reader):
+    obs = reader.episode(0)["obs"]
+    layout = reader.obs_layout
+    assert layout["curr_obs"] == [0, 18] and layout["goal_pos"] == [36, 39]
+    for name in ("hand_pos", "gripper_distance_apart", "obj_0_pos", "obj_1_quat"):
+        start, stop = layout[name]
+        assert layout[f"prev_{name}"] == [start + 18, stop + 18]
+
+    curr_obs = obs[:, reader.obs_slice("curr_obs")]
+    prev_obs = obs[:, reader.obs_slice("prev_obs")]
+    assert np.shares_memory(curr_obs, obs)
+    np.testing.assert_array_equal(prev_obs[1:], curr_obs[:-1])
+    np.testing.assert_array_equal(
+        obs[:, reader.obs_slice("goal_pos")],
+        np.broadcast_to(obs[0, 36:], (len(obs), 3)),
+    )
+
+
+def test_random_episode_access(reader):
+    assert len(reader) == 4 and reader.num_steps == 4 * 30
+    assert reader.find_episodes("pick-place-v2") == [0, 1, 2, 3]
+    assert reader.find_episodes(task=2) == [2]
+    assert reader.find_episodes("reach-v2") == []
+
+    for i in (3, 0, 2):
+        episode = reader.episode(i)
+        steps = reader.get_steps(reader.episode_steps([i]), fields=reader.fields)
+        for field in reader.fields:
+            np.testing.assert_array_equal(steps[field], episode[field])
+
+    for steps in ([0, reader.num_steps], [-1, 0]):
+        with pytest.raises(IndexError):
+            reader.get_steps(np.array(steps))
+    assert reader.get_steps(np.zeros(0, dtype=int))["reward"].shape == (0,)
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_iter_batches_reads_every_step_once(reader, prefetch):
+    ordered = list(reader.iter_batches(16, shuffle=False, prefetch=prefetch))
+    assert [len(batch["reward"]) for batch in ordered] == [16] * 7 + [8]
+    for field in ("obs", "action", "reward"):
+        np.testing.assert_array_equal(
+            np.concatenate([batch[field] for batch in ordered]),
+            np.concatenate([reader.episode(i)[field] for i in range(len(reader))]),
+        )
+
+    shuffled = list(reader.iter_batches(16, drop_last=True, seed=1, prefetch=prefetch))
+    assert len(shuffled) == 7
+    obs = np.concatenate([batch["obs"] for batch in shuffled])
+    all_obs = np.concatenate([batch["obs"] for batch in ordered])
+    assert not np.array_equal(obs, all_obs[: len(obs)])
+    # Every row of a batch is a step of the dataset, with its own action
+    rows = {row.tobytes(): i for i, row in enumerate(all_obs)}
+    steps = np.array([rows[row.tobytes()] for row in obs])
+    assert len(np.unique(steps)) == len(steps)
+    all_actions = np.concatenate([batch["action"] for batch in ordered])
+    np.testing.assert_array_equal(
+        np.concatenate([batch["action"] for batch in shuffled]), all_actions[steps]
+    )
+
+
+def test_prefetch_thread_stops(reader):
+    num_threads = threading.active_count()
+    batches = reader.iter_batches(4, prefetch=1)
+    next(batches)
+    assert threading.active_count() == num_threads + 1
+    batches.close()
+    assert threading.active_count() == num_threads
+
+    with pytest.raises(KeyError):
+        next(reader.iter_batches(4, fields=["not_a_field"]))
+    assert threading.active_count() == num_threads
@@ -0,0 +1,58 @@
+import pytest
+
+from metaworld import ML1, task_cache
+from metaworld.envs.mujoco.env_dict import ML1_V2
+from metaworld.utils import CACHE_DIR_ENV_VAR, get_cache_dir
+
+
+def task_files(cache_dir):
+    return [path for path in cache_dir.iterdir() if path.is_file()]
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path))
+    return tmp_path
+
+
+def test_cached_tasks_match_generated(cache_dir):
+    benchmark = ML1("pick-place-v2", seed=7)
+    assert len(task_files(cache_dir)) == 4  # An index and a blob per split
+
+    cached = ML1("pick-place-v2", seed=7)
+    assert cached.train_tasks == benchmark.train_tasks
+    assert cached.test_tasks == benchmark.test_tasks
+    assert len(task_files(cache_dir)) == 4
+
+
+def test_unseeded_tasks_are_not_cached(cache_dir):
+    ML1("pick-place-v2")
+    assert task_files(cache_dir) == []
+
+
+def test_cache_disabled_by_default(tmp_path, monkeypatch):
+    monkeypatch.delenv(CACHE_DIR_ENV_VAR, raising=False)
+    assert get_cache_dir() is None
+    assert task_cache.load_tasks("0" * 40) is None
+
+
+def test_key_depends_on_seed_and_source(cache_dir, monkeypatch):
+    classes = {"pick-place-v2": ML1_V2["train"]["pick-place-v2"]}
+    args_kwargs = {"pick-place-v2": {"args": [], "kwargs": {"task_id": 0}}}
+    key = task_cache.cache_key(classes, args_kwargs, {}, 0)
+    assert task_cache.cache_key(classes, args_kwargs, {}, 0) == key
+    assert task_cache.cache_key(classes, args_kwargs, {}, 1) != key
+
+    monkeypatch.setattr(task_cache, "_file_digest", lambda path: "changed")
+    assert task_cache.cache_key(classes, args_kwargs, {}, 0) != key
+
+
+def test_corrupt_entry_is_regenerated(cache_dir):
+    benchmark = ML1("pick-place-v2", seed=7)
+    for path in task_files(cache_dir):
+        if path.suffix == ".npy":
+            path.write_bytes(b"corrupt")
+
+    regenerated = ML1("pick-place-v2", seed=7)
+    assert regenerated.train_tasks == benchmark.train_tasks
+    assert regenerated.test_tasks == benchmark.test_tasks
@@ -0,0 +1,62 @@
+import time
+
+import numpy as np
+import pytest
+
+import metaworld
+from metaworld.envs.mujoco.sawyer_xyz.sawyer_xyz_env import SawyerXYZEnv
+from metaworld.vector import AsyncBenchmarkVectorEnv, SyncBenchmarkVectorEnv
+
+
+@pytest.fixture(scope="module")
+def benchmark():
+    return metaworld.ML1("pick-place-v2", seed=42)
+
+
+@pytest.mark.parametrize("context", ["fork", "spawn"])
+def test_matches_sync_vector_env(benchmark, context):
+    async_envs = AsyncBenchmarkVectorEnv(benchmark, context=context)
+    sync_envs = SyncBenchmarkVectorEnv(benchmark)
+    assert async_envs.observation_space == sync_envs.observation_space
+    assert async_envs.action_space == sync_envs.action_space
+
+    async_obs, _ = async_envs.reset(seed=7)
+    sync_obs, _ = sync_envs.reset(seed=7)
+    np.testing.assert_array_equal(async_obs, sync_obs)
+    np.testing.assert_array_equal(async_envs.task_ids, sync_envs.task_ids)
+
+    # Runs past the end of the episode, so the autoreset is covered as well
+    for _ in range(sync_envs.envs[0].max_path_length + 5):
+        actions = async_envs.action_space.sample()
+        async_results = async_envs.step(actions)
+        sync_results = sync_envs.step(actions)
+        for async_value, sync_value in zip(async_results[:4], sync_results[:4]):
+            np.testing.assert_array_equal(async_value, sync_value)
+        assert async_results[4].keys() == sync_results[4].keys()
+        for key in sync_results[4]:
+            np.testing.assert_array_equal(async_results[4][key], sync_results[4][key])
+    async_envs.close()
+    sync_envs.close()
+
+
+def test_close_keeps_last_results(benchmark):
+    envs = AsyncBenchmarkVectorEnv(benchmark, copy=False)
+    envs.reset(seed=0)
+    obs, *_ = envs.step(envs.action_space.sample())
+    last_obs = obs.copy()
+    envs.close()
+    assert envs.closed
+    np.testing.assert_array_equal(envs._observations, last_obs)
+    assert not envs._shared_memories
+    assert not any(process.is_alive() for process in envs._processes)
+
+
+def test_close_terminates_hung_workers(benchmark, monkeypatch):
+    # The forked workers hang while closing their environments
+    monkeypatch.setattr(SawyerXYZEnv, "close", lambda self: time.sleep(60))
+    envs = AsyncBenchmarkVectorEnv(benchmark, context="fork")
+    envs.reset(seed=0)
+    start = time.monotonic()
+    envs.close(timeout=1.0)
+    assert time.monotonic() - start < 10.0
+    assert not any(process.is_alive() for process in envs._processes)
@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+import metaworld
+from metaworld.vector import INFO_KEYS, SyncBenchmarkVectorEnv
+
+
+@pytest.fixture(scope="module")
+def benchmark():
+    return metaworld.ML1("pick-place-v2", seed=42)
+
+
+@pytest.mark.parametrize("split", ["train", "test"])
+def test_matches_individual_envs(benchmark, split):
+    envs = SyncBenchmarkVectorEnv(benchmark, split=split)
+    tasks = benchmark.train_tasks if split == "train" else benchmark.test_tasks
+    classes = benchmark.train_classes if split == "train" else benchmark.test_classes
+
+    obs, _ = envs.reset(seed=0)
+    assert obs.shape == (envs.num_envs, 39)
+    assert envs.observation_space.contains(obs)
+
+    singles = []
+    for i, env_name in enumerate(envs.env_names):
+        env = classes[env_name]()
+        env_tasks = [t for t in tasks if t.env_name == env_name]
+        env.set_task(env_tasks[envs.task_ids[i]])
+        single_obs, _ = env.reset()
+        np.testing.assert_array_equal(obs[i], single_obs)
+        singles.append(env)
+
+    for _ in range(10):
+        actions = envs.action_space.sample()
+        obs, rewards, terminations, truncations, infos = envs.step(actions)
+        assert obs.shape == (envs.num_envs, 39)
+        for i, env in enumerate(singles):
+            single_obs, reward, terminated, truncated, info = env.step(actions[i])
+            np.testing.assert_array_equal(obs[i], single_obs)
+            assert rewards[i] == reward
+            assert terminations[i] == terminated
+            assert truncations[i] == truncated
+            for key in INFO_KEYS:
+                assert infos[key][i] == info[key]
+                assert infos[f"_{key}"][i]
+    envs.close()
+
+
+def test_autoreset(benchmark):
+    envs = SyncBenchmarkVectorEnv(benchmark)
+    envs.reset(seed=1)
+    first_task_ids = envs.task_ids
+    actions = np.zeros((envs.num_envs, 4), dtype=np.float32)
+    for _ in range(envs.envs[0].max_path_length - 1):
+        _, _, _, truncations, _ = envs.step(actions)
+        assert not truncations.any()
+    _, _, _, truncations, _ = envs.step(actions)
+    assert truncations.all()
+    np.testing.assert_array_equal(envs.task_ids, first_task_ids)
+
+    obs, rewards, _, truncations, infos = envs.step(actions)
+    assert not truncations.any()
+    assert (rewards == 0.0).all()
+    assert not infos["_success"].any()
+    assert all(env.curr_path_length == 0 for env in envs.envs)
+    envs.close()
+
+
+def test_fixed_tasks(benchmark):
+    envs = SyncBenchmarkVectorEnv(benchmark, sample_tasks_on_reset=False)
+    envs.reset(seed=2)
+    task_ids = envs.task_ids
+    for _ in range(5):
+        envs.reset()
+        np.testing.assert_array_equal(envs.task_ids, task_ids)
+    envs.close()
+
+
+def test_envs_per_class(benchmark):
+    envs = SyncBenchmarkVectorEnv(benchmark, envs_per_class=3)
+    assert envs.num_envs == 3 * len(benchmark.train_classes)
+    assert envs.env_names == ["pick-place-v2"] * 3
+    obs, _ = envs.reset(seed=3)
+    assert obs.shape == (3, 39)
+    assert len({id(env) for env in envs.envs}) == 3
+    envs.close()
+
+    with pytest.raises(ValueError):
+        SyncBenchmarkVectorEnv(benchmark, envs_per_class=0)
+
+
+def test_share_models(benchmark):
+    shared_envs = SyncBenchmarkVectorEnv(benchmark, envs_per_class=3, share_models=True)
+    envs = SyncBenchmarkVectorEnv(benchmark, envs_per_class=3)
+    assert all(env.model is shared_envs.envs[0].model for env in shared_envs.envs)
+    np.testing.assert_array_equal(shared_envs.reset(seed=4)[0], envs.reset(seed=4)[0])
+    for _ in range(10):
+        actions = envs.action_space.sample()
+        np.testing.assert_array_equal(
+            shared_envs.step(actions)[0], envs.step(actions)[0]
+        )
+    shared_envs.close()
+    envs.close()
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+import metaworld
+from metaworld.vector import SyncBenchmarkVectorEnv, ThreadedBenchmarkVectorEnv
+
+
+@pytest.fixture(scope="module")
+def benchmark():
+    return metaworld.ML1("pick-place-v2", seed=42)
+
+
+@pytest.mark.parametrize("num_threads", [1, 2, 8])
+def test_matches_sync_vector_env(benchmark, num_threads):
+    threaded_envs = ThreadedBenchmarkVectorEnv(
+        benchmark, envs_per_class=3, num_threads=num_threads
+    )
+    sync_envs = SyncBenchmarkVectorEnv(benchmark, envs_per_class=3)
+    assert threaded_envs.observation_space == sync_envs.observation_space
+
+    threaded_obs, _ = threaded_envs.reset(seed=7)
+    sync_obs, _ = sync_envs.reset(seed=7)
+    np.testing.assert_array_equal(threaded_obs, sync_obs)
+    np.testing.assert_array_equal(threaded_envs.task_ids, sync_envs.task_ids)
+
+    # Runs past the end of the episode, so the autoreset is covered as well
+    for _ in range(sync_envs.envs[0].max_path_length + 5):
+        actions = threaded_envs.action_space.sample()
+        threaded_results = threaded_envs.step(actions)
+        sync_results = sync_envs.step(actions)
+        for threaded_value, sync_value in zip(threaded_results[:4], sync_results[:4]):
+            np.testing.assert_array_equal(threaded_value, sync_value)
+        for key in sync_results[4]:
+            np.testing.assert_array_equal(
+                threaded_results[4][key], sync_results[4][key]
+            )
+    threaded_envs.close()
+    sync_envs.close()